@@ -0,0 +1,126 @@
+"""
+Measures how long `construct_type` takes to turn large list responses into models, the work done after every
+`history.get_all`, `conversational_ai.get_conversations` or `voices.get_shared` call once the JSON is decoded.
+
+    python benchmarks/bench_construct.py
+"""
+
+import timeit
+import typing
+
+from elevenlabs.core import construct_type
+from elevenlabs.types import GetConversationsPageResponseModel, GetLibraryVoicesResponse, GetSpeechHistoryResponse
+
+ITEMS = 1000
+ITERATIONS = 10
+
+
+def history_page() -> typing.Dict[str, typing.Any]:
+    return {
+        "history": [
+            {
+                "history_item_id": f"item-{index}",
+                "request_id": f"request-{index}",
+                "voice_id": "JBFqnCBsd6RMkjVDRZzb",
+                "model_id": "eleven_multilingual_v2",
+                "voice_name": "George",
+                "voice_category": "premade",
+                "text": "Hello from the construct benchmark.",
+                "date_unix": 1714650306,
+                "character_count_change_from": 17231,
+                "character_count_change_to": 17266,
+                "content_type": "audio/mpeg",
+                "state": "created",
+                "settings": {"stability": 0.5, "similarity_boost": 0.75},
+                "feedback": {
+                    "thumbs_up": True,
+                    "feedback": "Great",
+                    "emotions": False,
+                    "inaccurate_clone": False,
+                    "glitches": False,
+                    "audio_quality": True,
+                    "other": False,
+                    "review_status": "not_reviewed",
+                },
+                "source": "TTS",
+            }
+            for index in range(ITEMS)
+        ],
+        "last_history_item_id": f"item-{ITEMS - 1}",
+        "has_more": True,
+    }
+
+
+def conversations_page() -> typing.Dict[str, typing.Any]:
+    return {
+        "conversations": [
+            {
+                "agent_id": "agent",
+                "agent_name": "Support",
+                "conversation_id": f"conversation-{index}",
+                "start_time_unix_secs": 1714650306,
+                "call_duration_secs": 42,
+                "message_count": 8,
+                "status": "done",
+                "call_successful": "success",
+            }
+            for index in range(ITEMS)
+        ],
+        "next_cursor": "cursor",
+        "has_more": True,
+    }
+
+
+def library_voices_page() -> typing.Dict[str, typing.Any]:
+    return {
+        "voices": [
+            {
+                "public_owner_id": "owner",
+                "voice_id": f"voice-{index}",
+                "date_unix": 1714650306,
+                "name": "George",
+                "accent": "british",
+                "gender": "male",
+                "age": "middle_aged",
+                "descriptive": "warm",
+                "use_case": "narrative_story",
+                "category": "professional",
+                "language": "en",
+                "description": "A warm British voice.",
+                "preview_url": "https://example.com/preview.mp3",
+                "usage_character_count_1y": 1000,
+                "usage_character_count_7d": 100,
+                "play_api_usage_character_count_1y": 10,
+                "cloned_by_count": 12,
+                "rate": 1.0,
+                "free_users_allowed": True,
+                "live_moderation_enabled": False,
+                "featured": False,
+                "verified_languages": [{"language": "en", "model_id": "eleven_multilingual_v2", "accent": "british"}],
+                "is_added_by_user": False,
+            }
+            for index in range(ITEMS)
+        ],
+        "has_more": True,
+        "last_sort_id": "sort",
+    }
+
+
+def main() -> None:
+    benchmarks: typing.List[typing.Tuple[str, typing.Type[typing.Any], typing.Dict[str, typing.Any]]] = [
+        ("GetSpeechHistoryResponse", GetSpeechHistoryResponse, history_page()),
+        ("GetConversationsPageResponseModel", GetConversationsPageResponseModel, conversations_page()),
+        ("GetLibraryVoicesResponse", GetLibraryVoicesResponse, library_voices_page()),
+    ]
+    for name, type_, payload in benchmarks:
+
+        def construct() -> None:
+            construct_type(type_=type_, object_=payload)
+
+        construct()
+        millis = min(timeit.repeat(construct, number=ITERATIONS, repeat=5)) / ITERATIONS * 1e3
+        print(f"{name:<34} {millis:8.2f} ms per {ITEMS} items")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Measures how long `jsonable_encoder` takes to prepare large request bodies: the conversation config dict sent by
+`conversational_ai.update_agent`, the form fields of `projects.add_project`, and a tree of models.
+
+    python benchmarks/bench_jsonable_encoder.py
+"""
+
+import timeit
+import typing
+
+from elevenlabs.core import construct_type, jsonable_encoder
+from elevenlabs.types import GetSpeechHistoryResponse
+
+TOOLS = 50
+DOCUMENTS = 200
+HISTORY_ITEMS = 200
+ITERATIONS = 10
+
+
+def conversation_config() -> typing.Dict[str, typing.Any]:
+    return {
+        "asr": {"quality": "high", "provider": "elevenlabs", "user_input_audio_format": "pcm_16000", "keywords": []},
+        "turn": {"turn_timeout": 7.0, "mode": "turn"},
+        "tts": {
+            "model_id": "eleven_turbo_v2",
+            "voice_id": "cjVigY5qzO86Huf0OWal",
+            "agent_output_audio_format": "pcm_16000",
+            "optimize_streaming_latency": 3,
+            "stability": 0.5,
+            "speed": 1.0,
+            "similarity_boost": 0.8,
+            "pronunciation_dictionary_locators": [],
+        },
+        "conversation": {"max_duration_seconds": 600, "client_events": ["audio", "interruption"]},
+        "agent": {
+            "first_message": "Hi, how can I help you today?",
+            "language": "en",
+            "dynamic_variables": {"dynamic_variable_placeholders": {"user_name": "there"}},
+            "prompt": {
+                "prompt": "You are a helpful support agent. " * 50,
+                "llm": "gemini-2.0-flash-001",
+                "temperature": 0.0,
+                "max_tokens": -1,
+                "tools": [
+                    {
+                        "type": "webhook",
+                        "name": f"lookup_order_{index}",
+                        "description": "Looks up an order by its id.",
+                        "api_schema": {
+                            "url": "https://example.com/orders/{order_id}",
+                            "method": "GET",
+                            "path_params_schema": {
+                                "order_id": {"type": "string", "description": "The id of the order."}
+                            },
+                            "query_params_schema": {
+                                "properties": {
+                                    "include": {"type": "string", "description": "Related data to include."},
+                                    "limit": {"type": "integer", "description": "How many items to return."},
+                                },
+                                "required": ["include"],
+                            },
+                            "request_headers": {"Authorization": "Bearer token"},
+                        },
+                    }
+                    for index in range(TOOLS)
+                ],
+                "knowledge_base": [
+                    {"type": "file", "name": f"Document {index}", "id": f"document-{index}", "usage_mode": "auto"}
+                    for index in range(DOCUMENTS)
+                ],
+                "rag": {"enabled": True, "embedding_model": "e5_mistral_7b_instruct", "max_vector_distance": 0.6},
+            },
+        },
+    }
+
+
+def add_project_form() -> typing.Dict[str, typing.Any]:
+    return {
+        "name": "Audiobook",
+        "default_title_voice_id": "JBFqnCBsd6RMkjVDRZzb",
+        "default_paragraph_voice_id": "JBFqnCBsd6RMkjVDRZzb",
+        "default_model_id": "eleven_multilingual_v2",
+        "quality_preset": "high",
+        "title": "A long story",
+        "genres": ["fiction", "adventure", "fantasy"],
+        "target_audience": "adult",
+        "mature_content": False,
+        "pronunciation_dictionary_locators": [
+            f'{{"pronunciation_dictionary_id": "dictionary-{index}", "version_id": "version"}}' for index in range(500)
+        ],
+        "auto_convert": True,
+    }
+
+
+def history_page() -> GetSpeechHistoryResponse:
+    return construct_type(
+        type_=GetSpeechHistoryResponse,
+        object_={
+            "history": [
+                {
+                    "history_item_id": f"item-{index}",
+                    "voice_id": "JBFqnCBsd6RMkjVDRZzb",
+                    "voice_category": "premade",
+                    "text": "Hello from the encoder benchmark.",
+                    "date_unix": 1714650306,
+                    "state": "created",
+                    "settings": {"stability": 0.5, "similarity_boost": 0.75},
+                    "feedback": {"thumbs_up": True, "feedback": "Great", "emotions": False, "glitches": False},
+                }
+                for index in range(HISTORY_ITEMS)
+            ],
+            "has_more": True,
+        },
+    )
+
+
+def main() -> None:
+    for name, payload in [
+        ("update_agent conversation_config", {"conversation_config": conversation_config(), "name": "Support"}),
+        ("projects.add_project form", add_project_form()),
+        ("GetSpeechHistoryResponse model", history_page()),
+    ]:
+
+        def encode() -> None:
+            jsonable_encoder(payload)
+
+        encode()
+        millis = min(timeit.repeat(encode, number=ITERATIONS, repeat=5)) / ITERATIONS * 1e3
+        print(f"{name:<34} {millis:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmarks the parsing, streaming and concurrency paths of the client against recorded API responses, so that runs
+are deterministic and need no network.
+
+The first run records the responses into the fixture file using the api key in `ELEVENLABS_API_KEY`; later runs
+replay them. Parsing and streaming are measured without the recorded delays, concurrency at the recorded speed.
+
+    ELEVENLABS_API_KEY=... python benchmarks/bench_replay.py benchmarks/fixtures/replay.json
+"""
+
+import concurrent.futures
+import os
+import sys
+import time
+import timeit
+import typing
+
+import httpx
+
+from elevenlabs.client import ElevenLabs
+from elevenlabs.core import RecordingTransport, ReplayTransport
+
+ITERATIONS = 200
+CONCURRENCY = 8
+VOICE_ID = "JBFqnCBsd6RMkjVDRZzb"
+
+
+def run(client: ElevenLabs) -> None:
+    client.voices.get_all()
+    client.models.get_all()
+    for _ in client.text_to_speech.convert_as_stream(VOICE_ID, text="Hello from the replay benchmark."):
+        pass
+
+
+def record(path: str) -> None:
+    transport = RecordingTransport(path)
+    run(ElevenLabs(api_key=os.environ["ELEVENLABS_API_KEY"], httpx_client=httpx.Client(transport=transport)))
+    transport.save()
+    print(f"Recorded {path}")
+
+
+def main() -> None:
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(__file__), "fixtures", "replay.json")
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        record(path)
+
+    client = ElevenLabs(api_key="benchmark", httpx_client=httpx.Client(transport=ReplayTransport(path, speed=None)))
+
+    def stream() -> None:
+        for _ in client.text_to_speech.convert_as_stream(VOICE_ID, text="Hello from the replay benchmark."):
+            pass
+
+    benchmarks: typing.List[typing.Tuple[str, typing.Callable[[], object]]] = [
+        ("parse voices.get_all", client.voices.get_all),
+        ("parse models.get_all", client.models.get_all),
+        ("stream text_to_speech", stream),
+    ]
+    for name, func in benchmarks:
+        func()
+        micros = min(timeit.repeat(func, number=ITERATIONS, repeat=5)) / ITERATIONS * 1e6
+        print(f"{name:<24} {micros:9.2f} us/request")
+
+    client = ElevenLabs(api_key="benchmark", httpx_client=httpx.Client(transport=ReplayTransport(path)))
+    started_at = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(CONCURRENCY) as executor:
+        list(executor.map(lambda _: client.voices.get_all(), range(CONCURRENCY * 4)))
+    elapsed = time.perf_counter() - started_at
+    print(f"{'concurrent voices.get_all':<24} {CONCURRENCY * 4 / elapsed:9.2f} requests/s at recorded latency")
+
+
+if __name__ == "__main__":
+    main()
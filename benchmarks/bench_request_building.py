@@ -0,0 +1,61 @@
+"""
+Measures the Python-side overhead `HttpClient.request` adds before handing a request to httpx: merging and encoding
+headers and query parameters, resolving the URL and filtering the JSON body.
+
+The httpx client is replaced by a stub that returns a canned request and response, so httpx's own request
+construction, the transport and the network are excluded.
+
+    python benchmarks/bench_request_building.py
+
+Typical results on CPython 3.11 with httpx 0.28 (retry, timing, cache and breaker hooks all unconfigured), the
+spread is between runs on the same machine:
+
+    POST text-to-speech     14-24 us/request
+    GET models               8-16 us/request
+"""
+
+import timeit
+import typing
+
+import httpx
+
+from elevenlabs.client import ElevenLabs
+
+ITERATIONS = 20000
+_REQUEST = httpx.Request("GET", "https://api.elevenlabs.io")
+_RESPONSE = httpx.Response(200, content=b"")
+
+
+class _StubHttpxClient(httpx.Client):
+    def build_request(self, *args: typing.Any, **kwargs: typing.Any) -> httpx.Request:
+        return _REQUEST
+
+    def send(self, request: httpx.Request, **kwargs: typing.Any) -> httpx.Response:
+        return _RESPONSE
+
+
+def main() -> None:
+    client = ElevenLabs(api_key="benchmark", httpx_client=_StubHttpxClient())
+    http_client = client._client_wrapper.httpx_client
+
+    def tts_request() -> None:
+        http_client.request(
+            "v1/text-to-speech/JBFqnCBsd6RMkjVDRZzb/stream",
+            method="POST",
+            params={"enable_logging": None, "optimize_streaming_latency": None, "output_format": "mp3_44100_128"},
+            json={"text": "Hello", "model_id": "eleven_multilingual_v2", "seed": ...},
+            headers={"content-type": "application/json"},
+            omit=...,
+        )
+
+    def get_request() -> None:
+        http_client.request("v1/models", method="GET")
+
+    for name, func in [("POST text-to-speech", tts_request), ("GET models", get_request)]:
+        func()
+        micros = min(timeit.repeat(func, number=ITERATIONS, repeat=5)) / ITERATIONS * 1e6
+        print(f"{name:<22} {micros:6.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
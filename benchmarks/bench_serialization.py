@@ -0,0 +1,92 @@
+"""
+Measures how long `convert_and_respect_annotation_metadata` takes over every request and response model in
+`elevenlabs.types`, the walk that aliases request bodies before they are sent and dealiases responses when they are
+parsed. The payloads are synthesized from the type annotations, one per model.
+
+    python benchmarks/bench_serialization.py
+"""
+
+import enum
+import inspect
+import timeit
+import typing
+
+import typing_extensions
+
+import pydantic
+from elevenlabs import types
+from elevenlabs.core import convert_and_respect_annotation_metadata
+from elevenlabs.core.serialization import needs_aliasing
+
+ITERATIONS = 10
+MAX_DEPTH = 4
+
+
+def sample(type_: typing.Any, depth: int = 0) -> typing.Any:
+    """Returns a JSON value of the given type, recursing into models, containers and unions up to `MAX_DEPTH`."""
+    origin = typing_extensions.get_origin(type_)
+    args = typing_extensions.get_args(type_)
+    if origin is typing_extensions.Annotated or origin is typing_extensions.NotRequired:
+        return sample(args[0], depth)
+    if origin is typing_extensions.Literal:
+        return args[0]
+    if origin is typing.Union:
+        return sample(next((arg for arg in args if arg is not type(None)), None), depth)
+    if origin in (list, set, typing.Sequence, typing.List, typing.Set):
+        return [sample(args[0], depth + 1)] if depth < MAX_DEPTH else []
+    if origin in (dict, typing.Dict):
+        return {"key": sample(args[1], depth + 1)} if depth < MAX_DEPTH else {}
+    if inspect.isclass(type_):
+        if issubclass(type_, pydantic.BaseModel) or typing_extensions.is_typeddict(type_):
+            if depth >= MAX_DEPTH:
+                return {}
+            try:
+                hints = typing_extensions.get_type_hints(type_, include_extras=True)
+            except NameError:
+                return {}
+            return {
+                name: sample(hint, depth + 1)
+                for name, hint in hints.items()
+                if typing_extensions.get_origin(hint) is not typing.ClassVar
+            }
+        if issubclass(type_, enum.Enum):
+            return next(iter(typing.cast(typing.Iterable[enum.Enum], type_))).value
+        if issubclass(type_, bool):
+            return True
+        if issubclass(type_, (int, float)):
+            return 1
+    return "value"
+
+
+def main() -> None:
+    models = [
+        getattr(types, name)
+        for name in types.__all__
+        if inspect.isclass(getattr(types, name)) and issubclass(getattr(types, name), pydantic.BaseModel)
+    ]
+    payloads = []
+    for model in models:
+        payload = sample(model)
+        try:
+            convert_and_respect_annotation_metadata(object_=payload, annotation=model, direction="read")
+        except NameError:
+            # Models with unresolved forward references can't be walked.
+            continue
+        payloads.append((model, payload))
+    aliased = sum(needs_aliasing(model) for model, _ in payloads)
+    print(f"{len(payloads)} of {len(models)} models walked, {aliased} of which have aliased fields")
+
+    directions: typing.Tuple[typing.Literal["read", "write"], ...] = ("read", "write")
+    for direction in directions:
+
+        def convert() -> None:
+            for model, payload in payloads:
+                convert_and_respect_annotation_metadata(object_=payload, annotation=model, direction=direction)
+
+        convert()
+        millis = min(timeit.repeat(convert, number=ITERATIONS, repeat=5)) / ITERATIONS * 1e3
+        print(f"{direction:<6} {millis:8.2f} ms for all models")
+
+
+if __name__ == "__main__":
+    main()
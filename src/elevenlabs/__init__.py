@@ -1,423 +1,883 @@
 # This file was auto-generated by Fern from our API Definition.
 
-from .types import (
-    Accent,
-    AddAgentSecretResponseModel,
-    AddChapterResponseModel,
-    AddKnowledgeBaseResponseModel,
-    AddProjectResponseModel,
-    AddPronunciationDictionaryResponseModel,
-    AddPronunciationDictionaryRulesResponseModel,
-    AddSharingVoiceRequest,
-    AddVoiceIvcResponseModel,
-    AddVoiceResponseModel,
-    AddWorkspaceGroupMemberResponseModel,
-    AddWorkspaceInviteResponseModel,
-    Age,
-    AgentBan,
-    AgentCallLimits,
-    AgentConfigApiModel,
-    AgentConfigOverride,
-    AgentConfigOverrideConfig,
-    AgentMetadataResponseModel,
-    AgentPlatformSettingsRequestModel,
-    AgentPlatformSettingsResponseModel,
-    AgentSummaryResponseModel,
-    AllowlistItem,
-    ArrayJsonSchemaProperty,
-    ArrayJsonSchemaPropertyItems,
-    AsrConversationalConfig,
-    AsrInputFormat,
-    AsrProvider,
-    AsrQuality,
-    AudioNativeCreateProjectResponseModel,
-    AudioNativeEditContentResponseModel,
-    AudioNativeProjectSettingsResponseModel,
-    AudioWithTimestampsResponseModel,
-    AuthSettings,
-    AuthorizationMethod,
-    BanReasonType,
-    BodyAddToKnowledgeBaseV1ConvaiAddToKnowledgeBasePost,
-    BodyAddToKnowledgeBaseV1ConvaiAgentsAgentIdAddToKnowledgeBasePost,
-    BreakdownTypes,
-    ChapterContentBlockExtendableNodeResponseModel,
-    ChapterContentBlockInputModel,
-    ChapterContentBlockResponseModel,
-    ChapterContentBlockResponseModelNodesItem,
-    ChapterContentBlockResponseModelNodesItem_Other,
-    ChapterContentBlockResponseModelNodesItem_TtsNode,
-    ChapterContentBlockTtsNodeResponseModel,
-    ChapterContentInputModel,
-    ChapterContentParagraphTtsNodeInputModel,
-    ChapterContentResponseModel,
-    ChapterResponse,
-    ChapterSnapshotExtendedResponseModel,
-    ChapterSnapshotResponse,
-    ChapterSnapshotsResponse,
-    ChapterState,
-    ChapterStatisticsResponse,
-    ChapterWithContentResponseModel,
-    ChapterWithContentResponseModelState,
-    CharacterAlignmentModel,
-    CharacterAlignmentResponseModel,
-    ClientEvent,
-    ClientToolConfig,
-    ConvAiSecretLocator,
-    ConvAiStoredSecretDependencies,
-    ConvAiStoredSecretDependenciesAgentToolsItem,
-    ConvAiStoredSecretDependenciesAgentToolsItem_Available,
-    ConvAiStoredSecretDependenciesAgentToolsItem_Unknown,
-    ConvAiStoredSecretDependenciesToolsItem,
-    ConvAiStoredSecretDependenciesToolsItem_Available,
-    ConvAiStoredSecretDependenciesToolsItem_Unknown,
-    ConvAiWebhooks,
-    ConvAiWorkspaceStoredSecretConfig,
-    ConversationChargingCommonModel,
-    ConversationConfig,
-    ConversationConfigClientOverride,
-    ConversationConfigClientOverrideConfig,
-    ConversationDeletionSettings,
-    ConversationHistoryAnalysisCommonModel,
-    ConversationHistoryEvaluationCriteriaResultCommonModel,
-    ConversationHistoryFeedbackCommonModel,
-    ConversationHistoryMetadataCommonModel,
-    ConversationHistoryTranscriptCommonModel,
-    ConversationHistoryTranscriptCommonModelRole,
-    ConversationHistoryTranscriptToolCallCommonModel,
-    ConversationHistoryTranscriptToolResultCommonModel,
-    ConversationInitiationClientData,
-    ConversationInitiationClientDataConfig,
-    ConversationInitiationClientDataDynamicVariablesValue,
-    ConversationInitiationClientDataWebhook,
-    ConversationInitiationClientDataWebhookRequestHeadersValue,
-    ConversationSignedUrlResponseModel,
-    ConversationSummaryResponseModel,
-    ConversationSummaryResponseModelStatus,
-    ConversationTokenDbModel,
-    ConversationTokenPurpose,
-    ConversationalConfigApiModel,
-    ConvertChapterResponseModel,
-    ConvertProjectResponseModel,
-    CreateAgentResponseModel,
-    CreateAudioNativeProjectRequest,
-    CreatePhoneNumberResponseModel,
-    CreatePronunciationDictionaryResponseModel,
-    Currency,
-    CustomLlm,
-    DataCollectionResultCommonModel,
-    DeleteChapterResponseModel,
-    DeleteDubbingResponseModel,
-    DeleteHistoryItemResponse,
-    DeleteProjectResponseModel,
-    DeleteSampleResponseModel,
-    DeleteVoiceResponseModel,
-    DeleteWorkspaceGroupMemberResponseModel,
-    DeleteWorkspaceInviteResponseModel,
-    DependentAvailableAgentIdentifier,
-    DependentAvailableAgentIdentifierAccessLevel,
-    DependentAvailableAgentToolIdentifier,
-    DependentAvailableAgentToolIdentifierAccessLevel,
-    DependentAvailableToolIdentifier,
-    DependentAvailableToolIdentifierAccessLevel,
-    DependentPhoneNumberIdentifier,
-    DependentUnknownAgentIdentifier,
-    DependentUnknownAgentToolIdentifier,
-    DependentUnknownToolIdentifier,
-    DoDubbingResponse,
-    DocumentUsageModeEnum,
-    DubbedSegment,
-    DubbingMediaMetadata,
-    DubbingMediaReference,
-    DubbingMetadataResponse,
-    DubbingResource,
-    DynamicVariablesConfig,
-    DynamicVariablesConfigDynamicVariablePlaceholdersValue,
-    EditChapterResponseModel,
-    EditProjectResponseModel,
-    EditVoiceResponseModel,
-    EditVoiceSettingsResponseModel,
-    EmbedVariant,
-    EmbeddingModelEnum,
-    EvaluationSettings,
-    EvaluationSuccessResult,
-    ExtendedSubscriptionResponseModelBillingPeriod,
-    ExtendedSubscriptionResponseModelCharacterRefreshPeriod,
-    ExtendedSubscriptionResponseModelCurrency,
-    FeedbackItem,
-    FineTuningResponse,
-    FineTuningResponseModelStateValue,
-    Gender,
-    GetAgentEmbedResponseModel,
-    GetAgentLinkResponseModel,
-    GetAgentResponseModel,
-    GetAgentsPageResponseModel,
-    GetAudioNativeProjectSettingsResponseModel,
-    GetChaptersResponse,
-    GetConvAiSettingsResponseModel,
-    GetConversationResponseModel,
-    GetConversationResponseModelStatus,
-    GetConversationsPageResponseModel,
-    GetKnowledgeBaseDependentAgentsResponseModel,
-    GetKnowledgeBaseDependentAgentsResponseModelAgentsItem,
-    GetKnowledgeBaseDependentAgentsResponseModelAgentsItem_Available,
-    GetKnowledgeBaseDependentAgentsResponseModelAgentsItem_Unknown,
-    GetKnowledgeBaseListResponseModel,
-    GetKnowledgeBaseResponseModel,
-    GetKnowledgeBaseResponseModelAccessLevel,
-    GetKnowledgeBaseResponseModelType,
-    GetKnowledgeBaseSummaryResponseModel,
-    GetKnowledgeBaseSummaryResponseModelAccessLevel,
-    GetKnowledgeBaseSummaryResponseModelDependentAgentsItem,
-    GetKnowledgeBaseSummaryResponseModelDependentAgentsItem_Available,
-    GetKnowledgeBaseSummaryResponseModelDependentAgentsItem_Unknown,
-    GetKnowledgeBaseSummaryResponseModelType,
-    GetLibraryVoicesResponse,
-    GetPhoneNumberResponseModel,
-    GetProjectsResponse,
-    GetPronunciationDictionariesMetadataResponseModel,
-    GetPronunciationDictionaryMetadataResponse,
-    GetSpeechHistoryResponse,
-    GetVoicesResponse,
-    GetWorkspaceSecretsResponseModel,
-    HistoryAlignmentResponseModel,
-    HistoryAlignmentsResponseModel,
-    HistoryItem,
-    HttpValidationError,
-    ImageAvatar,
-    Invoice,
-    KnowledgeBaseDocumentMetadataResponseModel,
-    KnowledgeBaseLocator,
-    KnowledgeBaseLocatorType,
-    LanguageAddedResponse,
-    LanguagePreset,
-    LanguagePresetTranslation,
-    LanguageResponse,
-    LibraryVoiceResponse,
-    LibraryVoiceResponseModelCategory,
-    LiteralJsonSchemaProperty,
-    LiteralJsonSchemaPropertyType,
-    Llm,
-    ManualVerificationFileResponse,
-    ManualVerificationResponse,
-    Model,
-    ModelRatesResponseModel,
-    ModelResponseModelConcurrencyGroup,
-    ModerationStatusResponseModel,
-    ModerationStatusResponseModelSafetyStatus,
-    ModerationStatusResponseModelWarningStatus,
-    ObjectJsonSchemaProperty,
-    ObjectJsonSchemaPropertyPropertiesValue,
-    OrbAvatar,
-    OutputFormat,
-    PhoneNumberAgentInfo,
-    PodcastBulletinMode,
-    PodcastBulletinModeData,
-    PodcastConversationMode,
-    PodcastConversationModeData,
-    PodcastProjectResponseModel,
-    PodcastTextSource,
-    PodcastUrlSource,
-    PostAgentAvatarResponseModel,
-    PostWorkspaceSecretResponseModel,
-    PrivacyConfig,
-    ProfilePageResponseModel,
-    ProjectCreationMetaResponseModel,
-    ProjectCreationMetaResponseModelStatus,
-    ProjectCreationMetaResponseModelType,
-    ProjectExtendedResponseModel,
-    ProjectExtendedResponseModelAccessLevel,
-    ProjectExtendedResponseModelApplyTextNormalization,
-    ProjectExtendedResponseModelFiction,
-    ProjectExtendedResponseModelQualityPreset,
-    ProjectExtendedResponseModelSourceType,
-    ProjectExtendedResponseModelTargetAudience,
-    ProjectResponse,
-    ProjectResponseModelAccessLevel,
-    ProjectResponseModelFiction,
-    ProjectResponseModelSourceType,
-    ProjectResponseModelTargetAudience,
-    ProjectSnapshotExtendedResponseModel,
-    ProjectSnapshotResponse,
-    ProjectSnapshotUploadResponseModel,
-    ProjectSnapshotUploadResponseModelStatus,
-    ProjectSnapshotsResponse,
-    ProjectState,
-    PromptAgent,
-    PromptAgentOverride,
-    PromptAgentOverrideConfig,
-    PromptAgentToolsItem,
-    PromptAgentToolsItem_Client,
-    PromptAgentToolsItem_System,
-    PromptAgentToolsItem_Webhook,
-    PromptEvaluationCriteria,
-    PronunciationDictionaryAliasRuleRequestModel,
-    PronunciationDictionaryPhonemeRuleRequestModel,
-    PronunciationDictionaryVersionLocator,
-    PronunciationDictionaryVersionResponseModel,
-    PydanticPronunciationDictionaryVersionLocator,
-    QueryParamsJsonSchema,
-    RagConfig,
-    RagIndexResponseModel,
-    RagIndexStatus,
-    ReaderResourceResponseModel,
-    ReaderResourceResponseModelResourceType,
-    RecordingResponse,
-    RemovePronunciationDictionaryRulesResponseModel,
-    ResourceAccessInfo,
-    ResourceAccessInfoRole,
-    ReviewStatus,
-    SafetyCommonModel,
-    SafetyEvaluation,
-    SafetyResponseModel,
-    SafetyRule,
-    SecretDependencyType,
-    SegmentCreateResponse,
-    SegmentDeleteResponse,
-    SegmentDubResponse,
-    SegmentTranscriptionResponse,
-    SegmentTranslationResponse,
-    SegmentUpdateResponse,
-    SpeakerSegment,
-    SpeakerTrack,
-    SpeechHistoryItemResponse,
-    SpeechHistoryItemResponseModelSource,
-    SpeechHistoryItemResponseModelVoiceCategory,
-    SpeechToTextCharacterResponseModel,
-    SpeechToTextChunkResponseModel,
-    SpeechToTextWordResponseModel,
-    SpeechToTextWordResponseModelType,
-    StreamingAudioChunkWithTimestampsResponseModel,
-    Subscription,
-    SubscriptionResponse,
-    SubscriptionResponseModelBillingPeriod,
-    SubscriptionResponseModelCharacterRefreshPeriod,
-    SubscriptionResponseModelCurrency,
-    SubscriptionStatus,
-    SubscriptionUsageResponseModel,
-    SystemToolConfig,
-    TelephonyProvider,
-    TextToSpeechAsStreamRequest,
-    TtsConversationalConfig,
-    TtsConversationalConfigOverride,
-    TtsConversationalConfigOverrideConfig,
-    TtsConversationalModel,
-    TtsOptimizeStreamingLatency,
-    TtsOutputFormat,
-    TurnConfig,
-    TurnMode,
-    UpdateWorkspaceMemberResponseModel,
-    UrlAvatar,
-    UsageCharactersResponseModel,
-    User,
-    UserFeedback,
-    UserFeedbackScore,
-    ValidationError,
-    ValidationErrorLocItem,
-    VerificationAttemptResponse,
-    VerifiedVoiceLanguageResponseModel,
-    Voice,
-    VoiceGenerationParameterOptionResponse,
-    VoiceGenerationParameterResponse,
-    VoicePreviewResponseModel,
-    VoicePreviewsResponseModel,
-    VoiceResponseModelCategory,
-    VoiceResponseModelSafetyControl,
-    VoiceSample,
-    VoiceSettings,
-    VoiceSharingModerationCheckResponseModel,
-    VoiceSharingResponse,
-    VoiceSharingResponseModelCategory,
-    VoiceSharingState,
-    VoiceVerificationResponse,
-    WebhookToolApiSchemaConfig,
-    WebhookToolApiSchemaConfigMethod,
-    WebhookToolApiSchemaConfigRequestHeadersValue,
-    WebhookToolConfig,
-    WidgetConfig,
-    WidgetConfigAvatar,
-    WidgetConfigAvatar_Image,
-    WidgetConfigAvatar_Orb,
-    WidgetConfigAvatar_Url,
-    WidgetConfigResponseModel,
-    WidgetConfigResponseModelAvatar,
-    WidgetConfigResponseModelAvatar_Image,
-    WidgetConfigResponseModelAvatar_Orb,
-    WidgetConfigResponseModelAvatar_Url,
-    WidgetExpandable,
-    WidgetFeedbackMode,
-    WorkspaceGroupByNameResponseModel,
-)
-from .errors import BadRequestError, ForbiddenError, NotFoundError, TooEarlyError, UnprocessableEntityError
-from . import (
-    audio_isolation,
-    audio_native,
-    conversational_ai,
-    dubbing,
-    history,
-    models,
-    projects,
-    pronunciation_dictionary,
-    samples,
-    speech_to_speech,
-    speech_to_text,
-    studio,
-    text_to_sound_effects,
-    text_to_speech,
-    text_to_voice,
-    usage,
-    user,
-    voice_generation,
-    voices,
-    workspace,
-)
-from .client import AsyncElevenLabs, ElevenLabs
-from .dubbing import DubbingGetTranscriptForDubRequestFormatType
-from .environment import ElevenLabsEnvironment
-from .history import HistoryGetAllRequestSource
+# Names are imported on first access (PEP 562) so that `import elevenlabs` does not load every model and client.
+
+import typing
+from importlib import import_module
+
+# Bound eagerly, importing the `elevenlabs.play` submodule would otherwise replace the lazy `play` function with it.
 from .play import play, save, stream
-from .projects import (
-    AddProjectV1ProjectsAddPostRequestApplyTextNormalization,
-    AddProjectV1ProjectsAddPostRequestFiction,
-    AddProjectV1ProjectsAddPostRequestTargetAudience,
-    BodyCreatePodcastV1ProjectsPodcastCreatePostDurationScale,
-    BodyCreatePodcastV1ProjectsPodcastCreatePostMode,
-    BodyCreatePodcastV1ProjectsPodcastCreatePostMode_Bulletin,
-    BodyCreatePodcastV1ProjectsPodcastCreatePostMode_Conversation,
-    BodyCreatePodcastV1ProjectsPodcastCreatePostQualityPreset,
-    BodyCreatePodcastV1ProjectsPodcastCreatePostSource,
-    BodyCreatePodcastV1ProjectsPodcastCreatePostSourceItem,
-    BodyCreatePodcastV1ProjectsPodcastCreatePostSourceItem_Text,
-    BodyCreatePodcastV1ProjectsPodcastCreatePostSourceItem_Url,
-)
-from .pronunciation_dictionary import (
-    PronunciationDictionaryAddFromFileRequestWorkspaceAccess,
-    PronunciationDictionaryRule,
-    PronunciationDictionaryRule_Alias,
-    PronunciationDictionaryRule_Phoneme,
-)
-from .speech_to_text import SpeechToTextConvertRequestTimestampsGranularity
-from .studio import (
-    BodyCreatePodcastV1StudioPodcastsPostDurationScale,
-    BodyCreatePodcastV1StudioPodcastsPostMode,
-    BodyCreatePodcastV1StudioPodcastsPostMode_Bulletin,
-    BodyCreatePodcastV1StudioPodcastsPostMode_Conversation,
-    BodyCreatePodcastV1StudioPodcastsPostQualityPreset,
-    BodyCreatePodcastV1StudioPodcastsPostSource,
-    BodyCreatePodcastV1StudioPodcastsPostSourceItem,
-    BodyCreatePodcastV1StudioPodcastsPostSourceItem_Text,
-    BodyCreatePodcastV1StudioPodcastsPostSourceItem_Url,
-)
-from .text_to_sound_effects import TextToSoundEffectsConvertRequestOutputFormat
-from .text_to_speech import (
-    BodyTextToSpeechStreamingV1TextToSpeechVoiceIdStreamPostApplyTextNormalization,
-    BodyTextToSpeechStreamingWithTimestampsV1TextToSpeechVoiceIdStreamWithTimestampsPostApplyTextNormalization,
-    BodyTextToSpeechV1TextToSpeechVoiceIdPostApplyTextNormalization,
-    BodyTextToSpeechWithTimestampsV1TextToSpeechVoiceIdWithTimestampsPostApplyTextNormalization,
+
+if typing.TYPE_CHECKING:
+    from .types import (
+        Accent,
+        AddAgentSecretResponseModel,
+        AddChapterResponseModel,
+        AddKnowledgeBaseResponseModel,
+        AddProjectResponseModel,
+        AddPronunciationDictionaryResponseModel,
+        AddPronunciationDictionaryRulesResponseModel,
+        AddSharingVoiceRequest,
+        AddVoiceIvcResponseModel,
+        AddVoiceResponseModel,
+        AddWorkspaceGroupMemberResponseModel,
+        AddWorkspaceInviteResponseModel,
+        Age,
+        AgentBan,
+        AgentCallLimits,
+        AgentConfigApiModel,
+        AgentConfigOverride,
+        AgentConfigOverrideConfig,
+        AgentMetadataResponseModel,
+        AgentPlatformSettingsRequestModel,
+        AgentPlatformSettingsResponseModel,
+        AgentSummaryResponseModel,
+        AllowlistItem,
+        ArrayJsonSchemaProperty,
+        ArrayJsonSchemaPropertyItems,
+        AsrConversationalConfig,
+        AsrInputFormat,
+        AsrProvider,
+        AsrQuality,
+        AudioNativeCreateProjectResponseModel,
+        AudioNativeEditContentResponseModel,
+        AudioNativeProjectSettingsResponseModel,
+        AudioWithTimestampsResponseModel,
+        AuthSettings,
+        AuthorizationMethod,
+        BanReasonType,
+        BodyAddToKnowledgeBaseV1ConvaiAddToKnowledgeBasePost,
+        BodyAddToKnowledgeBaseV1ConvaiAgentsAgentIdAddToKnowledgeBasePost,
+        BreakdownTypes,
+        ChapterContentBlockExtendableNodeResponseModel,
+        ChapterContentBlockInputModel,
+        ChapterContentBlockResponseModel,
+        ChapterContentBlockResponseModelNodesItem,
+        ChapterContentBlockResponseModelNodesItem_Other,
+        ChapterContentBlockResponseModelNodesItem_TtsNode,
+        ChapterContentBlockTtsNodeResponseModel,
+        ChapterContentInputModel,
+        ChapterContentParagraphTtsNodeInputModel,
+        ChapterContentResponseModel,
+        ChapterResponse,
+        ChapterSnapshotExtendedResponseModel,
+        ChapterSnapshotResponse,
+        ChapterSnapshotsResponse,
+        ChapterState,
+        ChapterStatisticsResponse,
+        ChapterWithContentResponseModel,
+        ChapterWithContentResponseModelState,
+        CharacterAlignmentModel,
+        CharacterAlignmentResponseModel,
+        ClientEvent,
+        ClientToolConfig,
+        ConvAiSecretLocator,
+        ConvAiStoredSecretDependencies,
+        ConvAiStoredSecretDependenciesAgentToolsItem,
+        ConvAiStoredSecretDependenciesAgentToolsItem_Available,
+        ConvAiStoredSecretDependenciesAgentToolsItem_Unknown,
+        ConvAiStoredSecretDependenciesToolsItem,
+        ConvAiStoredSecretDependenciesToolsItem_Available,
+        ConvAiStoredSecretDependenciesToolsItem_Unknown,
+        ConvAiWebhooks,
+        ConvAiWorkspaceStoredSecretConfig,
+        ConversationChargingCommonModel,
+        ConversationConfig,
+        ConversationConfigClientOverride,
+        ConversationConfigClientOverrideConfig,
+        ConversationDeletionSettings,
+        ConversationHistoryAnalysisCommonModel,
+        ConversationHistoryEvaluationCriteriaResultCommonModel,
+        ConversationHistoryFeedbackCommonModel,
+        ConversationHistoryMetadataCommonModel,
+        ConversationHistoryTranscriptCommonModel,
+        ConversationHistoryTranscriptCommonModelRole,
+        ConversationHistoryTranscriptToolCallCommonModel,
+        ConversationHistoryTranscriptToolResultCommonModel,
+        ConversationInitiationClientData,
+        ConversationInitiationClientDataConfig,
+        ConversationInitiationClientDataDynamicVariablesValue,
+        ConversationInitiationClientDataWebhook,
+        ConversationInitiationClientDataWebhookRequestHeadersValue,
+        ConversationSignedUrlResponseModel,
+        ConversationSummaryResponseModel,
+        ConversationSummaryResponseModelStatus,
+        ConversationTokenDbModel,
+        ConversationTokenPurpose,
+        ConversationalConfigApiModel,
+        ConvertChapterResponseModel,
+        ConvertProjectResponseModel,
+        CreateAgentResponseModel,
+        CreateAudioNativeProjectRequest,
+        CreatePhoneNumberResponseModel,
+        CreatePronunciationDictionaryResponseModel,
+        Currency,
+        CustomLlm,
+        DataCollectionResultCommonModel,
+        DeleteChapterResponseModel,
+        DeleteDubbingResponseModel,
+        DeleteHistoryItemResponse,
+        DeleteProjectResponseModel,
+        DeleteSampleResponseModel,
+        DeleteVoiceResponseModel,
+        DeleteWorkspaceGroupMemberResponseModel,
+        DeleteWorkspaceInviteResponseModel,
+        DependentAvailableAgentIdentifier,
+        DependentAvailableAgentIdentifierAccessLevel,
+        DependentAvailableAgentToolIdentifier,
+        DependentAvailableAgentToolIdentifierAccessLevel,
+        DependentAvailableToolIdentifier,
+        DependentAvailableToolIdentifierAccessLevel,
+        DependentPhoneNumberIdentifier,
+        DependentUnknownAgentIdentifier,
+        DependentUnknownAgentToolIdentifier,
+        DependentUnknownToolIdentifier,
+        DoDubbingResponse,
+        DocumentUsageModeEnum,
+        DubbedSegment,
+        DubbingMediaMetadata,
+        DubbingMediaReference,
+        DubbingMetadataResponse,
+        DubbingResource,
+        DynamicVariablesConfig,
+        DynamicVariablesConfigDynamicVariablePlaceholdersValue,
+        EditChapterResponseModel,
+        EditProjectResponseModel,
+        EditVoiceResponseModel,
+        EditVoiceSettingsResponseModel,
+        EmbedVariant,
+        EmbeddingModelEnum,
+        EvaluationSettings,
+        EvaluationSuccessResult,
+        ExtendedSubscriptionResponseModelBillingPeriod,
+        ExtendedSubscriptionResponseModelCharacterRefreshPeriod,
+        ExtendedSubscriptionResponseModelCurrency,
+        FeedbackItem,
+        FineTuningResponse,
+        FineTuningResponseModelStateValue,
+        Gender,
+        GetAgentEmbedResponseModel,
+        GetAgentLinkResponseModel,
+        GetAgentResponseModel,
+        GetAgentsPageResponseModel,
+        GetAudioNativeProjectSettingsResponseModel,
+        GetChaptersResponse,
+        GetConvAiSettingsResponseModel,
+        GetConversationResponseModel,
+        GetConversationResponseModelStatus,
+        GetConversationsPageResponseModel,
+        GetKnowledgeBaseDependentAgentsResponseModel,
+        GetKnowledgeBaseDependentAgentsResponseModelAgentsItem,
+        GetKnowledgeBaseDependentAgentsResponseModelAgentsItem_Available,
+        GetKnowledgeBaseDependentAgentsResponseModelAgentsItem_Unknown,
+        GetKnowledgeBaseListResponseModel,
+        GetKnowledgeBaseResponseModel,
+        GetKnowledgeBaseResponseModelAccessLevel,
+        GetKnowledgeBaseResponseModelType,
+        GetKnowledgeBaseSummaryResponseModel,
+        GetKnowledgeBaseSummaryResponseModelAccessLevel,
+        GetKnowledgeBaseSummaryResponseModelDependentAgentsItem,
+        GetKnowledgeBaseSummaryResponseModelDependentAgentsItem_Available,
+        GetKnowledgeBaseSummaryResponseModelDependentAgentsItem_Unknown,
+        GetKnowledgeBaseSummaryResponseModelType,
+        GetLibraryVoicesResponse,
+        GetPhoneNumberResponseModel,
+        GetProjectsResponse,
+        GetPronunciationDictionariesMetadataResponseModel,
+        GetPronunciationDictionaryMetadataResponse,
+        GetSpeechHistoryResponse,
+        GetVoicesResponse,
+        GetWorkspaceSecretsResponseModel,
+        HistoryAlignmentResponseModel,
+        HistoryAlignmentsResponseModel,
+        HistoryItem,
+        HttpValidationError,
+        ImageAvatar,
+        Invoice,
+        KnowledgeBaseDocumentMetadataResponseModel,
+        KnowledgeBaseLocator,
+        KnowledgeBaseLocatorType,
+        LanguageAddedResponse,
+        LanguagePreset,
+        LanguagePresetTranslation,
+        LanguageResponse,
+        LibraryVoiceResponse,
+        LibraryVoiceResponseModelCategory,
+        LiteralJsonSchemaProperty,
+        LiteralJsonSchemaPropertyType,
+        Llm,
+        ManualVerificationFileResponse,
+        ManualVerificationResponse,
+        Model,
+        ModelRatesResponseModel,
+        ModelResponseModelConcurrencyGroup,
+        ModerationStatusResponseModel,
+        ModerationStatusResponseModelSafetyStatus,
+        ModerationStatusResponseModelWarningStatus,
+        ObjectJsonSchemaProperty,
+        ObjectJsonSchemaPropertyPropertiesValue,
+        OrbAvatar,
+        OutputFormat,
+        PhoneNumberAgentInfo,
+        PodcastBulletinMode,
+        PodcastBulletinModeData,
+        PodcastConversationMode,
+        PodcastConversationModeData,
+        PodcastProjectResponseModel,
+        PodcastTextSource,
+        PodcastUrlSource,
+        PostAgentAvatarResponseModel,
+        PostWorkspaceSecretResponseModel,
+        PrivacyConfig,
+        ProfilePageResponseModel,
+        ProjectCreationMetaResponseModel,
+        ProjectCreationMetaResponseModelStatus,
+        ProjectCreationMetaResponseModelType,
+        ProjectExtendedResponseModel,
+        ProjectExtendedResponseModelAccessLevel,
+        ProjectExtendedResponseModelApplyTextNormalization,
+        ProjectExtendedResponseModelFiction,
+        ProjectExtendedResponseModelQualityPreset,
+        ProjectExtendedResponseModelSourceType,
+        ProjectExtendedResponseModelTargetAudience,
+        ProjectResponse,
+        ProjectResponseModelAccessLevel,
+        ProjectResponseModelFiction,
+        ProjectResponseModelSourceType,
+        ProjectResponseModelTargetAudience,
+        ProjectSnapshotExtendedResponseModel,
+        ProjectSnapshotResponse,
+        ProjectSnapshotUploadResponseModel,
+        ProjectSnapshotUploadResponseModelStatus,
+        ProjectSnapshotsResponse,
+        ProjectState,
+        PromptAgent,
+        PromptAgentOverride,
+        PromptAgentOverrideConfig,
+        PromptAgentToolsItem,
+        PromptAgentToolsItem_Client,
+        PromptAgentToolsItem_System,
+        PromptAgentToolsItem_Webhook,
+        PromptEvaluationCriteria,
+        PronunciationDictionaryAliasRuleRequestModel,
+        PronunciationDictionaryPhonemeRuleRequestModel,
+        PronunciationDictionaryVersionLocator,
+        PronunciationDictionaryVersionResponseModel,
+        PydanticPronunciationDictionaryVersionLocator,
+        QueryParamsJsonSchema,
+        RagConfig,
+        RagIndexResponseModel,
+        RagIndexStatus,
+        ReaderResourceResponseModel,
+        ReaderResourceResponseModelResourceType,
+        RecordingResponse,
+        RemovePronunciationDictionaryRulesResponseModel,
+        ResourceAccessInfo,
+        ResourceAccessInfoRole,
+        ReviewStatus,
+        SafetyCommonModel,
+        SafetyEvaluation,
+        SafetyResponseModel,
+        SafetyRule,
+        SecretDependencyType,
+        SegmentCreateResponse,
+        SegmentDeleteResponse,
+        SegmentDubResponse,
+        SegmentTranscriptionResponse,
+        SegmentTranslationResponse,
+        SegmentUpdateResponse,
+        SpeakerSegment,
+        SpeakerTrack,
+        SpeechHistoryItemResponse,
+        SpeechHistoryItemResponseModelSource,
+        SpeechHistoryItemResponseModelVoiceCategory,
+        SpeechToTextCharacterResponseModel,
+        SpeechToTextChunkResponseModel,
+        SpeechToTextWordResponseModel,
+        SpeechToTextWordResponseModelType,
+        StreamingAudioChunkWithTimestampsResponseModel,
+        Subscription,
+        SubscriptionResponse,
+        SubscriptionResponseModelBillingPeriod,
+        SubscriptionResponseModelCharacterRefreshPeriod,
+        SubscriptionResponseModelCurrency,
+        SubscriptionStatus,
+        SubscriptionUsageResponseModel,
+        SystemToolConfig,
+        TelephonyProvider,
+        TextToSpeechAsStreamRequest,
+        TtsConversationalConfig,
+        TtsConversationalConfigOverride,
+        TtsConversationalConfigOverrideConfig,
+        TtsConversationalModel,
+        TtsOptimizeStreamingLatency,
+        TtsOutputFormat,
+        TurnConfig,
+        TurnMode,
+        UpdateWorkspaceMemberResponseModel,
+        UrlAvatar,
+        UsageCharactersResponseModel,
+        User,
+        UserFeedback,
+        UserFeedbackScore,
+        ValidationError,
+        ValidationErrorLocItem,
+        VerificationAttemptResponse,
+        VerifiedVoiceLanguageResponseModel,
+        Voice,
+        VoiceGenerationParameterOptionResponse,
+        VoiceGenerationParameterResponse,
+        VoicePreviewResponseModel,
+        VoicePreviewsResponseModel,
+        VoiceResponseModelCategory,
+        VoiceResponseModelSafetyControl,
+        VoiceSample,
+        VoiceSettings,
+        VoiceSharingModerationCheckResponseModel,
+        VoiceSharingResponse,
+        VoiceSharingResponseModelCategory,
+        VoiceSharingState,
+        VoiceVerificationResponse,
+        WebhookToolApiSchemaConfig,
+        WebhookToolApiSchemaConfigMethod,
+        WebhookToolApiSchemaConfigRequestHeadersValue,
+        WebhookToolConfig,
+        WidgetConfig,
+        WidgetConfigAvatar,
+        WidgetConfigAvatar_Image,
+        WidgetConfigAvatar_Orb,
+        WidgetConfigAvatar_Url,
+        WidgetConfigResponseModel,
+        WidgetConfigResponseModelAvatar,
+        WidgetConfigResponseModelAvatar_Image,
+        WidgetConfigResponseModelAvatar_Orb,
+        WidgetConfigResponseModelAvatar_Url,
+        WidgetExpandable,
+        WidgetFeedbackMode,
+        WorkspaceGroupByNameResponseModel,
+    )
+    from .errors import BadRequestError, ForbiddenError, NotFoundError, TooEarlyError, UnprocessableEntityError
+    from . import (
+        audio_isolation,
+        audio_native,
+        conversational_ai,
+        dubbing,
+        history,
+        models,
+        projects,
+        pronunciation_dictionary,
+        samples,
+        speech_to_speech,
+        speech_to_text,
+        studio,
+        text_to_sound_effects,
+        text_to_speech,
+        text_to_voice,
+        usage,
+        user,
+        voice_generation,
+        voices,
+        workspace,
+    )
+    from .client import AsyncElevenLabs, ElevenLabs
+    from .dubbing import DubbingGetTranscriptForDubRequestFormatType
+    from .environment import ElevenLabsEnvironment
+    from .history import HistoryGetAllRequestSource
+    from .projects import (
+        AddProjectV1ProjectsAddPostRequestApplyTextNormalization,
+        AddProjectV1ProjectsAddPostRequestFiction,
+        AddProjectV1ProjectsAddPostRequestTargetAudience,
+        BodyCreatePodcastV1ProjectsPodcastCreatePostDurationScale,
+        BodyCreatePodcastV1ProjectsPodcastCreatePostMode,
+        BodyCreatePodcastV1ProjectsPodcastCreatePostMode_Bulletin,
+        BodyCreatePodcastV1ProjectsPodcastCreatePostMode_Conversation,
+        BodyCreatePodcastV1ProjectsPodcastCreatePostQualityPreset,
+        BodyCreatePodcastV1ProjectsPodcastCreatePostSource,
+        BodyCreatePodcastV1ProjectsPodcastCreatePostSourceItem,
+        BodyCreatePodcastV1ProjectsPodcastCreatePostSourceItem_Text,
+        BodyCreatePodcastV1ProjectsPodcastCreatePostSourceItem_Url,
+    )
+    from .pronunciation_dictionary import (
+        PronunciationDictionaryAddFromFileRequestWorkspaceAccess,
+        PronunciationDictionaryRule,
+        PronunciationDictionaryRule_Alias,
+        PronunciationDictionaryRule_Phoneme,
+    )
+    from .speech_to_text import SpeechToTextConvertRequestTimestampsGranularity
+    from .studio import (
+        BodyCreatePodcastV1StudioPodcastsPostDurationScale,
+        BodyCreatePodcastV1StudioPodcastsPostMode,
+        BodyCreatePodcastV1StudioPodcastsPostMode_Bulletin,
+        BodyCreatePodcastV1StudioPodcastsPostMode_Conversation,
+        BodyCreatePodcastV1StudioPodcastsPostQualityPreset,
+        BodyCreatePodcastV1StudioPodcastsPostSource,
+        BodyCreatePodcastV1StudioPodcastsPostSourceItem,
+        BodyCreatePodcastV1StudioPodcastsPostSourceItem_Text,
+        BodyCreatePodcastV1StudioPodcastsPostSourceItem_Url,
+    )
+    from .text_to_sound_effects import TextToSoundEffectsConvertRequestOutputFormat
+    from .text_to_speech import (
+        BodyTextToSpeechStreamingV1TextToSpeechVoiceIdStreamPostApplyTextNormalization,
+        BodyTextToSpeechStreamingWithTimestampsV1TextToSpeechVoiceIdStreamWithTimestampsPostApplyTextNormalization,
+        BodyTextToSpeechV1TextToSpeechVoiceIdPostApplyTextNormalization,
+        BodyTextToSpeechWithTimestampsV1TextToSpeechVoiceIdWithTimestampsPostApplyTextNormalization,
+    )
+    from .text_to_voice import TextToVoiceCreatePreviewsRequestOutputFormat
+    from .version import __version__
+    from .voices import VoicesGetSharedRequestCategory
+    from .workspace import BodyUpdateMemberV1WorkspaceMembersPostWorkspaceRole
+_dynamic_imports: typing.Dict[str, str] = {
+    "Accent": ".types",
+    "AddAgentSecretResponseModel": ".types",
+    "AddChapterResponseModel": ".types",
+    "AddKnowledgeBaseResponseModel": ".types",
+    "AddProjectResponseModel": ".types",
+    "AddPronunciationDictionaryResponseModel": ".types",
+    "AddPronunciationDictionaryRulesResponseModel": ".types",
+    "AddSharingVoiceRequest": ".types",
+    "AddVoiceIvcResponseModel": ".types",
+    "AddVoiceResponseModel": ".types",
+    "AddWorkspaceGroupMemberResponseModel": ".types",
+    "AddWorkspaceInviteResponseModel": ".types",
+    "Age": ".types",
+    "AgentBan": ".types",
+    "AgentCallLimits": ".types",
+    "AgentConfigApiModel": ".types",
+    "AgentConfigOverride": ".types",
+    "AgentConfigOverrideConfig": ".types",
+    "AgentMetadataResponseModel": ".types",
+    "AgentPlatformSettingsRequestModel": ".types",
+    "AgentPlatformSettingsResponseModel": ".types",
+    "AgentSummaryResponseModel": ".types",
+    "AllowlistItem": ".types",
+    "ArrayJsonSchemaProperty": ".types",
+    "ArrayJsonSchemaPropertyItems": ".types",
+    "AsrConversationalConfig": ".types",
+    "AsrInputFormat": ".types",
+    "AsrProvider": ".types",
+    "AsrQuality": ".types",
+    "AudioNativeCreateProjectResponseModel": ".types",
+    "AudioNativeEditContentResponseModel": ".types",
+    "AudioNativeProjectSettingsResponseModel": ".types",
+    "AudioWithTimestampsResponseModel": ".types",
+    "AuthSettings": ".types",
+    "AuthorizationMethod": ".types",
+    "BanReasonType": ".types",
+    "BodyAddToKnowledgeBaseV1ConvaiAddToKnowledgeBasePost": ".types",
+    "BodyAddToKnowledgeBaseV1ConvaiAgentsAgentIdAddToKnowledgeBasePost": ".types",
+    "BreakdownTypes": ".types",
+    "ChapterContentBlockExtendableNodeResponseModel": ".types",
+    "ChapterContentBlockInputModel": ".types",
+    "ChapterContentBlockResponseModel": ".types",
+    "ChapterContentBlockResponseModelNodesItem": ".types",
+    "ChapterContentBlockResponseModelNodesItem_Other": ".types",
+    "ChapterContentBlockResponseModelNodesItem_TtsNode": ".types",
+    "ChapterContentBlockTtsNodeResponseModel": ".types",
+    "ChapterContentInputModel": ".types",
+    "ChapterContentParagraphTtsNodeInputModel": ".types",
+    "ChapterContentResponseModel": ".types",
+    "ChapterResponse": ".types",
+    "ChapterSnapshotExtendedResponseModel": ".types",
+    "ChapterSnapshotResponse": ".types",
+    "ChapterSnapshotsResponse": ".types",
+    "ChapterState": ".types",
+    "ChapterStatisticsResponse": ".types",
+    "ChapterWithContentResponseModel": ".types",
+    "ChapterWithContentResponseModelState": ".types",
+    "CharacterAlignmentModel": ".types",
+    "CharacterAlignmentResponseModel": ".types",
+    "ClientEvent": ".types",
+    "ClientToolConfig": ".types",
+    "ConvAiSecretLocator": ".types",
+    "ConvAiStoredSecretDependencies": ".types",
+    "ConvAiStoredSecretDependenciesAgentToolsItem": ".types",
+    "ConvAiStoredSecretDependenciesAgentToolsItem_Available": ".types",
+    "ConvAiStoredSecretDependenciesAgentToolsItem_Unknown": ".types",
+    "ConvAiStoredSecretDependenciesToolsItem": ".types",
+    "ConvAiStoredSecretDependenciesToolsItem_Available": ".types",
+    "ConvAiStoredSecretDependenciesToolsItem_Unknown": ".types",
+    "ConvAiWebhooks": ".types",
+    "ConvAiWorkspaceStoredSecretConfig": ".types",
+    "ConversationChargingCommonModel": ".types",
+    "ConversationConfig": ".types",
+    "ConversationConfigClientOverride": ".types",
+    "ConversationConfigClientOverrideConfig": ".types",
+    "ConversationDeletionSettings": ".types",
+    "ConversationHistoryAnalysisCommonModel": ".types",
+    "ConversationHistoryEvaluationCriteriaResultCommonModel": ".types",
+    "ConversationHistoryFeedbackCommonModel": ".types",
+    "ConversationHistoryMetadataCommonModel": ".types",
+    "ConversationHistoryTranscriptCommonModel": ".types",
+    "ConversationHistoryTranscriptCommonModelRole": ".types",
+    "ConversationHistoryTranscriptToolCallCommonModel": ".types",
+    "ConversationHistoryTranscriptToolResultCommonModel": ".types",
+    "ConversationInitiationClientData": ".types",
+    "ConversationInitiationClientDataConfig": ".types",
+    "ConversationInitiationClientDataDynamicVariablesValue": ".types",
+    "ConversationInitiationClientDataWebhook": ".types",
+    "ConversationInitiationClientDataWebhookRequestHeadersValue": ".types",
+    "ConversationSignedUrlResponseModel": ".types",
+    "ConversationSummaryResponseModel": ".types",
+    "ConversationSummaryResponseModelStatus": ".types",
+    "ConversationTokenDbModel": ".types",
+    "ConversationTokenPurpose": ".types",
+    "ConversationalConfigApiModel": ".types",
+    "ConvertChapterResponseModel": ".types",
+    "ConvertProjectResponseModel": ".types",
+    "CreateAgentResponseModel": ".types",
+    "CreateAudioNativeProjectRequest": ".types",
+    "CreatePhoneNumberResponseModel": ".types",
+    "CreatePronunciationDictionaryResponseModel": ".types",
+    "Currency": ".types",
+    "CustomLlm": ".types",
+    "DataCollectionResultCommonModel": ".types",
+    "DeleteChapterResponseModel": ".types",
+    "DeleteDubbingResponseModel": ".types",
+    "DeleteHistoryItemResponse": ".types",
+    "DeleteProjectResponseModel": ".types",
+    "DeleteSampleResponseModel": ".types",
+    "DeleteVoiceResponseModel": ".types",
+    "DeleteWorkspaceGroupMemberResponseModel": ".types",
+    "DeleteWorkspaceInviteResponseModel": ".types",
+    "DependentAvailableAgentIdentifier": ".types",
+    "DependentAvailableAgentIdentifierAccessLevel": ".types",
+    "DependentAvailableAgentToolIdentifier": ".types",
+    "DependentAvailableAgentToolIdentifierAccessLevel": ".types",
+    "DependentAvailableToolIdentifier": ".types",
+    "DependentAvailableToolIdentifierAccessLevel": ".types",
+    "DependentPhoneNumberIdentifier": ".types",
+    "DependentUnknownAgentIdentifier": ".types",
+    "DependentUnknownAgentToolIdentifier": ".types",
+    "DependentUnknownToolIdentifier": ".types",
+    "DoDubbingResponse": ".types",
+    "DocumentUsageModeEnum": ".types",
+    "DubbedSegment": ".types",
+    "DubbingMediaMetadata": ".types",
+    "DubbingMediaReference": ".types",
+    "DubbingMetadataResponse": ".types",
+    "DubbingResource": ".types",
+    "DynamicVariablesConfig": ".types",
+    "DynamicVariablesConfigDynamicVariablePlaceholdersValue": ".types",
+    "EditChapterResponseModel": ".types",
+    "EditProjectResponseModel": ".types",
+    "EditVoiceResponseModel": ".types",
+    "EditVoiceSettingsResponseModel": ".types",
+    "EmbedVariant": ".types",
+    "EmbeddingModelEnum": ".types",
+    "EvaluationSettings": ".types",
+    "EvaluationSuccessResult": ".types",
+    "ExtendedSubscriptionResponseModelBillingPeriod": ".types",
+    "ExtendedSubscriptionResponseModelCharacterRefreshPeriod": ".types",
+    "ExtendedSubscriptionResponseModelCurrency": ".types",
+    "FeedbackItem": ".types",
+    "FineTuningResponse": ".types",
+    "FineTuningResponseModelStateValue": ".types",
+    "Gender": ".types",
+    "GetAgentEmbedResponseModel": ".types",
+    "GetAgentLinkResponseModel": ".types",
+    "GetAgentResponseModel": ".types",
+    "GetAgentsPageResponseModel": ".types",
+    "GetAudioNativeProjectSettingsResponseModel": ".types",
+    "GetChaptersResponse": ".types",
+    "GetConvAiSettingsResponseModel": ".types",
+    "GetConversationResponseModel": ".types",
+    "GetConversationResponseModelStatus": ".types",
+    "GetConversationsPageResponseModel": ".types",
+    "GetKnowledgeBaseDependentAgentsResponseModel": ".types",
+    "GetKnowledgeBaseDependentAgentsResponseModelAgentsItem": ".types",
+    "GetKnowledgeBaseDependentAgentsResponseModelAgentsItem_Available": ".types",
+    "GetKnowledgeBaseDependentAgentsResponseModelAgentsItem_Unknown": ".types",
+    "GetKnowledgeBaseListResponseModel": ".types",
+    "GetKnowledgeBaseResponseModel": ".types",
+    "GetKnowledgeBaseResponseModelAccessLevel": ".types",
+    "GetKnowledgeBaseResponseModelType": ".types",
+    "GetKnowledgeBaseSummaryResponseModel": ".types",
+    "GetKnowledgeBaseSummaryResponseModelAccessLevel": ".types",
+    "GetKnowledgeBaseSummaryResponseModelDependentAgentsItem": ".types",
+    "GetKnowledgeBaseSummaryResponseModelDependentAgentsItem_Available": ".types",
+    "GetKnowledgeBaseSummaryResponseModelDependentAgentsItem_Unknown": ".types",
+    "GetKnowledgeBaseSummaryResponseModelType": ".types",
+    "GetLibraryVoicesResponse": ".types",
+    "GetPhoneNumberResponseModel": ".types",
+    "GetProjectsResponse": ".types",
+    "GetPronunciationDictionariesMetadataResponseModel": ".types",
+    "GetPronunciationDictionaryMetadataResponse": ".types",
+    "GetSpeechHistoryResponse": ".types",
+    "GetVoicesResponse": ".types",
+    "GetWorkspaceSecretsResponseModel": ".types",
+    "HistoryAlignmentResponseModel": ".types",
+    "HistoryAlignmentsResponseModel": ".types",
+    "HistoryItem": ".types",
+    "HttpValidationError": ".types",
+    "ImageAvatar": ".types",
+    "Invoice": ".types",
+    "KnowledgeBaseDocumentMetadataResponseModel": ".types",
+    "KnowledgeBaseLocator": ".types",
+    "KnowledgeBaseLocatorType": ".types",
+    "LanguageAddedResponse": ".types",
+    "LanguagePreset": ".types",
+    "LanguagePresetTranslation": ".types",
+    "LanguageResponse": ".types",
+    "LibraryVoiceResponse": ".types",
+    "LibraryVoiceResponseModelCategory": ".types",
+    "LiteralJsonSchemaProperty": ".types",
+    "LiteralJsonSchemaPropertyType": ".types",
+    "Llm": ".types",
+    "ManualVerificationFileResponse": ".types",
+    "ManualVerificationResponse": ".types",
+    "Model": ".types",
+    "ModelRatesResponseModel": ".types",
+    "ModelResponseModelConcurrencyGroup": ".types",
+    "ModerationStatusResponseModel": ".types",
+    "ModerationStatusResponseModelSafetyStatus": ".types",
+    "ModerationStatusResponseModelWarningStatus": ".types",
+    "ObjectJsonSchemaProperty": ".types",
+    "ObjectJsonSchemaPropertyPropertiesValue": ".types",
+    "OrbAvatar": ".types",
+    "OutputFormat": ".types",
+    "PhoneNumberAgentInfo": ".types",
+    "PodcastBulletinMode": ".types",
+    "PodcastBulletinModeData": ".types",
+    "PodcastConversationMode": ".types",
+    "PodcastConversationModeData": ".types",
+    "PodcastProjectResponseModel": ".types",
+    "PodcastTextSource": ".types",
+    "PodcastUrlSource": ".types",
+    "PostAgentAvatarResponseModel": ".types",
+    "PostWorkspaceSecretResponseModel": ".types",
+    "PrivacyConfig": ".types",
+    "ProfilePageResponseModel": ".types",
+    "ProjectCreationMetaResponseModel": ".types",
+    "ProjectCreationMetaResponseModelStatus": ".types",
+    "ProjectCreationMetaResponseModelType": ".types",
+    "ProjectExtendedResponseModel": ".types",
+    "ProjectExtendedResponseModelAccessLevel": ".types",
+    "ProjectExtendedResponseModelApplyTextNormalization": ".types",
+    "ProjectExtendedResponseModelFiction": ".types",
+    "ProjectExtendedResponseModelQualityPreset": ".types",
+    "ProjectExtendedResponseModelSourceType": ".types",
+    "ProjectExtendedResponseModelTargetAudience": ".types",
+    "ProjectResponse": ".types",
+    "ProjectResponseModelAccessLevel": ".types",
+    "ProjectResponseModelFiction": ".types",
+    "ProjectResponseModelSourceType": ".types",
+    "ProjectResponseModelTargetAudience": ".types",
+    "ProjectSnapshotExtendedResponseModel": ".types",
+    "ProjectSnapshotResponse": ".types",
+    "ProjectSnapshotUploadResponseModel": ".types",
+    "ProjectSnapshotUploadResponseModelStatus": ".types",
+    "ProjectSnapshotsResponse": ".types",
+    "ProjectState": ".types",
+    "PromptAgent": ".types",
+    "PromptAgentOverride": ".types",
+    "PromptAgentOverrideConfig": ".types",
+    "PromptAgentToolsItem": ".types",
+    "PromptAgentToolsItem_Client": ".types",
+    "PromptAgentToolsItem_System": ".types",
+    "PromptAgentToolsItem_Webhook": ".types",
+    "PromptEvaluationCriteria": ".types",
+    "PronunciationDictionaryAliasRuleRequestModel": ".types",
+    "PronunciationDictionaryPhonemeRuleRequestModel": ".types",
+    "PronunciationDictionaryVersionLocator": ".types",
+    "PronunciationDictionaryVersionResponseModel": ".types",
+    "PydanticPronunciationDictionaryVersionLocator": ".types",
+    "QueryParamsJsonSchema": ".types",
+    "RagConfig": ".types",
+    "RagIndexResponseModel": ".types",
+    "RagIndexStatus": ".types",
+    "ReaderResourceResponseModel": ".types",
+    "ReaderResourceResponseModelResourceType": ".types",
+    "RecordingResponse": ".types",
+    "RemovePronunciationDictionaryRulesResponseModel": ".types",
+    "ResourceAccessInfo": ".types",
+    "ResourceAccessInfoRole": ".types",
+    "ReviewStatus": ".types",
+    "SafetyCommonModel": ".types",
+    "SafetyEvaluation": ".types",
+    "SafetyResponseModel": ".types",
+    "SafetyRule": ".types",
+    "SecretDependencyType": ".types",
+    "SegmentCreateResponse": ".types",
+    "SegmentDeleteResponse": ".types",
+    "SegmentDubResponse": ".types",
+    "SegmentTranscriptionResponse": ".types",
+    "SegmentTranslationResponse": ".types",
+    "SegmentUpdateResponse": ".types",
+    "SpeakerSegment": ".types",
+    "SpeakerTrack": ".types",
+    "SpeechHistoryItemResponse": ".types",
+    "SpeechHistoryItemResponseModelSource": ".types",
+    "SpeechHistoryItemResponseModelVoiceCategory": ".types",
+    "SpeechToTextCharacterResponseModel": ".types",
+    "SpeechToTextChunkResponseModel": ".types",
+    "SpeechToTextWordResponseModel": ".types",
+    "SpeechToTextWordResponseModelType": ".types",
+    "StreamingAudioChunkWithTimestampsResponseModel": ".types",
+    "Subscription": ".types",
+    "SubscriptionResponse": ".types",
+    "SubscriptionResponseModelBillingPeriod": ".types",
+    "SubscriptionResponseModelCharacterRefreshPeriod": ".types",
+    "SubscriptionResponseModelCurrency": ".types",
+    "SubscriptionStatus": ".types",
+    "SubscriptionUsageResponseModel": ".types",
+    "SystemToolConfig": ".types",
+    "TelephonyProvider": ".types",
+    "TextToSpeechAsStreamRequest": ".types",
+    "TtsConversationalConfig": ".types",
+    "TtsConversationalConfigOverride": ".types",
+    "TtsConversationalConfigOverrideConfig": ".types",
+    "TtsConversationalModel": ".types",
+    "TtsOptimizeStreamingLatency": ".types",
+    "TtsOutputFormat": ".types",
+    "TurnConfig": ".types",
+    "TurnMode": ".types",
+    "UpdateWorkspaceMemberResponseModel": ".types",
+    "UrlAvatar": ".types",
+    "UsageCharactersResponseModel": ".types",
+    "User": ".types",
+    "UserFeedback": ".types",
+    "UserFeedbackScore": ".types",
+    "ValidationError": ".types",
+    "ValidationErrorLocItem": ".types",
+    "VerificationAttemptResponse": ".types",
+    "VerifiedVoiceLanguageResponseModel": ".types",
+    "Voice": ".types",
+    "VoiceGenerationParameterOptionResponse": ".types",
+    "VoiceGenerationParameterResponse": ".types",
+    "VoicePreviewResponseModel": ".types",
+    "VoicePreviewsResponseModel": ".types",
+    "VoiceResponseModelCategory": ".types",
+    "VoiceResponseModelSafetyControl": ".types",
+    "VoiceSample": ".types",
+    "VoiceSettings": ".types",
+    "VoiceSharingModerationCheckResponseModel": ".types",
+    "VoiceSharingResponse": ".types",
+    "VoiceSharingResponseModelCategory": ".types",
+    "VoiceSharingState": ".types",
+    "VoiceVerificationResponse": ".types",
+    "WebhookToolApiSchemaConfig": ".types",
+    "WebhookToolApiSchemaConfigMethod": ".types",
+    "WebhookToolApiSchemaConfigRequestHeadersValue": ".types",
+    "WebhookToolConfig": ".types",
+    "WidgetConfig": ".types",
+    "WidgetConfigAvatar": ".types",
+    "WidgetConfigAvatar_Image": ".types",
+    "WidgetConfigAvatar_Orb": ".types",
+    "WidgetConfigAvatar_Url": ".types",
+    "WidgetConfigResponseModel": ".types",
+    "WidgetConfigResponseModelAvatar": ".types",
+    "WidgetConfigResponseModelAvatar_Image": ".types",
+    "WidgetConfigResponseModelAvatar_Orb": ".types",
+    "WidgetConfigResponseModelAvatar_Url": ".types",
+    "WidgetExpandable": ".types",
+    "WidgetFeedbackMode": ".types",
+    "WorkspaceGroupByNameResponseModel": ".types",
+    "BadRequestError": ".errors",
+    "ForbiddenError": ".errors",
+    "NotFoundError": ".errors",
+    "TooEarlyError": ".errors",
+    "UnprocessableEntityError": ".errors",
+    "audio_isolation": ".audio_isolation",
+    "audio_native": ".audio_native",
+    "conversational_ai": ".conversational_ai",
+    "dubbing": ".dubbing",
+    "history": ".history",
+    "models": ".models",
+    "projects": ".projects",
+    "pronunciation_dictionary": ".pronunciation_dictionary",
+    "samples": ".samples",
+    "speech_to_speech": ".speech_to_speech",
+    "speech_to_text": ".speech_to_text",
+    "studio": ".studio",
+    "text_to_sound_effects": ".text_to_sound_effects",
+    "text_to_speech": ".text_to_speech",
+    "text_to_voice": ".text_to_voice",
+    "usage": ".usage",
+    "user": ".user",
+    "voice_generation": ".voice_generation",
+    "voices": ".voices",
+    "workspace": ".workspace",
+    "AsyncElevenLabs": ".client",
+    "ElevenLabs": ".client",
+    "DubbingGetTranscriptForDubRequestFormatType": ".dubbing",
+    "ElevenLabsEnvironment": ".environment",
+    "HistoryGetAllRequestSource": ".history",
+    "AddProjectV1ProjectsAddPostRequestApplyTextNormalization": ".projects",
+    "AddProjectV1ProjectsAddPostRequestFiction": ".projects",
+    "AddProjectV1ProjectsAddPostRequestTargetAudience": ".projects",
+    "BodyCreatePodcastV1ProjectsPodcastCreatePostDurationScale": ".projects",
+    "BodyCreatePodcastV1ProjectsPodcastCreatePostMode": ".projects",
+    "BodyCreatePodcastV1ProjectsPodcastCreatePostMode_Bulletin": ".projects",
+    "BodyCreatePodcastV1ProjectsPodcastCreatePostMode_Conversation": ".projects",
+    "BodyCreatePodcastV1ProjectsPodcastCreatePostQualityPreset": ".projects",
+    "BodyCreatePodcastV1ProjectsPodcastCreatePostSource": ".projects",
+    "BodyCreatePodcastV1ProjectsPodcastCreatePostSourceItem": ".projects",
+    "BodyCreatePodcastV1ProjectsPodcastCreatePostSourceItem_Text": ".projects",
+    "BodyCreatePodcastV1ProjectsPodcastCreatePostSourceItem_Url": ".projects",
+    "PronunciationDictionaryAddFromFileRequestWorkspaceAccess": ".pronunciation_dictionary",
+    "PronunciationDictionaryRule": ".pronunciation_dictionary",
+    "PronunciationDictionaryRule_Alias": ".pronunciation_dictionary",
+    "PronunciationDictionaryRule_Phoneme": ".pronunciation_dictionary",
+    "SpeechToTextConvertRequestTimestampsGranularity": ".speech_to_text",
+    "BodyCreatePodcastV1StudioPodcastsPostDurationScale": ".studio",
+    "BodyCreatePodcastV1StudioPodcastsPostMode": ".studio",
+    "BodyCreatePodcastV1StudioPodcastsPostMode_Bulletin": ".studio",
+    "BodyCreatePodcastV1StudioPodcastsPostMode_Conversation": ".studio",
+    "BodyCreatePodcastV1StudioPodcastsPostQualityPreset": ".studio",
+    "BodyCreatePodcastV1StudioPodcastsPostSource": ".studio",
+    "BodyCreatePodcastV1StudioPodcastsPostSourceItem": ".studio",
+    "BodyCreatePodcastV1StudioPodcastsPostSourceItem_Text": ".studio",
+    "BodyCreatePodcastV1StudioPodcastsPostSourceItem_Url": ".studio",
+    "TextToSoundEffectsConvertRequestOutputFormat": ".text_to_sound_effects",
+    "BodyTextToSpeechStreamingV1TextToSpeechVoiceIdStreamPostApplyTextNormalization": ".text_to_speech",
+    "BodyTextToSpeechStreamingWithTimestampsV1TextToSpeechVoiceIdStreamWithTimestampsPostApplyTextNormalization": ".text_to_speech",
+    "BodyTextToSpeechV1TextToSpeechVoiceIdPostApplyTextNormalization": ".text_to_speech",
+    "BodyTextToSpeechWithTimestampsV1TextToSpeechVoiceIdWithTimestampsPostApplyTextNormalization": ".text_to_speech",
+    "TextToVoiceCreatePreviewsRequestOutputFormat": ".text_to_voice",
+    "__version__": ".version",
+    "VoicesGetSharedRequestCategory": ".voices",
+    "BodyUpdateMemberV1WorkspaceMembersPostWorkspaceRole": ".workspace",
+}
+_submodules = frozenset(
+    (
+        "audio_isolation",
+        "audio_native",
+        "conversational_ai",
+        "dubbing",
+        "history",
+        "models",
+        "projects",
+        "pronunciation_dictionary",
+        "samples",
+        "speech_to_speech",
+        "speech_to_text",
+        "studio",
+        "text_to_sound_effects",
+        "text_to_speech",
+        "text_to_voice",
+        "usage",
+        "user",
+        "voice_generation",
+        "voices",
+        "workspace",
+    )
 )
-from .text_to_voice import TextToVoiceCreatePreviewsRequestOutputFormat
-from .version import __version__
-from .voices import VoicesGetSharedRequestCategory
-from .workspace import BodyUpdateMemberV1WorkspaceMembersPostWorkspaceRole
+
+
+def __getattr__(attr_name: str) -> typing.Any:
+    module_name = _dynamic_imports.get(attr_name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {attr_name!r}")
+    module = import_module(module_name, __package__)
+    value = module if attr_name in _submodules else getattr(module, attr_name)
+    # Cached so that later lookups no longer go through __getattr__.
+    globals()[attr_name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted({*globals(), *_dynamic_imports})
+
 
 __all__ = [
     "Accent",
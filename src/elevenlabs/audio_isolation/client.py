@@ -4,6 +4,7 @@ import typing
 from ..core.client_wrapper import SyncClientWrapper
 from .. import core
 from ..core.request_options import RequestOptions
+from ..core.download import get_chunk_size
 from ..errors.unprocessable_entity_error import UnprocessableEntityError
 from ..types.http_validation_error import HttpValidationError
 from ..core.unchecked_base_model import construct_type
@@ -50,7 +51,7 @@ class AudioIsolationClient:
         ) as _response:
             try:
                 if 200 <= _response.status_code < 300:
-                    _chunk_size = request_options.get("chunk_size", 1024) if request_options is not None else 1024
+                    _chunk_size = get_chunk_size(request_options)
                     for _chunk in _response.iter_bytes(chunk_size=_chunk_size):
                         yield _chunk
                     return
@@ -101,7 +102,7 @@ class AudioIsolationClient:
         ) as _response:
             try:
                 if 200 <= _response.status_code < 300:
-                    _chunk_size = request_options.get("chunk_size", 1024) if request_options is not None else 1024
+                    _chunk_size = get_chunk_size(request_options)
                     for _chunk in _response.iter_bytes(chunk_size=_chunk_size):
                         yield _chunk
                     return
@@ -157,7 +158,7 @@ class AsyncAudioIsolationClient:
         ) as _response:
             try:
                 if 200 <= _response.status_code < 300:
-                    _chunk_size = request_options.get("chunk_size", 1024) if request_options is not None else 1024
+                    _chunk_size = get_chunk_size(request_options)
                     async for _chunk in _response.aiter_bytes(chunk_size=_chunk_size):
                         yield _chunk
                     return
@@ -208,7 +209,7 @@ class AsyncAudioIsolationClient:
         ) as _response:
             try:
                 if 200 <= _response.status_code < 300:
-                    _chunk_size = request_options.get("chunk_size", 1024) if request_options is not None else 1024
+                    _chunk_size = get_chunk_size(request_options)
                     async for _chunk in _response.aiter_bytes(chunk_size=_chunk_size):
                         yield _chunk
                     return
@@ -4,48 +4,42 @@ import typing
 from .environment import ElevenLabsEnvironment
 import os
 import httpx
+from .core.api_key_pool import ApiKeyPool
+from .core.circuit_breaker import CircuitBreaker
 from .core.client_wrapper import SyncClientWrapper
-from .history.client import HistoryClient
-from .text_to_sound_effects.client import TextToSoundEffectsClient
-from .audio_isolation.client import AudioIsolationClient
-from .samples.client import SamplesClient
-from .text_to_speech.client import TextToSpeechClient
-from .speech_to_speech.client import SpeechToSpeechClient
-from .voice_generation.client import VoiceGenerationClient
-from .text_to_voice.client import TextToVoiceClient
-from .user.client import UserClient
-from .voices.client import VoicesClient
-from .studio.client import StudioClient
-from .projects.client import ProjectsClient
-from .dubbing.client import DubbingClient
-from .models.client import ModelsClient
-from .audio_native.client import AudioNativeClient
-from .usage.client import UsageClient
-from .pronunciation_dictionary.client import PronunciationDictionaryClient
-from .workspace.client import WorkspaceClient
-from .speech_to_text.client import SpeechToTextClient
-from .conversational_ai.client import ConversationalAiClient
+from .core.connection_pool import ConnectionPoolOptions, build_async_httpx_client, build_httpx_client
+from .core.environment_selector import EnvironmentSelector
+from .core.hedging_policy import HedgingPolicy
+from .core.metrics import MetricsRegistry
+from .core.rate_limiter import RateLimiter
+from .core.request_coalescer import RequestCoalescer
+from .core.request_timing import RequestTimingHook
+from .core.response_cache import ResponseCache
+from .core.retry_policy import RetryPolicy
+from .core.timeouts import TimeoutOptions
 from .core.client_wrapper import AsyncClientWrapper
-from .history.client import AsyncHistoryClient
-from .text_to_sound_effects.client import AsyncTextToSoundEffectsClient
-from .audio_isolation.client import AsyncAudioIsolationClient
-from .samples.client import AsyncSamplesClient
-from .text_to_speech.client import AsyncTextToSpeechClient
-from .speech_to_speech.client import AsyncSpeechToSpeechClient
-from .voice_generation.client import AsyncVoiceGenerationClient
-from .text_to_voice.client import AsyncTextToVoiceClient
-from .user.client import AsyncUserClient
-from .voices.client import AsyncVoicesClient
-from .studio.client import AsyncStudioClient
-from .projects.client import AsyncProjectsClient
-from .dubbing.client import AsyncDubbingClient
-from .models.client import AsyncModelsClient
-from .audio_native.client import AsyncAudioNativeClient
-from .usage.client import AsyncUsageClient
-from .pronunciation_dictionary.client import AsyncPronunciationDictionaryClient
-from .workspace.client import AsyncWorkspaceClient
-from .speech_to_text.client import AsyncSpeechToTextClient
-from .conversational_ai.client import AsyncConversationalAiClient
+
+if typing.TYPE_CHECKING:
+    from .history.client import AsyncHistoryClient, HistoryClient
+    from .text_to_sound_effects.client import AsyncTextToSoundEffectsClient, TextToSoundEffectsClient
+    from .audio_isolation.client import AsyncAudioIsolationClient, AudioIsolationClient
+    from .samples.client import AsyncSamplesClient, SamplesClient
+    from .text_to_speech.client import AsyncTextToSpeechClient, TextToSpeechClient
+    from .speech_to_speech.client import AsyncSpeechToSpeechClient, SpeechToSpeechClient
+    from .voice_generation.client import AsyncVoiceGenerationClient, VoiceGenerationClient
+    from .text_to_voice.client import AsyncTextToVoiceClient, TextToVoiceClient
+    from .user.client import AsyncUserClient, UserClient
+    from .voices.client import AsyncVoicesClient, VoicesClient
+    from .studio.client import AsyncStudioClient, StudioClient
+    from .projects.client import AsyncProjectsClient, ProjectsClient
+    from .dubbing.client import AsyncDubbingClient, DubbingClient
+    from .models.client import AsyncModelsClient, ModelsClient
+    from .audio_native.client import AsyncAudioNativeClient, AudioNativeClient
+    from .usage.client import AsyncUsageClient, UsageClient
+    from .pronunciation_dictionary.client import AsyncPronunciationDictionaryClient, PronunciationDictionaryClient
+    from .workspace.client import AsyncWorkspaceClient, WorkspaceClient
+    from .speech_to_text.client import AsyncSpeechToTextClient, SpeechToTextClient
+    from .conversational_ai.client import AsyncConversationalAiClient, ConversationalAiClient
 
 
 class BaseElevenLabs:
@@ -70,12 +64,51 @@ class BaseElevenLabs:
     timeout : typing.Optional[float]
         The timeout to be used, in seconds, for requests. By default the timeout is 60 seconds, unless a custom httpx client is used, in which case this default is not enforced.
 
+    timeouts : typing.Optional[TimeoutOptions]
+        Separate connect, read, write and pool timeouts falling back to `timeout`, and an idle timeout between the chunks of streamed responses, e.g. `{"connect_in_seconds": 2, "stream_idle_in_seconds": 5}`.
+
     follow_redirects : typing.Optional[bool]
         Whether the default httpx client follows redirects or not, this is irrelevant if a custom httpx client is passed in.
 
     httpx_client : typing.Optional[httpx.Client]
         The httpx client to use for making requests, a preconfigured client is used by default, however this is useful should you want to pass in any custom httpx configuration.
 
+    connection_pool : typing.Optional[ConnectionPoolOptions]
+        Connection pool configuration (connection limits, keep-alive, HTTP/2 and pool timeout) for the default httpx client. Only the pool timeout applies if a custom httpx client is passed in.
+
+    retry_policy : typing.Optional[RetryPolicy]
+        The retry policy (backoff, retried status codes and transport errors, retry budget) applied to every request. By default requests are only retried when `max_retries` is set in the request options.
+
+    hedging_policy : typing.Optional[HedgingPolicy]
+        Enables hedging of streaming requests such as `text_to_speech.convert_as_stream`: a duplicate request is sent when the first one has not produced audio within the hedging delay, and the slower one is cancelled. Disabled by default.
+
+    rate_limiter : typing.Optional[RateLimiter]
+        Client-side concurrency and rate limits applied to every request, requests over the limits wait instead of being rejected by the API. Pass the same limiter to several clients to share the limits between them. Disabled by default.
+
+    request_coalescer : typing.Optional[RequestCoalescer]
+        Enables coalescing of identical concurrent GET requests, which then share a single round-trip and response. Disabled by default.
+
+    response_cache : typing.Optional[ResponseCache]
+        Caches responses of read-mostly endpoints such as `models.get_all` and `voices.get_settings`, e.g. `InMemoryResponseCache()`. Mutating requests made through the client invalidate the affected responses. Disabled by default.
+
+    timing_hooks : typing.Optional[typing.Sequence[RequestTimingHook]]
+        Callables receiving a `RequestTiming` record (endpoint, status, retries, bytes and the duration of each phase) for every request. More hooks can be registered later with `client._client_wrapper.add_timing_hook`.
+
+    metrics : typing.Optional[MetricsRegistry]
+        A metrics registry recording latency histograms, retries, rate limited responses, errors, in-flight requests and open websockets, which can be rendered in the Prometheus text format. Disabled by default.
+
+    circuit_breaker : typing.Optional[CircuitBreaker]
+        Per endpoint family circuit breakers, e.g. for `v1/dubbing` or `v1/speech-to-text`: once a family fails or slows down past the thresholds, its requests raise `CircuitOpenError` right away until probe requests succeed again. Disabled by default.
+
+    api_key_pool : typing.Optional[ApiKeyPool]
+        Spreads requests over several API keys, picking for each attempt the key with the most remaining character quota per request in flight and moving away from keys answering with 429 or 401. Takes precedence over `api_key`.
+
+    environment_selector : typing.Optional[EnvironmentSelector]
+        Probes the `ElevenLabsEnvironment`s when the client is created and periodically after that, and sends REST and websocket requests to the lowest-latency healthy one, failing over on connection errors. Takes precedence over `environment` and `base_url`.
+
+    validate_responses : bool
+        Validates successful JSON responses against their models with pydantic, decoding and validating the response bytes in one pass with pydantic-core on pydantic v2, instead of constructing the models without validation. Responses that do not match their model raise `pydantic.ValidationError`. Disabled by default.
+
     Examples
     --------
     from elevenlabs import ElevenLabs
@@ -92,8 +125,21 @@ class BaseElevenLabs:
         environment: ElevenLabsEnvironment = ElevenLabsEnvironment.PRODUCTION,
         api_key: typing.Optional[str] = os.getenv("ELEVENLABS_API_KEY"),
         timeout: typing.Optional[float] = None,
+        timeouts: typing.Optional[TimeoutOptions] = None,
         follow_redirects: typing.Optional[bool] = True,
         httpx_client: typing.Optional[httpx.Client] = None,
+        connection_pool: typing.Optional[ConnectionPoolOptions] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        hedging_policy: typing.Optional[HedgingPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        request_coalescer: typing.Optional[RequestCoalescer] = None,
+        response_cache: typing.Optional[ResponseCache] = None,
+        timing_hooks: typing.Optional[typing.Sequence[RequestTimingHook]] = None,
+        metrics: typing.Optional[MetricsRegistry] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        api_key_pool: typing.Optional[ApiKeyPool] = None,
+        environment_selector: typing.Optional[EnvironmentSelector] = None,
+        validate_responses: bool = False,
     ):
         _defaulted_timeout = timeout if timeout is not None else 60 if httpx_client is None else None
         self._client_wrapper = SyncClientWrapper(
@@ -101,31 +147,284 @@ class BaseElevenLabs:
             api_key=api_key,
             httpx_client=httpx_client
             if httpx_client is not None
-            else httpx.Client(timeout=_defaulted_timeout, follow_redirects=follow_redirects)
-            if follow_redirects is not None
-            else httpx.Client(timeout=_defaulted_timeout),
+            else build_httpx_client(
+                timeout=_defaulted_timeout, follow_redirects=follow_redirects, connection_pool=connection_pool
+            ),
             timeout=_defaulted_timeout,
+            timeouts=timeouts,
+            connection_pool=connection_pool,
+            retry_policy=retry_policy,
+            hedging_policy=hedging_policy,
+            rate_limiter=rate_limiter,
+            request_coalescer=request_coalescer,
+            response_cache=response_cache,
+            timing_hooks=timing_hooks,
+            metrics=metrics,
+            circuit_breaker=circuit_breaker,
+            api_key_pool=api_key_pool,
+            environment_selector=environment_selector,
+            validate_responses=validate_responses,
         )
-        self.history = HistoryClient(client_wrapper=self._client_wrapper)
-        self.text_to_sound_effects = TextToSoundEffectsClient(client_wrapper=self._client_wrapper)
-        self.audio_isolation = AudioIsolationClient(client_wrapper=self._client_wrapper)
-        self.samples = SamplesClient(client_wrapper=self._client_wrapper)
-        self.text_to_speech = TextToSpeechClient(client_wrapper=self._client_wrapper)
-        self.speech_to_speech = SpeechToSpeechClient(client_wrapper=self._client_wrapper)
-        self.voice_generation = VoiceGenerationClient(client_wrapper=self._client_wrapper)
-        self.text_to_voice = TextToVoiceClient(client_wrapper=self._client_wrapper)
-        self.user = UserClient(client_wrapper=self._client_wrapper)
-        self.voices = VoicesClient(client_wrapper=self._client_wrapper)
-        self.studio = StudioClient(client_wrapper=self._client_wrapper)
-        self.projects = ProjectsClient(client_wrapper=self._client_wrapper)
-        self.dubbing = DubbingClient(client_wrapper=self._client_wrapper)
-        self.models = ModelsClient(client_wrapper=self._client_wrapper)
-        self.audio_native = AudioNativeClient(client_wrapper=self._client_wrapper)
-        self.usage = UsageClient(client_wrapper=self._client_wrapper)
-        self.pronunciation_dictionary = PronunciationDictionaryClient(client_wrapper=self._client_wrapper)
-        self.workspace = WorkspaceClient(client_wrapper=self._client_wrapper)
-        self.speech_to_text = SpeechToTextClient(client_wrapper=self._client_wrapper)
-        self.conversational_ai = ConversationalAiClient(client_wrapper=self._client_wrapper)
+        self._history: typing.Optional[HistoryClient] = None
+        self._text_to_sound_effects: typing.Optional[TextToSoundEffectsClient] = None
+        self._audio_isolation: typing.Optional[AudioIsolationClient] = None
+        self._samples: typing.Optional[SamplesClient] = None
+        self._text_to_speech: typing.Optional[TextToSpeechClient] = None
+        self._speech_to_speech: typing.Optional[SpeechToSpeechClient] = None
+        self._voice_generation: typing.Optional[VoiceGenerationClient] = None
+        self._text_to_voice: typing.Optional[TextToVoiceClient] = None
+        self._user: typing.Optional[UserClient] = None
+        self._voices: typing.Optional[VoicesClient] = None
+        self._studio: typing.Optional[StudioClient] = None
+        self._projects: typing.Optional[ProjectsClient] = None
+        self._dubbing: typing.Optional[DubbingClient] = None
+        self._models: typing.Optional[ModelsClient] = None
+        self._audio_native: typing.Optional[AudioNativeClient] = None
+        self._usage: typing.Optional[UsageClient] = None
+        self._pronunciation_dictionary: typing.Optional[PronunciationDictionaryClient] = None
+        self._workspace: typing.Optional[WorkspaceClient] = None
+        self._speech_to_text: typing.Optional[SpeechToTextClient] = None
+        self._conversational_ai: typing.Optional[ConversationalAiClient] = None
+
+    @property
+    def history(self) -> "HistoryClient":
+        if self._history is None:
+            from .history.client import HistoryClient
+
+            self._history = HistoryClient(client_wrapper=self._client_wrapper)
+        return self._history
+
+    @history.setter
+    def history(self, value: "HistoryClient") -> None:
+        self._history = value
+
+    @property
+    def text_to_sound_effects(self) -> "TextToSoundEffectsClient":
+        if self._text_to_sound_effects is None:
+            from .text_to_sound_effects.client import TextToSoundEffectsClient
+
+            self._text_to_sound_effects = TextToSoundEffectsClient(client_wrapper=self._client_wrapper)
+        return self._text_to_sound_effects
+
+    @text_to_sound_effects.setter
+    def text_to_sound_effects(self, value: "TextToSoundEffectsClient") -> None:
+        self._text_to_sound_effects = value
+
+    @property
+    def audio_isolation(self) -> "AudioIsolationClient":
+        if self._audio_isolation is None:
+            from .audio_isolation.client import AudioIsolationClient
+
+            self._audio_isolation = AudioIsolationClient(client_wrapper=self._client_wrapper)
+        return self._audio_isolation
+
+    @audio_isolation.setter
+    def audio_isolation(self, value: "AudioIsolationClient") -> None:
+        self._audio_isolation = value
+
+    @property
+    def samples(self) -> "SamplesClient":
+        if self._samples is None:
+            from .samples.client import SamplesClient
+
+            self._samples = SamplesClient(client_wrapper=self._client_wrapper)
+        return self._samples
+
+    @samples.setter
+    def samples(self, value: "SamplesClient") -> None:
+        self._samples = value
+
+    @property
+    def text_to_speech(self) -> "TextToSpeechClient":
+        if self._text_to_speech is None:
+            from .text_to_speech.client import TextToSpeechClient
+
+            self._text_to_speech = TextToSpeechClient(client_wrapper=self._client_wrapper)
+        return self._text_to_speech
+
+    @text_to_speech.setter
+    def text_to_speech(self, value: "TextToSpeechClient") -> None:
+        self._text_to_speech = value
+
+    @property
+    def speech_to_speech(self) -> "SpeechToSpeechClient":
+        if self._speech_to_speech is None:
+            from .speech_to_speech.client import SpeechToSpeechClient
+
+            self._speech_to_speech = SpeechToSpeechClient(client_wrapper=self._client_wrapper)
+        return self._speech_to_speech
+
+    @speech_to_speech.setter
+    def speech_to_speech(self, value: "SpeechToSpeechClient") -> None:
+        self._speech_to_speech = value
+
+    @property
+    def voice_generation(self) -> "VoiceGenerationClient":
+        if self._voice_generation is None:
+            from .voice_generation.client import VoiceGenerationClient
+
+            self._voice_generation = VoiceGenerationClient(client_wrapper=self._client_wrapper)
+        return self._voice_generation
+
+    @voice_generation.setter
+    def voice_generation(self, value: "VoiceGenerationClient") -> None:
+        self._voice_generation = value
+
+    @property
+    def text_to_voice(self) -> "TextToVoiceClient":
+        if self._text_to_voice is None:
+            from .text_to_voice.client import TextToVoiceClient
+
+            self._text_to_voice = TextToVoiceClient(client_wrapper=self._client_wrapper)
+        return self._text_to_voice
+
+    @text_to_voice.setter
+    def text_to_voice(self, value: "TextToVoiceClient") -> None:
+        self._text_to_voice = value
+
+    @property
+    def user(self) -> "UserClient":
+        if self._user is None:
+            from .user.client import UserClient
+
+            self._user = UserClient(client_wrapper=self._client_wrapper)
+        return self._user
+
+    @user.setter
+    def user(self, value: "UserClient") -> None:
+        self._user = value
+
+    @property
+    def voices(self) -> "VoicesClient":
+        if self._voices is None:
+            from .voices.client import VoicesClient
+
+            self._voices = VoicesClient(client_wrapper=self._client_wrapper)
+        return self._voices
+
+    @voices.setter
+    def voices(self, value: "VoicesClient") -> None:
+        self._voices = value
+
+    @property
+    def studio(self) -> "StudioClient":
+        if self._studio is None:
+            from .studio.client import StudioClient
+
+            self._studio = StudioClient(client_wrapper=self._client_wrapper)
+        return self._studio
+
+    @studio.setter
+    def studio(self, value: "StudioClient") -> None:
+        self._studio = value
+
+    @property
+    def projects(self) -> "ProjectsClient":
+        if self._projects is None:
+            from .projects.client import ProjectsClient
+
+            self._projects = ProjectsClient(client_wrapper=self._client_wrapper)
+        return self._projects
+
+    @projects.setter
+    def projects(self, value: "ProjectsClient") -> None:
+        self._projects = value
+
+    @property
+    def dubbing(self) -> "DubbingClient":
+        if self._dubbing is None:
+            from .dubbing.client import DubbingClient
+
+            self._dubbing = DubbingClient(client_wrapper=self._client_wrapper)
+        return self._dubbing
+
+    @dubbing.setter
+    def dubbing(self, value: "DubbingClient") -> None:
+        self._dubbing = value
+
+    @property
+    def models(self) -> "ModelsClient":
+        if self._models is None:
+            from .models.client import ModelsClient
+
+            self._models = ModelsClient(client_wrapper=self._client_wrapper)
+        return self._models
+
+    @models.setter
+    def models(self, value: "ModelsClient") -> None:
+        self._models = value
+
+    @property
+    def audio_native(self) -> "AudioNativeClient":
+        if self._audio_native is None:
+            from .audio_native.client import AudioNativeClient
+
+            self._audio_native = AudioNativeClient(client_wrapper=self._client_wrapper)
+        return self._audio_native
+
+    @audio_native.setter
+    def audio_native(self, value: "AudioNativeClient") -> None:
+        self._audio_native = value
+
+    @property
+    def usage(self) -> "UsageClient":
+        if self._usage is None:
+            from .usage.client import UsageClient
+
+            self._usage = UsageClient(client_wrapper=self._client_wrapper)
+        return self._usage
+
+    @usage.setter
+    def usage(self, value: "UsageClient") -> None:
+        self._usage = value
+
+    @property
+    def pronunciation_dictionary(self) -> "PronunciationDictionaryClient":
+        if self._pronunciation_dictionary is None:
+            from .pronunciation_dictionary.client import PronunciationDictionaryClient
+
+            self._pronunciation_dictionary = PronunciationDictionaryClient(client_wrapper=self._client_wrapper)
+        return self._pronunciation_dictionary
+
+    @pronunciation_dictionary.setter
+    def pronunciation_dictionary(self, value: "PronunciationDictionaryClient") -> None:
+        self._pronunciation_dictionary = value
+
+    @property
+    def workspace(self) -> "WorkspaceClient":
+        if self._workspace is None:
+            from .workspace.client import WorkspaceClient
+
+            self._workspace = WorkspaceClient(client_wrapper=self._client_wrapper)
+        return self._workspace
+
+    @workspace.setter
+    def workspace(self, value: "WorkspaceClient") -> None:
+        self._workspace = value
+
+    @property
+    def speech_to_text(self) -> "SpeechToTextClient":
+        if self._speech_to_text is None:
+            from .speech_to_text.client import SpeechToTextClient
+
+            self._speech_to_text = SpeechToTextClient(client_wrapper=self._client_wrapper)
+        return self._speech_to_text
+
+    @speech_to_text.setter
+    def speech_to_text(self, value: "SpeechToTextClient") -> None:
+        self._speech_to_text = value
+
+    @property
+    def conversational_ai(self) -> "ConversationalAiClient":
+        if self._conversational_ai is None:
+            from .conversational_ai.client import ConversationalAiClient
+
+            self._conversational_ai = ConversationalAiClient(client_wrapper=self._client_wrapper)
+        return self._conversational_ai
+
+    @conversational_ai.setter
+    def conversational_ai(self, value: "ConversationalAiClient") -> None:
+        self._conversational_ai = value
 
 
 class AsyncBaseElevenLabs:
@@ -150,12 +449,51 @@ class AsyncBaseElevenLabs:
     timeout : typing.Optional[float]
         The timeout to be used, in seconds, for requests. By default the timeout is 60 seconds, unless a custom httpx client is used, in which case this default is not enforced.
 
+    timeouts : typing.Optional[TimeoutOptions]
+        Separate connect, read, write and pool timeouts falling back to `timeout`, and an idle timeout between the chunks of streamed responses, e.g. `{"connect_in_seconds": 2, "stream_idle_in_seconds": 5}`.
+
     follow_redirects : typing.Optional[bool]
         Whether the default httpx client follows redirects or not, this is irrelevant if a custom httpx client is passed in.
 
     httpx_client : typing.Optional[httpx.AsyncClient]
         The httpx client to use for making requests, a preconfigured client is used by default, however this is useful should you want to pass in any custom httpx configuration.
 
+    connection_pool : typing.Optional[ConnectionPoolOptions]
+        Connection pool configuration (connection limits, keep-alive, HTTP/2 and pool timeout) for the default httpx client. Only the pool timeout applies if a custom httpx client is passed in.
+
+    retry_policy : typing.Optional[RetryPolicy]
+        The retry policy (backoff, retried status codes and transport errors, retry budget) applied to every request. By default requests are only retried when `max_retries` is set in the request options.
+
+    hedging_policy : typing.Optional[HedgingPolicy]
+        Enables hedging of streaming requests such as `text_to_speech.convert_as_stream`: a duplicate request is sent when the first one has not produced audio within the hedging delay, and the slower one is cancelled. Disabled by default.
+
+    rate_limiter : typing.Optional[RateLimiter]
+        Client-side concurrency and rate limits applied to every request, requests over the limits wait instead of being rejected by the API. Pass the same limiter to several clients to share the limits between them. Disabled by default.
+
+    request_coalescer : typing.Optional[RequestCoalescer]
+        Enables coalescing of identical concurrent GET requests, which then share a single round-trip and response. Disabled by default.
+
+    response_cache : typing.Optional[ResponseCache]
+        Caches responses of read-mostly endpoints such as `models.get_all` and `voices.get_settings`, e.g. `InMemoryResponseCache()`. Mutating requests made through the client invalidate the affected responses. Disabled by default.
+
+    timing_hooks : typing.Optional[typing.Sequence[RequestTimingHook]]
+        Callables receiving a `RequestTiming` record (endpoint, status, retries, bytes and the duration of each phase) for every request. More hooks can be registered later with `client._client_wrapper.add_timing_hook`.
+
+    metrics : typing.Optional[MetricsRegistry]
+        A metrics registry recording latency histograms, retries, rate limited responses, errors, in-flight requests and open websockets, which can be rendered in the Prometheus text format. Disabled by default.
+
+    circuit_breaker : typing.Optional[CircuitBreaker]
+        Per endpoint family circuit breakers, e.g. for `v1/dubbing` or `v1/speech-to-text`: once a family fails or slows down past the thresholds, its requests raise `CircuitOpenError` right away until probe requests succeed again. Disabled by default.
+
+    api_key_pool : typing.Optional[ApiKeyPool]
+        Spreads requests over several API keys, picking for each attempt the key with the most remaining character quota per request in flight and moving away from keys answering with 429 or 401. Takes precedence over `api_key`.
+
+    environment_selector : typing.Optional[EnvironmentSelector]
+        Probes the `ElevenLabsEnvironment`s when the client is created and periodically after that, and sends REST and websocket requests to the lowest-latency healthy one, failing over on connection errors. Takes precedence over `environment` and `base_url`.
+
+    validate_responses : bool
+        Validates successful JSON responses against their models with pydantic, decoding and validating the response bytes in one pass with pydantic-core on pydantic v2, instead of constructing the models without validation. Responses that do not match their model raise `pydantic.ValidationError`. Disabled by default.
+
     Examples
     --------
     from elevenlabs import AsyncElevenLabs
@@ -172,8 +510,21 @@ class AsyncBaseElevenLabs:
         environment: ElevenLabsEnvironment = ElevenLabsEnvironment.PRODUCTION,
         api_key: typing.Optional[str] = os.getenv("ELEVENLABS_API_KEY"),
         timeout: typing.Optional[float] = None,
+        timeouts: typing.Optional[TimeoutOptions] = None,
         follow_redirects: typing.Optional[bool] = True,
         httpx_client: typing.Optional[httpx.AsyncClient] = None,
+        connection_pool: typing.Optional[ConnectionPoolOptions] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        hedging_policy: typing.Optional[HedgingPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        request_coalescer: typing.Optional[RequestCoalescer] = None,
+        response_cache: typing.Optional[ResponseCache] = None,
+        timing_hooks: typing.Optional[typing.Sequence[RequestTimingHook]] = None,
+        metrics: typing.Optional[MetricsRegistry] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        api_key_pool: typing.Optional[ApiKeyPool] = None,
+        environment_selector: typing.Optional[EnvironmentSelector] = None,
+        validate_responses: bool = False,
     ):
         _defaulted_timeout = timeout if timeout is not None else 60 if httpx_client is None else None
         self._client_wrapper = AsyncClientWrapper(
@@ -181,31 +532,284 @@ class AsyncBaseElevenLabs:
             api_key=api_key,
             httpx_client=httpx_client
             if httpx_client is not None
-            else httpx.AsyncClient(timeout=_defaulted_timeout, follow_redirects=follow_redirects)
-            if follow_redirects is not None
-            else httpx.AsyncClient(timeout=_defaulted_timeout),
+            else build_async_httpx_client(
+                timeout=_defaulted_timeout, follow_redirects=follow_redirects, connection_pool=connection_pool
+            ),
             timeout=_defaulted_timeout,
+            timeouts=timeouts,
+            connection_pool=connection_pool,
+            retry_policy=retry_policy,
+            hedging_policy=hedging_policy,
+            rate_limiter=rate_limiter,
+            request_coalescer=request_coalescer,
+            response_cache=response_cache,
+            timing_hooks=timing_hooks,
+            metrics=metrics,
+            circuit_breaker=circuit_breaker,
+            api_key_pool=api_key_pool,
+            environment_selector=environment_selector,
+            validate_responses=validate_responses,
         )
-        self.history = AsyncHistoryClient(client_wrapper=self._client_wrapper)
-        self.text_to_sound_effects = AsyncTextToSoundEffectsClient(client_wrapper=self._client_wrapper)
-        self.audio_isolation = AsyncAudioIsolationClient(client_wrapper=self._client_wrapper)
-        self.samples = AsyncSamplesClient(client_wrapper=self._client_wrapper)
-        self.text_to_speech = AsyncTextToSpeechClient(client_wrapper=self._client_wrapper)
-        self.speech_to_speech = AsyncSpeechToSpeechClient(client_wrapper=self._client_wrapper)
-        self.voice_generation = AsyncVoiceGenerationClient(client_wrapper=self._client_wrapper)
-        self.text_to_voice = AsyncTextToVoiceClient(client_wrapper=self._client_wrapper)
-        self.user = AsyncUserClient(client_wrapper=self._client_wrapper)
-        self.voices = AsyncVoicesClient(client_wrapper=self._client_wrapper)
-        self.studio = AsyncStudioClient(client_wrapper=self._client_wrapper)
-        self.projects = AsyncProjectsClient(client_wrapper=self._client_wrapper)
-        self.dubbing = AsyncDubbingClient(client_wrapper=self._client_wrapper)
-        self.models = AsyncModelsClient(client_wrapper=self._client_wrapper)
-        self.audio_native = AsyncAudioNativeClient(client_wrapper=self._client_wrapper)
-        self.usage = AsyncUsageClient(client_wrapper=self._client_wrapper)
-        self.pronunciation_dictionary = AsyncPronunciationDictionaryClient(client_wrapper=self._client_wrapper)
-        self.workspace = AsyncWorkspaceClient(client_wrapper=self._client_wrapper)
-        self.speech_to_text = AsyncSpeechToTextClient(client_wrapper=self._client_wrapper)
-        self.conversational_ai = AsyncConversationalAiClient(client_wrapper=self._client_wrapper)
+        self._history: typing.Optional[AsyncHistoryClient] = None
+        self._text_to_sound_effects: typing.Optional[AsyncTextToSoundEffectsClient] = None
+        self._audio_isolation: typing.Optional[AsyncAudioIsolationClient] = None
+        self._samples: typing.Optional[AsyncSamplesClient] = None
+        self._text_to_speech: typing.Optional[AsyncTextToSpeechClient] = None
+        self._speech_to_speech: typing.Optional[AsyncSpeechToSpeechClient] = None
+        self._voice_generation: typing.Optional[AsyncVoiceGenerationClient] = None
+        self._text_to_voice: typing.Optional[AsyncTextToVoiceClient] = None
+        self._user: typing.Optional[AsyncUserClient] = None
+        self._voices: typing.Optional[AsyncVoicesClient] = None
+        self._studio: typing.Optional[AsyncStudioClient] = None
+        self._projects: typing.Optional[AsyncProjectsClient] = None
+        self._dubbing: typing.Optional[AsyncDubbingClient] = None
+        self._models: typing.Optional[AsyncModelsClient] = None
+        self._audio_native: typing.Optional[AsyncAudioNativeClient] = None
+        self._usage: typing.Optional[AsyncUsageClient] = None
+        self._pronunciation_dictionary: typing.Optional[AsyncPronunciationDictionaryClient] = None
+        self._workspace: typing.Optional[AsyncWorkspaceClient] = None
+        self._speech_to_text: typing.Optional[AsyncSpeechToTextClient] = None
+        self._conversational_ai: typing.Optional[AsyncConversationalAiClient] = None
+
+    @property
+    def history(self) -> "AsyncHistoryClient":
+        if self._history is None:
+            from .history.client import AsyncHistoryClient
+
+            self._history = AsyncHistoryClient(client_wrapper=self._client_wrapper)
+        return self._history
+
+    @history.setter
+    def history(self, value: "AsyncHistoryClient") -> None:
+        self._history = value
+
+    @property
+    def text_to_sound_effects(self) -> "AsyncTextToSoundEffectsClient":
+        if self._text_to_sound_effects is None:
+            from .text_to_sound_effects.client import AsyncTextToSoundEffectsClient
+
+            self._text_to_sound_effects = AsyncTextToSoundEffectsClient(client_wrapper=self._client_wrapper)
+        return self._text_to_sound_effects
+
+    @text_to_sound_effects.setter
+    def text_to_sound_effects(self, value: "AsyncTextToSoundEffectsClient") -> None:
+        self._text_to_sound_effects = value
+
+    @property
+    def audio_isolation(self) -> "AsyncAudioIsolationClient":
+        if self._audio_isolation is None:
+            from .audio_isolation.client import AsyncAudioIsolationClient
+
+            self._audio_isolation = AsyncAudioIsolationClient(client_wrapper=self._client_wrapper)
+        return self._audio_isolation
+
+    @audio_isolation.setter
+    def audio_isolation(self, value: "AsyncAudioIsolationClient") -> None:
+        self._audio_isolation = value
+
+    @property
+    def samples(self) -> "AsyncSamplesClient":
+        if self._samples is None:
+            from .samples.client import AsyncSamplesClient
+
+            self._samples = AsyncSamplesClient(client_wrapper=self._client_wrapper)
+        return self._samples
+
+    @samples.setter
+    def samples(self, value: "AsyncSamplesClient") -> None:
+        self._samples = value
+
+    @property
+    def text_to_speech(self) -> "AsyncTextToSpeechClient":
+        if self._text_to_speech is None:
+            from .text_to_speech.client import AsyncTextToSpeechClient
+
+            self._text_to_speech = AsyncTextToSpeechClient(client_wrapper=self._client_wrapper)
+        return self._text_to_speech
+
+    @text_to_speech.setter
+    def text_to_speech(self, value: "AsyncTextToSpeechClient") -> None:
+        self._text_to_speech = value
+
+    @property
+    def speech_to_speech(self) -> "AsyncSpeechToSpeechClient":
+        if self._speech_to_speech is None:
+            from .speech_to_speech.client import AsyncSpeechToSpeechClient
+
+            self._speech_to_speech = AsyncSpeechToSpeechClient(client_wrapper=self._client_wrapper)
+        return self._speech_to_speech
+
+    @speech_to_speech.setter
+    def speech_to_speech(self, value: "AsyncSpeechToSpeechClient") -> None:
+        self._speech_to_speech = value
+
+    @property
+    def voice_generation(self) -> "AsyncVoiceGenerationClient":
+        if self._voice_generation is None:
+            from .voice_generation.client import AsyncVoiceGenerationClient
+
+            self._voice_generation = AsyncVoiceGenerationClient(client_wrapper=self._client_wrapper)
+        return self._voice_generation
+
+    @voice_generation.setter
+    def voice_generation(self, value: "AsyncVoiceGenerationClient") -> None:
+        self._voice_generation = value
+
+    @property
+    def text_to_voice(self) -> "AsyncTextToVoiceClient":
+        if self._text_to_voice is None:
+            from .text_to_voice.client import AsyncTextToVoiceClient
+
+            self._text_to_voice = AsyncTextToVoiceClient(client_wrapper=self._client_wrapper)
+        return self._text_to_voice
+
+    @text_to_voice.setter
+    def text_to_voice(self, value: "AsyncTextToVoiceClient") -> None:
+        self._text_to_voice = value
+
+    @property
+    def user(self) -> "AsyncUserClient":
+        if self._user is None:
+            from .user.client import AsyncUserClient
+
+            self._user = AsyncUserClient(client_wrapper=self._client_wrapper)
+        return self._user
+
+    @user.setter
+    def user(self, value: "AsyncUserClient") -> None:
+        self._user = value
+
+    @property
+    def voices(self) -> "AsyncVoicesClient":
+        if self._voices is None:
+            from .voices.client import AsyncVoicesClient
+
+            self._voices = AsyncVoicesClient(client_wrapper=self._client_wrapper)
+        return self._voices
+
+    @voices.setter
+    def voices(self, value: "AsyncVoicesClient") -> None:
+        self._voices = value
+
+    @property
+    def studio(self) -> "AsyncStudioClient":
+        if self._studio is None:
+            from .studio.client import AsyncStudioClient
+
+            self._studio = AsyncStudioClient(client_wrapper=self._client_wrapper)
+        return self._studio
+
+    @studio.setter
+    def studio(self, value: "AsyncStudioClient") -> None:
+        self._studio = value
+
+    @property
+    def projects(self) -> "AsyncProjectsClient":
+        if self._projects is None:
+            from .projects.client import AsyncProjectsClient
+
+            self._projects = AsyncProjectsClient(client_wrapper=self._client_wrapper)
+        return self._projects
+
+    @projects.setter
+    def projects(self, value: "AsyncProjectsClient") -> None:
+        self._projects = value
+
+    @property
+    def dubbing(self) -> "AsyncDubbingClient":
+        if self._dubbing is None:
+            from .dubbing.client import AsyncDubbingClient
+
+            self._dubbing = AsyncDubbingClient(client_wrapper=self._client_wrapper)
+        return self._dubbing
+
+    @dubbing.setter
+    def dubbing(self, value: "AsyncDubbingClient") -> None:
+        self._dubbing = value
+
+    @property
+    def models(self) -> "AsyncModelsClient":
+        if self._models is None:
+            from .models.client import AsyncModelsClient
+
+            self._models = AsyncModelsClient(client_wrapper=self._client_wrapper)
+        return self._models
+
+    @models.setter
+    def models(self, value: "AsyncModelsClient") -> None:
+        self._models = value
+
+    @property
+    def audio_native(self) -> "AsyncAudioNativeClient":
+        if self._audio_native is None:
+            from .audio_native.client import AsyncAudioNativeClient
+
+            self._audio_native = AsyncAudioNativeClient(client_wrapper=self._client_wrapper)
+        return self._audio_native
+
+    @audio_native.setter
+    def audio_native(self, value: "AsyncAudioNativeClient") -> None:
+        self._audio_native = value
+
+    @property
+    def usage(self) -> "AsyncUsageClient":
+        if self._usage is None:
+            from .usage.client import AsyncUsageClient
+
+            self._usage = AsyncUsageClient(client_wrapper=self._client_wrapper)
+        return self._usage
+
+    @usage.setter
+    def usage(self, value: "AsyncUsageClient") -> None:
+        self._usage = value
+
+    @property
+    def pronunciation_dictionary(self) -> "AsyncPronunciationDictionaryClient":
+        if self._pronunciation_dictionary is None:
+            from .pronunciation_dictionary.client import AsyncPronunciationDictionaryClient
+
+            self._pronunciation_dictionary = AsyncPronunciationDictionaryClient(client_wrapper=self._client_wrapper)
+        return self._pronunciation_dictionary
+
+    @pronunciation_dictionary.setter
+    def pronunciation_dictionary(self, value: "AsyncPronunciationDictionaryClient") -> None:
+        self._pronunciation_dictionary = value
+
+    @property
+    def workspace(self) -> "AsyncWorkspaceClient":
+        if self._workspace is None:
+            from .workspace.client import AsyncWorkspaceClient
+
+            self._workspace = AsyncWorkspaceClient(client_wrapper=self._client_wrapper)
+        return self._workspace
+
+    @workspace.setter
+    def workspace(self, value: "AsyncWorkspaceClient") -> None:
+        self._workspace = value
+
+    @property
+    def speech_to_text(self) -> "AsyncSpeechToTextClient":
+        if self._speech_to_text is None:
+            from .speech_to_text.client import AsyncSpeechToTextClient
+
+            self._speech_to_text = AsyncSpeechToTextClient(client_wrapper=self._client_wrapper)
+        return self._speech_to_text
+
+    @speech_to_text.setter
+    def speech_to_text(self, value: "AsyncSpeechToTextClient") -> None:
+        self._speech_to_text = value
+
+    @property
+    def conversational_ai(self) -> "AsyncConversationalAiClient":
+        if self._conversational_ai is None:
+            from .conversational_ai.client import AsyncConversationalAiClient
+
+            self._conversational_ai = AsyncConversationalAiClient(client_wrapper=self._client_wrapper)
+        return self._conversational_ai
+
+    @conversational_ai.setter
+    def conversational_ai(self, value: "AsyncConversationalAiClient") -> None:
+        self._conversational_ai = value
 
 
 def _get_base_url(*, base_url: typing.Optional[str] = None, environment: ElevenLabsEnvironment) -> str:
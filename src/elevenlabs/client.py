@@ -1,5 +1,4 @@
 import typing
-import json
 import re
 import os
 import httpx
@@ -9,13 +8,16 @@ from typing import Iterator, Optional, Union, \
 
 from .base_client import \
   BaseElevenLabs, AsyncBaseElevenLabs
-from .core import RequestOptions, ApiError
+from .core import RequestOptions, ApiError, ApiKeyPool, CircuitBreaker, ConnectionPoolOptions, EnvironmentSelector, HedgingPolicy, MetricsRegistry, RateLimiter, RequestCoalescer, RequestTimingHook, ResponseCache, RetryPolicy, TimeoutOptions, UploadFile, json_dumps_text
 from .types import Voice, VoiceSettings, \
   PronunciationDictionaryVersionLocator, Model
 from .environment import ElevenLabsEnvironment
-from .realtime_tts import RealtimeTextToSpeechClient
 from .types import OutputFormat
 
+if typing.TYPE_CHECKING:
+    from .realtime_tts import RealtimeTextToSpeechClient
+    from .text_to_speech.client import TextToSpeechClient
+
 
 DEFAULT_VOICE = Voice(
     voice_id="EXAVITQu4vr4xnSDxMaL",
@@ -55,7 +57,33 @@ class ElevenLabs(BaseElevenLabs):
 
         - timeout: typing.Optional[float]. The timeout to be used, in seconds, for requests by default the timeout is 60 seconds.
 
+        - timeouts: typing.Optional[TimeoutOptions]. Separate connect, read, write and pool timeouts, and an idle timeout between the chunks of streamed responses.
+
         - httpx_client: typing.Optional[httpx.Client]. The httpx client to use for making requests, a preconfigured client is used by default, however this is useful should you want to pass in any custom httpx configuration.
+
+        - connection_pool: typing.Optional[ConnectionPoolOptions]. Connection pool configuration (connection limits, keep-alive, HTTP/2 and pool timeout) for the default httpx client.
+
+        - retry_policy: typing.Optional[RetryPolicy]. The retry policy (backoff, retried status codes and transport errors, retry budget) applied to every request.
+
+        - hedging_policy: typing.Optional[HedgingPolicy]. Enables hedging of streaming requests such as `text_to_speech.convert_as_stream`.
+
+        - rate_limiter: typing.Optional[RateLimiter]. Client-side concurrency and rate limits applied to every request.
+
+        - request_coalescer: typing.Optional[RequestCoalescer]. Enables coalescing of identical concurrent GET requests.
+
+        - response_cache: typing.Optional[ResponseCache]. Caches responses of read-mostly endpoints such as `models.get_all`.
+
+        - timing_hooks: typing.Optional[typing.Sequence[RequestTimingHook]]. Callables receiving a `RequestTiming` record for every request.
+
+        - metrics: typing.Optional[MetricsRegistry]. A metrics registry recording latencies, retries, errors, in-flight requests and open websockets.
+
+        - circuit_breaker: typing.Optional[CircuitBreaker]. Per endpoint family circuit breakers failing requests fast while a backend is degraded.
+
+        - api_key_pool: typing.Optional[ApiKeyPool]. Spreads requests over several API keys based on their remaining quota, requests in flight and 429/401 responses.
+
+        - environment_selector: typing.Optional[EnvironmentSelector]. Sends requests to the lowest-latency healthy environment, failing over on connection errors.
+
+        - validate_responses: bool. Validates successful JSON responses with pydantic, raising `pydantic.ValidationError` for responses that do not match their model.
     ---
     from elevenlabs.client import ElevenLabs
 
@@ -70,16 +98,61 @@ class ElevenLabs(BaseElevenLabs):
         environment: ElevenLabsEnvironment = ElevenLabsEnvironment.PRODUCTION,
         api_key: typing.Optional[str] = os.getenv("ELEVENLABS_API_KEY"),
         timeout: typing.Optional[float] = 60,
-        httpx_client: typing.Optional[httpx.Client] = None
+        timeouts: typing.Optional[TimeoutOptions] = None,
+        httpx_client: typing.Optional[httpx.Client] = None,
+        connection_pool: typing.Optional[ConnectionPoolOptions] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        hedging_policy: typing.Optional[HedgingPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        request_coalescer: typing.Optional[RequestCoalescer] = None,
+        response_cache: typing.Optional[ResponseCache] = None,
+        timing_hooks: typing.Optional[typing.Sequence[RequestTimingHook]] = None,
+        metrics: typing.Optional[MetricsRegistry] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        api_key_pool: typing.Optional[ApiKeyPool] = None,
+        environment_selector: typing.Optional[EnvironmentSelector] = None,
+        validate_responses: bool = False
     ):
         super().__init__(
             base_url=base_url,
             environment=environment,
             api_key=api_key,
             timeout=timeout,
-            httpx_client=httpx_client
+            timeouts=timeouts,
+            httpx_client=httpx_client,
+            connection_pool=connection_pool,
+            retry_policy=retry_policy,
+            hedging_policy=hedging_policy,
+            rate_limiter=rate_limiter,
+            request_coalescer=request_coalescer,
+            response_cache=response_cache,
+            timing_hooks=timing_hooks,
+            metrics=metrics,
+            circuit_breaker=circuit_breaker,
+            api_key_pool=api_key_pool,
+            environment_selector=environment_selector,
+            validate_responses=validate_responses
         )
-        self.text_to_speech = RealtimeTextToSpeechClient(client_wrapper=self._client_wrapper)
+
+    # Narrows the getter to the realtime client, which mypy rejects for a property that can also be set.
+    @property  # type: ignore[override]
+    def text_to_speech(self) -> "RealtimeTextToSpeechClient":
+        if self._text_to_speech is None:
+            from .realtime_tts import RealtimeTextToSpeechClient
+
+            self._text_to_speech = RealtimeTextToSpeechClient(client_wrapper=self._client_wrapper)
+        return typing.cast("RealtimeTextToSpeechClient", self._text_to_speech)
+
+    @text_to_speech.setter
+    def text_to_speech(self, value: "TextToSpeechClient") -> None:
+        self._text_to_speech = value
+
+    def close(self) -> None:
+        """
+        Stops the background work of the client, i.e. the probes of its `environment_selector`. The httpx client is
+        not closed.
+        """
+        self._client_wrapper.close()
 
     def clone(
       self,
@@ -108,8 +181,8 @@ class ElevenLabs(BaseElevenLabs):
         add_voice_response = self.voices.add(
           name=name,
           description=description, 
-          files=[open(file, 'rb') for file in files],
-          labels=str(json.dumps(labels or {}))
+          files=[UploadFile(file) for file in files],
+          labels=json_dumps_text(labels or {})
         )
         return self.voices.get(
           add_voice_response.voice_id,
@@ -249,7 +322,33 @@ class AsyncElevenLabs(AsyncBaseElevenLabs):
 
         - timeout: typing.Optional[float]. The timeout to be used, in seconds, for requests by default the timeout is 60 seconds.
 
+        - timeouts: typing.Optional[TimeoutOptions]. Separate connect, read, write and pool timeouts, and an idle timeout between the chunks of streamed responses.
+
         - httpx_client: typing.Optional[httpx.AsyncClient]. The httpx client to use for making requests, a preconfigured client is used by default, however this is useful should you want to pass in any custom httpx configuration.
+
+        - connection_pool: typing.Optional[ConnectionPoolOptions]. Connection pool configuration (connection limits, keep-alive, HTTP/2 and pool timeout) for the default httpx client.
+
+        - retry_policy: typing.Optional[RetryPolicy]. The retry policy (backoff, retried status codes and transport errors, retry budget) applied to every request.
+
+        - hedging_policy: typing.Optional[HedgingPolicy]. Enables hedging of streaming requests such as `text_to_speech.convert_as_stream`.
+
+        - rate_limiter: typing.Optional[RateLimiter]. Client-side concurrency and rate limits applied to every request.
+
+        - request_coalescer: typing.Optional[RequestCoalescer]. Enables coalescing of identical concurrent GET requests.
+
+        - response_cache: typing.Optional[ResponseCache]. Caches responses of read-mostly endpoints such as `models.get_all`.
+
+        - timing_hooks: typing.Optional[typing.Sequence[RequestTimingHook]]. Callables receiving a `RequestTiming` record for every request.
+
+        - metrics: typing.Optional[MetricsRegistry]. A metrics registry recording latencies, retries, errors, in-flight requests and open websockets.
+
+        - circuit_breaker: typing.Optional[CircuitBreaker]. Per endpoint family circuit breakers failing requests fast while a backend is degraded.
+
+        - api_key_pool: typing.Optional[ApiKeyPool]. Spreads requests over several API keys based on their remaining quota, requests in flight and 429/401 responses.
+
+        - environment_selector: typing.Optional[EnvironmentSelector]. Sends requests to the lowest-latency healthy environment, failing over on connection errors.
+
+        - validate_responses: bool. Validates successful JSON responses with pydantic, raising `pydantic.ValidationError` for responses that do not match their model.
     ---
     from elevenlabs.client import AsyncElevenLabs
 
@@ -258,6 +357,13 @@ class AsyncElevenLabs(AsyncBaseElevenLabs):
     )
     """
 
+    def close(self) -> None:
+        """
+        Stops the background work of the client, i.e. the probes of its `environment_selector`. The httpx client is
+        not closed.
+        """
+        self._client_wrapper.close()
+
     async def clone(
       self,
       name: str,
@@ -288,8 +394,8 @@ class AsyncElevenLabs(AsyncBaseElevenLabs):
         add_voice_response = await self.voices.add(
           name=name,
           description=description, 
-          files=[open(file, 'rb') for file in files],
-          labels=str(json.dumps(labels or {}))
+          files=[UploadFile(file) for file in files],
+          labels=json_dumps_text(labels or {})
         )
         return await self.voices.get(
           add_voice_response.voice_id,
@@ -1,6 +1,5 @@
 from abc import ABC, abstractmethod
 import base64
-import json
 import threading
 from typing import Callable, Optional, Awaitable, Union, Any
 import asyncio
@@ -10,6 +9,8 @@ from websockets.sync.client import connect
 from websockets.exceptions import ConnectionClosedOK
 
 from ..base_client import BaseElevenLabs
+from ..core.json_codec import json_dumps_text, json_loads
+from ..core.metrics import WebsocketMetrics
 
 
 class AudioInterface(ABC):
@@ -193,6 +194,7 @@ class Conversation:
     _should_stop: threading.Event
     _conversation_id: Optional[str]
     _last_interrupt_id: int
+    _websocket_metrics: WebsocketMetrics
 
     def __init__(
         self,
@@ -243,6 +245,7 @@ class Conversation:
         self._should_stop = threading.Event()
         self._conversation_id = None
         self._last_interrupt_id = 0
+        self._websocket_metrics = WebsocketMetrics(client._client_wrapper.get_metrics(), "conversation")
 
     def start_session(self):
         """Starts the conversation session.
@@ -272,9 +275,9 @@ class Conversation:
         return self._conversation_id
 
     def _run(self, ws_url: str):
-        with connect(ws_url, max_size=16 * 1024 * 1024) as ws:
+        with connect(ws_url, max_size=16 * 1024 * 1024) as ws, self._websocket_metrics:
             ws.send(
-                json.dumps(
+                json_dumps_text(
                     {
                         "type": "conversation_initiation_client_data",
                         "custom_llm_extra_body": self.config.extra_body,
@@ -287,7 +290,7 @@ class Conversation:
             def input_callback(audio):
                 try:
                     ws.send(
-                        json.dumps(
+                        json_dumps_text(
                             {
                                 "user_audio_chunk": base64.b64encode(audio).decode(),
                             }
@@ -302,7 +305,7 @@ class Conversation:
             self.audio_interface.start(input_callback)
             while not self._should_stop.is_set():
                 try:
-                    message = json.loads(ws.recv(timeout=0.5))
+                    message = json_loads(ws.recv(timeout=0.5))
                     if self._should_stop.is_set():
                         return
                     self._handle_message(message, ws)
@@ -325,6 +328,7 @@ class Conversation:
             if int(event["event_id"]) <= self._last_interrupt_id:
                 return
             audio = base64.b64decode(event["audio_base_64"])
+            self._websocket_metrics.record_audio()
             self.audio_interface.output(audio)
         elif message["type"] == "agent_response":
             if self.callback_agent_response:
@@ -347,7 +351,7 @@ class Conversation:
         elif message["type"] == "ping":
             event = message["ping_event"]
             ws.send(
-                json.dumps(
+                json_dumps_text(
                     {
                         "type": "pong",
                         "event_id": event["event_id"],
@@ -363,14 +367,14 @@ class Conversation:
 
             def send_response(response):
                 if not self._should_stop.is_set():
-                    ws.send(json.dumps(response))
+                    ws.send(json_dumps_text(response))
 
             self.client_tools.execute_tool(tool_name, parameters, send_response)
         else:
             pass  # Ignore all other message types.
 
     def _get_wss_url(self):
-        base_url = self.client._client_wrapper._base_url
+        base_url = self.client._client_wrapper.get_base_url()
         # Replace http(s) with ws(s).
         base_ws_url = base_url.replace("http", "ws", 1)  # First occurrence only.
         return f"{base_ws_url}/v1/convai/conversation?agent_id={self.agent_id}"
@@ -1,49 +1,111 @@
 # This file was auto-generated by Fern from our API Definition.
 
 from .api_error import ApiError
+from .api_key_pool import ApiKeyPool
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
 from .client_wrapper import AsyncClientWrapper, BaseClientWrapper, SyncClientWrapper
+from .connection_pool import ConnectionPoolOptions
 from .datetime_utils import serialize_datetime
+from .download import adownload_to, areadinto, download_to, readinto
+from .environment_selector import EnvironmentSelector
 from .file import File, convert_file_dict_to_httpx_tuples, with_content_type
+from .hedging_policy import HedgingPolicy
 from .http_client import AsyncHttpClient, HttpClient
+from .json_codec import (
+    JsonCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    get_json_codec,
+    json_dumps,
+    json_dumps_text,
+    json_loads,
+    set_json_codec,
+)
 from .jsonable_encoder import jsonable_encoder
+from .metrics import MetricsRegistry
 from .pydantic_utilities import (
     IS_PYDANTIC_V2,
     UniversalBaseModel,
     UniversalRootModel,
+    parse_json_as,
     parse_obj_as,
     universal_field_validator,
     universal_root_validator,
     update_forward_refs,
 )
 from .query_encoder import encode_query
+from .rate_limiter import RateLimiter
+from .record_replay import AsyncRecordingTransport, AsyncReplayTransport, RecordingTransport, ReplayTransport
 from .remove_none_from_dict import remove_none_from_dict
+from .request_coalescer import RequestCoalescer
 from .request_options import RequestOptions
+from .request_timing import RequestTiming, RequestTimingHook
+from .response_cache import DiskResponseCache, InMemoryResponseCache, ResponseCache
+from .retry_policy import RetryBudget, RetryPolicy
 from .serialization import FieldMetadata, convert_and_respect_annotation_metadata
+from .timeouts import DeadlineExceededError, TimeoutOptions
 from .unchecked_base_model import UncheckedBaseModel, UnionMetadata, construct_type
+from .upload import UploadFile
 
 __all__ = [
     "ApiError",
+    "ApiKeyPool",
     "AsyncClientWrapper",
     "AsyncHttpClient",
+    "AsyncRecordingTransport",
+    "AsyncReplayTransport",
     "BaseClientWrapper",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "ConnectionPoolOptions",
+    "DeadlineExceededError",
+    "DiskResponseCache",
+    "EnvironmentSelector",
     "FieldMetadata",
     "File",
+    "HedgingPolicy",
     "HttpClient",
     "IS_PYDANTIC_V2",
+    "InMemoryResponseCache",
+    "JsonCodec",
+    "MetricsRegistry",
+    "MsgspecCodec",
+    "OrjsonCodec",
+    "RateLimiter",
+    "RecordingTransport",
+    "ReplayTransport",
+    "RequestCoalescer",
     "RequestOptions",
+    "RequestTiming",
+    "RequestTimingHook",
+    "ResponseCache",
+    "RetryBudget",
+    "RetryPolicy",
     "SyncClientWrapper",
+    "TimeoutOptions",
     "UncheckedBaseModel",
     "UnionMetadata",
     "UniversalBaseModel",
     "UniversalRootModel",
+    "UploadFile",
+    "adownload_to",
+    "areadinto",
     "construct_type",
     "convert_and_respect_annotation_metadata",
     "convert_file_dict_to_httpx_tuples",
+    "download_to",
     "encode_query",
+    "get_json_codec",
+    "json_dumps",
+    "json_dumps_text",
+    "json_loads",
     "jsonable_encoder",
+    "parse_json_as",
     "parse_obj_as",
+    "readinto",
     "remove_none_from_dict",
     "serialize_datetime",
+    "set_json_codec",
     "universal_field_validator",
     "universal_root_validator",
     "update_forward_refs",
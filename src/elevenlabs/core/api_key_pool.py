@@ -0,0 +1,184 @@
+import threading
+import time
+import typing
+
+import httpx
+
+from .retry_policy import MAX_RETRY_DELAY_SECONDS_FROM_HEADER, _parse_retry_after
+
+if typing.TYPE_CHECKING:
+    from ..types.subscription import Subscription
+
+
+class _ApiKeyState:
+    def __init__(self, api_key: str) -> None:
+        self.api_key = api_key
+        self.in_flight = 0
+        self.remaining_characters: typing.Optional[int] = None
+        self.cooldown_until = 0.0
+        self.requests = 0
+        self.rate_limited_responses = 0
+        self.unauthorized_responses = 0
+
+
+class ApiKeyPool:
+    """
+    Spreads the requests of a client over several API keys, e.g. of accounts run for extra capacity. Each attempt
+    is sent with the available key that has the most remaining character quota per request in flight; keys answering
+    with a 429 are rested for `rate_limited_cooldown_in_seconds` (or their `Retry-After`), keys answering with a 401
+    for `unauthorized_cooldown_in_seconds`, and retries of a request move on to another key.
+
+    The remaining quota of each key is read from `user.get_subscription` by `refresh` / `arefresh`, which should be
+    called periodically. Until then keys are balanced on their requests in flight only. Requests setting the
+    `xi-api-key` header through `additional_headers` are sent with that key.
+
+    from elevenlabs.client import ElevenLabs
+    from elevenlabs.core import ApiKeyPool
+
+    api_key_pool = ApiKeyPool(["KEY_1", "KEY_2"])
+    client = ElevenLabs(api_key_pool=api_key_pool)
+    api_key_pool.refresh(client)
+
+    Parameters
+    ----------
+    api_keys : typing.Sequence[str]
+        The API keys to route requests to.
+
+    rate_limited_cooldown_in_seconds : float
+        How long a key that answered with a 429 is avoided when the response has no `Retry-After`. Defaults to 5.
+
+    unauthorized_cooldown_in_seconds : float
+        How long a key that answered with a 401, e.g. because its quota is exhausted, is avoided. Defaults to 300.
+    """
+
+    def __init__(
+        self,
+        api_keys: typing.Sequence[str],
+        *,
+        rate_limited_cooldown_in_seconds: float = 5.0,
+        unauthorized_cooldown_in_seconds: float = 300.0,
+    ) -> None:
+        if not api_keys:
+            raise ValueError("An ApiKeyPool requires at least one API key.")
+        self.rate_limited_cooldown_in_seconds = rate_limited_cooldown_in_seconds
+        self.unauthorized_cooldown_in_seconds = unauthorized_cooldown_in_seconds
+        self._keys = [_ApiKeyState(api_key) for api_key in dict.fromkeys(api_keys)]
+        self._keys_by_api_key = {state.api_key: state for state in self._keys}
+        self._lock = threading.Lock()
+
+    @property
+    def api_keys(self) -> typing.List[str]:
+        return [state.api_key for state in self._keys]
+
+    def _select_locked(self, now: float) -> _ApiKeyState:
+        available = [state for state in self._keys if state.cooldown_until <= now]
+        if not available:
+            # Every key is resting, the one available again soonest is least likely to be rejected.
+            return min(self._keys, key=lambda state: state.cooldown_until)
+        with_quota = [
+            state for state in available if state.remaining_characters is None or state.remaining_characters > 0
+        ]
+        candidates = with_quota or available
+        known_quotas = [state.remaining_characters for state in candidates if state.remaining_characters is not None]
+        # Keys whose quota is not known yet are assumed to have as much left as the best known one.
+        default_quota = max(known_quotas) if known_quotas else 1
+
+        def score(state: _ApiKeyState) -> float:
+            remaining = state.remaining_characters if state.remaining_characters is not None else default_quota
+            return max(remaining, 1) / (state.in_flight + 1)
+
+        return max(candidates, key=score)
+
+    def select(self) -> str:
+        """
+        Returns the key the next request should be sent with, without counting it as in flight.
+        """
+        with self._lock:
+            return self._select_locked(time.monotonic()).api_key
+
+    def acquire(self) -> str:
+        """
+        Returns the key the next attempt should be sent with and counts it as in flight until `release`.
+        """
+        with self._lock:
+            state = self._select_locked(time.monotonic())
+            state.in_flight += 1
+            state.requests += 1
+            return state.api_key
+
+    def release(self, api_key: str) -> None:
+        with self._lock:
+            state = self._keys_by_api_key.get(api_key)
+            if state is not None:
+                state.in_flight -= 1
+
+    def record_response(self, api_key: str, response: httpx.Response) -> None:
+        """
+        Rests the key if the response shows it is rate limited or no longer authorized.
+        """
+        if response.status_code == 429:
+            retry_after = _parse_retry_after(response.headers)
+            cooldown = (
+                retry_after
+                if retry_after is not None and retry_after <= MAX_RETRY_DELAY_SECONDS_FROM_HEADER
+                else self.rate_limited_cooldown_in_seconds
+            )
+        elif response.status_code == 401:
+            cooldown = self.unauthorized_cooldown_in_seconds
+        else:
+            return
+        with self._lock:
+            state = self._keys_by_api_key.get(api_key)
+            if state is None:
+                return
+            state.cooldown_until = max(state.cooldown_until, time.monotonic() + cooldown)
+            if response.status_code == 429:
+                state.rate_limited_responses += 1
+            else:
+                state.unauthorized_responses += 1
+
+    def update_from_subscription(self, api_key: str, subscription: "Subscription") -> None:
+        """
+        Sets the remaining character quota of a key from its subscription, as returned by `user.get_subscription()`.
+        """
+        with self._lock:
+            state = self._keys_by_api_key.get(api_key)
+            if state is not None:
+                state.remaining_characters = subscription.character_limit - subscription.character_count
+
+    def refresh(self, client: typing.Any) -> None:
+        """
+        Reads the remaining character quota of every key with `client.user.get_subscription()`.
+        """
+        for api_key in self.api_keys:
+            subscription = client.user.get_subscription(request_options={"additional_headers": {"xi-api-key": api_key}})
+            self.update_from_subscription(api_key, subscription)
+
+    async def arefresh(self, client: typing.Any) -> None:
+        """
+        The async counterpart of `refresh`, for `AsyncElevenLabs` clients.
+        """
+        for api_key in self.api_keys:
+            subscription = await client.user.get_subscription(
+                request_options={"additional_headers": {"xi-api-key": api_key}}
+            )
+            self.update_from_subscription(api_key, subscription)
+
+    def get_stats(self) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        """
+        Returns the requests, in-flight requests, rejections, remaining quota and cooldown of each key, keyed by the
+        last four characters of the key.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                f"...{state.api_key[-4:]}": {
+                    "requests": state.requests,
+                    "in_flight": state.in_flight,
+                    "rate_limited_responses": state.rate_limited_responses,
+                    "unauthorized_responses": state.unauthorized_responses,
+                    "remaining_characters": state.remaining_characters,
+                    "cooldown_in_seconds": max(0.0, state.cooldown_until - now),
+                }
+                for state in self._keys
+            }
@@ -0,0 +1,229 @@
+import collections
+import threading
+import time
+import typing
+
+import httpx
+
+from .api_error import ApiError
+from .resource_family import get_resource_family
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(ApiError):
+    """
+    Raised without contacting the API while the circuit of an endpoint family is open.
+
+    Attributes:
+        - family: str. The endpoint family whose circuit is open, e.g. `v1/dubbing`.
+
+        - retry_after_in_seconds: float. The time until the circuit lets probe requests through again.
+    """
+
+    def __init__(self, *, family: str, retry_after_in_seconds: float) -> None:
+        super().__init__(
+            body=f"The circuit for {family} is open after repeated failures, retry in {retry_after_in_seconds:.1f}s."
+        )
+        self.family = family
+        self.retry_after_in_seconds = retry_after_in_seconds
+
+
+class _Circuit:
+    def __init__(self, window_size: int) -> None:
+        self.state = CLOSED
+        # One (failed, slow) pair per completed call.
+        self.outcomes: typing.Deque[typing.Tuple[bool, bool]] = collections.deque(maxlen=window_size)
+        self.opened_at = 0.0
+        self.probes_in_flight = 0
+        self.probe_successes = 0
+
+
+class CircuitPermit:
+    """
+    Permission for a single attempt, returned by `CircuitBreaker.acquire`. Exactly one of `record_response`,
+    `record_exception` or `release` must be called once the attempt is over.
+    """
+
+    def __init__(self, circuit_breaker: "CircuitBreaker", circuit: _Circuit, family: str, probe: bool) -> None:
+        self.circuit_breaker = circuit_breaker
+        self.family = family
+        self._circuit = circuit
+        self._probe = probe
+        self._started_at = time.monotonic()
+
+    def record_response(self, response: httpx.Response) -> None:
+        self.circuit_breaker._record(
+            self._circuit,
+            self._probe,
+            failed=response.status_code >= 500,
+            duration=time.monotonic() - self._started_at,
+        )
+
+    def record_exception(self, exception: BaseException) -> None:
+        # Only transport errors and timeouts say something about the health of the backend.
+        if isinstance(exception, httpx.TransportError):
+            self.circuit_breaker._record(
+                self._circuit, self._probe, failed=True, duration=time.monotonic() - self._started_at
+            )
+        else:
+            self.release()
+
+    def release(self) -> None:
+        self.circuit_breaker._release(self._circuit, self._probe)
+
+
+class CircuitBreaker:
+    """
+    Opt-in circuit breakers for the endpoint families of the API, e.g. `v1/dubbing` or `v1/speech-to-text`, so that
+    a degraded backend fails fast instead of every request waiting out its timeout.
+
+    Each family has its own circuit. Once at least `minimum_calls` of the last `window_size` attempts completed and
+    the share of failed attempts (5xx responses, transport errors and timeouts) reaches `failure_rate_threshold`, or
+    the share of slow attempts reaches `slow_call_rate_threshold`, the circuit opens: requests to that family raise
+    `CircuitOpenError` without being sent, and retries stop. After `open_duration_in_seconds` the circuit is
+    half-open and lets up to `half_open_max_calls` probe requests through at a time; it closes once that many probes
+    succeeded in a row and opens again on the first failed probe.
+
+    Parameters
+    ----------
+    failure_rate_threshold : float
+        The share of failed attempts that opens the circuit. Defaults to 0.5.
+
+    slow_call_duration_in_seconds : typing.Optional[float]
+        Attempts taking longer than this until their response was received count as slow: until the whole body was
+        read for regular requests, and until the response headers were received for streamed ones. Defaults to None,
+        not tracking slow attempts.
+
+    slow_call_rate_threshold : float
+        The share of slow attempts that opens the circuit. Defaults to 0.8.
+
+    window_size : int
+        The number of most recent attempts per family the rates are computed from. Defaults to 20.
+
+    minimum_calls : int
+        The number of attempts required before the circuit can open. Defaults to 10.
+
+    open_duration_in_seconds : float
+        How long the circuit stays open before probing. Defaults to 30 seconds.
+
+    half_open_max_calls : int
+        The number of concurrent probe requests while half-open, and of successful probes closing the circuit.
+        Defaults to 1.
+
+    families : typing.Optional[typing.Collection[str]]
+        The endpoint families guarded, e.g. `("v1/dubbing", "v1/speech-to-text")`. Defaults to all of them.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration_in_seconds: typing.Optional[float] = None,
+        slow_call_rate_threshold: float = 0.8,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_duration_in_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        families: typing.Optional[typing.Collection[str]] = None,
+    ) -> None:
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration_in_seconds = slow_call_duration_in_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window_size = window_size
+        self.minimum_calls = minimum_calls
+        self.open_duration_in_seconds = open_duration_in_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.families = frozenset(families) if families is not None else None
+        self._circuits: typing.Dict[str, _Circuit] = {}
+        self._opened = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, request: httpx.Request) -> typing.Optional[CircuitPermit]:
+        """
+        Returns a permit for an attempt of the request, None if its family is not guarded, or raises
+        `CircuitOpenError` if the circuit of its family is open.
+        """
+        family = get_resource_family(request.url.path)
+        if self.families is not None and family not in self.families:
+            return None
+        with self._lock:
+            circuit = self._circuits.get(family)
+            if circuit is None:
+                circuit = self._circuits[family] = _Circuit(self.window_size)
+            if circuit.state == CLOSED:
+                return CircuitPermit(self, circuit, family, probe=False)
+            if circuit.state == OPEN:
+                retry_after = circuit.opened_at + self.open_duration_in_seconds - time.monotonic()
+                if retry_after > 0:
+                    self._rejected += 1
+                    raise CircuitOpenError(family=family, retry_after_in_seconds=retry_after)
+                circuit.state = HALF_OPEN
+                circuit.probe_successes = 0
+            if circuit.probes_in_flight >= self.half_open_max_calls:
+                self._rejected += 1
+                raise CircuitOpenError(family=family, retry_after_in_seconds=0.0)
+            circuit.probes_in_flight += 1
+            return CircuitPermit(self, circuit, family, probe=True)
+
+    def _open(self, circuit: _Circuit) -> None:
+        circuit.state = OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.outcomes.clear()
+        self._opened += 1
+
+    def _record(self, circuit: _Circuit, probe: bool, *, failed: bool, duration: float) -> None:
+        slow = self.slow_call_duration_in_seconds is not None and duration > self.slow_call_duration_in_seconds
+        with self._lock:
+            if probe:
+                circuit.probes_in_flight -= 1
+                if circuit.state != HALF_OPEN:
+                    return
+                if failed or slow:
+                    self._open(circuit)
+                else:
+                    circuit.probe_successes += 1
+                    if circuit.probe_successes >= self.half_open_max_calls:
+                        circuit.state = CLOSED
+                return
+            if circuit.state != CLOSED:
+                return
+            circuit.outcomes.append((failed, slow))
+            calls = len(circuit.outcomes)
+            if calls < self.minimum_calls:
+                return
+            failures = sum(1 for outcome in circuit.outcomes if outcome[0])
+            slow_calls = sum(1 for outcome in circuit.outcomes if outcome[1])
+            if failures / calls >= self.failure_rate_threshold or slow_calls / calls >= self.slow_call_rate_threshold:
+                self._open(circuit)
+
+    def _release(self, circuit: _Circuit, probe: bool) -> None:
+        if probe:
+            with self._lock:
+                circuit.probes_in_flight -= 1
+
+    def get_state(self, family: str) -> str:
+        """
+        Returns `closed`, `open` or `half_open` for an endpoint family such as `v1/dubbing`.
+        """
+        with self._lock:
+            circuit = self._circuits.get(family)
+            if circuit is None:
+                return CLOSED
+            if circuit.state == OPEN and time.monotonic() >= circuit.opened_at + self.open_duration_in_seconds:
+                return HALF_OPEN
+            return circuit.state
+
+    def reset(self) -> None:
+        with self._lock:
+            self._circuits.clear()
+
+    def get_stats(self) -> typing.Dict[str, int]:
+        """
+        Returns the number of times a circuit opened and of requests rejected while open.
+        """
+        with self._lock:
+            return {"opened": self._opened, "rejected": self._rejected}
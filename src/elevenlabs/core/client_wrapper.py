@@ -4,13 +4,63 @@ import typing
 import httpx
 from .http_client import HttpClient
 from .http_client import AsyncHttpClient
+from .metrics import MetricsRegistry
+from .api_key_pool import ApiKeyPool
+from .circuit_breaker import CircuitBreaker
+from .connection_pool import ConnectionPoolOptions, get_pool_timeout
+from .environment_selector import EnvironmentSelector
+from .hedging_policy import HedgingPolicy
+from .rate_limiter import RateLimiter
+from .request_coalescer import RequestCoalescer
+from .request_timing import RequestTimingHook
+from .response_cache import ResponseCache
+from .retry_policy import RetryPolicy
+from .timeouts import TimeoutOptions
 
 
 class BaseClientWrapper:
-    def __init__(self, *, api_key: typing.Optional[str] = None, base_url: str, timeout: typing.Optional[float] = None):
+    def __init__(
+        self,
+        *,
+        api_key: typing.Optional[str] = None,
+        base_url: str,
+        timeout: typing.Optional[float] = None,
+        timeouts: typing.Optional[TimeoutOptions] = None,
+        connection_pool: typing.Optional[ConnectionPoolOptions] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        hedging_policy: typing.Optional[HedgingPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        request_coalescer: typing.Optional[RequestCoalescer] = None,
+        response_cache: typing.Optional[ResponseCache] = None,
+        timing_hooks: typing.Optional[typing.Sequence[RequestTimingHook]] = None,
+        metrics: typing.Optional[MetricsRegistry] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        api_key_pool: typing.Optional[ApiKeyPool] = None,
+        environment_selector: typing.Optional[EnvironmentSelector] = None,
+        validate_responses: bool = False,
+    ):
         self._api_key = api_key
         self._base_url = base_url
         self._timeout = timeout
+        self._timeouts = timeouts
+        self._connection_pool = connection_pool
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._hedging_policy = hedging_policy
+        self._rate_limiter = rate_limiter
+        self._request_coalescer = request_coalescer
+        self._response_cache = response_cache
+        self._timing_hooks: typing.List[RequestTimingHook] = []
+        for hook in timing_hooks or ():
+            self.add_timing_hook(hook)
+        self._metrics = metrics
+        self._circuit_breaker = circuit_breaker
+        self._api_key_pool = api_key_pool
+        self._environment_selector = environment_selector
+        self._validate_responses = validate_responses
+        if metrics is not None:
+            self.add_timing_hook(metrics.record_request_timing)
+        self._cached_headers: typing.Optional[typing.Dict[str, str]] = None
+        self._cached_headers_api_key: typing.Optional[str] = None
 
     def get_headers(self) -> typing.Dict[str, str]:
         headers: typing.Dict[str, str] = {
@@ -18,16 +68,90 @@ class BaseClientWrapper:
             "X-Fern-SDK-Name": "elevenlabs",
             "X-Fern-SDK-Version": "1.54.0",
         }
-        if self._api_key is not None:
-            headers["xi-api-key"] = self._api_key
+        # With a key pool, HTTP requests pick their key per attempt; websockets connect with the best key right now.
+        api_key = self._api_key_pool.select() if self._api_key_pool is not None else self._api_key
+        if api_key is not None:
+            headers["xi-api-key"] = api_key
         return headers
 
+    def get_cached_headers(self) -> typing.Dict[str, str]:
+        """
+        Returns the same headers as `get_headers`, built once and reused until the api key changes.
+        The returned dict is shared between requests and must not be mutated. With a key pool, the api key is left
+        out, HTTP requests set the key picked from the pool on every attempt.
+        """
+        if self._cached_headers is None or self._cached_headers_api_key != self._api_key:
+            headers = self.get_headers()
+            if self._api_key_pool is not None:
+                headers.pop("xi-api-key", None)
+            self._cached_headers = headers
+            self._cached_headers_api_key = self._api_key
+        return self._cached_headers
+
     def get_base_url(self) -> str:
+        if self._environment_selector is not None:
+            return self._environment_selector.get_base_url()
         return self._base_url
 
     def get_timeout(self) -> typing.Optional[float]:
         return self._timeout
 
+    def get_timeouts(self) -> typing.Optional[TimeoutOptions]:
+        return self._timeouts
+
+    def get_connection_pool(self) -> typing.Optional[ConnectionPoolOptions]:
+        return self._connection_pool
+
+    def get_pool_timeout(self) -> typing.Optional[float]:
+        return get_pool_timeout(self._connection_pool)
+
+    def get_retry_policy(self) -> RetryPolicy:
+        return self._retry_policy
+
+    def get_hedging_policy(self) -> typing.Optional[HedgingPolicy]:
+        return self._hedging_policy
+
+    def get_rate_limiter(self) -> typing.Optional[RateLimiter]:
+        return self._rate_limiter
+
+    def get_request_coalescer(self) -> typing.Optional[RequestCoalescer]:
+        return self._request_coalescer
+
+    def get_response_cache(self) -> typing.Optional[ResponseCache]:
+        return self._response_cache
+
+    def get_metrics(self) -> typing.Optional[MetricsRegistry]:
+        return self._metrics
+
+    def get_circuit_breaker(self) -> typing.Optional[CircuitBreaker]:
+        return self._circuit_breaker
+
+    def get_api_key_pool(self) -> typing.Optional[ApiKeyPool]:
+        return self._api_key_pool
+
+    def get_environment_selector(self) -> typing.Optional[EnvironmentSelector]:
+        return self._environment_selector
+
+    def get_validate_responses(self) -> bool:
+        return self._validate_responses
+
+    def get_timing_hooks(self) -> typing.List[RequestTimingHook]:
+        return self._timing_hooks
+
+    def add_timing_hook(self, hook: RequestTimingHook) -> None:
+        """
+        Registers a callable that receives the `RequestTiming` of every request made through the client. Hooks are
+        called synchronously, from async clients too, and should return quickly.
+        """
+        self._timing_hooks.append(hook)
+
+    def remove_timing_hook(self, hook: RequestTimingHook) -> None:
+        self._timing_hooks.remove(hook)
+
+    def close(self) -> None:
+        if self._environment_selector is not None:
+            self._environment_selector.close()
+
 
 class SyncClientWrapper(BaseClientWrapper):
     def __init__(
@@ -36,14 +160,57 @@ class SyncClientWrapper(BaseClientWrapper):
         api_key: typing.Optional[str] = None,
         base_url: str,
         timeout: typing.Optional[float] = None,
+        timeouts: typing.Optional[TimeoutOptions] = None,
+        connection_pool: typing.Optional[ConnectionPoolOptions] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        hedging_policy: typing.Optional[HedgingPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        request_coalescer: typing.Optional[RequestCoalescer] = None,
+        response_cache: typing.Optional[ResponseCache] = None,
+        timing_hooks: typing.Optional[typing.Sequence[RequestTimingHook]] = None,
+        metrics: typing.Optional[MetricsRegistry] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        api_key_pool: typing.Optional[ApiKeyPool] = None,
+        environment_selector: typing.Optional[EnvironmentSelector] = None,
+        validate_responses: bool = False,
         httpx_client: httpx.Client,
     ):
-        super().__init__(api_key=api_key, base_url=base_url, timeout=timeout)
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            timeouts=timeouts,
+            connection_pool=connection_pool,
+            retry_policy=retry_policy,
+            hedging_policy=hedging_policy,
+            rate_limiter=rate_limiter,
+            request_coalescer=request_coalescer,
+            response_cache=response_cache,
+            timing_hooks=timing_hooks,
+            metrics=metrics,
+            circuit_breaker=circuit_breaker,
+            api_key_pool=api_key_pool,
+            environment_selector=environment_selector,
+            validate_responses=validate_responses,
+        )
         self.httpx_client = HttpClient(
             httpx_client=httpx_client,
-            base_headers=self.get_headers,
+            base_headers=self.get_cached_headers,
             base_timeout=self.get_timeout,
             base_url=self.get_base_url,
+            base_pool_timeout=self.get_pool_timeout,
+            base_timeouts=self.get_timeouts,
+            retry_policy=self.get_retry_policy(),
+            hedging_policy=self.get_hedging_policy(),
+            rate_limiter=self.get_rate_limiter(),
+            request_coalescer=self.get_request_coalescer(),
+            response_cache=self.get_response_cache(),
+            timing_hooks=self.get_timing_hooks(),
+            metrics=self.get_metrics(),
+            circuit_breaker=self.get_circuit_breaker(),
+            api_key_pool=self.get_api_key_pool(),
+            environment_selector=self.get_environment_selector(),
+            validate_responses=self.get_validate_responses(),
         )
 
 
@@ -54,12 +221,55 @@ class AsyncClientWrapper(BaseClientWrapper):
         api_key: typing.Optional[str] = None,
         base_url: str,
         timeout: typing.Optional[float] = None,
+        timeouts: typing.Optional[TimeoutOptions] = None,
+        connection_pool: typing.Optional[ConnectionPoolOptions] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        hedging_policy: typing.Optional[HedgingPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        request_coalescer: typing.Optional[RequestCoalescer] = None,
+        response_cache: typing.Optional[ResponseCache] = None,
+        timing_hooks: typing.Optional[typing.Sequence[RequestTimingHook]] = None,
+        metrics: typing.Optional[MetricsRegistry] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        api_key_pool: typing.Optional[ApiKeyPool] = None,
+        environment_selector: typing.Optional[EnvironmentSelector] = None,
+        validate_responses: bool = False,
         httpx_client: httpx.AsyncClient,
     ):
-        super().__init__(api_key=api_key, base_url=base_url, timeout=timeout)
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            timeouts=timeouts,
+            connection_pool=connection_pool,
+            retry_policy=retry_policy,
+            hedging_policy=hedging_policy,
+            rate_limiter=rate_limiter,
+            request_coalescer=request_coalescer,
+            response_cache=response_cache,
+            timing_hooks=timing_hooks,
+            metrics=metrics,
+            circuit_breaker=circuit_breaker,
+            api_key_pool=api_key_pool,
+            environment_selector=environment_selector,
+            validate_responses=validate_responses,
+        )
         self.httpx_client = AsyncHttpClient(
             httpx_client=httpx_client,
-            base_headers=self.get_headers,
+            base_headers=self.get_cached_headers,
             base_timeout=self.get_timeout,
             base_url=self.get_base_url,
+            base_pool_timeout=self.get_pool_timeout,
+            base_timeouts=self.get_timeouts,
+            retry_policy=self.get_retry_policy(),
+            hedging_policy=self.get_hedging_policy(),
+            rate_limiter=self.get_rate_limiter(),
+            request_coalescer=self.get_request_coalescer(),
+            response_cache=self.get_response_cache(),
+            timing_hooks=self.get_timing_hooks(),
+            metrics=self.get_metrics(),
+            circuit_breaker=self.get_circuit_breaker(),
+            api_key_pool=self.get_api_key_pool(),
+            environment_selector=self.get_environment_selector(),
+            validate_responses=self.get_validate_responses(),
         )
@@ -0,0 +1,98 @@
+import typing
+
+import httpx
+
+try:
+    from typing import NotRequired  # type: ignore
+except ImportError:
+    from typing_extensions import NotRequired
+
+# Defaults sized for many concurrent, short-lived requests against a single API host. With HTTP/2 enabled most of
+# these requests are multiplexed over a handful of connections, so the connection ceiling is rarely reached. HTTP/2 is
+# opt-in, so installing `h2` for another library does not change how this client talks to the API.
+DEFAULT_MAX_CONNECTIONS = 256
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 64
+DEFAULT_KEEPALIVE_EXPIRY_IN_SECONDS = 60.0
+
+
+class ConnectionPoolOptions(typing.TypedDict, total=False):
+    """
+    Connection pool configuration for the httpx client the SDK builds when no custom `httpx_client` is passed in.
+
+    Attributes:
+        - max_connections: int. The maximum number of concurrent connections that may be established. Defaults to 256.
+
+        - max_keepalive_connections: int. The maximum number of idle connections kept open for reuse. Defaults to 64.
+
+        - keepalive_expiry: float. The number of seconds an idle connection is kept open before being closed. Defaults to 60.
+
+        - http2: bool. Whether to negotiate HTTP/2, which multiplexes concurrent requests over a single connection. Requires the `h2` package (`pip install httpx[http2]`). Defaults to False.
+
+        - pool_timeout_in_seconds: float. The number of seconds to wait for a connection to become available from the pool. Defaults to the request timeout. This is also honoured when a custom `httpx_client` is used.
+    """
+
+    max_connections: NotRequired[int]
+    max_keepalive_connections: NotRequired[int]
+    keepalive_expiry: NotRequired[float]
+    http2: NotRequired[bool]
+    pool_timeout_in_seconds: NotRequired[float]
+
+
+def is_http2_available() -> bool:
+    try:
+        import h2  # type: ignore # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_httpx_limits(connection_pool: typing.Optional[ConnectionPoolOptions]) -> httpx.Limits:
+    options: ConnectionPoolOptions = connection_pool if connection_pool is not None else {}
+    return httpx.Limits(
+        max_connections=options.get("max_connections", DEFAULT_MAX_CONNECTIONS),
+        max_keepalive_connections=options.get("max_keepalive_connections", DEFAULT_MAX_KEEPALIVE_CONNECTIONS),
+        keepalive_expiry=options.get("keepalive_expiry", DEFAULT_KEEPALIVE_EXPIRY_IN_SECONDS),
+    )
+
+
+def get_http2_enabled(connection_pool: typing.Optional[ConnectionPoolOptions]) -> bool:
+    http2 = connection_pool.get("http2", False) if connection_pool is not None else False
+    if http2 and not is_http2_available():
+        raise ImportError(
+            "HTTP/2 support requires the `h2` package, install it with `pip install httpx[http2]` and try again."
+        )
+    return http2
+
+
+def get_pool_timeout(connection_pool: typing.Optional[ConnectionPoolOptions]) -> typing.Optional[float]:
+    return connection_pool.get("pool_timeout_in_seconds") if connection_pool is not None else None
+
+
+def build_httpx_client(
+    *,
+    timeout: typing.Optional[float],
+    follow_redirects: typing.Optional[bool],
+    connection_pool: typing.Optional[ConnectionPoolOptions],
+) -> httpx.Client:
+    return httpx.Client(
+        timeout=timeout,
+        limits=get_httpx_limits(connection_pool),
+        http2=get_http2_enabled(connection_pool),
+        # httpx does not follow redirects unless asked to.
+        follow_redirects=follow_redirects if follow_redirects is not None else False,
+    )
+
+
+def build_async_httpx_client(
+    *,
+    timeout: typing.Optional[float],
+    follow_redirects: typing.Optional[bool],
+    connection_pool: typing.Optional[ConnectionPoolOptions],
+) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=timeout,
+        limits=get_httpx_limits(connection_pool),
+        http2=get_http2_enabled(connection_pool),
+        # httpx does not follow redirects unless asked to.
+        follow_redirects=follow_redirects if follow_redirects is not None else False,
+    )
@@ -0,0 +1,116 @@
+import asyncio
+import os
+import typing
+
+from .request_options import RequestOptions
+
+Destination = typing.Union[str, "os.PathLike[str]", typing.IO[bytes]]
+
+
+def get_chunk_size(request_options: typing.Optional[RequestOptions]) -> typing.Optional[int]:
+    """
+    Returns the `chunk_size` binary responses are iterated with. Without one, chunks are yielded as they are received
+    from the network: as small as the API sends them while audio is generated, and up to the 64 KiB read at a time
+    from the connection for downloads, rather than re-buffered into a Python object per KiB.
+    """
+    return request_options.get("chunk_size") if request_options is not None else None
+
+
+def _close(chunks: typing.Iterator[bytes]) -> None:
+    close = getattr(chunks, "close", None)
+    if close is not None:
+        close()
+
+
+async def _aclose(chunks: typing.AsyncIterator[bytes]) -> None:
+    aclose = getattr(chunks, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+def download_to(chunks: typing.Iterator[bytes], destination: Destination) -> int:
+    """
+    Writes a binary response, e.g. of `history.download` or `text_to_speech.convert`, to a path or a file object
+    opened in binary mode as it is received, and returns the number of bytes written. Files opened from a path are
+    closed, file objects are left open.
+
+    from elevenlabs.client import ElevenLabs
+    from elevenlabs.core import download_to
+
+    client = ElevenLabs()
+    download_to(client.history.download(history_item_ids=["HISTORY_ITEM_ID"]), "history.zip")
+    """
+    file = open(destination, "wb") if isinstance(destination, (str, os.PathLike)) else destination
+    written = 0
+    try:
+        for chunk in chunks:
+            file.write(chunk)
+            written += len(chunk)
+    finally:
+        _close(chunks)
+        if file is not destination:
+            file.close()
+    return written
+
+
+async def adownload_to(chunks: typing.AsyncIterator[bytes], destination: Destination) -> int:
+    """
+    The async counterpart of `download_to`, for `AsyncElevenLabs` clients. Files are written in a worker thread so
+    that the event loop is not blocked on disk.
+    """
+    loop = asyncio.get_running_loop()
+    file: typing.IO[bytes]
+    if isinstance(destination, (str, os.PathLike)):
+        file = await loop.run_in_executor(None, open, destination, "wb")
+    else:
+        file = destination
+    written = 0
+    try:
+        async for chunk in chunks:
+            await loop.run_in_executor(None, file.write, chunk)
+            written += len(chunk)
+    finally:
+        await _aclose(chunks)
+        if file is not destination:
+            await loop.run_in_executor(None, file.close)
+    return written
+
+
+def _write_into(view: memoryview, written: int, chunk: bytes) -> int:
+    end = written + len(chunk)
+    if end > len(view):
+        raise ValueError(f"The response does not fit into the buffer of {len(view)} bytes.")
+    view[written:end] = chunk
+    return end
+
+
+def readinto(chunks: typing.Iterator[bytes], buffer: typing.Union[bytearray, memoryview]) -> int:
+    """
+    Copies a binary response into a preallocated buffer as it is received and returns the number of bytes written,
+    raising `ValueError` if the response is larger than the buffer.
+
+    audio = bytearray(10 * 1024 * 1024)
+    size = readinto(client.text_to_speech.convert(voice_id, text="Hello"), audio)
+    """
+    view = memoryview(buffer).cast("B")
+    written = 0
+    try:
+        for chunk in chunks:
+            written = _write_into(view, written, chunk)
+    finally:
+        _close(chunks)
+    return written
+
+
+async def areadinto(chunks: typing.AsyncIterator[bytes], buffer: typing.Union[bytearray, memoryview]) -> int:
+    """
+    The async counterpart of `readinto`, for `AsyncElevenLabs` clients.
+    """
+    view = memoryview(buffer).cast("B")
+    written = 0
+    try:
+        async for chunk in chunks:
+            written = _write_into(view, written, chunk)
+    finally:
+        await _aclose(chunks)
+    return written
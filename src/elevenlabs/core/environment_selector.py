@@ -0,0 +1,176 @@
+import threading
+import time
+import typing
+
+import httpx
+
+from ..environment import ElevenLabsEnvironment
+
+# Errors showing that a region cannot be reached at all, as opposed to a slow or failing request.
+CONNECTION_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+
+def _is_under(url: str, base_url: str) -> bool:
+    return url == base_url or url.startswith(base_url + "/")
+
+
+class EnvironmentSelector:
+    """
+    Opt-in selection of the lowest-latency region among the `ElevenLabsEnvironment`s. The base url of each
+    environment is probed in a background thread when the client first needs a base url and every
+    `probe_interval_in_seconds` after that; REST requests, `text_to_speech.convert_realtime` and conversations then use
+    the fastest healthy one. Until the first probe completes the first environment is used. `client.close()` stops the
+    probes.
+
+    An environment whose connections fail is skipped until the next probe, and requests retried after such a failure
+    are sent to the next best environment.
+
+    Parameters
+    ----------
+    environments : typing.Sequence[typing.Union[ElevenLabsEnvironment, str]]
+        The environments, or base urls, to choose from, in order of preference when latencies are equal. Defaults to
+        every `ElevenLabsEnvironment`.
+
+    probe_interval_in_seconds : float
+        How often the environments are probed again. Defaults to 300 seconds.
+
+    probe_timeout_in_seconds : float
+        The timeout of a probe, environments not answering in time are considered unhealthy. Defaults to 2 seconds.
+
+    probe_count : int
+        The number of requests sent to each environment per probe, the fastest one is its latency so that the
+        connection setup of the first one is not counted. Defaults to 3.
+
+    probe_path : str
+        The path requested when probing. Any response other than a 5xx counts as healthy. Defaults to the base url.
+    """
+
+    def __init__(
+        self,
+        environments: typing.Optional[typing.Sequence[typing.Union[ElevenLabsEnvironment, str]]] = None,
+        *,
+        probe_interval_in_seconds: float = 300.0,
+        probe_timeout_in_seconds: float = 2.0,
+        probe_count: int = 3,
+        probe_path: str = "",
+    ) -> None:
+        self.base_urls = [
+            environment.value if isinstance(environment, ElevenLabsEnvironment) else environment
+            for environment in (environments if environments is not None else list(ElevenLabsEnvironment))
+        ]
+        if not self.base_urls:
+            raise ValueError("An EnvironmentSelector requires at least one environment.")
+        self.probe_interval_in_seconds = probe_interval_in_seconds
+        self.probe_timeout_in_seconds = probe_timeout_in_seconds
+        self.probe_count = probe_count
+        self.probe_path = probe_path
+        self._latencies: typing.Dict[str, typing.Optional[float]] = {}
+        self._unreachable: typing.Set[str] = set()
+        self._base_url = self.base_urls[0]
+        self._last_probe = -float("inf")
+        self._probing = False
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def get_base_url(self) -> str:
+        """
+        Returns the base url of the selected environment, starting a background probe when the last one is older
+        than `probe_interval_in_seconds`.
+        """
+        if time.monotonic() - self._last_probe >= self.probe_interval_in_seconds:
+            self.start()
+        return self._base_url
+
+    def get_latencies(self) -> typing.Dict[str, typing.Optional[float]]:
+        """
+        Returns the latency measured by the last probe for each base url, None for unhealthy ones.
+        """
+        with self._lock:
+            return dict(self._latencies)
+
+    def start(self) -> None:
+        """
+        Probes the environments in a background thread, unless a probe is already running or the selector is closed.
+        """
+        with self._lock:
+            if self._probing or self._closed:
+                return
+            self._probing = True
+            # Set up front so that requests made during the probe do not start another one.
+            self._last_probe = time.monotonic()
+        threading.Thread(target=self._probe_in_background, name="elevenlabs-environment-probe", daemon=True).start()
+
+    def close(self) -> None:
+        """
+        Stops probing the environments, the selected one keeps being used. A probe already running completes in the
+        background.
+        """
+        with self._lock:
+            self._closed = True
+
+    def _probe_in_background(self) -> None:
+        try:
+            self.probe()
+        finally:
+            with self._lock:
+                self._probing = False
+
+    def _probe_base_url(self, client: httpx.Client, base_url: str) -> typing.Optional[float]:
+        latency: typing.Optional[float] = None
+        for _ in range(self.probe_count):
+            started_at = time.perf_counter()
+            try:
+                response = client.get(f"{base_url}/{self.probe_path}")
+            except httpx.HTTPError:
+                return None
+            if response.status_code >= 500:
+                return None
+            elapsed = time.perf_counter() - started_at
+            latency = elapsed if latency is None else min(latency, elapsed)
+        return latency
+
+    def probe(self) -> None:
+        """
+        Probes every environment now and selects the fastest healthy one. The selection is kept if none is healthy.
+        """
+        with httpx.Client(timeout=self.probe_timeout_in_seconds) as client:
+            latencies = {base_url: self._probe_base_url(client, base_url) for base_url in self.base_urls}
+        with self._lock:
+            self._latencies = latencies
+            self._unreachable = {base_url for base_url, latency in latencies.items() if latency is None}
+            self._last_probe = time.monotonic()
+            self._select_locked()
+
+    def _select_locked(self) -> None:
+        healthy = [
+            base_url
+            for base_url in self.base_urls
+            if base_url not in self._unreachable and self._latencies.get(base_url, 0.0) is not None
+        ]
+        if healthy:
+            self._base_url = min(healthy, key=lambda base_url: self._latencies.get(base_url) or 0.0)
+
+    def record_connection_error(self, url: str) -> None:
+        """
+        Marks the environment of a request that could not connect as unreachable until the next probe, failing over
+        to the next best one.
+        """
+        with self._lock:
+            for base_url in self.base_urls:
+                if _is_under(url, base_url):
+                    self._unreachable.add(base_url)
+            self._select_locked()
+
+    def rebase(self, request: httpx.Request) -> None:
+        """
+        Points a request built for another of the environments, e.g. before a failover, to the selected one.
+        """
+        base_url = self._base_url
+        url = str(request.url)
+        if _is_under(url, base_url):
+            return
+        for other_base_url in self.base_urls:
+            if _is_under(url, other_base_url):
+                request.url = httpx.URL(base_url + url[len(other_base_url) :])
+                request.headers["host"] = request.url.netloc.decode("ascii")
+                return
@@ -1,10 +1,13 @@
 # This file was auto-generated by Fern from our API Definition.
 
-from typing import IO, Dict, List, Mapping, Optional, Tuple, Union, cast
+from typing import IO, TYPE_CHECKING, Dict, List, Mapping, Optional, Tuple, Union, cast
+
+if TYPE_CHECKING:
+    from .upload import UploadFile
 
 # File typing inspired by the flexibility of types within the httpx library
 # https://github.com/encode/httpx/blob/master/httpx/_types.py
-FileContent = Union[IO[bytes], bytes, str]
+FileContent = Union[IO[bytes], bytes, str, "UploadFile"]
 File = Union[
     # file (or bytes)
     FileContent,
@@ -0,0 +1,88 @@
+import collections
+import threading
+import typing
+
+
+class HedgingPolicy:
+    """
+    Opt-in request hedging for latency-critical streaming calls such as `text_to_speech.convert_as_stream`. When the
+    first attempt has not produced its first byte of audio after the hedging delay, an identical second request is
+    sent; whichever produces the first byte first is used and the other one is cancelled.
+
+    Only requests whose body is held in memory, or that have no body, are hedged. Uploads of files and iterators are
+    sent once.
+
+    A policy can be set on the client, and overridden per call through `RequestOptions`.
+
+    Parameters
+    ----------
+    delay_in_seconds : typing.Optional[float]
+        A fixed delay after which the hedge is sent. When omitted, the delay adapts to the `percentile` of the time
+        to first byte recently observed by this policy.
+
+    percentile : float
+        The time to first byte percentile used as the adaptive delay. Defaults to 0.95.
+
+    min_samples : int
+        The number of observations required before the adaptive delay is used, no hedges are sent before that.
+        Defaults to 20.
+
+    window_size : int
+        The number of most recent time to first byte observations the adaptive delay is computed from. Defaults to 200.
+
+    min_delay_in_seconds : float
+        A floor for the adaptive delay, so that a fast backend does not turn every request into two. Defaults to 0.05.
+    """
+
+    def __init__(
+        self,
+        *,
+        delay_in_seconds: typing.Optional[float] = None,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        window_size: int = 200,
+        min_delay_in_seconds: float = 0.05,
+    ) -> None:
+        self.delay_in_seconds = delay_in_seconds
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay_in_seconds = min_delay_in_seconds
+        self._ttfb_samples: typing.Deque[float] = collections.deque(maxlen=window_size)
+        self._requests = 0
+        self._hedges_fired = 0
+        self._hedges_won = 0
+        self._lock = threading.Lock()
+
+    def get_delay(self) -> typing.Optional[float]:
+        """
+        Returns the number of seconds to wait before sending a hedge, or None if no hedge should be sent.
+        """
+        with self._lock:
+            self._requests += 1
+            if self.delay_in_seconds is not None:
+                return self.delay_in_seconds
+            if len(self._ttfb_samples) < self.min_samples:
+                return None
+            samples = sorted(self._ttfb_samples)
+        index = min(len(samples) - 1, int(len(samples) * self.percentile))
+        return max(samples[index], self.min_delay_in_seconds)
+
+    def record_time_to_first_byte(self, seconds: float) -> None:
+        with self._lock:
+            self._ttfb_samples.append(seconds)
+
+    def record_hedge_fired(self) -> None:
+        with self._lock:
+            self._hedges_fired += 1
+
+    def record_hedge_won(self) -> None:
+        with self._lock:
+            self._hedges_won += 1
+
+    def get_stats(self) -> typing.Dict[str, int]:
+        """
+        Returns how many requests went through this policy, how many of them sent a hedge and how many hedges
+        produced the first byte before the original request.
+        """
+        with self._lock:
+            return {"requests": self._requests, "hedges_fired": self._hedges_fired, "hedges_won": self._hedges_won}
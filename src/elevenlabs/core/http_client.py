@@ -1,92 +1,160 @@
 # This file was auto-generated by Fern from our API Definition.
 
 import asyncio
-import email.utils
-import json
+import concurrent.futures
+import functools
 import re
+import threading
 import time
 import typing
 import urllib.parse
 from contextlib import asynccontextmanager, contextmanager
-from random import random
 
 import httpx
 
+from .api_key_pool import ApiKeyPool
+from .circuit_breaker import CircuitBreaker, CircuitPermit
+from .environment_selector import CONNECTION_ERRORS, EnvironmentSelector
 from .file import File, convert_file_dict_to_httpx_tuples
+from .json_codec import json_dumps, json_loads
 from .jsonable_encoder import jsonable_encoder
-from .query_encoder import encode_query
+from .query_encoder import single_query_encoder
 from .remove_none_from_dict import remove_none_from_dict
+from .hedging_policy import HedgingPolicy
+from .metrics import REQUESTS_IN_FLIGHT, MetricsRegistry
+from .pydantic_utilities import UnparsedJson
+from .rate_limiter import RateLimiter
+from .request_coalescer import RequestCoalescer
 from .request_options import RequestOptions
+from .request_timing import RequestTiming, RequestTimingHook
+from .response_cache import ResponseCache
+from .retry_policy import RetryPolicy
+from .timeouts import (
+    DeadlineExceededError,
+    TimeoutOptions,
+    build_httpx_timeout,
+    fits_deadline,
+    get_deadline,
+    get_stream_idle_timeout,
+    limit_timeouts_to_deadline,
+    set_stream_read_timeout,
+)
+from .upload import MultipartStream, is_streaming_upload, with_multipart_stream
 
-INITIAL_RETRY_DELAY_SECONDS = 0.5
-MAX_RETRY_DELAY_SECONDS = 10
-MAX_RETRY_DELAY_SECONDS_FROM_HEADER = 30
+if typing.TYPE_CHECKING:
+    from httpx._types import RequestFiles
 
+# Requests with these methods never invalidate cached responses.
+_SAFE_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
 
-def _parse_retry_after(response_headers: httpx.Headers) -> typing.Optional[float]:
-    """
-    This function parses the `Retry-After` header in a HTTP response and returns the number of seconds to wait.
+# Values of these exact types are already JSON-compatible and are passed through without running `jsonable_encoder`.
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool))
 
-    Inspired by the urllib3 retry implementation.
-    """
-    retry_after_ms = response_headers.get("retry-after-ms")
-    if retry_after_ms is not None:
-        try:
-            return int(retry_after_ms) / 1000 if retry_after_ms > 0 else 0
-        except Exception:
-            pass
 
-    retry_after = response_headers.get("retry-after")
-    if retry_after is None:
-        return None
+class _JsonResponse(httpx.Response):
+    """A response whose JSON body is decoded with the codec set with `set_json_codec`."""
 
-    # Attempt to parse the header as an int.
-    if re.match(r"^\s*[0-9]+\s*$", retry_after):
-        seconds = float(retry_after)
-    # Fallback to parsing it as a date.
-    else:
-        retry_date_tuple = email.utils.parsedate_tz(retry_after)
-        if retry_date_tuple is None:
-            return None
-        if retry_date_tuple[9] is None:  # Python 2
-            # Assume UTC if no timezone was specified
-            # On Python2.7, parsedate_tz returns None for a timezone offset
-            # instead of 0 if no timezone is given, where mktime_tz treats
-            # a None timezone offset as local time.
-            retry_date_tuple = retry_date_tuple[:9] + (0,) + retry_date_tuple[10:]
+    def json(self, **kwargs: typing.Any) -> typing.Any:
+        if kwargs:
+            return super().json(**kwargs)
+        return json_loads(self.content)
 
-        retry_date = email.utils.mktime_tz(retry_date_tuple)
-        seconds = retry_date - time.time()
 
-    if seconds < 0:
-        seconds = 0
+class _ValidatedResponse(_JsonResponse):
+    """A successful response whose JSON body is left undecoded, for `construct_type` to validate with pydantic."""
 
-    return seconds
+    def json(self, **kwargs: typing.Any) -> typing.Any:
+        if kwargs or not self.content:
+            return super().json(**kwargs)
+        return UnparsedJson(self.content)
 
 
-def _retry_timeout(response: httpx.Response, retries: int) -> float:
+def _decode_json_with_codec(response: httpx.Response, *, validate: bool = False) -> httpx.Response:
+    # Error responses keep decoding their JSON when validating, their bodies are constructed leniently into
+    # `ApiError`s. Coalesced responses already decode their JSON with the codec, once for all callers.
+    if validate and 200 <= response.status_code < 300:
+        response.__class__ = _ValidatedResponse
+    elif type(response) is httpx.Response:
+        response.__class__ = _JsonResponse
+    return response
+
+
+@functools.lru_cache(maxsize=32)
+def _get_url_prefix(base_url: str) -> typing.Optional[str]:
     """
-    Determine the amount of time to wait before retrying a request.
-    This function begins by trying to parse a retry-after header from the response, and then proceeds to use exponential backoff
-    with a jitter to determine the number of seconds to wait.
+    Returns the prefix request paths can be appended to for the given base url, or None if the base url has a
+    query string, fragment or similar that requires the full `urljoin` resolution.
     """
+    prefix = f"{base_url}/"
+    return prefix if urllib.parse.urljoin(prefix, "path") == f"{prefix}path" else None
 
-    # If the API asks us to wait a certain amount of time (and it's a reasonable amount), just do what it says.
-    retry_after = _parse_retry_after(response.headers)
-    if retry_after is not None and retry_after <= MAX_RETRY_DELAY_SECONDS_FROM_HEADER:
-        return retry_after
 
-    # Apply exponential backoff, capped at MAX_RETRY_DELAY_SECONDS.
-    retry_delay = min(INITIAL_RETRY_DELAY_SECONDS * pow(2.0, retries), MAX_RETRY_DELAY_SECONDS)
+# Request paths made up of plain segments (no dots, colons, queries or leading slashes) resolve to a simple
+# concatenation onto the base url.
+_SIMPLE_PATH_RE = re.compile(r"^[A-Za-z0-9_~%@!$&'()*+,;=-]+(?:/[A-Za-z0-9_~%@!$&'()*+,;=-]*)*$")
 
-    # Add a randomness / jitter to the retry delay to avoid overwhelming the server with retries.
-    timeout = retry_delay * (1 - 0.25 * random())
-    return timeout if timeout >= 0 else 0
 
+def _build_url(base_url: str, path: typing.Optional[str]) -> str:
+    prefix = _get_url_prefix(base_url)
+    if prefix is not None:
+        if not path:
+            return prefix
+        if _SIMPLE_PATH_RE.match(path) is not None:
+            return prefix + path
+    return urllib.parse.urljoin(f"{base_url}/", path)
 
-def _should_retry(response: httpx.Response) -> bool:
-    retriable_400s = [429, 408, 409]
-    return response.status_code >= 500 or response.status_code in retriable_400s
+
+def _build_headers(
+    base_headers: typing.Dict[str, str],
+    headers: typing.Optional[typing.Dict[str, typing.Any]],
+    request_options: typing.Optional[RequestOptions],
+) -> typing.Dict[str, typing.Any]:
+    additional_headers = request_options.get("additional_headers") if request_options is not None else None
+    merged_headers = {
+        **base_headers,
+        **(headers if headers is not None else {}),
+        **(additional_headers or {}),
+    }
+    return {
+        key: value if type(value) in _PRIMITIVE_TYPES else jsonable_encoder(value)
+        for key, value in merged_headers.items()
+        if value is not None
+    }
+
+
+def _build_query(
+    params: typing.Optional[typing.Dict[str, typing.Any]],
+    request_options: typing.Optional[RequestOptions],
+    omit: typing.Optional[typing.Any],
+) -> typing.List[typing.Tuple[str, typing.Any]]:
+    additional_query_parameters = (
+        request_options.get("additional_query_parameters") if request_options is not None else None
+    )
+    merged_params = (
+        {**(params if params is not None else {}), **additional_query_parameters}
+        if additional_query_parameters
+        else params
+    )
+    encoded_query: typing.List[typing.Tuple[str, typing.Any]] = []
+    if not merged_params:
+        return encoded_query
+    for key, value in merged_params.items():
+        if value is None or (omit is not None and value is omit):
+            continue
+        if type(value) in _PRIMITIVE_TYPES:
+            encoded_query.append((key, value))
+        else:
+            encoded_query.extend(single_query_encoder(key, jsonable_encoder(value)))
+    return encoded_query
+
+
+def _build_files(
+    files: typing.Optional[typing.Dict[str, typing.Optional[typing.Union[File, typing.List[File]]]]],
+    omit: typing.Optional[typing.Any],
+) -> typing.Optional[typing.List[typing.Tuple[str, File]]]:
+    if files is None or files is omit:
+        return None
+    return convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
 
 
 def remove_omit_from_dict(
@@ -127,6 +195,251 @@ def maybe_filter_request_body(
     return data_content
 
 
+def _get_request_timeout(
+    *,
+    request_options: typing.Optional[RequestOptions],
+    base_timeout: typing.Callable[[], typing.Optional[float]],
+    base_pool_timeout: typing.Optional[typing.Callable[[], typing.Optional[float]]],
+    base_timeouts: typing.Optional[typing.Callable[[], typing.Optional[TimeoutOptions]]],
+) -> typing.Optional[typing.Union[float, httpx.Timeout]]:
+    timeout = (
+        request_options.get("timeout_in_seconds")
+        if request_options is not None and request_options.get("timeout_in_seconds") is not None
+        else base_timeout()
+    )
+    # A per-request timeout replaces the httpx client's timeout entirely, so the pool and phase timeouts have to be
+    # re-applied here.
+    return build_httpx_timeout(
+        timeout=timeout,
+        pool_timeout=base_pool_timeout() if base_pool_timeout is not None else None,
+        client_timeouts=base_timeouts() if base_timeouts is not None else None,
+        request_timeouts=request_options.get("timeouts") if request_options is not None else None,
+    )
+
+
+def _has_api_key_header(request_options: typing.Optional[RequestOptions]) -> bool:
+    additional_headers = request_options.get("additional_headers") if request_options is not None else None
+    return additional_headers is not None and any(key.lower() == "xi-api-key" for key in additional_headers)
+
+
+def _encode_json_body(
+    json_body: typing.Optional[typing.Any],
+    *,
+    content: typing.Optional[typing.Any],
+    data: typing.Optional[typing.Any],
+    files: typing.Optional[typing.Any],
+) -> typing.Optional[bytes]:
+    # Like httpx, JSON bodies are only sent when there is no raw content, form data or files.
+    if json_body is None or content is not None or data or files:
+        return None
+    return json_dumps(json_body)
+
+
+def _is_replayable(content: typing.Optional[typing.Any], request: httpx.Request) -> bool:
+    # Iterator bodies are consumed by the first attempt and cannot be sent again.
+    if isinstance(request.stream, MultipartStream):
+        return request.stream.replayable
+    return content is None or isinstance(content, (bytes, str))
+
+
+class _PeekedByteStream(httpx.SyncByteStream):
+    """Replays an already read first chunk ahead of the rest of a response stream."""
+
+    def __init__(self, first_chunk: bytes, iterator: typing.Iterator[bytes], stream: httpx.SyncByteStream) -> None:
+        self._first_chunk = first_chunk
+        self._iterator = iterator
+        self._stream = stream
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        if self._first_chunk:
+            yield self._first_chunk
+        yield from self._iterator
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+class _AsyncPeekedByteStream(httpx.AsyncByteStream):
+    """Replays an already read first chunk ahead of the rest of a response stream."""
+
+    def __init__(
+        self, first_chunk: bytes, iterator: typing.AsyncIterator[bytes], stream: httpx.AsyncByteStream
+    ) -> None:
+        self._first_chunk = first_chunk
+        self._iterator = iterator
+        self._stream = stream
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        if self._first_chunk:
+            yield self._first_chunk
+        async for chunk in self._iterator:
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+
+class _DeadlineByteStream(httpx.SyncByteStream):
+    """Fails a response stream that is still being read once the request's deadline has passed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, deadline: float, request: httpx.Request) -> None:
+        self._stream = stream
+        self._deadline = deadline
+        self._request = request
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        for chunk in self._stream:
+            if time.monotonic() > self._deadline:
+                raise DeadlineExceededError("The deadline of the request has passed.", request=self._request)
+            yield chunk
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+class _AsyncDeadlineByteStream(httpx.AsyncByteStream):
+    """Fails a response stream that is still being read once the request's deadline has passed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, deadline: float, request: httpx.Request) -> None:
+        self._stream = stream
+        self._deadline = deadline
+        self._request = request
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            if time.monotonic() > self._deadline:
+                raise DeadlineExceededError("The deadline of the request has passed.", request=self._request)
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+
+class _ReleasingByteStream(httpx.SyncByteStream):
+    """Calls `release` once the response stream is closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, release: typing.Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: typing.Optional[typing.Callable[[], None]] = release
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            release = self._release
+            self._release = None
+            if release is not None:
+                release()
+
+
+class _AsyncReleasingByteStream(httpx.AsyncByteStream):
+    """Calls `release` once the response stream is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: typing.Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: typing.Optional[typing.Callable[[], None]] = release
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            release = self._release
+            self._release = None
+            if release is not None:
+                release()
+
+
+def _peek_first_chunk(response: httpx.Response) -> None:
+    """
+    Reads the first chunk of a streamed response so that transport errors surfacing before any body byte reaches
+    the caller can still be retried.
+    """
+    stream = typing.cast(httpx.SyncByteStream, response.stream)
+    iterator = iter(stream)
+    first_chunk = next(iterator, b"")
+    response.stream = _PeekedByteStream(first_chunk, iterator, stream)
+
+
+async def _apeek_first_chunk(response: httpx.Response) -> None:
+    stream = typing.cast(httpx.AsyncByteStream, response.stream)
+    iterator = stream.__aiter__()
+    try:
+        first_chunk = await iterator.__anext__()
+    except StopAsyncIteration:
+        first_chunk = b""
+    response.stream = _AsyncPeekedByteStream(first_chunk, iterator, stream)
+
+
+def _is_hedgeable(request: httpx.Request) -> bool:
+    # Hedged attempts share the request body, which is only safe for bodies held in memory. Files and iterators are
+    # read as they are sent and would be consumed by whichever attempt reads them first.
+    return isinstance(request.stream, httpx.ByteStream)
+
+
+def _clone_request(request: httpx.Request) -> httpx.Request:
+    # Hedged attempts are in flight concurrently, so each gets its own request object over the same in-memory body.
+    return httpx.Request(
+        request.method,
+        request.url,
+        headers=request.headers,
+        stream=request.stream,
+        extensions=_copy_extensions(request),
+    )
+
+
+def _copy_extensions(request: httpx.Request) -> typing.Dict[str, typing.Any]:
+    # The timeout extension is changed per attempt by `_apply_stream_idle_timeout`, so each copy gets its own.
+    extensions = dict(request.extensions)
+    if isinstance(extensions.get("timeout"), dict):
+        extensions["timeout"] = dict(extensions["timeout"])
+    return extensions
+
+
+def _apply_stream_idle_timeout(
+    response: httpx.Response, stream_idle_timeout: typing.Optional[float], deadline: typing.Optional[float]
+) -> None:
+    """
+    Replaces the read timeout of a streamed response whose headers were received with the stream idle timeout, so that
+    every chunk of the body, the first one included, is waited for at most that long.
+    """
+    if stream_idle_timeout is None:
+        return
+    set_stream_read_timeout(
+        response,
+        stream_idle_timeout if deadline is None else min(stream_idle_timeout, max(deadline - time.monotonic(), 0.0)),
+    )
+
+
+_hedging_executor: typing.Optional[concurrent.futures.ThreadPoolExecutor] = None
+_hedging_executor_lock = threading.Lock()
+
+
+def _get_hedging_executor() -> concurrent.futures.ThreadPoolExecutor:
+    # Shared by all clients, so hedging does not leave a pool of threads behind for every client that is discarded.
+    global _hedging_executor
+    with _hedging_executor_lock:
+        if _hedging_executor is None:
+            _hedging_executor = concurrent.futures.ThreadPoolExecutor(thread_name_prefix="elevenlabs-hedge")
+        return _hedging_executor
+
+
+def _close_hedge_loser(future: "concurrent.futures.Future[typing.Tuple[httpx.Response, float]]") -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result()[0].close()
+
+
+def _aclose_hedge_loser(task: "asyncio.Task[typing.Tuple[httpx.Response, float]]") -> None:
+    if not task.cancelled() and task.exception() is None:
+        asyncio.ensure_future(task.result()[0].aclose())
+
+
 # Abstracted out for testing purposes
 def get_request_body(
     *,
@@ -155,10 +468,36 @@ class HttpClient:
         base_timeout: typing.Callable[[], typing.Optional[float]],
         base_headers: typing.Callable[[], typing.Dict[str, str]],
         base_url: typing.Optional[typing.Callable[[], str]] = None,
+        base_pool_timeout: typing.Optional[typing.Callable[[], typing.Optional[float]]] = None,
+        base_timeouts: typing.Optional[typing.Callable[[], typing.Optional[TimeoutOptions]]] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        hedging_policy: typing.Optional[HedgingPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        request_coalescer: typing.Optional[RequestCoalescer] = None,
+        response_cache: typing.Optional[ResponseCache] = None,
+        timing_hooks: typing.Optional[typing.List[RequestTimingHook]] = None,
+        metrics: typing.Optional[MetricsRegistry] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        api_key_pool: typing.Optional[ApiKeyPool] = None,
+        environment_selector: typing.Optional[EnvironmentSelector] = None,
+        validate_responses: bool = False,
     ):
         self.base_url = base_url
         self.base_timeout = base_timeout
         self.base_headers = base_headers
+        self.base_pool_timeout = base_pool_timeout
+        self.base_timeouts = base_timeouts
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.hedging_policy = hedging_policy
+        self.rate_limiter = rate_limiter
+        self.request_coalescer = request_coalescer
+        self.response_cache = response_cache
+        self.timing_hooks = timing_hooks if timing_hooks is not None else []
+        self.metrics = metrics
+        self.circuit_breaker = circuit_breaker
+        self.api_key_pool = api_key_pool
+        self.environment_selector = environment_selector
+        self.validate_responses = validate_responses
         self.httpx_client = httpx_client
 
     def get_base_url(self, maybe_base_url: typing.Optional[str]) -> str:
@@ -170,6 +509,368 @@ class HttpClient:
             raise ValueError("A base_url is required to make this request, please provide one and try again.")
         return base_url
 
+    def get_timeout(
+        self, request_options: typing.Optional[RequestOptions]
+    ) -> typing.Optional[typing.Union[float, httpx.Timeout]]:
+        return _get_request_timeout(
+            request_options=request_options,
+            base_timeout=self.base_timeout,
+            base_pool_timeout=self.base_pool_timeout,
+            base_timeouts=self.base_timeouts,
+        )
+
+    def get_stream_idle_timeout(self, request_options: typing.Optional[RequestOptions]) -> typing.Optional[float]:
+        return get_stream_idle_timeout(
+            self.base_timeouts() if self.base_timeouts is not None else None,
+            request_options.get("timeouts") if request_options is not None else None,
+        )
+
+    def get_retry_policy(self, request_options: typing.Optional[RequestOptions]) -> RetryPolicy:
+        retry_policy = request_options.get("retry_policy") if request_options is not None else None
+        return retry_policy if retry_policy is not None else self.retry_policy
+
+    def get_hedging_policy(self, request_options: typing.Optional[RequestOptions]) -> typing.Optional[HedgingPolicy]:
+        hedging_policy = request_options.get("hedging_policy") if request_options is not None else None
+        return hedging_policy if hedging_policy is not None else self.hedging_policy
+
+    def _send_until_first_byte(
+        self, request: httpx.Request, stream_idle_timeout: typing.Optional[float], deadline: typing.Optional[float]
+    ) -> typing.Tuple[httpx.Response, float]:
+        started_at = time.monotonic()
+        response = self.httpx_client.send(request, stream=True)
+        try:
+            _apply_stream_idle_timeout(response, stream_idle_timeout, deadline)
+            if 200 <= response.status_code < 300:
+                _peek_first_chunk(response)
+        except BaseException:
+            response.close()
+            raise
+        return response, time.monotonic() - started_at
+
+    def _send_hedged(
+        self,
+        request: httpx.Request,
+        hedging_policy: HedgingPolicy,
+        stream_idle_timeout: typing.Optional[float],
+        deadline: typing.Optional[float],
+    ) -> httpx.Response:
+        delay = hedging_policy.get_delay()
+        if delay is None:
+            response, time_to_first_byte = self._send_until_first_byte(request, stream_idle_timeout, deadline)
+            hedging_policy.record_time_to_first_byte(time_to_first_byte)
+            return response
+
+        # Cloned before the primary attempt changes the timeouts of `request` once its headers are received.
+        hedge_request = _clone_request(request)
+        executor = _get_hedging_executor()
+        primary = executor.submit(self._send_until_first_byte, request, stream_idle_timeout, deadline)
+        attempts = [primary]
+        done, pending = concurrent.futures.wait(attempts, timeout=delay)
+        if not done:
+            hedging_policy.record_hedge_fired()
+            attempts.append(executor.submit(self._send_until_first_byte, hedge_request, stream_idle_timeout, deadline))
+            pending = set(attempts)
+
+        winner = next((attempt for attempt in done if attempt.exception() is None), None)
+        while winner is None and pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            winner = next((attempt for attempt in done if attempt.exception() is None), None)
+
+        # Threads cannot be interrupted, so losers are closed as soon as they complete.
+        for attempt in attempts:
+            if attempt is not winner:
+                attempt.cancel()
+                attempt.add_done_callback(_close_hedge_loser)
+        if winner is None:
+            raise typing.cast(BaseException, attempts[0].exception())
+        if winner is not primary:
+            hedging_policy.record_hedge_won()
+        response, time_to_first_byte = winner.result()
+        hedging_policy.record_time_to_first_byte(time_to_first_byte)
+        return response
+
+    def _sleep_before_retry(self, delay: float, rate_limited: bool) -> None:
+        if rate_limited and self.rate_limiter is not None:
+            self.rate_limiter.sleep(delay)
+        else:
+            time.sleep(delay)
+
+    def build_request(
+        self,
+        path: typing.Optional[str],
+        *,
+        method: str,
+        base_url: typing.Optional[str],
+        params: typing.Optional[typing.Dict[str, typing.Any]],
+        json: typing.Optional[typing.Any],
+        data: typing.Optional[typing.Any],
+        content: typing.Optional[typing.Union[bytes, typing.Iterator[bytes], typing.AsyncIterator[bytes]]],
+        files: typing.Optional[typing.Dict[str, typing.Optional[typing.Union[File, typing.List[File]]]]],
+        headers: typing.Optional[typing.Dict[str, typing.Any]],
+        request_options: typing.Optional[RequestOptions],
+        omit: typing.Optional[typing.Any],
+    ) -> httpx.Request:
+        json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
+        built_files = _build_files(files, omit)
+        json_content = _encode_json_body(json_body, content=content, data=data_body, files=built_files)
+        streaming_upload = built_files is not None and is_streaming_upload(built_files, stream_file_objects=False)
+        request = self.httpx_client.build_request(
+            method=method,
+            url=_build_url(self.get_base_url(base_url), path),
+            headers=_build_headers(self.base_headers(), headers, request_options),
+            params=_build_query(params, request_options, omit),
+            data=data_body if not streaming_upload else None,
+            content=json_content if json_content is not None else content,
+            # Without `UploadFile`s the files are plain httpx files.
+            files=typing.cast("typing.Optional[RequestFiles]", built_files if not streaming_upload else None),
+            timeout=self.get_timeout(request_options),
+        )
+        if json_content is not None:
+            request.headers.setdefault("Content-Type", "application/json")
+        if streaming_upload:
+            request = with_multipart_stream(
+                request, data_body, typing.cast(typing.List[typing.Tuple[str, File]], built_files)
+            )
+        return request
+
+    def send(
+        self,
+        request: httpx.Request,
+        *,
+        stream: bool = False,
+        request_options: typing.Optional[RequestOptions] = None,
+        retries: int = 0,
+        replayable: bool = True,
+        timing: typing.Optional[RequestTiming] = None,
+        deadline: typing.Optional[float] = None,
+        rate_limited: bool = False,
+    ) -> httpx.Response:
+        """
+        Sends the request, retrying retriable status codes and transport errors according to the retry policy.
+        Streamed responses are returned open, with their first chunk already read whenever a retry is still possible
+        or the request is hedged. No attempt is started after the `time.monotonic()` deadline, if any, and the
+        timeouts of each attempt are shrunk to the time left. When `rate_limited`, the caller holds a slot of the rate
+        limiter, which is given up while backing off between attempts.
+        """
+        retry_policy = self.get_retry_policy(request_options)
+        hedging_policy = (
+            self.get_hedging_policy(request_options) if stream and replayable and _is_hedgeable(request) else None
+        )
+        max_retries = retry_policy.get_max_retries(request_options) if replayable else 0
+        stream_idle_timeout = self.get_stream_idle_timeout(request_options) if stream else None
+        # The idle timeout and the deadline change the timeouts of an attempt, every attempt starts over from the
+        # request's own timeouts.
+        request_timeouts = (
+            request.extensions.get("timeout") if stream_idle_timeout is not None or deadline is not None else None
+        )
+        # Requests sending their own key through `additional_headers` bypass the key pool.
+        api_key_pool = self.api_key_pool if not _has_api_key_header(request_options) else None
+        retry_policy.record_request()
+        while True:
+            response: typing.Optional[httpx.Response] = None
+            if isinstance(request_timeouts, dict):
+                request.extensions["timeout"] = dict(request_timeouts)
+            if self.environment_selector is not None:
+                self.environment_selector.rebase(request)
+            if deadline is not None:
+                limit_timeouts_to_deadline(request, deadline)
+            # Raises without sending while the circuit is open, which also ends any retries.
+            permit: typing.Optional[CircuitPermit] = (
+                self.circuit_breaker.acquire(request) if self.circuit_breaker is not None else None
+            )
+            api_key: typing.Optional[str] = None
+            if api_key_pool is not None:
+                api_key = api_key_pool.acquire()
+                request.headers["xi-api-key"] = api_key
+            if timing is not None:
+                timing.start_attempt(request)
+                timing.retries = retries
+            try:
+                if hedging_policy is not None:
+                    response = self._send_hedged(request, hedging_policy, stream_idle_timeout, deadline)
+                else:
+                    response = self.httpx_client.send(request, stream=stream)
+                if permit is not None:
+                    permit.record_response(response)
+                    permit = None
+                if api_key_pool is not None and api_key is not None:
+                    api_key_pool.record_response(api_key, response)
+                    # Streamed responses keep their key in flight until they are closed.
+                    if stream and not response.is_closed:
+                        response.stream = _ReleasingByteStream(
+                            typing.cast(httpx.SyncByteStream, response.stream),
+                            functools.partial(api_key_pool.release, api_key),
+                        )
+                    else:
+                        api_key_pool.release(api_key)
+                    api_key = None
+                if self.rate_limiter is not None:
+                    self.rate_limiter.record_response(response)
+                if self.metrics is not None and response.status_code == 429:
+                    self.metrics.record_rate_limited(request.method, request.url.path)
+                if timing is not None:
+                    timing.record_response(response)
+                _apply_stream_idle_timeout(response, stream_idle_timeout, deadline)
+                if stream and deadline is not None:
+                    response.stream = _DeadlineByteStream(
+                        typing.cast(httpx.SyncByteStream, response.stream), deadline, request
+                    )
+                if not retry_policy.should_retry_response(response):
+                    if stream and hedging_policy is None and retries < max_retries:
+                        _peek_first_chunk(response)
+                    return response
+            except Exception as exception:
+                if permit is not None:
+                    permit.record_exception(exception)
+                if api_key_pool is not None and api_key is not None:
+                    api_key_pool.release(api_key)
+                if self.environment_selector is not None and isinstance(exception, CONNECTION_ERRORS):
+                    self.environment_selector.record_connection_error(str(request.url))
+                if response is not None:
+                    response.close()
+                delay = retry_policy.get_retry_delay(retries)
+                if not (
+                    retry_policy.should_retry_exception(exception)
+                    and retries < max_retries
+                    and fits_deadline(deadline, delay)
+                    and retry_policy.try_acquire_retry()
+                ):
+                    raise
+                self._sleep_before_retry(delay, rate_limited)
+                retries += 1
+                continue
+            except BaseException:
+                if permit is not None:
+                    permit.release()
+                if api_key_pool is not None and api_key is not None:
+                    api_key_pool.release(api_key)
+                raise
+
+            delay = retry_policy.get_retry_delay(retries, response)
+            if retries >= max_retries or not fits_deadline(deadline, delay) or not retry_policy.try_acquire_retry():
+                return response
+            if stream:
+                response.close()
+            self._sleep_before_retry(delay, rate_limited)
+            retries += 1
+
+    def _send_rate_limited(
+        self,
+        request: httpx.Request,
+        *,
+        request_options: typing.Optional[RequestOptions],
+        retries: int,
+        replayable: bool,
+        timing: typing.Optional[RequestTiming],
+        deadline: typing.Optional[float],
+    ) -> httpx.Response:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        if self.metrics is not None:
+            self.metrics.increment(REQUESTS_IN_FLIGHT)
+        try:
+            return self.send(
+                request,
+                request_options=request_options,
+                retries=retries,
+                replayable=replayable,
+                timing=timing,
+                deadline=deadline,
+                rate_limited=True,
+            )
+        finally:
+            if self.rate_limiter is not None:
+                self.rate_limiter.release()
+            if self.metrics is not None:
+                self.metrics.increment(REQUESTS_IN_FLIGHT, -1.0)
+
+    def _send_coalesced(
+        self,
+        request: httpx.Request,
+        *,
+        request_options: typing.Optional[RequestOptions],
+        retries: int,
+        replayable: bool,
+        timing: typing.Optional[RequestTiming],
+        deadline: typing.Optional[float],
+    ) -> httpx.Response:
+        coalescing_key = (
+            self.request_coalescer.get_key(request) if self.request_coalescer is not None and replayable else None
+        )
+        if coalescing_key is not None:
+            if timing is not None:
+                # Cleared again when this request is the one sent, by its first attempt.
+                timing.coalesced = True
+            return typing.cast(RequestCoalescer, self.request_coalescer).send(
+                coalescing_key,
+                lambda: self._send_rate_limited(
+                    request,
+                    request_options=request_options,
+                    retries=retries,
+                    replayable=replayable,
+                    timing=timing,
+                    deadline=deadline,
+                ),
+            )
+        return self._send_rate_limited(
+            request,
+            request_options=request_options,
+            retries=retries,
+            replayable=replayable,
+            timing=timing,
+            deadline=deadline,
+        )
+
+    def _send_cached(
+        self,
+        request: httpx.Request,
+        *,
+        request_options: typing.Optional[RequestOptions],
+        retries: int,
+        replayable: bool,
+        timing: typing.Optional[RequestTiming],
+        deadline: typing.Optional[float],
+    ) -> httpx.Response:
+        response_cache = self.response_cache
+        if response_cache is None:
+            return self._send_coalesced(
+                request,
+                request_options=request_options,
+                retries=retries,
+                replayable=replayable,
+                timing=timing,
+                deadline=deadline,
+            )
+        if not response_cache.is_cacheable(request):
+            try:
+                return self._send_coalesced(
+                    request,
+                    request_options=request_options,
+                    retries=retries,
+                    replayable=replayable,
+                    timing=timing,
+                    deadline=deadline,
+                )
+            finally:
+                if request.method not in _SAFE_METHODS:
+                    response_cache.invalidate(request)
+        if self.api_key_pool is not None and "xi-api-key" not in request.headers:
+            # Looked up under the key the pool would pick, while `store` keys the response by the key that answered it,
+            # so that the accounts of the pool never share cached responses.
+            request.headers["xi-api-key"] = self.api_key_pool.select()
+        cached_response, stale_entry = response_cache.lookup(request)
+        if cached_response is not None:
+            return cached_response
+        response = self._send_coalesced(
+            request,
+            request_options=request_options,
+            retries=retries,
+            replayable=replayable,
+            timing=timing,
+            deadline=deadline,
+        )
+        return response_cache.store(request, response, stale_entry)
+
     def request(
         self,
         path: typing.Optional[str] = None,
@@ -186,73 +887,51 @@ class HttpClient:
         retries: int = 0,
         omit: typing.Optional[typing.Any] = None,
     ) -> httpx.Response:
-        base_url = self.get_base_url(base_url)
-        timeout = (
-            request_options.get("timeout_in_seconds")
-            if request_options is not None and request_options.get("timeout_in_seconds") is not None
-            else self.base_timeout()
-        )
-
-        json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
-
-        response = self.httpx_client.request(
+        request = self.build_request(
+            path,
             method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **self.base_headers(),
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) or {} if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
-                    remove_none_from_dict(
-                        remove_omit_from_dict(
-                            {
-                                **(params if params is not None else {}),
-                                **(
-                                    request_options.get("additional_query_parameters", {}) or {}
-                                    if request_options is not None
-                                    else {}
-                                ),
-                            },
-                            omit,
-                        )
-                    )
-                )
-            ),
-            json=json_body,
-            data=data_body,
+            base_url=base_url,
+            params=params,
+            json=json,
+            data=data,
             content=content,
-            files=(
-                convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
-                if (files is not None and files is not omit)
-                else None
-            ),
-            timeout=timeout,
+            files=files,
+            headers=headers,
+            request_options=request_options,
+            omit=omit,
         )
-
-        max_retries: int = request_options.get("max_retries", 0) if request_options is not None else 0
-        if _should_retry(response=response):
-            if max_retries > retries:
-                time.sleep(_retry_timeout(response=response, retries=retries))
-                return self.request(
-                    path=path,
-                    method=method,
-                    base_url=base_url,
-                    params=params,
-                    json=json,
-                    content=content,
-                    files=files,
-                    headers=headers,
-                    request_options=request_options,
-                    retries=retries + 1,
-                    omit=omit,
-                )
-
+        timing = (
+            RequestTiming(method=request.method, url=str(request.url), hooks=self.timing_hooks)
+            if self.timing_hooks
+            else None
+        )
+        deadline = get_deadline(request_options)
+        replayable = _is_replayable(content, request)
+        if timing is None:
+            response = self._send_cached(
+                request,
+                request_options=request_options,
+                retries=retries,
+                replayable=replayable,
+                timing=None,
+                deadline=deadline,
+            )
+            return _decode_json_with_codec(response, validate=self.validate_responses)
+        try:
+            response = self._send_cached(
+                request,
+                request_options=request_options,
+                retries=retries,
+                replayable=replayable,
+                timing=timing,
+                deadline=deadline,
+            )
+        except BaseException as exception:
+            timing.record_error(exception)
+            raise
+        _decode_json_with_codec(response, validate=self.validate_responses)
+        timing.record_download_complete(response)
+        timing.emit_and_await_parse(response)
         return response
 
     @contextmanager
@@ -272,55 +951,60 @@ class HttpClient:
         retries: int = 0,
         omit: typing.Optional[typing.Any] = None,
     ) -> typing.Iterator[httpx.Response]:
-        base_url = self.get_base_url(base_url)
-        timeout = (
-            request_options.get("timeout_in_seconds")
-            if request_options is not None and request_options.get("timeout_in_seconds") is not None
-            else self.base_timeout()
-        )
-
-        json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
-
-        with self.httpx_client.stream(
+        request = self.build_request(
+            path,
             method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **self.base_headers(),
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
-                    remove_none_from_dict(
-                        remove_omit_from_dict(
-                            {
-                                **(params if params is not None else {}),
-                                **(
-                                    request_options.get("additional_query_parameters", {})
-                                    if request_options is not None
-                                    else {}
-                                ),
-                            },
-                            omit,
-                        )
-                    )
-                )
-            ),
-            json=json_body,
-            data=data_body,
+            base_url=base_url,
+            params=params,
+            json=json,
+            data=data,
             content=content,
-            files=(
-                convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
-                if (files is not None and files is not omit)
-                else None
-            ),
-            timeout=timeout,
-        ) as stream:
-            yield stream
+            files=files,
+            headers=headers,
+            request_options=request_options,
+            omit=omit,
+        )
+        timing = (
+            RequestTiming(method=request.method, url=str(request.url), hooks=self.timing_hooks)
+            if self.timing_hooks
+            else None
+        )
+        deadline = get_deadline(request_options)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        if self.metrics is not None:
+            self.metrics.increment(REQUESTS_IN_FLIGHT)
+        try:
+            try:
+                response = self.send(
+                    request,
+                    stream=True,
+                    request_options=request_options,
+                    retries=retries,
+                    replayable=_is_replayable(content, request),
+                    timing=timing,
+                    deadline=deadline,
+                    rate_limited=True,
+                )
+            except BaseException as exception:
+                if timing is not None:
+                    timing.record_error(exception)
+                raise
+            try:
+                yield _decode_json_with_codec(response)
+            finally:
+                response.close()
+                if timing is not None:
+                    timing.record_download_complete(response)
+                    timing.emit()
+        finally:
+            if self.response_cache is not None and request.method not in _SAFE_METHODS:
+                self.response_cache.invalidate(request)
+            # Streamed responses hold their slot until they are closed.
+            if self.rate_limiter is not None:
+                self.rate_limiter.release()
+            if self.metrics is not None:
+                self.metrics.increment(REQUESTS_IN_FLIGHT, -1.0)
 
 
 class AsyncHttpClient:
@@ -331,10 +1015,36 @@ class AsyncHttpClient:
         base_timeout: typing.Callable[[], typing.Optional[float]],
         base_headers: typing.Callable[[], typing.Dict[str, str]],
         base_url: typing.Optional[typing.Callable[[], str]] = None,
+        base_pool_timeout: typing.Optional[typing.Callable[[], typing.Optional[float]]] = None,
+        base_timeouts: typing.Optional[typing.Callable[[], typing.Optional[TimeoutOptions]]] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        hedging_policy: typing.Optional[HedgingPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        request_coalescer: typing.Optional[RequestCoalescer] = None,
+        response_cache: typing.Optional[ResponseCache] = None,
+        timing_hooks: typing.Optional[typing.List[RequestTimingHook]] = None,
+        metrics: typing.Optional[MetricsRegistry] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        api_key_pool: typing.Optional[ApiKeyPool] = None,
+        environment_selector: typing.Optional[EnvironmentSelector] = None,
+        validate_responses: bool = False,
     ):
         self.base_url = base_url
         self.base_timeout = base_timeout
         self.base_headers = base_headers
+        self.base_pool_timeout = base_pool_timeout
+        self.base_timeouts = base_timeouts
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.hedging_policy = hedging_policy
+        self.rate_limiter = rate_limiter
+        self.request_coalescer = request_coalescer
+        self.response_cache = response_cache
+        self.timing_hooks = timing_hooks if timing_hooks is not None else []
+        self.metrics = metrics
+        self.circuit_breaker = circuit_breaker
+        self.api_key_pool = api_key_pool
+        self.environment_selector = environment_selector
+        self.validate_responses = validate_responses
         self.httpx_client = httpx_client
 
     def get_base_url(self, maybe_base_url: typing.Optional[str]) -> str:
@@ -346,6 +1056,370 @@ class AsyncHttpClient:
             raise ValueError("A base_url is required to make this request, please provide one and try again.")
         return base_url
 
+    def get_timeout(
+        self, request_options: typing.Optional[RequestOptions]
+    ) -> typing.Optional[typing.Union[float, httpx.Timeout]]:
+        return _get_request_timeout(
+            request_options=request_options,
+            base_timeout=self.base_timeout,
+            base_pool_timeout=self.base_pool_timeout,
+            base_timeouts=self.base_timeouts,
+        )
+
+    def get_stream_idle_timeout(self, request_options: typing.Optional[RequestOptions]) -> typing.Optional[float]:
+        return get_stream_idle_timeout(
+            self.base_timeouts() if self.base_timeouts is not None else None,
+            request_options.get("timeouts") if request_options is not None else None,
+        )
+
+    def get_retry_policy(self, request_options: typing.Optional[RequestOptions]) -> RetryPolicy:
+        retry_policy = request_options.get("retry_policy") if request_options is not None else None
+        return retry_policy if retry_policy is not None else self.retry_policy
+
+    def get_hedging_policy(self, request_options: typing.Optional[RequestOptions]) -> typing.Optional[HedgingPolicy]:
+        hedging_policy = request_options.get("hedging_policy") if request_options is not None else None
+        return hedging_policy if hedging_policy is not None else self.hedging_policy
+
+    async def _send_until_first_byte(
+        self, request: httpx.Request, stream_idle_timeout: typing.Optional[float], deadline: typing.Optional[float]
+    ) -> typing.Tuple[httpx.Response, float]:
+        started_at = time.monotonic()
+        response = await self.httpx_client.send(request, stream=True)
+        try:
+            _apply_stream_idle_timeout(response, stream_idle_timeout, deadline)
+            if 200 <= response.status_code < 300:
+                await _apeek_first_chunk(response)
+        except BaseException:
+            await response.aclose()
+            raise
+        return response, time.monotonic() - started_at
+
+    async def _send_hedged(
+        self,
+        request: httpx.Request,
+        hedging_policy: HedgingPolicy,
+        stream_idle_timeout: typing.Optional[float],
+        deadline: typing.Optional[float],
+    ) -> httpx.Response:
+        delay = hedging_policy.get_delay()
+        if delay is None:
+            response, time_to_first_byte = await self._send_until_first_byte(request, stream_idle_timeout, deadline)
+            hedging_policy.record_time_to_first_byte(time_to_first_byte)
+            return response
+
+        # Cloned before the primary attempt changes the timeouts of `request` once its headers are received.
+        hedge_request = _clone_request(request)
+        primary = asyncio.ensure_future(self._send_until_first_byte(request, stream_idle_timeout, deadline))
+        attempts = [primary]
+        winner = None
+        try:
+            done, pending = await asyncio.wait(attempts, timeout=delay)
+            if not done:
+                hedging_policy.record_hedge_fired()
+                attempts.append(
+                    asyncio.ensure_future(self._send_until_first_byte(hedge_request, stream_idle_timeout, deadline))
+                )
+                pending = set(attempts)
+
+            winner = next((attempt for attempt in done if attempt.exception() is None), None)
+            while winner is None and pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((attempt for attempt in done if attempt.exception() is None), None)
+        finally:
+            for attempt in attempts:
+                if attempt is not winner:
+                    attempt.cancel()
+                    attempt.add_done_callback(_aclose_hedge_loser)
+        if winner is None:
+            raise typing.cast(BaseException, attempts[0].exception())
+        if winner is not primary:
+            hedging_policy.record_hedge_won()
+        response, time_to_first_byte = winner.result()
+        hedging_policy.record_time_to_first_byte(time_to_first_byte)
+        return response
+
+    async def _sleep_before_retry(self, delay: float, rate_limited: bool) -> None:
+        if rate_limited and self.rate_limiter is not None:
+            await self.rate_limiter.asleep(delay)
+        else:
+            await asyncio.sleep(delay)
+
+    def build_request(
+        self,
+        path: typing.Optional[str],
+        *,
+        method: str,
+        base_url: typing.Optional[str],
+        params: typing.Optional[typing.Dict[str, typing.Any]],
+        json: typing.Optional[typing.Any],
+        data: typing.Optional[typing.Any],
+        content: typing.Optional[typing.Union[bytes, typing.Iterator[bytes], typing.AsyncIterator[bytes]]],
+        files: typing.Optional[typing.Dict[str, typing.Optional[typing.Union[File, typing.List[File]]]]],
+        headers: typing.Optional[typing.Dict[str, typing.Any]],
+        request_options: typing.Optional[RequestOptions],
+        omit: typing.Optional[typing.Any],
+    ) -> httpx.Request:
+        json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
+        built_files = _build_files(files, omit)
+        json_content = _encode_json_body(json_body, content=content, data=data_body, files=built_files)
+        streaming_upload = built_files is not None and is_streaming_upload(built_files, stream_file_objects=True)
+        request = self.httpx_client.build_request(
+            method=method,
+            url=_build_url(self.get_base_url(base_url), path),
+            headers=_build_headers(self.base_headers(), headers, request_options),
+            params=_build_query(params, request_options, omit),
+            data=data_body if not streaming_upload else None,
+            content=json_content if json_content is not None else content,
+            # Without `UploadFile`s the files are plain httpx files.
+            files=typing.cast("typing.Optional[RequestFiles]", built_files if not streaming_upload else None),
+            timeout=self.get_timeout(request_options),
+        )
+        if json_content is not None:
+            request.headers.setdefault("Content-Type", "application/json")
+        if streaming_upload:
+            request = with_multipart_stream(
+                request, data_body, typing.cast(typing.List[typing.Tuple[str, File]], built_files)
+            )
+        return request
+
+    async def send(
+        self,
+        request: httpx.Request,
+        *,
+        stream: bool = False,
+        request_options: typing.Optional[RequestOptions] = None,
+        retries: int = 0,
+        replayable: bool = True,
+        timing: typing.Optional[RequestTiming] = None,
+        deadline: typing.Optional[float] = None,
+        rate_limited: bool = False,
+    ) -> httpx.Response:
+        """
+        Sends the request, retrying retriable status codes and transport errors according to the retry policy.
+        Streamed responses are returned open, with their first chunk already read whenever a retry is still possible
+        or the request is hedged. No attempt is started after the `time.monotonic()` deadline, if any, and the
+        timeouts of each attempt are shrunk to the time left. When `rate_limited`, the caller holds a slot of the rate
+        limiter, which is given up while backing off between attempts.
+        """
+        retry_policy = self.get_retry_policy(request_options)
+        hedging_policy = (
+            self.get_hedging_policy(request_options) if stream and replayable and _is_hedgeable(request) else None
+        )
+        max_retries = retry_policy.get_max_retries(request_options) if replayable else 0
+        stream_idle_timeout = self.get_stream_idle_timeout(request_options) if stream else None
+        # The idle timeout and the deadline change the timeouts of an attempt, every attempt starts over from the
+        # request's own timeouts.
+        request_timeouts = (
+            request.extensions.get("timeout") if stream_idle_timeout is not None or deadline is not None else None
+        )
+        # Requests sending their own key through `additional_headers` bypass the key pool.
+        api_key_pool = self.api_key_pool if not _has_api_key_header(request_options) else None
+        retry_policy.record_request()
+        while True:
+            response: typing.Optional[httpx.Response] = None
+            if isinstance(request_timeouts, dict):
+                request.extensions["timeout"] = dict(request_timeouts)
+            if self.environment_selector is not None:
+                self.environment_selector.rebase(request)
+            if deadline is not None:
+                limit_timeouts_to_deadline(request, deadline)
+            # Raises without sending while the circuit is open, which also ends any retries.
+            permit: typing.Optional[CircuitPermit] = (
+                self.circuit_breaker.acquire(request) if self.circuit_breaker is not None else None
+            )
+            api_key: typing.Optional[str] = None
+            if api_key_pool is not None:
+                api_key = api_key_pool.acquire()
+                request.headers["xi-api-key"] = api_key
+            if timing is not None:
+                timing.start_attempt(request, asynchronous=True)
+                timing.retries = retries
+            try:
+                if hedging_policy is not None:
+                    response = await self._send_hedged(request, hedging_policy, stream_idle_timeout, deadline)
+                else:
+                    response = await self.httpx_client.send(request, stream=stream)
+                if permit is not None:
+                    permit.record_response(response)
+                    permit = None
+                if api_key_pool is not None and api_key is not None:
+                    api_key_pool.record_response(api_key, response)
+                    # Streamed responses keep their key in flight until they are closed.
+                    if stream and not response.is_closed:
+                        response.stream = _AsyncReleasingByteStream(
+                            typing.cast(httpx.AsyncByteStream, response.stream),
+                            functools.partial(api_key_pool.release, api_key),
+                        )
+                    else:
+                        api_key_pool.release(api_key)
+                    api_key = None
+                if self.rate_limiter is not None:
+                    self.rate_limiter.record_response(response)
+                if self.metrics is not None and response.status_code == 429:
+                    self.metrics.record_rate_limited(request.method, request.url.path)
+                if timing is not None:
+                    timing.record_response(response)
+                _apply_stream_idle_timeout(response, stream_idle_timeout, deadline)
+                if stream and deadline is not None:
+                    response.stream = _AsyncDeadlineByteStream(
+                        typing.cast(httpx.AsyncByteStream, response.stream), deadline, request
+                    )
+                if not retry_policy.should_retry_response(response):
+                    if stream and hedging_policy is None and retries < max_retries:
+                        await _apeek_first_chunk(response)
+                    return response
+            except Exception as exception:
+                if permit is not None:
+                    permit.record_exception(exception)
+                if api_key_pool is not None and api_key is not None:
+                    api_key_pool.release(api_key)
+                if self.environment_selector is not None and isinstance(exception, CONNECTION_ERRORS):
+                    self.environment_selector.record_connection_error(str(request.url))
+                if response is not None:
+                    await response.aclose()
+                delay = retry_policy.get_retry_delay(retries)
+                if not (
+                    retry_policy.should_retry_exception(exception)
+                    and retries < max_retries
+                    and fits_deadline(deadline, delay)
+                    and retry_policy.try_acquire_retry()
+                ):
+                    raise
+                await self._sleep_before_retry(delay, rate_limited)
+                retries += 1
+                continue
+            except BaseException:
+                if permit is not None:
+                    permit.release()
+                if api_key_pool is not None and api_key is not None:
+                    api_key_pool.release(api_key)
+                raise
+
+            delay = retry_policy.get_retry_delay(retries, response)
+            if retries >= max_retries or not fits_deadline(deadline, delay) or not retry_policy.try_acquire_retry():
+                return response
+            if stream:
+                await response.aclose()
+            await self._sleep_before_retry(delay, rate_limited)
+            retries += 1
+
+    async def _send_rate_limited(
+        self,
+        request: httpx.Request,
+        *,
+        request_options: typing.Optional[RequestOptions],
+        retries: int,
+        replayable: bool,
+        timing: typing.Optional[RequestTiming],
+        deadline: typing.Optional[float],
+    ) -> httpx.Response:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire()
+        if self.metrics is not None:
+            self.metrics.increment(REQUESTS_IN_FLIGHT)
+        try:
+            return await self.send(
+                request,
+                request_options=request_options,
+                retries=retries,
+                replayable=replayable,
+                timing=timing,
+                deadline=deadline,
+                rate_limited=True,
+            )
+        finally:
+            if self.rate_limiter is not None:
+                self.rate_limiter.release()
+            if self.metrics is not None:
+                self.metrics.increment(REQUESTS_IN_FLIGHT, -1.0)
+
+    async def _send_coalesced(
+        self,
+        request: httpx.Request,
+        *,
+        request_options: typing.Optional[RequestOptions],
+        retries: int,
+        replayable: bool,
+        timing: typing.Optional[RequestTiming],
+        deadline: typing.Optional[float],
+    ) -> httpx.Response:
+        coalescing_key = (
+            self.request_coalescer.get_key(request) if self.request_coalescer is not None and replayable else None
+        )
+        if coalescing_key is not None:
+            if timing is not None:
+                # Cleared again when this request is the one sent, by its first attempt.
+                timing.coalesced = True
+            return await typing.cast(RequestCoalescer, self.request_coalescer).asend(
+                coalescing_key,
+                lambda: self._send_rate_limited(
+                    request,
+                    request_options=request_options,
+                    retries=retries,
+                    replayable=replayable,
+                    timing=timing,
+                    deadline=deadline,
+                ),
+            )
+        return await self._send_rate_limited(
+            request,
+            request_options=request_options,
+            retries=retries,
+            replayable=replayable,
+            timing=timing,
+            deadline=deadline,
+        )
+
+    async def _send_cached(
+        self,
+        request: httpx.Request,
+        *,
+        request_options: typing.Optional[RequestOptions],
+        retries: int,
+        replayable: bool,
+        timing: typing.Optional[RequestTiming],
+        deadline: typing.Optional[float],
+    ) -> httpx.Response:
+        response_cache = self.response_cache
+        if response_cache is None:
+            return await self._send_coalesced(
+                request,
+                request_options=request_options,
+                retries=retries,
+                replayable=replayable,
+                timing=timing,
+                deadline=deadline,
+            )
+        if not response_cache.is_cacheable(request):
+            try:
+                return await self._send_coalesced(
+                    request,
+                    request_options=request_options,
+                    retries=retries,
+                    replayable=replayable,
+                    timing=timing,
+                    deadline=deadline,
+                )
+            finally:
+                if request.method not in _SAFE_METHODS:
+                    response_cache.invalidate(request)
+        if self.api_key_pool is not None and "xi-api-key" not in request.headers:
+            # Looked up under the key the pool would pick, while `store` keys the response by the key that answered it,
+            # so that the accounts of the pool never share cached responses.
+            request.headers["xi-api-key"] = self.api_key_pool.select()
+        cached_response, stale_entry = response_cache.lookup(request)
+        if cached_response is not None:
+            return cached_response
+        response = await self._send_coalesced(
+            request,
+            request_options=request_options,
+            retries=retries,
+            replayable=replayable,
+            timing=timing,
+            deadline=deadline,
+        )
+        return response_cache.store(request, response, stale_entry)
+
     async def request(
         self,
         path: typing.Optional[str] = None,
@@ -362,73 +1436,51 @@ class AsyncHttpClient:
         retries: int = 0,
         omit: typing.Optional[typing.Any] = None,
     ) -> httpx.Response:
-        base_url = self.get_base_url(base_url)
-        timeout = (
-            request_options.get("timeout_in_seconds")
-            if request_options is not None and request_options.get("timeout_in_seconds") is not None
-            else self.base_timeout()
-        )
-
-        json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
-
-        # Add the input to each of these and do None-safety checks
-        response = await self.httpx_client.request(
+        request = self.build_request(
+            path,
             method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **self.base_headers(),
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) or {} if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
-                    remove_none_from_dict(
-                        remove_omit_from_dict(
-                            {
-                                **(params if params is not None else {}),
-                                **(
-                                    request_options.get("additional_query_parameters", {}) or {}
-                                    if request_options is not None
-                                    else {}
-                                ),
-                            },
-                            omit,
-                        )
-                    )
-                )
-            ),
-            json=json_body,
-            data=data_body,
+            base_url=base_url,
+            params=params,
+            json=json,
+            data=data,
             content=content,
-            files=(
-                convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
-                if files is not None
-                else None
-            ),
-            timeout=timeout,
+            files=files,
+            headers=headers,
+            request_options=request_options,
+            omit=omit,
         )
-
-        max_retries: int = request_options.get("max_retries", 0) if request_options is not None else 0
-        if _should_retry(response=response):
-            if max_retries > retries:
-                await asyncio.sleep(_retry_timeout(response=response, retries=retries))
-                return await self.request(
-                    path=path,
-                    method=method,
-                    base_url=base_url,
-                    params=params,
-                    json=json,
-                    content=content,
-                    files=files,
-                    headers=headers,
-                    request_options=request_options,
-                    retries=retries + 1,
-                    omit=omit,
-                )
+        timing = (
+            RequestTiming(method=request.method, url=str(request.url), hooks=self.timing_hooks)
+            if self.timing_hooks
+            else None
+        )
+        deadline = get_deadline(request_options)
+        replayable = _is_replayable(content, request)
+        if timing is None:
+            response = await self._send_cached(
+                request,
+                request_options=request_options,
+                retries=retries,
+                replayable=replayable,
+                timing=None,
+                deadline=deadline,
+            )
+            return _decode_json_with_codec(response, validate=self.validate_responses)
+        try:
+            response = await self._send_cached(
+                request,
+                request_options=request_options,
+                retries=retries,
+                replayable=replayable,
+                timing=timing,
+                deadline=deadline,
+            )
+        except BaseException as exception:
+            timing.record_error(exception)
+            raise
+        _decode_json_with_codec(response, validate=self.validate_responses)
+        timing.record_download_complete(response)
+        timing.emit_and_await_parse(response)
         return response
 
     @asynccontextmanager
@@ -448,52 +1500,57 @@ class AsyncHttpClient:
         retries: int = 0,
         omit: typing.Optional[typing.Any] = None,
     ) -> typing.AsyncIterator[httpx.Response]:
-        base_url = self.get_base_url(base_url)
-        timeout = (
-            request_options.get("timeout_in_seconds")
-            if request_options is not None and request_options.get("timeout_in_seconds") is not None
-            else self.base_timeout()
-        )
-
-        json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
-
-        async with self.httpx_client.stream(
+        request = self.build_request(
+            path,
             method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **self.base_headers(),
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
-                    remove_none_from_dict(
-                        remove_omit_from_dict(
-                            {
-                                **(params if params is not None else {}),
-                                **(
-                                    request_options.get("additional_query_parameters", {})
-                                    if request_options is not None
-                                    else {}
-                                ),
-                            },
-                            omit=omit,
-                        )
-                    )
-                )
-            ),
-            json=json_body,
-            data=data_body,
+            base_url=base_url,
+            params=params,
+            json=json,
+            data=data,
             content=content,
-            files=(
-                convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
-                if files is not None
-                else None
-            ),
-            timeout=timeout,
-        ) as stream:
-            yield stream
+            files=files,
+            headers=headers,
+            request_options=request_options,
+            omit=omit,
+        )
+        timing = (
+            RequestTiming(method=request.method, url=str(request.url), hooks=self.timing_hooks)
+            if self.timing_hooks
+            else None
+        )
+        deadline = get_deadline(request_options)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire()
+        if self.metrics is not None:
+            self.metrics.increment(REQUESTS_IN_FLIGHT)
+        try:
+            try:
+                response = await self.send(
+                    request,
+                    stream=True,
+                    request_options=request_options,
+                    retries=retries,
+                    replayable=_is_replayable(content, request),
+                    timing=timing,
+                    deadline=deadline,
+                    rate_limited=True,
+                )
+            except BaseException as exception:
+                if timing is not None:
+                    timing.record_error(exception)
+                raise
+            try:
+                yield _decode_json_with_codec(response)
+            finally:
+                await response.aclose()
+                if timing is not None:
+                    timing.record_download_complete(response)
+                    timing.emit()
+        finally:
+            if self.response_cache is not None and request.method not in _SAFE_METHODS:
+                self.response_cache.invalidate(request)
+            # Streamed responses hold their slot until they are closed.
+            if self.rate_limiter is not None:
+                self.rate_limiter.release()
+            if self.metrics is not None:
+                self.metrics.increment(REQUESTS_IN_FLIGHT, -1.0)
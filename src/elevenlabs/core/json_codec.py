@@ -0,0 +1,109 @@
+import json
+import typing
+
+JsonInput = typing.Union[str, bytes, bytearray, memoryview]
+
+
+class JsonCodec:
+    """
+    Encodes and decodes JSON with the standard library `json` module, the codec used when neither orjson nor msgspec
+    is installed. Bodies are encoded compactly as UTF-8 without escaping non-ASCII characters, like httpx does.
+
+    Other codecs subclass it and override `dumps` and `loads`.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    def loads(self, data: JsonInput) -> typing.Any:
+        return json.loads(data if isinstance(data, (str, bytes, bytearray)) else bytes(data))
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    Encodes and decodes JSON with orjson (`pip install orjson`), straight from and to bytes.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson  # type: ignore
+
+        self._orjson = orjson
+        # `jsonable_encoder` keeps non-string keys, e.g. integers, which the standard library stringifies too.
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        return self._orjson.dumps(obj, option=self._options)
+
+    def loads(self, data: JsonInput) -> typing.Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """
+    Encodes and decodes JSON with msgspec (`pip install msgspec`), straight from and to bytes.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec  # type: ignore
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: JsonInput) -> typing.Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as error:
+            # Callers handle malformed bodies by catching `json.JSONDecodeError`, which orjson's errors subclass too.
+            raise json.JSONDecodeError(str(error), "", 0) from error
+
+
+def _get_default_json_codec() -> JsonCodec:
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec()
+        except ImportError:
+            pass
+    return JsonCodec()
+
+
+_json_codec: JsonCodec = _get_default_json_codec()
+
+
+def get_json_codec() -> JsonCodec:
+    """
+    Returns the codec request bodies, responses, streamed lines and websocket messages are encoded and decoded with:
+    orjson if it is installed, otherwise msgspec if it is installed, otherwise the standard library.
+    """
+    return _json_codec
+
+
+def set_json_codec(codec: typing.Optional[JsonCodec]) -> None:
+    """
+    Replaces the codec used by all clients, e.g. with `JsonCodec()` to opt out of orjson, or with a subclass of
+    `JsonCodec`. None restores the default codec.
+    """
+    global _json_codec
+    _json_codec = codec if codec is not None else _get_default_json_codec()
+
+
+def json_dumps(obj: typing.Any) -> bytes:
+    return _json_codec.dumps(obj)
+
+
+def json_dumps_text(obj: typing.Any) -> str:
+    """Encodes an object into a JSON string, for websocket text frames and form fields."""
+    return _json_codec.dumps(obj).decode("utf-8")
+
+
+def json_loads(data: JsonInput) -> typing.Any:
+    return _json_codec.loads(data)
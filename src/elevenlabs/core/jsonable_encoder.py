@@ -28,9 +28,13 @@ from .pydantic_utilities import (
 SetIntStr = Set[Union[int, str]]
 DictIntStrAny = Dict[Union[int, str], Any]
 
+Encoder = Callable[[Any, Optional[Dict[Any, Callable[[Any], Any]]]], Any]
+
+# Values of these exact types are returned as they are, without looking up their encoder.
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool, type(None)))
+
 
 def jsonable_encoder(obj: Any, custom_encoder: Optional[Dict[Any, Callable[[Any], Any]]] = None) -> Any:
-    custom_encoder = custom_encoder or {}
     if custom_encoder:
         if type(obj) in custom_encoder:
             return custom_encoder[type(obj)](obj)
@@ -38,49 +42,76 @@ def jsonable_encoder(obj: Any, custom_encoder: Optional[Dict[Any, Callable[[Any]
             for encoder_type, encoder_instance in custom_encoder.items():
                 if isinstance(obj, encoder_type):
                     return encoder_instance(obj)
-    if isinstance(obj, pydantic.BaseModel):
-        if IS_PYDANTIC_V2:
-            encoder = getattr(obj.model_config, "json_encoders", {})  # type: ignore # Pydantic v2
-        else:
-            encoder = getattr(obj.__config__, "json_encoders", {})  # type: ignore # Pydantic v1
-        if custom_encoder:
-            encoder.update(custom_encoder)
-        obj_dict = obj.dict(by_alias=True)
-        if "__root__" in obj_dict:
-            obj_dict = obj_dict["__root__"]
-        if "root" in obj_dict:
-            obj_dict = obj_dict["root"]
-        return jsonable_encoder(obj_dict, custom_encoder=encoder)
-    if dataclasses.is_dataclass(obj):
-        obj_dict = dataclasses.asdict(obj)  # type: ignore
-        return jsonable_encoder(obj_dict, custom_encoder=custom_encoder)
-    if isinstance(obj, bytes):
-        return base64.b64encode(obj).decode("utf-8")
-    if isinstance(obj, Enum):
-        return obj.value
-    if isinstance(obj, PurePath):
-        return str(obj)
-    if isinstance(obj, (str, int, float, type(None))):
+    elif type(obj) in _PRIMITIVE_TYPES:
         return obj
-    if isinstance(obj, dt.datetime):
-        return serialize_datetime(obj)
-    if isinstance(obj, dt.date):
-        return str(obj)
-    if isinstance(obj, dict):
-        encoded_dict = {}
-        allowed_keys = set(obj.keys())
-        for key, value in obj.items():
-            if key in allowed_keys:
-                encoded_key = jsonable_encoder(key, custom_encoder=custom_encoder)
-                encoded_value = jsonable_encoder(value, custom_encoder=custom_encoder)
-                encoded_dict[encoded_key] = encoded_value
-        return encoded_dict
-    if isinstance(obj, (list, set, frozenset, GeneratorType, tuple)):
-        encoded_list = []
-        for item in obj:
-            encoded_list.append(jsonable_encoder(item, custom_encoder=custom_encoder))
-        return encoded_list
+    encoder = _encoders_by_type.get(type(obj))
+    if encoder is None:
+        encoder = _encoders_by_type[type(obj)] = _get_encoder(type(obj))
+    return encoder(obj, custom_encoder)
+
+
+def _encode_model(obj: Any, custom_encoder: Optional[Dict[Any, Callable[[Any], Any]]]) -> Any:
+    if IS_PYDANTIC_V2:
+        encoder = getattr(obj.model_config, "json_encoders", {})  # type: ignore # Pydantic v2
+    else:
+        encoder = getattr(obj.__config__, "json_encoders", {})  # type: ignore # Pydantic v1
+    if custom_encoder:
+        encoder.update(custom_encoder)
+    obj_dict = obj.dict(by_alias=True)
+    if "__root__" in obj_dict:
+        obj_dict = obj_dict["__root__"]
+    if "root" in obj_dict:
+        obj_dict = obj_dict["root"]
+    return jsonable_encoder(obj_dict, custom_encoder=encoder)
+
+
+def _encode_dataclass(obj: Any, custom_encoder: Optional[Dict[Any, Callable[[Any], Any]]]) -> Any:
+    obj_dict = dataclasses.asdict(obj)  # type: ignore
+    return jsonable_encoder(obj_dict, custom_encoder=custom_encoder)
+
+
+def _encode_bytes(obj: Any, custom_encoder: Optional[Dict[Any, Callable[[Any], Any]]]) -> Any:
+    return base64.b64encode(obj).decode("utf-8")
+
+
+def _encode_enum(obj: Any, custom_encoder: Optional[Dict[Any, Callable[[Any], Any]]]) -> Any:
+    return obj.value
+
+
+def _encode_as_str(obj: Any, custom_encoder: Optional[Dict[Any, Callable[[Any], Any]]]) -> Any:
+    return str(obj)
+
 
+def _encode_as_is(obj: Any, custom_encoder: Optional[Dict[Any, Callable[[Any], Any]]]) -> Any:
+    return obj
+
+
+def _encode_datetime(obj: Any, custom_encoder: Optional[Dict[Any, Callable[[Any], Any]]]) -> Any:
+    return serialize_datetime(obj)
+
+
+def _encode_dict(obj: Any, custom_encoder: Optional[Dict[Any, Callable[[Any], Any]]]) -> Any:
+    if custom_encoder:
+        return {
+            jsonable_encoder(key, custom_encoder=custom_encoder): jsonable_encoder(value, custom_encoder=custom_encoder)
+            for key, value in obj.items()
+        }
+    # Primitive keys and values are inlined rather than going through `jsonable_encoder` one by one.
+    return {
+        (key if type(key) in _PRIMITIVE_TYPES else jsonable_encoder(key)): (
+            value if type(value) in _PRIMITIVE_TYPES else jsonable_encoder(value)
+        )
+        for key, value in obj.items()
+    }
+
+
+def _encode_sequence(obj: Any, custom_encoder: Optional[Dict[Any, Callable[[Any], Any]]]) -> Any:
+    if custom_encoder:
+        return [jsonable_encoder(item, custom_encoder=custom_encoder) for item in obj]
+    return [item if type(item) in _PRIMITIVE_TYPES else jsonable_encoder(item) for item in obj]
+
+
+def _encode_fallback(obj: Any, custom_encoder: Optional[Dict[Any, Callable[[Any], Any]]]) -> Any:
     def fallback_serializer(o: Any) -> Any:
         attempt_encode = encode_by_type(o)
         if attempt_encode is not None:
@@ -99,3 +130,32 @@ def jsonable_encoder(obj: Any, custom_encoder: Optional[Dict[Any, Callable[[Any]
         return jsonable_encoder(data, custom_encoder=custom_encoder)
 
     return to_jsonable_with_fallback(obj, fallback_serializer)
+
+
+# The encoder of each type `jsonable_encoder` has seen, resolved once by `_get_encoder`.
+_encoders_by_type: Dict[type, Encoder] = {}
+
+
+def _get_encoder(type_: type) -> Encoder:
+    """Returns the encoder of a type, checking its bases in the order the encoders take precedence."""
+    if issubclass(type_, pydantic.BaseModel):
+        return _encode_model
+    if dataclasses.is_dataclass(type_):
+        return _encode_dataclass
+    if issubclass(type_, bytes):
+        return _encode_bytes
+    if issubclass(type_, Enum):
+        return _encode_enum
+    if issubclass(type_, PurePath):
+        return _encode_as_str
+    if issubclass(type_, (str, int, float, type(None))):
+        return _encode_as_is
+    if issubclass(type_, dt.datetime):
+        return _encode_datetime
+    if issubclass(type_, dt.date):
+        return _encode_as_str
+    if issubclass(type_, dict):
+        return _encode_dict
+    if issubclass(type_, (list, set, frozenset, GeneratorType, tuple)):
+        return _encode_sequence
+    return _encode_fallback
@@ -0,0 +1,269 @@
+import math
+import threading
+import time
+import types
+import typing
+
+from .request_timing import RequestTiming, get_endpoint_template
+
+Labels = typing.Tuple[typing.Tuple[str, str], ...]
+
+DEFAULT_LATENCY_BUCKETS: typing.Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+REQUESTS_TOTAL = "elevenlabs_requests_total"
+REQUEST_RETRIES_TOTAL = "elevenlabs_request_retries_total"
+RATE_LIMITED_RESPONSES_TOTAL = "elevenlabs_rate_limited_responses_total"
+REQUEST_ERRORS_TOTAL = "elevenlabs_request_errors_total"
+REQUESTS_IN_FLIGHT = "elevenlabs_requests_in_flight"
+REQUEST_TIME_TO_FIRST_BYTE_SECONDS = "elevenlabs_request_time_to_first_byte_seconds"
+REQUEST_DURATION_SECONDS = "elevenlabs_request_duration_seconds"
+WEBSOCKETS_OPEN = "elevenlabs_websockets_open"
+WEBSOCKET_CONNECTIONS_TOTAL = "elevenlabs_websocket_connections_total"
+WEBSOCKET_ERRORS_TOTAL = "elevenlabs_websocket_errors_total"
+WEBSOCKET_TIME_TO_FIRST_AUDIO_SECONDS = "elevenlabs_websocket_time_to_first_audio_seconds"
+
+_METRICS: typing.Dict[str, typing.Tuple[str, str]] = {
+    REQUESTS_TOTAL: ("counter", "Requests completed, by endpoint, method and status code."),
+    REQUEST_RETRIES_TOTAL: ("counter", "Retries made, by endpoint and method."),
+    RATE_LIMITED_RESPONSES_TOTAL: ("counter", "Responses with status code 429, including retried ones."),
+    REQUEST_ERRORS_TOTAL: ("counter", "Requests that failed without a response, by endpoint and error type."),
+    REQUESTS_IN_FLIGHT: ("gauge", "Requests currently in flight, streamed responses count until they are closed."),
+    REQUEST_TIME_TO_FIRST_BYTE_SECONDS: ("histogram", "Time until the response headers were received."),
+    REQUEST_DURATION_SECONDS: ("histogram", "Time until the response was received."),
+    WEBSOCKETS_OPEN: ("gauge", "Websocket connections currently open, by client."),
+    WEBSOCKET_CONNECTIONS_TOTAL: ("counter", "Websocket connections opened, by client."),
+    WEBSOCKET_ERRORS_TOTAL: ("counter", "Websocket connections closed by an error, by client."),
+    WEBSOCKET_TIME_TO_FIRST_AUDIO_SECONDS: ("histogram", "Time from connecting until the first audio was received."),
+}
+
+
+class _Shard:
+    """The metrics recorded by a single thread, only ever written to by that thread."""
+
+    def __init__(self) -> None:
+        self.values: typing.Dict[typing.Tuple[str, Labels], float] = {}
+        self.histograms: typing.Dict[typing.Tuple[str, Labels], typing.List[float]] = {}
+
+
+def _format_labels(labels: Labels, extra: str = "") -> str:
+    parts = [
+        '{}="{}"'.format(key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels
+    ]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class MetricsRegistry:
+    """
+    A lightweight metrics registry the client records request latencies, retries, rate limiting, errors, in-flight
+    requests and open websockets into. Pass it to the client with `metrics=` and render it with
+    `render_prometheus()` or `snapshot()`.
+
+    Each thread records into its own shard without taking a lock; shards are only summed up when the registry is
+    read, so recording stays cheap enough to leave on in production.
+
+    Parameters
+    ----------
+    latency_buckets : typing.Sequence[float]
+        The upper bounds, in seconds, of the latency histogram buckets.
+    """
+
+    def __init__(self, *, latency_buckets: typing.Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self._local = threading.local()
+        self._shards: typing.List[_Shard] = []
+        self._shards_lock = threading.Lock()
+
+    def _get_shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _Shard()
+            with self._shards_lock:
+                self._shards.append(shard)
+            return shard
+
+    def increment(self, name: str, value: float = 1.0, labels: Labels = ()) -> None:
+        """
+        Adds `value` to a counter, or to a gauge when `value` is negative.
+        """
+        values = self._get_shard().values
+        key = (name, labels)
+        values[key] = values.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, labels: Labels = ()) -> None:
+        histograms = self._get_shard().histograms
+        key = (name, labels)
+        histogram = histograms.get(key)
+        if histogram is None:
+            # One count per bucket, then the +Inf bucket, then the sum of all observations.
+            histogram = histograms[key] = [0.0] * (len(self.latency_buckets) + 2)
+        index = 0
+        for bound in self.latency_buckets:
+            if value <= bound:
+                break
+            index += 1
+        histogram[index] += 1
+        histogram[-1] += value
+
+    def record_request_timing(self, timing: RequestTiming) -> None:
+        """
+        A timing hook recording a completed request, registered on the client when the registry is passed in.
+        """
+        labels = (("endpoint", timing.endpoint), ("method", timing.method))
+        if timing.error is not None:
+            self.increment(REQUEST_ERRORS_TOTAL, labels=labels + (("error", type(timing.error).__name__),))
+        else:
+            self.increment(REQUESTS_TOTAL, labels=labels + (("status", str(timing.status_code)),))
+        if timing.retries:
+            self.increment(REQUEST_RETRIES_TOTAL, timing.retries, labels=labels)
+        if timing.time_to_first_byte_in_seconds is not None:
+            self.observe(REQUEST_TIME_TO_FIRST_BYTE_SECONDS, timing.time_to_first_byte_in_seconds, labels=labels)
+        self.observe(REQUEST_DURATION_SECONDS, timing.total_in_seconds, labels=labels)
+
+    def record_rate_limited(self, method: str, path: str) -> None:
+        self.increment(
+            RATE_LIMITED_RESPONSES_TOTAL, labels=(("endpoint", get_endpoint_template(path)), ("method", method))
+        )
+
+    def record_websocket_opened(self, client: str) -> None:
+        labels = (("client", client),)
+        self.increment(WEBSOCKET_CONNECTIONS_TOTAL, labels=labels)
+        self.increment(WEBSOCKETS_OPEN, labels=labels)
+
+    def record_websocket_closed(self, client: str, error: typing.Optional[BaseException] = None) -> None:
+        labels = (("client", client),)
+        self.increment(WEBSOCKETS_OPEN, -1.0, labels=labels)
+        if error is not None:
+            self.increment(WEBSOCKET_ERRORS_TOTAL, labels=labels)
+
+    def record_websocket_first_audio(self, client: str, seconds: float) -> None:
+        self.observe(WEBSOCKET_TIME_TO_FIRST_AUDIO_SECONDS, seconds, labels=(("client", client),))
+
+    def _collect(
+        self,
+    ) -> typing.Tuple[
+        typing.Dict[typing.Tuple[str, Labels], float], typing.Dict[typing.Tuple[str, Labels], typing.List[float]]
+    ]:
+        with self._shards_lock:
+            shards = list(self._shards)
+        values: typing.Dict[typing.Tuple[str, Labels], float] = {}
+        histograms: typing.Dict[typing.Tuple[str, Labels], typing.List[float]] = {}
+        for shard in shards:
+            # Copied first since the owning thread may add keys while the shard is read.
+            for key, value in shard.values.copy().items():
+                values[key] = values.get(key, 0.0) + value
+            for key, histogram in shard.histograms.copy().items():
+                total = histograms.get(key)
+                if total is None:
+                    histograms[key] = list(histogram)
+                else:
+                    for index, count in enumerate(histogram):
+                        total[index] += count
+        return values, histograms
+
+    def snapshot(self) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        """
+        Returns the current value of every metric, keyed by metric name and then by its labels formatted as in the
+        Prometheus text format. Histograms are returned with their cumulative bucket counts, sum and count.
+        """
+        values, histograms = self._collect()
+        snapshot: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        for (name, labels), value in sorted(values.items()):
+            snapshot.setdefault(name, {})[_format_labels(labels)] = value
+        for (name, labels), histogram in sorted(histograms.items()):
+            cumulative = 0.0
+            buckets: typing.Dict[str, float] = {}
+            for bound, count in zip(self.latency_buckets + (math.inf,), histogram):
+                cumulative += count
+                buckets[_format_value(bound)] = cumulative
+            snapshot.setdefault(name, {})[_format_labels(labels)] = {
+                "buckets": buckets,
+                "sum": histogram[-1],
+                "count": cumulative,
+            }
+        return snapshot
+
+    def render_prometheus(self) -> str:
+        """
+        Renders every metric in the Prometheus text exposition format.
+        """
+        values, histograms = self._collect()
+        samples: typing.Dict[str, typing.List[str]] = {}
+        for (name, labels), value in sorted(values.items()):
+            samples.setdefault(name, []).append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        for (name, labels), histogram in sorted(histograms.items()):
+            lines = samples.setdefault(name, [])
+            cumulative = 0.0
+            for bound, count in zip(self.latency_buckets + (math.inf,), histogram):
+                cumulative += count
+                bucket_labels = _format_labels(labels, f'le="{_format_value(bound)}"')
+                lines.append(f"{name}_bucket{bucket_labels} {_format_value(cumulative)}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram[-1])}")
+            lines.append(f"{name}_count{_format_labels(labels)} {_format_value(cumulative)}")
+
+        output = []
+        for name in sorted(samples):
+            metric_type, description = _METRICS.get(name, ("untyped", name))
+            output.append(f"# HELP {name} {description}")
+            output.append(f"# TYPE {name} {metric_type}")
+            output.extend(samples[name])
+        return "\n".join(output) + "\n" if output else ""
+
+
+class WebsocketMetrics:
+    """
+    Records the lifetime of a websocket connection into the client's metrics registry, if any. Used as a context
+    manager around the connection, with `record_audio` called whenever audio is received.
+    """
+
+    def __init__(self, metrics: typing.Optional[MetricsRegistry], client: str) -> None:
+        self.metrics = metrics
+        self.client = client
+        self._connected_at = time.monotonic()
+        self._received_audio = False
+
+    def __enter__(self) -> "WebsocketMetrics":
+        self._connected_at = time.monotonic()
+        self._received_audio = False
+        if self.metrics is not None:
+            self.metrics.record_websocket_opened(self.client)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: typing.Optional[typing.Type[BaseException]],
+        exc_value: typing.Optional[BaseException],
+        traceback: typing.Optional[types.TracebackType],
+    ) -> None:
+        if self.metrics is not None:
+            # A generator closed by its consumer is not an error.
+            error = exc_value if isinstance(exc_value, Exception) else None
+            self.metrics.record_websocket_closed(self.client, error)
+
+    def record_audio(self) -> None:
+        if self.metrics is not None and not self._received_audio:
+            self.metrics.record_websocket_first_audio(self.client, time.monotonic() - self._connected_at)
+        self._received_audio = True
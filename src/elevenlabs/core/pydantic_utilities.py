@@ -10,7 +10,8 @@ import typing_extensions
 import pydantic
 
 from .datetime_utils import serialize_datetime
-from .serialization import convert_and_respect_annotation_metadata
+from .json_codec import json_loads
+from .serialization import convert_and_respect_annotation_metadata, needs_aliasing
 
 IS_PYDANTIC_V2 = pydantic.VERSION.startswith("2.")
 
@@ -56,15 +57,52 @@ T = typing.TypeVar("T")
 Model = typing.TypeVar("Model", bound=pydantic.BaseModel)
 
 
+# Building a `TypeAdapter` compiles a validator for the whole type, so each type is only compiled once.
+_type_adapters: typing.Dict[typing.Any, typing.Any] = {}
+
+
+def _get_type_adapter(type_: typing.Any) -> typing.Any:
+    try:
+        adapter = _type_adapters.get(type_)
+    except TypeError:
+        # Unhashable types, e.g. `Annotated` with unhashable metadata, can't be cached.
+        return pydantic.TypeAdapter(type_)  # type: ignore # Pydantic v2
+    if adapter is None:
+        adapter = _type_adapters[type_] = pydantic.TypeAdapter(type_)  # type: ignore # Pydantic v2
+    return adapter
+
+
 def parse_obj_as(type_: typing.Type[T], object_: typing.Any) -> T:
     dealiased_object = convert_and_respect_annotation_metadata(object_=object_, annotation=type_, direction="read")
     if IS_PYDANTIC_V2:
-        adapter = pydantic.TypeAdapter(type_)  # type: ignore # Pydantic v2
-        return adapter.validate_python(dealiased_object)
+        return _get_type_adapter(type_).validate_python(dealiased_object)
     else:
         return pydantic.parse_obj_as(type_, dealiased_object)
 
 
+class UnparsedJson:
+    """
+    The undecoded body of a response, returned by `response.json()` when the client validates responses, so that
+    `construct_type` can validate the bytes with `parse_json_as` instead of walking the decoded JSON.
+    """
+
+    __slots__ = ("content",)
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+
+def parse_json_as(type_: typing.Type[T], content: typing.Union[str, bytes]) -> T:
+    """
+    Validates a JSON document as `type_`, raising `pydantic.ValidationError` if it does not match. On pydantic v2 the
+    JSON is decoded and validated in one pass by pydantic-core, unless fields of the type are aliased with
+    `FieldMetadata` and the document has to be dealiased first.
+    """
+    if IS_PYDANTIC_V2 and not needs_aliasing(type_):
+        return _get_type_adapter(type_).validate_json(content)
+    return parse_obj_as(type_, json_loads(content))
+
+
 def to_jsonable_with_fallback(
     obj: typing.Any, fallback_serializer: typing.Callable[[typing.Any], typing.Any]
 ) -> typing.Any:
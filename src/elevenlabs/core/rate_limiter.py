@@ -0,0 +1,255 @@
+import asyncio
+import math
+import threading
+import time
+import typing
+
+import httpx
+
+from .retry_policy import MAX_RETRY_DELAY_SECONDS_FROM_HEADER, _parse_retry_after
+
+if typing.TYPE_CHECKING:
+    from ..types.subscription import Subscription
+
+# Default concurrent request limits of the self-serve subscription tiers, as published when this SDK was released.
+# Pass `concurrency_limits_by_tier` to `RateLimiter` when the limits of a plan differ. Tiers that are not listed keep
+# the configured limit.
+CONCURRENCY_LIMITS_BY_TIER: typing.Mapping[str, int] = {
+    "free": 2,
+    "starter": 3,
+    "creator": 5,
+    "pro": 10,
+    "scale": 15,
+    "growing_business": 15,
+    "business": 15,
+}
+
+
+def _resolve_future(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class RateLimiter:
+    """
+    Client-side limiter shared by every request made through a client, so that batch jobs saturate but do not
+    exceed the plan's quota. Requests over the limits wait locally instead of being rejected with a 429.
+
+    The same limiter can be used from sync and async clients, and shared between several clients.
+
+    Parameters
+    ----------
+    max_concurrency : typing.Optional[int]
+        The maximum number of requests in flight at once. Streamed responses count until they are closed.
+        Use `update_from_subscription` to size it from the subscription tier. Defaults to no limit.
+
+    requests_per_second : typing.Optional[float]
+        The sustained request rate of the token bucket. Defaults to no limit.
+
+    burst : typing.Optional[int]
+        The number of requests that may be sent at once when the bucket is full. Defaults to `requests_per_second`.
+
+    adaptive : bool
+        Whether 429 responses halve the request rate (recovering gradually on success) and `Retry-After` headers
+        pause all requests. Defaults to True.
+
+    min_requests_per_second : float
+        The floor the adaptive rate does not drop below. Defaults to 0.1.
+
+    concurrency_limits_by_tier : typing.Optional[typing.Mapping[str, int]]
+        The concurrent request limit of each subscription tier, used by `update_from_subscription`. Defaults to
+        `CONCURRENCY_LIMITS_BY_TIER`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: typing.Optional[int] = None,
+        requests_per_second: typing.Optional[float] = None,
+        burst: typing.Optional[int] = None,
+        adaptive: bool = True,
+        min_requests_per_second: float = 0.1,
+        concurrency_limits_by_tier: typing.Optional[typing.Mapping[str, int]] = None,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.requests_per_second = requests_per_second
+        self.burst = burst if burst is not None else max(1, math.ceil(requests_per_second or 1))
+        self.adaptive = adaptive
+        self.min_requests_per_second = min_requests_per_second
+        self.concurrency_limits_by_tier = (
+            concurrency_limits_by_tier if concurrency_limits_by_tier is not None else CONCURRENCY_LIMITS_BY_TIER
+        )
+        self._rate = requests_per_second
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._in_flight = 0
+        self._queue_depth = 0
+        self._waiters: typing.List[typing.Callable[[], None]] = []
+        self._acquired = 0
+        self._rate_limited_responses = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+        self._lock = threading.Lock()
+
+    def update_from_subscription(self, subscription: "Subscription") -> None:
+        """
+        Sets `max_concurrency` to the concurrent request limit of the subscription's tier, as returned by
+        `user.get_subscription()`, looked up in `concurrency_limits_by_tier`.
+        """
+        max_concurrency = self.concurrency_limits_by_tier.get(subscription.tier.lower())
+        if max_concurrency is not None:
+            with self._lock:
+                self.max_concurrency = max_concurrency
+            self._wake_waiters()
+
+    def _try_acquire_locked(self, now: float) -> typing.Optional[float]:
+        """
+        Returns None once a slot was acquired, otherwise the number of seconds to wait before trying again, or
+        infinity if the request has to wait for another one to complete.
+        """
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self.max_concurrency is not None and self._in_flight >= self.max_concurrency:
+            return math.inf
+        if self._rate is not None:
+            self._tokens = min(float(self.burst), self._tokens + (now - self._last_refill) * self._rate)
+            self._last_refill = now
+            if self._tokens < 1:
+                return (1 - self._tokens) / self._rate
+            self._tokens -= 1
+        self._in_flight += 1
+        self._acquired += 1
+        return None
+
+    def _record_wait_locked(self, wait_time: float) -> None:
+        self._queue_depth -= 1
+        self._total_wait_time += wait_time
+        self._max_wait_time = max(self._max_wait_time, wait_time)
+
+    def _wake_waiters(self) -> None:
+        with self._lock:
+            waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            waiter()
+
+    def acquire(self) -> None:
+        started_at = time.monotonic()
+        with self._lock:
+            wait = self._try_acquire_locked(started_at)
+            if wait is None:
+                return
+            self._queue_depth += 1
+        event = threading.Event()
+        try:
+            while wait is not None:
+                with self._lock:
+                    self._waiters.append(event.set)
+                event.wait(None if wait == math.inf else wait)
+                event.clear()
+                with self._lock:
+                    if event.set in self._waiters:
+                        self._waiters.remove(event.set)
+                    wait = self._try_acquire_locked(time.monotonic())
+        finally:
+            with self._lock:
+                self._record_wait_locked(time.monotonic() - started_at)
+
+    async def aacquire(self) -> None:
+        started_at = time.monotonic()
+        with self._lock:
+            wait = self._try_acquire_locked(started_at)
+            if wait is None:
+                return
+            self._queue_depth += 1
+        loop = asyncio.get_running_loop()
+        try:
+            while wait is not None:
+                future = loop.create_future()
+
+                def waiter(future: "asyncio.Future[None]" = future) -> None:
+                    loop.call_soon_threadsafe(_resolve_future, future)
+
+                with self._lock:
+                    self._waiters.append(waiter)
+                try:
+                    await asyncio.wait_for(future, None if wait == math.inf else wait)
+                except asyncio.TimeoutError:
+                    pass
+                with self._lock:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+                    wait = self._try_acquire_locked(time.monotonic())
+        finally:
+            with self._lock:
+                self._record_wait_locked(time.monotonic() - started_at)
+
+    def release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        self._wake_waiters()
+
+    def _reclaim(self) -> None:
+        # Takes a slot back without waiting, for callers that release the slot they hold when an error propagates.
+        with self._lock:
+            self._in_flight += 1
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Sleeps without holding the caller's slot, which is acquired again before returning. Retries back off this
+        way, so that other requests are not held up by the delay.
+        """
+        self.release()
+        try:
+            time.sleep(seconds)
+            self.acquire()
+        except BaseException:
+            self._reclaim()
+            raise
+
+    async def asleep(self, seconds: float) -> None:
+        """
+        The async counterpart of `sleep`.
+        """
+        self.release()
+        try:
+            await asyncio.sleep(seconds)
+            await self.aacquire()
+        except BaseException:
+            self._reclaim()
+            raise
+
+    def record_response(self, response: httpx.Response) -> None:
+        """
+        Adapts the limiter to the API's rate limiting feedback.
+        """
+        if not self.adaptive:
+            return
+        if response.status_code == 429:
+            retry_after = _parse_retry_after(response.headers)
+            with self._lock:
+                self._rate_limited_responses += 1
+                if retry_after is not None:
+                    paused_until = time.monotonic() + min(retry_after, MAX_RETRY_DELAY_SECONDS_FROM_HEADER)
+                    self._paused_until = max(self._paused_until, paused_until)
+                if self._rate is not None:
+                    self._rate = max(self.min_requests_per_second, self._rate / 2)
+        elif response.status_code < 400 and self._rate is not None and self.requests_per_second is not None:
+            with self._lock:
+                if self._rate < self.requests_per_second:
+                    self._rate = min(self.requests_per_second, self._rate + self.requests_per_second * 0.05)
+
+    def get_stats(self) -> typing.Dict[str, typing.Any]:
+        """
+        Returns the current load on the limiter and the time requests spent waiting in its queue.
+        """
+        with self._lock:
+            return {
+                "in_flight": self._in_flight,
+                "queue_depth": self._queue_depth,
+                "acquired": self._acquired,
+                "rate_limited_responses": self._rate_limited_responses,
+                "requests_per_second": self._rate,
+                "total_wait_time_in_seconds": self._total_wait_time,
+                "max_wait_time_in_seconds": self._max_wait_time,
+            }
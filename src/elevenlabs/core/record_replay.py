@@ -0,0 +1,284 @@
+import asyncio
+import base64
+import collections
+import json
+import threading
+import time
+import typing
+
+import httpx
+
+FIXTURE_VERSION = 1
+
+# Credentials are never written to fixture files.
+REDACTED_HEADERS = frozenset(("xi-api-key", "authorization"))
+
+
+def _encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+def _get_exchange_key(method: str, url: str) -> typing.Tuple[str, str]:
+    return method.upper(), str(httpx.URL(url).copy_with(fragment=None))
+
+
+class _Recording:
+    """Request/response pairs recorded by a transport, written to `path` as JSON by `save`."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.exchanges: typing.List[typing.Dict[str, typing.Any]] = []
+        self._lock = threading.Lock()
+
+    def add(
+        self, request: httpx.Request, response: httpx.Response, time_to_first_byte: float
+    ) -> typing.Dict[str, typing.Any]:
+        exchange: typing.Dict[str, typing.Any] = {
+            "request": {
+                "method": request.method,
+                "url": str(request.url),
+                "headers": [
+                    [key, "<redacted>" if key.lower() in REDACTED_HEADERS else value]
+                    for key, value in request.headers.multi_items()
+                ],
+                "body": _encode(request.content) if isinstance(request.stream, httpx.ByteStream) else None,
+            },
+            "response": {
+                "status_code": response.status_code,
+                "headers": [[key, value] for key, value in response.headers.multi_items()],
+                "time_to_first_byte": time_to_first_byte,
+                "chunks": [],
+            },
+        }
+        with self._lock:
+            self.exchanges.append(exchange)
+        return exchange
+
+    def save(self) -> None:
+        with self._lock:
+            data = {"version": FIXTURE_VERSION, "exchanges": list(self.exchanges)}
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+
+class _RecordingByteStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, chunks: typing.List[typing.List[typing.Any]]) -> None:
+        self._stream = stream
+        self._chunks = chunks
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        previous = time.monotonic()
+        for chunk in self._stream:
+            now = time.monotonic()
+            self._chunks.append([now - previous, _encode(chunk)])
+            previous = now
+            yield chunk
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+class _AsyncRecordingByteStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, chunks: typing.List[typing.List[typing.Any]]) -> None:
+        self._stream = stream
+        self._chunks = chunks
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        previous = time.monotonic()
+        async for chunk in self._stream:
+            now = time.monotonic()
+            self._chunks.append([now - previous, _encode(chunk)])
+            previous = now
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """
+    An httpx transport recording every request/response pair it forwards, including the time to first byte and the
+    timing of each streamed chunk, so that they can be replayed offline by `ReplayTransport`. The fixture file is
+    written when the transport is closed, e.g. together with the client, or by calling `save`.
+
+    from elevenlabs.client import ElevenLabs
+    from elevenlabs.core import RecordingTransport
+
+    client = ElevenLabs(httpx_client=httpx.Client(transport=RecordingTransport("fixtures/tts.json")))
+
+    Parameters
+    ----------
+    path : str
+        The fixture file to write.
+
+    transport : typing.Optional[httpx.BaseTransport]
+        The transport requests are forwarded to, defaults to a new `httpx.HTTPTransport`.
+    """
+
+    def __init__(self, path: str, transport: typing.Optional[httpx.BaseTransport] = None) -> None:
+        self._recording = _Recording(path)
+        self._transport = transport if transport is not None else httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started_at = time.monotonic()
+        response = self._transport.handle_request(request)
+        exchange = self._recording.add(request, response, time.monotonic() - started_at)
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=_RecordingByteStream(
+                typing.cast(httpx.SyncByteStream, response.stream), exchange["response"]["chunks"]
+            ),
+            extensions=response.extensions,
+        )
+
+    def save(self) -> None:
+        self._recording.save()
+
+    def close(self) -> None:
+        self._transport.close()
+        self.save()
+
+
+class AsyncRecordingTransport(httpx.AsyncBaseTransport):
+    """
+    The async counterpart of `RecordingTransport`, defaulting to a new `httpx.AsyncHTTPTransport`.
+    """
+
+    def __init__(self, path: str, transport: typing.Optional[httpx.AsyncBaseTransport] = None) -> None:
+        self._recording = _Recording(path)
+        self._transport = transport if transport is not None else httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started_at = time.monotonic()
+        response = await self._transport.handle_async_request(request)
+        exchange = self._recording.add(request, response, time.monotonic() - started_at)
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=_AsyncRecordingByteStream(
+                typing.cast(httpx.AsyncByteStream, response.stream), exchange["response"]["chunks"]
+            ),
+            extensions=response.extensions,
+        )
+
+    def save(self) -> None:
+        self._recording.save()
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+        self.save()
+
+
+class _Replay:
+    """Recorded responses grouped by method and url, handed out in the order they were recorded."""
+
+    def __init__(self, path: str, *, speed: typing.Optional[float], loop: bool) -> None:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != FIXTURE_VERSION:
+            raise ValueError(f"Unsupported fixture version {data.get('version')!r} in {path}.")
+        self.speed = speed
+        self.loop = loop
+        self._responses: typing.Dict[typing.Tuple[str, str], typing.Deque[typing.Dict[str, typing.Any]]] = (
+            collections.defaultdict(collections.deque)
+        )
+        for exchange in data["exchanges"]:
+            key = _get_exchange_key(exchange["request"]["method"], exchange["request"]["url"])
+            self._responses[key].append(exchange["response"])
+        self._lock = threading.Lock()
+
+    def get_delay(self, seconds: float) -> float:
+        return seconds / self.speed if self.speed else 0.0
+
+    def next_response(self, request: httpx.Request) -> typing.Dict[str, typing.Any]:
+        key = _get_exchange_key(request.method, str(request.url))
+        with self._lock:
+            responses = self._responses.get(key)
+            if not responses:
+                raise httpx.TransportError(f"No recorded response for {request.method} {request.url}.", request=request)
+            response = responses.popleft()
+            if self.loop:
+                responses.append(response)
+        return response
+
+    def get_chunks(self, response: typing.Dict[str, typing.Any]) -> typing.List[typing.Tuple[float, bytes]]:
+        return [(self.get_delay(delay), base64.b64decode(chunk)) for delay, chunk in response["chunks"]]
+
+
+class _ReplayByteStream(httpx.SyncByteStream):
+    def __init__(self, chunks: typing.List[typing.Tuple[float, bytes]]) -> None:
+        self._chunks = chunks
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        for delay, chunk in self._chunks:
+            if delay > 0:
+                time.sleep(delay)
+            yield chunk
+
+
+class _AsyncReplayByteStream(httpx.AsyncByteStream):
+    def __init__(self, chunks: typing.List[typing.Tuple[float, bytes]]) -> None:
+        self._chunks = chunks
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        for delay, chunk in self._chunks:
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield chunk
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """
+    An httpx transport answering requests from a fixture file written by `RecordingTransport`, without any network
+    access. Requests are matched on method and url; identical requests receive the recorded responses in order.
+
+    Parameters
+    ----------
+    path : str
+        The fixture file to replay.
+
+    speed : typing.Optional[float]
+        The replay speed relative to the recording, e.g. 2.0 halves the time to first byte and the delay between
+        chunks. None replays without any delay. Defaults to 1.0.
+
+    loop : bool
+        Whether the recorded responses of a request start over once they have all been replayed, so that a fixture
+        can drive benchmarks of any length. Defaults to True.
+    """
+
+    def __init__(self, path: str, *, speed: typing.Optional[float] = 1.0, loop: bool = True) -> None:
+        self._replay = _Replay(path, speed=speed, loop=loop)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        response = self._replay.next_response(request)
+        delay = self._replay.get_delay(response["time_to_first_byte"])
+        if delay > 0:
+            time.sleep(delay)
+        return httpx.Response(
+            response["status_code"],
+            headers=response["headers"],
+            stream=_ReplayByteStream(self._replay.get_chunks(response)),
+        )
+
+
+class AsyncReplayTransport(httpx.AsyncBaseTransport):
+    """
+    The async counterpart of `ReplayTransport`.
+    """
+
+    def __init__(self, path: str, *, speed: typing.Optional[float] = 1.0, loop: bool = True) -> None:
+        self._replay = _Replay(path, speed=speed, loop=loop)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        response = self._replay.next_response(request)
+        delay = self._replay.get_delay(response["time_to_first_byte"])
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return httpx.Response(
+            response["status_code"],
+            headers=response["headers"],
+            stream=_AsyncReplayByteStream(self._replay.get_chunks(response)),
+        )
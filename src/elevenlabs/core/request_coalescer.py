@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import typing
+
+import httpx
+
+from .json_codec import json_loads
+
+_RequestKey = typing.Tuple[str, str, typing.Tuple[typing.Tuple[bytes, bytes], ...]]
+
+
+class _CoalescedResponse(httpx.Response):
+    """A response handed to several callers, its JSON body is decoded once and shared between them."""
+
+    _decoded_json: typing.Any
+
+    def json(self, **kwargs: typing.Any) -> typing.Any:
+        if kwargs:
+            return super().json(**kwargs)
+        try:
+            return self._decoded_json
+        except AttributeError:
+            self._decoded_json = json_loads(self.content)
+            return self._decoded_json
+
+
+def _share_response(response: httpx.Response) -> httpx.Response:
+    # The body has already been read, only the JSON decoding is changed so every caller parses the same object.
+    response.__class__ = _CoalescedResponse
+    return response
+
+
+class _InFlightCall:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: typing.Optional[httpx.Response] = None
+        self.exception: typing.Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """
+    Opt-in coalescing of identical idempotent requests. While a request is in flight, identical requests (same method,
+    url and headers) made concurrently through the client wait for it and receive the same response instead of
+    making their own round-trip, which removes the burst of duplicate `voices.get` or `user.get_subscription` calls
+    made by many workers starting at once.
+
+    Coalesced callers share the request options of the request that is already in flight, and the decoded JSON body
+    of the shared response, which must therefore not be mutated. Streaming requests are never coalesced.
+
+    Parameters
+    ----------
+    methods : typing.Collection[str]
+        The HTTP methods that are coalesced. Defaults to GET.
+    """
+
+    def __init__(self, *, methods: typing.Collection[str] = ("GET",)) -> None:
+        self.methods = frozenset(method.upper() for method in methods)
+        self._in_flight: typing.Dict[_RequestKey, _InFlightCall] = {}
+        self._async_in_flight: typing.Dict[
+            typing.Tuple[asyncio.AbstractEventLoop, _RequestKey], "asyncio.Future[httpx.Response]"
+        ] = {}
+        self._requests = 0
+        self._coalesced = 0
+        self._lock = threading.Lock()
+
+    def get_key(self, request: httpx.Request) -> typing.Optional[_RequestKey]:
+        """
+        Returns the key identical requests share, or None if the request is not coalesced.
+        """
+        if request.method not in self.methods:
+            return None
+        return request.method, str(request.url), tuple(request.headers.raw)
+
+    def send(self, key: _RequestKey, send: typing.Callable[[], httpx.Response]) -> httpx.Response:
+        with self._lock:
+            self._requests += 1
+            in_flight_call = self._in_flight.get(key)
+            if in_flight_call is not None:
+                self._coalesced += 1
+            call = self._in_flight[key] = in_flight_call if in_flight_call is not None else _InFlightCall()
+
+        if in_flight_call is not None:
+            call.done.wait()
+            if call.exception is not None:
+                raise call.exception
+            return typing.cast(httpx.Response, call.response)
+
+        try:
+            call.response = _share_response(send())
+            return call.response
+        except BaseException as exception:
+            call.exception = exception
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+
+    async def asend(
+        self, key: _RequestKey, send: typing.Callable[[], typing.Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        loop_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            self._requests += 1
+            future = self._async_in_flight.get(loop_key)
+            if future is not None:
+                self._coalesced += 1
+            else:
+                future = asyncio.ensure_future(self._asend_shared(loop_key, send))
+                self._async_in_flight[loop_key] = future
+        # Shielded so that a cancelled caller does not cancel the request for the others waiting on it.
+        return await asyncio.shield(future)
+
+    async def _asend_shared(
+        self,
+        loop_key: typing.Tuple[asyncio.AbstractEventLoop, _RequestKey],
+        send: typing.Callable[[], typing.Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        try:
+            return _share_response(await send())
+        finally:
+            with self._lock:
+                del self._async_in_flight[loop_key]
+
+    def get_stats(self) -> typing.Dict[str, int]:
+        """
+        Returns how many requests went through the coalescer and how many of them shared an in-flight request.
+        """
+        with self._lock:
+            return {"requests": self._requests, "coalesced": self._coalesced}
@@ -7,6 +7,10 @@ try:
 except ImportError:
     from typing_extensions import NotRequired
 
+from .hedging_policy import HedgingPolicy
+from .retry_policy import RetryPolicy
+from .timeouts import TimeoutOptions
+
 
 class RequestOptions(typing.TypedDict, total=False):
     """
@@ -16,19 +20,34 @@ class RequestOptions(typing.TypedDict, total=False):
     Attributes:
         - timeout_in_seconds: int. The number of seconds to await an API call before timing out.
 
+        - timeouts: TimeoutOptions. Overrides the client's connect, read, write, pool and stream idle timeouts for this request.
+
+        - deadline_in_seconds: float. The number of seconds the whole call may take, including retries, backoff and reading a streamed response. Retries that cannot start before the deadline are not attempted, and the timeouts of each attempt shrink to the time left. Fails with `DeadlineExceededError` once the deadline has passed.
+
+        - deadline: float. The same as `deadline_in_seconds`, as an absolute timestamp as returned by `time.time()`.
+
         - max_retries: int. The max number of retries to attempt if the API call fails.
 
+        - retry_policy: RetryPolicy. Overrides the client's retry policy (backoff, retried status codes and transport errors, retry budget) for this request.
+
+        - hedging_policy: HedgingPolicy. Overrides the client's hedging policy for this request, only streaming requests are hedged.
+
         - additional_headers: typing.Dict[str, typing.Any]. A dictionary containing additional parameters to spread into the request's header dict
 
         - additional_query_parameters: typing.Dict[str, typing.Any]. A dictionary containing additional parameters to spread into the request's query parameters dict
 
         - additional_body_parameters: typing.Dict[str, typing.Any]. A dictionary containing additional parameters to spread into the request's body parameters dict
 
-        - chunk_size: int. The size, in bytes, to process each chunk of data being streamed back within the response. This equates to leveraging `chunk_size` within `requests` or `httpx`, and is only leveraged for file downloads.
+        - chunk_size: int. The size, in bytes, to process each chunk of data being streamed back within the response. This equates to leveraging `chunk_size` within `requests` or `httpx`, and is only leveraged for file downloads. Defaults to yielding chunks as they are received from the network.
     """
 
     timeout_in_seconds: NotRequired[int]
+    timeouts: NotRequired[TimeoutOptions]
+    deadline_in_seconds: NotRequired[float]
+    deadline: NotRequired[float]
     max_retries: NotRequired[int]
+    retry_policy: NotRequired[RetryPolicy]
+    hedging_policy: NotRequired[HedgingPolicy]
     additional_headers: NotRequired[typing.Dict[str, typing.Any]]
     additional_query_parameters: NotRequired[typing.Dict[str, typing.Any]]
     additional_body_parameters: NotRequired[typing.Dict[str, typing.Any]]
@@ -0,0 +1,199 @@
+import contextvars
+import re
+import time
+import typing
+
+import httpx
+
+# Path segments that identify a resource (voice, history item, dictionary ids, ...) rather than an endpoint.
+_ID_SEGMENT_RE = re.compile(r"^(?=[^/]*[0-9])[A-Za-z0-9_-]{8,}$")
+
+# The timing of the last JSON response whose parse time was asked for, until its body is parsed by `construct_type`.
+_pending_parse: "contextvars.ContextVar[typing.Optional[RequestTiming]]" = contextvars.ContextVar(
+    "elevenlabs_pending_parse", default=None
+)
+
+# Set once any parse callback is registered, so that `construct_type` skips the context lookup until then.
+parse_timing_enabled = False
+
+
+def get_endpoint_template(path: str) -> str:
+    """
+    Returns the path with resource ids replaced, e.g. `v1/voices/{id}/settings`, so that timings can be aggregated
+    per endpoint.
+    """
+    return "/".join("{id}" if _ID_SEGMENT_RE.match(segment) else segment for segment in path.strip("/").split("/"))
+
+
+class RequestTiming:
+    """
+    The timing record of a single request, passed to the timing hooks registered on the client once the response has
+    been fully received, i.e. when the request returns or the stream is closed. Phases that could not be observed
+    (e.g. `connect_in_seconds` when a pooled connection was reused, or all transport phases with a custom transport,
+    a coalesced request or a cached response) are None.
+
+    The body of a JSON response is parsed after the request returned, so `parse_in_seconds` is None when the record is
+    emitted. Hooks interested in it register a callback with `on_parse_complete`, which receives the record again once
+    the body has been parsed.
+
+    Attributes:
+        - method: str. The HTTP method.
+
+        - endpoint: str. The request path with resource ids replaced by `{id}`, e.g. `v1/voices/{id}/settings`.
+
+        - url: str. The full request url.
+
+        - status_code: typing.Optional[int]. The response status code, None if the request failed.
+
+        - retries: int. The number of retries made before the final attempt.
+
+        - coalesced: bool. Whether the response was shared from an identical request already in flight, rather than sent.
+
+        - request_bytes: int. The size of the request body.
+
+        - response_bytes: int. The number of response bytes downloaded.
+
+        - pool_wait_in_seconds: typing.Optional[float]. The time spent waiting for a connection from the pool.
+
+        - connect_in_seconds: typing.Optional[float]. The time spent establishing the TCP connection.
+
+        - tls_in_seconds: typing.Optional[float]. The time spent on the TLS handshake.
+
+        - time_to_first_byte_in_seconds: typing.Optional[float]. The time from sending the final attempt until the response headers were received.
+
+        - download_in_seconds: typing.Optional[float]. The time spent receiving the response body, for streamed responses until the stream was closed.
+
+        - parse_in_seconds: typing.Optional[float]. The time from the request returning until its JSON body was decoded into the response model, set before the callbacks registered with `on_parse_complete` are called.
+
+        - total_in_seconds: float. The time from the start of the request until the record was emitted.
+
+        - error: typing.Optional[BaseException]. The exception the request failed with.
+    """
+
+    def __init__(self, *, method: str, url: str, hooks: typing.Sequence["RequestTimingHook"]) -> None:
+        self.method = method
+        self.url = url
+        self.endpoint = get_endpoint_template(httpx.URL(url).path)
+        self.status_code: typing.Optional[int] = None
+        self.retries = 0
+        self.coalesced = False
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.pool_wait_in_seconds: typing.Optional[float] = None
+        self.connect_in_seconds: typing.Optional[float] = None
+        self.tls_in_seconds: typing.Optional[float] = None
+        self.time_to_first_byte_in_seconds: typing.Optional[float] = None
+        self.download_in_seconds: typing.Optional[float] = None
+        self.parse_in_seconds: typing.Optional[float] = None
+        self.total_in_seconds = 0.0
+        self.error: typing.Optional[BaseException] = None
+        self._hooks = hooks
+        self._started_at = time.perf_counter()
+        self._attempt_started_at = self._started_at
+        self._parse_started_at = self._started_at
+        self._parse_callbacks: typing.List[RequestTimingHook] = []
+        self._events: typing.Dict[str, float] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestTiming(method={self.method!r}, endpoint={self.endpoint!r}, status_code={self.status_code!r}, "
+            f"retries={self.retries!r}, total_in_seconds={self.total_in_seconds!r})"
+        )
+
+    def start_attempt(self, request: httpx.Request, *, asynchronous: bool = False) -> None:
+        self._attempt_started_at = time.perf_counter()
+        self._events = {}
+        self.coalesced = False
+        request.extensions["trace"] = self.atrace if asynchronous else self.trace
+
+    def trace(self, name: str, info: typing.Dict[str, typing.Any]) -> None:
+        # Event names are prefixed by the httpcore module emitting them, e.g. `http11.receive_response_headers.complete`.
+        self._events[name.split(".", 1)[-1]] = time.perf_counter()
+
+    async def atrace(self, name: str, info: typing.Dict[str, typing.Any]) -> None:
+        self.trace(name, info)
+
+    def _get_duration(self, started: str, completed: str) -> typing.Optional[float]:
+        if started in self._events and completed in self._events:
+            return self._events[completed] - self._events[started]
+        return None
+
+    def record_response(self, response: httpx.Response) -> None:
+        """
+        Records the transport phases of the final attempt once the response headers have been received.
+        """
+        self.status_code = response.status_code
+        self.request_bytes = int(response.request.headers.get("content-length", 0))
+        events = self._events
+        first_event = events.get("connect_tcp.started", events.get("send_request_headers.started"))
+        if first_event is not None:
+            self.pool_wait_in_seconds = first_event - self._attempt_started_at
+        self.connect_in_seconds = self._get_duration("connect_tcp.started", "connect_tcp.complete")
+        self.tls_in_seconds = self._get_duration("start_tls.started", "start_tls.complete")
+        if "receive_response_headers.complete" in events:
+            self.time_to_first_byte_in_seconds = events["receive_response_headers.complete"] - self._attempt_started_at
+        else:
+            self.time_to_first_byte_in_seconds = time.perf_counter() - self._attempt_started_at
+
+    def record_download_complete(self, response: httpx.Response) -> None:
+        self.status_code = response.status_code
+        try:
+            # Responses built in memory, e.g. by a mock transport or the response cache, download nothing.
+            self.response_bytes = response.num_bytes_downloaded or len(response.content)
+        except httpx.ResponseNotRead:
+            self.response_bytes = response.num_bytes_downloaded
+        if self.time_to_first_byte_in_seconds is not None:
+            self.download_in_seconds = max(
+                0.0, time.perf_counter() - self._attempt_started_at - self.time_to_first_byte_in_seconds
+            )
+
+    def record_error(self, error: BaseException) -> None:
+        self.error = error
+        self.emit()
+
+    def emit(self) -> None:
+        self.total_in_seconds = time.perf_counter() - self._started_at
+        for hook in self._hooks:
+            hook(self)
+
+    def on_parse_complete(self, callback: "RequestTimingHook") -> None:
+        """
+        Registers a callback that receives this record again, with `parse_in_seconds` set, once the JSON body of the
+        response has been parsed. Only records emitted by `request` can be updated, register it from a timing hook.
+        """
+        global parse_timing_enabled
+        parse_timing_enabled = True
+        self._parse_callbacks.append(callback)
+
+    def emit_and_await_parse(self, response: httpx.Response) -> None:
+        """
+        Emits the record, then waits for the body of a successful JSON response to be parsed by `construct_type` if
+        a callback asked for the parse time.
+        """
+        self.emit()
+        if (
+            self._parse_callbacks
+            and 200 <= response.status_code < 300
+            and "json" in response.headers.get("content-type", "")
+        ):
+            self._parse_started_at = time.perf_counter()
+            _pending_parse.set(self)
+        elif parse_timing_enabled:
+            # The body of a previous response that was never parsed is not attributed to this one.
+            _pending_parse.set(None)
+
+    def record_parse_complete(self) -> None:
+        # Measured from the moment the response was handed back, so JSON decoding is included.
+        self.parse_in_seconds = time.perf_counter() - self._parse_started_at
+        for callback in self._parse_callbacks:
+            callback(self)
+
+
+RequestTimingHook = typing.Callable[[RequestTiming], None]
+
+
+def pop_pending_parse() -> typing.Optional[RequestTiming]:
+    timing = _pending_parse.get()
+    if timing is not None:
+        _pending_parse.set(None)
+    return timing
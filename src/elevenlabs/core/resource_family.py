@@ -0,0 +1,9 @@
+def get_resource_family(path: str) -> str:
+    """
+    Returns the resource a path belongs to, e.g. `v1/voices` for `/v1/voices/{voice_id}/settings/edit`. Requests are
+    grouped by resource family: a mutating request invalidates every cached response of its family, and the circuit
+    breaker tracks the health of each family separately.
+    """
+    segments = [segment for segment in path.split("/") if segment]
+    index = segments.index("v1") if "v1" in segments else 0
+    return "/".join(segments[: index + 2])
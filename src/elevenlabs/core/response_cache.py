@@ -0,0 +1,313 @@
+import abc
+import base64
+import collections
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+import typing
+
+import httpx
+
+from .resource_family import get_resource_family
+
+# Read-mostly endpoints cached by default, matched against the end of the request path.
+DEFAULT_CACHEABLE_PATHS: typing.Tuple[str, ...] = (
+    r"/v1/models",
+    r"/v1/voices",
+    r"/v1/voices/settings/default",
+    r"/v1/voices/[^/]+",
+    r"/v1/voices/[^/]+/settings",
+    r"/v1/pronunciation-dictionaries/[^/]+/",
+    r"/v1/user",
+)
+
+DEFAULT_TTL_IN_SECONDS = 300.0
+DEFAULT_MAX_ENTRIES = 256
+
+# Headers describing the encoded body on the wire, which no longer apply to the decoded body that is cached.
+_ENCODING_HEADERS = frozenset(("content-encoding", "content-length", "transfer-encoding"))
+
+
+class CachedResponse:
+    def __init__(
+        self,
+        *,
+        status_code: int,
+        headers: typing.List[typing.Tuple[str, str]],
+        content: bytes,
+        expires_at: float,
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.expires_at = expires_at
+
+    @classmethod
+    def from_response(cls, response: httpx.Response, *, ttl_in_seconds: float) -> "CachedResponse":
+        return cls(
+            status_code=response.status_code,
+            headers=[(key, value) for key, value in response.headers.items() if key not in _ENCODING_HEADERS],
+            content=response.content,
+            expires_at=time.time() + ttl_in_seconds,
+        )
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def get_validators(self) -> typing.Dict[str, str]:
+        headers = httpx.Headers(self.headers)
+        validators = {}
+        if "etag" in headers:
+            validators["If-None-Match"] = headers["etag"]
+        if "last-modified" in headers:
+            validators["If-Modified-Since"] = headers["last-modified"]
+        return validators
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(self.status_code, headers=self.headers, content=self.content, request=request)
+
+
+class ResponseCache(abc.ABC):
+    """
+    Caches responses of read-mostly endpoints such as `models.get_all` or `voices.get_settings`. Entries expire after
+    `ttl_in_seconds`; expired entries with an `ETag` or `Last-Modified` header are revalidated with a conditional
+    request instead of being downloaded again. Any mutating request made through the client, e.g.
+    `voices.edit_settings` or `voices.delete`, invalidates the cached responses of the resource it changes.
+
+    This abstract base class holds the caching rules, subclasses store the entries. Use `InMemoryResponseCache` or
+    `DiskResponseCache`, or subclass it to plug in another store.
+
+    Parameters
+    ----------
+    ttl_in_seconds : float
+        How long a cached response is used without contacting the API. Defaults to 300 seconds.
+
+    cacheable_paths : typing.Collection[str]
+        Regular expressions matched against the end of the path of GET requests. Defaults to the models, voices,
+        voice settings, pronunciation dictionary and user endpoints.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_in_seconds: float = DEFAULT_TTL_IN_SECONDS,
+        cacheable_paths: typing.Collection[str] = DEFAULT_CACHEABLE_PATHS,
+    ) -> None:
+        self.ttl_in_seconds = ttl_in_seconds
+        self._cacheable_path_re = re.compile("(?:" + "|".join(cacheable_paths) + ")$")
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+        self._invalidations = 0
+        self._stats_lock = threading.Lock()
+
+    @abc.abstractmethod
+    def get_entry(self, key: str, family: str) -> typing.Optional[CachedResponse]:
+        """Returns the entry stored under `key`, if any."""
+
+    @abc.abstractmethod
+    def set_entry(self, key: str, family: str, entry: CachedResponse) -> None:
+        """Stores an entry under `key`, as part of the resource `family`."""
+
+    @abc.abstractmethod
+    def invalidate_family(self, family: str) -> None:
+        """Drops every entry of the resource `family`."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Drops every entry."""
+
+    def has_family(self, family: str) -> bool:
+        """
+        Returns whether entries of the resource `family` may be stored. Stores that can tell cheaply should override
+        it, so that requests to resources that are never cached, e.g. text-to-speech, skip `invalidate_family`.
+        """
+        return True
+
+    def is_cacheable(self, request: httpx.Request) -> bool:
+        return request.method == "GET" and self._cacheable_path_re.search(request.url.path) is not None
+
+    def get_key(self, request: httpx.Request) -> str:
+        # The api key is part of the key so that clients with different credentials never share responses.
+        raw_key = "\n".join((request.method, str(request.url), request.headers.get("xi-api-key", "")))
+        return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+    def lookup(
+        self, request: httpx.Request
+    ) -> typing.Tuple[typing.Optional[httpx.Response], typing.Optional[CachedResponse]]:
+        """
+        Returns the cached response if it is fresh. Otherwise returns the stale entry, if any, after adding its
+        validators to the request so that it can be revalidated by `store`.
+        """
+        entry = self.get_entry(self.get_key(request), get_resource_family(request.url.path))
+        if entry is not None and entry.is_fresh():
+            with self._stats_lock:
+                self._hits += 1
+            return entry.to_response(request), None
+        with self._stats_lock:
+            self._misses += 1
+        if entry is None:
+            return None, None
+        validators = entry.get_validators()
+        if not validators:
+            return None, None
+        request.headers.update(validators)
+        return None, entry
+
+    def store(
+        self, request: httpx.Request, response: httpx.Response, stale_entry: typing.Optional[CachedResponse]
+    ) -> httpx.Response:
+        """
+        Caches a successful response, or refreshes the stale entry the API confirmed with a 304. The entry is keyed by
+        the request the response answered, which carries the api key it was actually sent with.
+        """
+        if "no-store" in response.headers.get("cache-control", ""):
+            return response
+        family = get_resource_family(request.url.path)
+        key = self.get_key(response.request)
+        if response.status_code == 304 and stale_entry is not None:
+            stale_entry.expires_at = time.time() + self.ttl_in_seconds
+            self.set_entry(key, family, stale_entry)
+            with self._stats_lock:
+                self._revalidations += 1
+            return stale_entry.to_response(request)
+        if response.status_code == 200:
+            self.set_entry(key, family, CachedResponse.from_response(response, ttl_in_seconds=self.ttl_in_seconds))
+        return response
+
+    def invalidate(self, request: httpx.Request) -> None:
+        """
+        Drops the cached responses of the resource a mutating request changes.
+        """
+        family = get_resource_family(request.url.path)
+        if not self.has_family(family):
+            return
+        self.invalidate_family(family)
+        with self._stats_lock:
+            self._invalidations += 1
+
+    def get_stats(self) -> typing.Dict[str, int]:
+        with self._stats_lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "revalidations": self._revalidations,
+                "invalidations": self._invalidations,
+            }
+
+
+class InMemoryResponseCache(ResponseCache):
+    """
+    Keeps up to `max_entries` responses in memory, evicting the least recently used ones.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_in_seconds: float = DEFAULT_TTL_IN_SECONDS,
+        cacheable_paths: typing.Collection[str] = DEFAULT_CACHEABLE_PATHS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        super().__init__(ttl_in_seconds=ttl_in_seconds, cacheable_paths=cacheable_paths)
+        self.max_entries = max_entries
+        self._entries: "collections.OrderedDict[str, typing.Tuple[str, CachedResponse]]" = collections.OrderedDict()
+        self._families: typing.Dict[str, typing.Set[str]] = collections.defaultdict(set)
+        self._lock = threading.Lock()
+
+    def get_entry(self, key: str, family: str) -> typing.Optional[CachedResponse]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            self._entries.move_to_end(key)
+            return item[1]
+
+    def set_entry(self, key: str, family: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = (family, entry)
+            self._entries.move_to_end(key)
+            self._families[family].add(key)
+            while len(self._entries) > self.max_entries:
+                evicted_key, (evicted_family, _) = self._entries.popitem(last=False)
+                evicted_family_keys = self._families[evicted_family]
+                evicted_family_keys.discard(evicted_key)
+                if not evicted_family_keys:
+                    del self._families[evicted_family]
+
+    def has_family(self, family: str) -> bool:
+        with self._lock:
+            return family in self._families
+
+    def invalidate_family(self, family: str) -> None:
+        with self._lock:
+            for key in self._families.pop(family, ()):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._families.clear()
+
+
+class DiskResponseCache(ResponseCache):
+    """
+    Stores responses as JSON files under `directory`, so that they survive process restarts and are shared by the
+    processes of a batch job.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        ttl_in_seconds: float = DEFAULT_TTL_IN_SECONDS,
+        cacheable_paths: typing.Collection[str] = DEFAULT_CACHEABLE_PATHS,
+    ) -> None:
+        super().__init__(ttl_in_seconds=ttl_in_seconds, cacheable_paths=cacheable_paths)
+        self.directory = directory
+
+    def _get_family_directory(self, family: str) -> str:
+        return os.path.join(self.directory, family.replace("/", "_"))
+
+    def get_entry(self, key: str, family: str) -> typing.Optional[CachedResponse]:
+        try:
+            with open(os.path.join(self._get_family_directory(family), f"{key}.json"), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return CachedResponse(
+            status_code=data["status_code"],
+            headers=[(key, value) for key, value in data["headers"]],
+            content=base64.b64decode(data["content"]),
+            expires_at=data["expires_at"],
+        )
+
+    def set_entry(self, key: str, family: str, entry: CachedResponse) -> None:
+        family_directory = self._get_family_directory(family)
+        os.makedirs(family_directory, exist_ok=True)
+        path = os.path.join(family_directory, f"{key}.json")
+        # Written to a temporary file first so that concurrent readers never see a partial entry.
+        temporary_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "status_code": entry.status_code,
+                    "headers": entry.headers,
+                    "content": base64.b64encode(entry.content).decode("ascii"),
+                    "expires_at": entry.expires_at,
+                },
+                f,
+            )
+        os.replace(temporary_path, path)
+
+    def has_family(self, family: str) -> bool:
+        return os.path.isdir(self._get_family_directory(family))
+
+    def invalidate_family(self, family: str) -> None:
+        shutil.rmtree(self._get_family_directory(family), ignore_errors=True)
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
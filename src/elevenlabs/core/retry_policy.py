@@ -0,0 +1,181 @@
+import email.utils
+import re
+import threading
+import time
+import typing
+from random import random
+
+import httpx
+
+if typing.TYPE_CHECKING:
+    from .request_options import RequestOptions
+
+INITIAL_RETRY_DELAY_SECONDS = 0.5
+MAX_RETRY_DELAY_SECONDS = 10
+MAX_RETRY_DELAY_SECONDS_FROM_HEADER = 30
+
+DEFAULT_RETRY_STATUS_CODES: typing.FrozenSet[int] = frozenset((408, 409, 429))
+
+# Transport errors raised before any part of the response body reached the caller. Connect and pool errors mean the
+# request never left the client; read timeouts and protocol errors are typically a stalled or recycled connection.
+DEFAULT_RETRY_EXCEPTIONS: typing.Tuple[typing.Type[Exception], ...] = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+    httpx.ReadTimeout,
+    httpx.RemoteProtocolError,
+)
+
+
+def _parse_retry_after(response_headers: httpx.Headers) -> typing.Optional[float]:
+    """
+    This function parses the `Retry-After` header in a HTTP response and returns the number of seconds to wait.
+
+    Inspired by the urllib3 retry implementation.
+    """
+    retry_after_ms = response_headers.get("retry-after-ms")
+    if retry_after_ms is not None:
+        try:
+            return int(retry_after_ms) / 1000 if int(retry_after_ms) > 0 else 0
+        except Exception:
+            pass
+
+    retry_after = response_headers.get("retry-after")
+    if retry_after is None:
+        return None
+
+    # Attempt to parse the header as an int.
+    if re.match(r"^\s*[0-9]+\s*$", retry_after):
+        seconds = float(retry_after)
+    # Fallback to parsing it as a date.
+    else:
+        retry_date_tuple = email.utils.parsedate_tz(retry_after)
+        if retry_date_tuple is None:
+            return None
+        if retry_date_tuple[9] is None:  # Python 2
+            # Assume UTC if no timezone was specified
+            # On Python2.7, parsedate_tz returns None for a timezone offset
+            # instead of 0 if no timezone is given, where mktime_tz treats
+            # a None timezone offset as local time.
+            retry_date_tuple = retry_date_tuple[:9] + (0,) + retry_date_tuple[10:]
+
+        retry_date = email.utils.mktime_tz(retry_date_tuple)
+        seconds = retry_date - time.time()
+
+    if seconds < 0:
+        seconds = 0
+
+    return seconds
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the overall request volume so that a backend outage does not multiply traffic by
+    `max_retries + 1`.
+
+    Every request deposits `ratio` tokens and every retry withdraws one. Independently of traffic,
+    `min_retries_per_second` tokens are added back each second so low-volume clients can still retry. The balance
+    never exceeds `max_tokens`.
+    """
+
+    def __init__(self, *, ratio: float = 0.2, min_retries_per_second: float = 1.0, max_tokens: float = 20.0) -> None:
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._last_refill) * self.min_retries_per_second)
+        self._last_refill = now
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried. A policy can be set on the client, and overridden per call
+    through `RequestOptions`.
+
+    Parameters
+    ----------
+    max_retries : int
+        The max number of retries to attempt. `max_retries` in `RequestOptions` takes precedence. Defaults to 0.
+
+    initial_delay_in_seconds : float
+        The base delay of the exponential backoff. Defaults to 0.5 seconds.
+
+    max_delay_in_seconds : float
+        The cap of the exponential backoff. Defaults to 10 seconds.
+
+    retry_status_codes : typing.Collection[int]
+        Status codes below 500 that are retried, 5xx responses are always retried. Defaults to 408, 409 and 429.
+
+    retry_exceptions : typing.Tuple[typing.Type[Exception], ...]
+        Transport errors that are retried. Streaming requests are only retried until the first byte of the body is
+        handed to the caller. Defaults to connect errors, pool timeouts, read timeouts and protocol errors.
+
+    budget : typing.Optional[RetryBudget]
+        Retry budget shared by every request made with this policy, defaults to a new `RetryBudget`. Pass None to
+        disable it.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = 0,
+        initial_delay_in_seconds: float = INITIAL_RETRY_DELAY_SECONDS,
+        max_delay_in_seconds: float = MAX_RETRY_DELAY_SECONDS,
+        retry_status_codes: typing.Collection[int] = DEFAULT_RETRY_STATUS_CODES,
+        retry_exceptions: typing.Tuple[typing.Type[Exception], ...] = DEFAULT_RETRY_EXCEPTIONS,
+        budget: typing.Optional[RetryBudget] = typing.cast(RetryBudget, ...),
+    ) -> None:
+        self.max_retries = max_retries
+        self.initial_delay_in_seconds = initial_delay_in_seconds
+        self.max_delay_in_seconds = max_delay_in_seconds
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.retry_exceptions = retry_exceptions
+        self.budget = RetryBudget() if budget is ... else budget
+
+    def get_max_retries(self, request_options: typing.Optional["RequestOptions"]) -> int:
+        max_retries = request_options.get("max_retries") if request_options is not None else None
+        return max_retries if max_retries is not None else self.max_retries
+
+    def should_retry_response(self, response: httpx.Response) -> bool:
+        return response.status_code >= 500 or response.status_code in self.retry_status_codes
+
+    def should_retry_exception(self, exception: Exception) -> bool:
+        return isinstance(exception, self.retry_exceptions)
+
+    def record_request(self) -> None:
+        if self.budget is not None:
+            self.budget.record_request()
+
+    def try_acquire_retry(self) -> bool:
+        return self.budget.try_acquire() if self.budget is not None else True
+
+    def get_retry_delay(self, retries: int, response: typing.Optional[httpx.Response] = None) -> float:
+        """
+        Determine the amount of time to wait before retrying a request. A reasonable `Retry-After` header from the
+        response is honoured as is, otherwise exponential backoff with full jitter is applied.
+        """
+        if response is not None:
+            retry_after = _parse_retry_after(response.headers)
+            if retry_after is not None and retry_after <= MAX_RETRY_DELAY_SECONDS_FROM_HEADER:
+                return retry_after
+
+        retry_delay = min(self.initial_delay_in_seconds * pow(2.0, retries), self.max_delay_in_seconds)
+        return retry_delay * random()
@@ -59,6 +59,10 @@ def convert_and_respect_annotation_metadata(
     if inner_type is None:
         inner_type = annotation
 
+    # Objects of types without any aliased fields are left as they are, there is nothing to walk them for.
+    if not needs_aliasing(inner_type):
+        return object_
+
     clean_type = _remove_annotations(inner_type)
     # Pydantic models
     if (
@@ -155,14 +159,70 @@ def convert_and_respect_annotation_metadata(
     return object_
 
 
+# Whether each type, or any type it is made of, has fields aliased with `FieldMetadata`.
+_needs_aliasing: typing.Dict[typing.Any, bool] = {}
+
+
+def needs_aliasing(type_: typing.Any) -> bool:
+    """
+    Returns whether `convert_and_respect_annotation_metadata` could change objects of the type, i.e. whether a model
+    or TypedDict reachable from it has fields aliased with `FieldMetadata`. Computed once per type.
+    """
+    try:
+        result = _needs_aliasing.get(type_)
+    except TypeError:
+        return True
+    if result is None:
+        result = _needs_aliasing[type_] = _has_aliases(type_, set())
+    return result
+
+
+def _has_aliases(type_: typing.Any, seen: typing.Set[int]) -> bool:
+    if id(type_) in seen:
+        return False
+    seen.add(id(type_))
+    if _get_alias_from_type(type_) is not None:
+        return True
+    clean_type = _remove_annotations(type_)
+    if inspect.isclass(clean_type) and (
+        issubclass(clean_type, pydantic.BaseModel) or typing_extensions.is_typeddict(clean_type)
+    ):
+        try:
+            annotations = typing_extensions.get_type_hints(clean_type, include_extras=True)
+        except Exception:
+            # Unresolved forward references, the aliases cannot be ruled out.
+            return True
+        return any(
+            _has_aliases(annotation, seen)
+            for annotation in annotations.values()
+            if typing_extensions.get_origin(annotation) is not typing.ClassVar
+        )
+    return any(_has_aliases(arg, seen) for arg in typing_extensions.get_args(clean_type))
+
+
+# The resolved annotations of each model or TypedDict, and the field names of their aliases.
+_annotations_and_aliases: typing.Dict[
+    typing.Any, typing.Tuple[typing.Dict[str, typing.Any], typing.Dict[str, str]]
+] = {}
+
+
+def _get_annotations_and_aliases(
+    expected_type: typing.Any,
+) -> typing.Tuple[typing.Dict[str, typing.Any], typing.Dict[str, str]]:
+    result = _annotations_and_aliases.get(expected_type)
+    if result is None:
+        annotations = typing_extensions.get_type_hints(expected_type, include_extras=True)
+        result = _annotations_and_aliases[expected_type] = (annotations, _get_alias_to_field_name(annotations))
+    return result
+
+
 def _convert_mapping(
     object_: typing.Mapping[str, object],
     expected_type: typing.Any,
     direction: typing.Literal["read", "write"],
 ) -> typing.Mapping[str, object]:
     converted_object: typing.Dict[str, object] = {}
-    annotations = typing_extensions.get_type_hints(expected_type, include_extras=True)
-    aliases_to_field_names = _get_alias_to_field_name(annotations)
+    annotations, aliases_to_field_names = _get_annotations_and_aliases(expected_type)
     for key, value in object_.items():
         if direction == "read" and key in aliases_to_field_names:
             dealiased_key = aliases_to_field_names.get(key)
@@ -0,0 +1,145 @@
+import time
+import typing
+
+import httpx
+
+try:
+    from typing import NotRequired  # type: ignore
+except ImportError:
+    from typing_extensions import NotRequired
+
+
+if typing.TYPE_CHECKING:
+    from .request_options import RequestOptions
+
+
+class TimeoutOptions(typing.TypedDict, total=False):
+    """
+    Timeouts for the individual phases of a request, set on the client with `timeouts=` and overridden per request
+    through `RequestOptions`. Phases that are not set fall back to the overall timeout, i.e. `timeout_in_seconds` of
+    the request or the `timeout` of the client.
+
+    Attributes:
+        - connect_in_seconds: float. The number of seconds to wait for a connection, including the TLS handshake.
+
+        - read_in_seconds: float. The number of seconds to wait for data from the API, including the response headers.
+
+        - write_in_seconds: float. The number of seconds to wait while sending a chunk of the request body.
+
+        - pool_in_seconds: float. The number of seconds to wait for a connection to become available from the pool. Takes precedence over `pool_timeout_in_seconds` of `ConnectionPoolOptions`.
+
+        - stream_idle_in_seconds: float. The number of seconds a streamed response body, e.g. of `text_to_speech.convert_as_stream`, may go without receiving a chunk before failing with `httpx.ReadTimeout`. Replaces the read timeout once the response headers were received, so that a stalled stream is detected in seconds while the API may still take longer to start responding. Enforced by the httpx transports used by default.
+    """
+
+    connect_in_seconds: NotRequired[float]
+    read_in_seconds: NotRequired[float]
+    write_in_seconds: NotRequired[float]
+    pool_in_seconds: NotRequired[float]
+    stream_idle_in_seconds: NotRequired[float]
+
+
+_PHASES = (
+    ("connect", "connect_in_seconds"),
+    ("read", "read_in_seconds"),
+    ("write", "write_in_seconds"),
+    ("pool", "pool_in_seconds"),
+)
+
+
+def _get_option(
+    key: str,
+    client_timeouts: typing.Optional[TimeoutOptions],
+    request_timeouts: typing.Optional[TimeoutOptions],
+) -> typing.Optional[float]:
+    # TypedDicts only allow literal keys, the phases are looked up dynamically here.
+    for timeouts in (request_timeouts, client_timeouts):
+        if timeouts is not None:
+            value = typing.cast(typing.Dict[str, typing.Optional[float]], timeouts).get(key)
+            if value is not None:
+                return value
+    return None
+
+
+def build_httpx_timeout(
+    *,
+    timeout: typing.Optional[float],
+    pool_timeout: typing.Optional[float],
+    client_timeouts: typing.Optional[TimeoutOptions],
+    request_timeouts: typing.Optional[TimeoutOptions],
+) -> typing.Optional[typing.Union[float, httpx.Timeout]]:
+    """
+    Returns the timeout of a request: the phase timeouts of the request, then those of the client, then the overall
+    timeout. A plain float is returned when no phase is configured.
+    """
+    phases: typing.Dict[str, typing.Optional[float]] = {}
+    for phase, key in _PHASES:
+        value = _get_option(key, client_timeouts, request_timeouts)
+        if value is not None:
+            phases[phase] = value
+    if "pool" not in phases and pool_timeout is not None:
+        phases["pool"] = pool_timeout
+    if not phases:
+        return timeout
+    return httpx.Timeout(timeout, **phases)
+
+
+def get_stream_idle_timeout(
+    client_timeouts: typing.Optional[TimeoutOptions], request_timeouts: typing.Optional[TimeoutOptions]
+) -> typing.Optional[float]:
+    return _get_option("stream_idle_in_seconds", client_timeouts, request_timeouts)
+
+
+def set_stream_read_timeout(response: httpx.Response, read_timeout: float) -> None:
+    """
+    Replaces the read timeout of a streamed response whose headers were received. httpcore looks the read timeout up
+    in the request's `timeout` extension when the body is read, so it then applies to every chunk still to come.
+    """
+    timeouts = response.request.extensions.get("timeout")
+    if isinstance(timeouts, dict):
+        timeouts["read"] = read_timeout
+
+
+class DeadlineExceededError(httpx.TimeoutException):
+    """
+    Raised once the deadline of a request set through `RequestOptions` has passed, before an attempt is sent or
+    while its streamed response is read.
+    """
+
+
+def get_deadline(request_options: typing.Optional["RequestOptions"]) -> typing.Optional[float]:
+    """
+    Returns the deadline of a request as a `time.monotonic()` timestamp, the earlier one if both a relative and an
+    absolute deadline are set.
+    """
+    if request_options is None:
+        return None
+    deadlines = []
+    deadline_in_seconds = request_options.get("deadline_in_seconds")
+    if deadline_in_seconds is not None:
+        deadlines.append(time.monotonic() + deadline_in_seconds)
+    deadline = request_options.get("deadline")
+    if deadline is not None:
+        deadlines.append(time.monotonic() + deadline - time.time())
+    return min(deadlines) if deadlines else None
+
+
+def limit_timeouts_to_deadline(request: httpx.Request, deadline: float) -> None:
+    """
+    Shrinks every phase timeout of the request to the time left until the deadline, raising `DeadlineExceededError`
+    if it has already passed.
+    """
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceededError("The deadline of the request has passed.", request=request)
+    timeouts = request.extensions.get("timeout")
+    if isinstance(timeouts, dict):
+        request.extensions["timeout"] = {
+            phase: remaining if value is None else min(value, remaining) for phase, value in timeouts.items()
+        }
+
+
+def fits_deadline(deadline: typing.Optional[float], delay: float) -> bool:
+    """
+    Returns whether a retry sent after `delay` seconds would still start before the deadline.
+    """
+    return deadline is None or time.monotonic() + delay < deadline
@@ -14,14 +14,17 @@ from .pydantic_utilities import (
     IS_PYDANTIC_V2,
     ModelField,
     UniversalBaseModel,
+    UnparsedJson,
     get_args,
     get_origin,
     is_literal_type,
     is_union,
     parse_date,
     parse_datetime,
+    parse_json_as,
     parse_obj_as,
 )
+from . import request_timing
 from .serialization import get_field_to_alias_mapping
 
 
@@ -66,30 +69,19 @@ class UncheckedBaseModel(UniversalBaseModel):
         if _fields_set is None:
             _fields_set = set(values.keys())
 
-        fields = _get_model_fields(cls)
-        populate_by_name = _get_is_populate_by_name(cls)
-        field_aliases = get_field_to_alias_mapping(cls)
+        metadata = _get_construct_metadata(cls)
+        populate_by_name = metadata.populate_by_name
 
-        for name, field in fields.items():
+        for name, key, decode, field in metadata.fields:
             # Key here is only used to pull data from the values dict
             # you should always use the NAME of the field to for field_values, etc.
             # because that's how the object is constructed from a pydantic perspective
-            key = field.alias
-            if (key is None or field.alias == name) and name in field_aliases:
-                key = field_aliases[name]
-
-            if key is None or (key not in values and populate_by_name):  # Added this to allow population by field name
+            if key not in values and populate_by_name:  # Added this to allow population by field name
                 key = name
 
             if key in values:
-                if IS_PYDANTIC_V2:
-                    type_ = field.annotation  # type: ignore # Pydantic v2
-                else:
-                    type_ = typing.cast(typing.Type, field.outer_type_)  # type: ignore # Pydantic < v1.10.15
-
-                fields_values[name] = (
-                    construct_type(object_=values[key], type_=type_) if type_ is not None else values[key]
-                )
+                value = values[key]
+                fields_values[name] = decode(value) if decode is not None and value is not None else value
                 _fields_set.add(name)
             else:
                 default = _get_field_default(field)
@@ -103,11 +95,10 @@ class UncheckedBaseModel(UniversalBaseModel):
 
         # Add extras back in
         extras = {}
-        pydantic_alias_fields = [field.alias for field in fields.values()]
-        internal_alias_fields = list(field_aliases.values())
+        known_keys = metadata.known_keys
         for key, value in values.items():
             # If the key is not a field by name, nor an alias to a field, then it's extra
-            if (key not in pydantic_alias_fields and key not in internal_alias_fields) and key not in fields:
+            if key not in known_keys:
                 if IS_PYDANTIC_V2:
                     extras[key] = value
                 else:
@@ -126,149 +117,296 @@ class UncheckedBaseModel(UniversalBaseModel):
         return m
 
 
-def _convert_undiscriminated_union_type(union_type: typing.Type[typing.Any], object_: typing.Any) -> typing.Any:
-    inner_types = get_args(union_type)
-    if typing.Any in inner_types:
+class _ConstructMetadata:
+    """
+    What `UncheckedBaseModel.construct` needs to know about a model class, computed once per class rather than for
+    every object constructed.
+    """
+
+    def __init__(self, model: typing.Type[pydantic.BaseModel]) -> None:
+        self.model_fields = _get_model_fields(model)
+        self.populate_by_name = _get_is_populate_by_name(model)
+        field_aliases = get_field_to_alias_mapping(model)
+        # One (name, key, decoder, field) entry per field, the key being the one the field is read from.
+        self.fields: typing.List[typing.Tuple[str, str, typing.Optional[Decoder], PydanticField]] = []
+        for name, field in self.model_fields.items():
+            key = field.alias
+            if (key is None or field.alias == name) and name in field_aliases:
+                key = field_aliases[name]
+            if IS_PYDANTIC_V2:
+                type_ = field.annotation  # type: ignore # Pydantic v2
+            else:
+                type_ = typing.cast(typing.Type, field.outer_type_)  # type: ignore # Pydantic < v1.10.15
+            self.fields.append(
+                (name, key if key is not None else name, _get_decoder(type_) if type_ is not None else None, field)
+            )
+        # The keys that are not extras: the field names, their pydantic aliases and their `FieldMetadata` aliases.
+        self.known_keys: typing.FrozenSet[str] = frozenset(
+            {
+                *self.model_fields,
+                *(field.alias for field in self.model_fields.values() if field.alias is not None),
+                *field_aliases.values(),
+            }
+        )
+
+
+_construct_metadata: typing.Dict[type, _ConstructMetadata] = {}
+
+
+def _get_construct_metadata(model: typing.Type[pydantic.BaseModel]) -> _ConstructMetadata:
+    metadata = _construct_metadata.get(model)
+    # Rebuilding a model, e.g. with `update_forward_refs`, replaces its fields and the cached metadata with them.
+    if metadata is None or metadata.model_fields is not _get_model_fields(model):
+        metadata = _construct_metadata[model] = _ConstructMetadata(model)
+    return metadata
+
+
+Decoder = typing.Callable[[typing.Any], typing.Any]
+
+# The decoder compiled for each type by `_get_decoder`.
+_decoders: typing.Dict[typing.Any, Decoder] = {}
+
+
+def _identity(object_: typing.Any) -> typing.Any:
+    return object_
+
+
+def _decode_datetime(object_: typing.Any) -> typing.Any:
+    try:
+        return parse_datetime(object_)
+    except Exception:
+        return object_
+
+
+def _decode_date(object_: typing.Any) -> typing.Any:
+    try:
+        return parse_date(object_)
+    except Exception:
         return object_
 
-    for inner_type in inner_types:
-        try:
-            if inspect.isclass(inner_type) and issubclass(inner_type, pydantic.BaseModel):
+
+def _decode_uuid(object_: typing.Any) -> typing.Any:
+    try:
+        return uuid.UUID(object_)
+    except Exception:
+        return object_
+
+
+def _decode_int(object_: typing.Any) -> typing.Any:
+    try:
+        return int(object_)
+    except Exception:
+        return object_
+
+
+def _decode_bool(object_: typing.Any) -> typing.Any:
+    try:
+        if isinstance(object_, str):
+            stringified_object = object_.lower()
+            return stringified_object == "true" or stringified_object == "1"
+
+        return bool(object_)
+    except Exception:
+        return object_
+
+
+_SCALAR_DECODERS: typing.Dict[typing.Any, Decoder] = {
+    dt.datetime: _decode_datetime,
+    dt.date: _decode_date,
+    uuid.UUID: _decode_uuid,
+    int: _decode_int,
+    bool: _decode_bool,
+}
+
+
+def _compile_dict(type_: typing.Any) -> Decoder:
+    key_type, items_type = get_args(type_)
+    decode_key = _get_decoder(key_type)
+    decode_item = _get_decoder(items_type)
+
+    def decode(object_: typing.Any) -> typing.Any:
+        if not isinstance(object_, typing.Mapping):
+            return object_
+        return {
+            (None if key is None else decode_key(key)): (None if item is None else decode_item(item))
+            for key, item in object_.items()
+        }
+
+    return decode
+
+
+def _compile_list(type_: typing.Any) -> Decoder:
+    decode_entry = _get_decoder(get_args(type_)[0])
+    if decode_entry is _identity:
+        return lambda object_: list(object_) if isinstance(object_, list) else object_
+
+    def decode(object_: typing.Any) -> typing.Any:
+        if not isinstance(object_, list):
+            return object_
+        return [None if entry is None else decode_entry(entry) for entry in object_]
+
+    return decode
+
+
+def _compile_set(type_: typing.Any) -> Decoder:
+    decode_entry = _get_decoder(get_args(type_)[0])
+
+    def decode(object_: typing.Any) -> typing.Any:
+        if not isinstance(object_, set) and not isinstance(object_, list):
+            return object_
+        return {None if entry is None else decode_entry(entry) for entry in object_}
+
+    return decode
+
+
+def _compile_undiscriminated_union(union_type: typing.Any) -> Decoder:
+    inner_types = get_args(union_type)
+    if typing.Any in inner_types:
+        return _identity
+
+    models = [
+        inner_type
+        for inner_type in inner_types
+        if inspect.isclass(inner_type) and issubclass(inner_type, pydantic.BaseModel)
+    ]
+    inner_decoders = [_get_decoder(inner_type) for inner_type in inner_types]
+
+    def decode(object_: typing.Any) -> typing.Any:
+        for model in models:
+            try:
                 # Attempt a validated parse until one works
-                return parse_obj_as(inner_type, object_)
-        except Exception:
-            continue
+                return parse_obj_as(model, object_)
+            except Exception:
+                continue
+
+        # If none of the types work, just return the first successful cast
+        for decode_inner in inner_decoders:
+            try:
+                return decode_inner(object_)
+            except Exception:
+                continue
+        return None
 
-    # If none of the types work, just return the first successful cast
-    for inner_type in inner_types:
-        try:
-            return construct_type(object_=object_, type_=inner_type)
-        except Exception:
-            continue
+    return decode
 
 
-def _convert_union_type(type_: typing.Type[typing.Any], object_: typing.Any) -> typing.Any:
+def _compile_union(type_: typing.Any) -> Decoder:
     base_type = get_origin(type_) or type_
     union_type = type_
+    # The (discriminant, [(value, decoder)]) of unions annotated with `UnionMetadata`.
+    discriminated: typing.List[typing.Tuple[str, typing.List[typing.Tuple[typing.Any, Decoder]]]] = []
     if base_type == typing_extensions.Annotated:
         union_type = get_args(type_)[0]
-        annotated_metadata = get_args(type_)[1:]
-        for metadata in annotated_metadata:
+        for metadata in get_args(type_)[1:]:
             if isinstance(metadata, UnionMetadata):
+                variants = []
+                for inner_type in get_args(union_type):
+                    try:
+                        value = _get_model_fields(inner_type)[metadata.discriminant].default
+                    except Exception:
+                        # Variants without the discriminant end the lookup, as they did when it was done per object.
+                        break
+                    variants.append((value, _get_decoder(inner_type)))
+                discriminated.append((metadata.discriminant, variants))
+    decode_undiscriminated = _compile_undiscriminated_union(union_type)
+    if not discriminated:
+        return decode_undiscriminated
+
+    def decode(object_: typing.Any) -> typing.Any:
+        for discriminant, variants in discriminated:
+            try:
+                # Cast to the correct type, based on the discriminant
                 try:
-                    # Cast to the correct type, based on the discriminant
-                    for inner_type in get_args(union_type):
-                        try:
-                            objects_discriminant = getattr(object_, metadata.discriminant)
-                        except:
-                            objects_discriminant = object_[metadata.discriminant]
-                        if inner_type.__fields__[metadata.discriminant].default == objects_discriminant:
-                            return construct_type(object_=object_, type_=inner_type)
-                except Exception:
-                    # Allow to fall through to our regular union handling
-                    pass
-    return _convert_undiscriminated_union_type(union_type, object_)
+                    objects_discriminant = getattr(object_, discriminant)
+                except:
+                    objects_discriminant = object_[discriminant]
+                for value, decode_variant in variants:
+                    if value == objects_discriminant:
+                        return decode_variant(object_)
+            except Exception:
+                # Allow to fall through to our regular union handling
+                pass
+        return decode_undiscriminated(object_)
 
+    return decode
 
-def construct_type(*, type_: typing.Type[typing.Any], object_: typing.Any) -> typing.Any:
-    """
-    Here we are essentially creating the same `construct` method in spirit as the above, but for all types, not just
-    Pydantic models.
-    The idea is to essentially attempt to coerce object_ to type_ (recursively)
-    """
-    # Short circuit when dealing with optionals, don't try to coerces None to a type
-    if object_ is None:
-        return None
 
+def _compile(type_: typing.Any) -> Decoder:
     base_type = get_origin(type_) or type_
     is_annotated = base_type == typing_extensions.Annotated
     maybe_annotation_members = get_args(type_)
     is_annotated_union = is_annotated and is_union(get_origin(maybe_annotation_members[0]))
 
     if base_type == typing.Any:
-        return object_
+        return _identity
 
     if base_type == dict:
-        if not isinstance(object_, typing.Mapping):
-            return object_
-
-        key_type, items_type = get_args(type_)
-        d = {
-            construct_type(object_=key, type_=key_type): construct_type(object_=item, type_=items_type)
-            for key, item in object_.items()
-        }
-        return d
+        return _compile_dict(type_)
 
     if base_type == list:
-        if not isinstance(object_, list):
-            return object_
-
-        inner_type = get_args(type_)[0]
-        return [construct_type(object_=entry, type_=inner_type) for entry in object_]
+        return _compile_list(type_)
 
     if base_type == set:
-        if not isinstance(object_, set) and not isinstance(object_, list):
-            return object_
-
-        inner_type = get_args(type_)[0]
-        return {construct_type(object_=entry, type_=inner_type) for entry in object_}
+        return _compile_set(type_)
 
     if is_union(base_type) or is_annotated_union:
-        return _convert_union_type(type_, object_)
+        return _compile_union(type_)
 
     # Cannot do an `issubclass` with a literal type, let's also just confirm we have a class before this call
-    if (
-        object_ is not None
-        and not is_literal_type(type_)
-        and (
-            (inspect.isclass(base_type) and issubclass(base_type, pydantic.BaseModel))
-            or (
-                is_annotated
-                and inspect.isclass(maybe_annotation_members[0])
-                and issubclass(maybe_annotation_members[0], pydantic.BaseModel)
-            )
+    if not is_literal_type(type_) and (
+        (inspect.isclass(base_type) and issubclass(base_type, pydantic.BaseModel))
+        or (
+            is_annotated
+            and inspect.isclass(maybe_annotation_members[0])
+            and issubclass(maybe_annotation_members[0], pydantic.BaseModel)
         )
     ):
-        if IS_PYDANTIC_V2:
-            return type_.model_construct(**object_)
-        else:
-            return type_.construct(**object_)
+        model_construct = type_.model_construct if IS_PYDANTIC_V2 else type_.construct
+        return lambda object_: model_construct(**object_)
 
-    if base_type == dt.datetime:
-        try:
-            return parse_datetime(object_)
-        except Exception:
-            return object_
+    try:
+        return _SCALAR_DECODERS.get(base_type, _identity)
+    except TypeError:
+        return _identity
 
-    if base_type == dt.date:
-        try:
-            return parse_date(object_)
-        except Exception:
-            return object_
 
-    if base_type == uuid.UUID:
-        try:
-            return uuid.UUID(object_)
-        except Exception:
-            return object_
+def _get_decoder(type_: typing.Any) -> Decoder:
+    """
+    Returns the decoder of a type, compiled on first use: the type is inspected once and the containers, unions and
+    models it is made of are resolved into nested decoders, so decoding a value no longer inspects its type.
+    """
+    try:
+        decoder = _decoders.get(type_)
+    except TypeError:
+        # Types that cannot be hashed, e.g. annotated with unhashable metadata, are compiled every time.
+        return _compile(type_)
+    if decoder is None:
+        decoder = _decoders[type_] = _compile(type_)
+    return decoder
 
-    if base_type == int:
-        try:
-            return int(object_)
-        except Exception:
-            return object_
 
-    if base_type == bool:
-        try:
-            if isinstance(object_, str):
-                stringified_object = object_.lower()
-                return stringified_object == "true" or stringified_object == "1"
+def construct_type(*, type_: typing.Type[typing.Any], object_: typing.Any) -> typing.Any:
+    """
+    Here we are essentially creating the same `construct` method in spirit as the above, but for all types, not just
+    Pydantic models.
+    The idea is to essentially attempt to coerce object_ to type_ (recursively)
+    """
+    if request_timing.parse_timing_enabled:
+        timing = request_timing.pop_pending_parse()
+        if timing is not None:
+            try:
+                return construct_type(type_=type_, object_=object_)
+            finally:
+                timing.record_parse_complete()
+
+    # Short circuit when dealing with optionals, don't try to coerces None to a type
+    if object_ is None:
+        return None
 
-            return bool(object_)
-        except Exception:
-            return object_
+    if isinstance(object_, UnparsedJson):
+        return parse_json_as(type_, object_.content)
 
-    return object_
+    return _get_decoder(type_)(object_)
 
 
 def _get_is_populate_by_name(model: typing.Type["Model"]) -> bool:
@@ -0,0 +1,366 @@
+import asyncio
+import inspect
+import mimetypes
+import os
+import typing
+
+import httpx
+
+from .file import File, FileContent
+from .json_codec import json_dumps
+
+# The most that is read from a file into memory at a time.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+ProgressCallback = typing.Callable[[int, typing.Optional[int]], None]
+
+_PATH = "path"
+_FILE = "file"
+_ASYNC_FILE = "async_file"
+_ITERATOR = "iterator"
+_ASYNC_ITERATOR = "async_iterator"
+
+
+class UploadFile:
+    """
+    A file uploaded as a streamed multipart body, for the `core.File` parameters of endpoints such as
+    `speech_to_text.convert`, `speech_to_speech.convert`, `audio_isolation.audio_isolation`,
+    `dubbing.dub_a_video_or_an_audio_file` or `voices.add`. Only `chunk_size` bytes are held in memory at a time, so
+    multi-GB media can be uploaded with flat memory, and the async client reads files in a worker thread instead of
+    blocking the event loop.
+
+    Files opened from a path are closed once they were read and iterators are closed when the upload stops early.
+    Paths and seekable file objects are read again if the request is retried, iterators cannot be and disable retries.
+
+    from elevenlabs.client import ElevenLabs
+    from elevenlabs.core import UploadFile
+
+    client = ElevenLabs()
+    client.speech_to_text.convert(
+        model_id="scribe_v1",
+        file=UploadFile("interview.wav", on_progress=lambda uploaded, total: print(f"{uploaded}/{total}")),
+    )
+
+    Parameters
+    ----------
+    source : typing.Union[str, os.PathLike, typing.IO[bytes], typing.Iterable[bytes], typing.AsyncIterable[bytes]]
+        A path, a file object opened in binary mode, an object with an async `read` method such as an `anyio` or
+        `aiofiles` file, or an iterator or async iterator of bytes. Async sources can only be uploaded by the async
+        client.
+
+    filename : typing.Optional[str]
+        The filename sent to the API. Defaults to the name of the path or file object.
+
+    content_type : typing.Optional[str]
+        The content type of the file. Defaults to a guess from the filename, or `application/octet-stream`.
+
+    size : typing.Optional[int]
+        The size of the file in bytes, sent as the `Content-Length` of the request. Read from the path or file object
+        when not set; uploads of iterators without a size are sent with chunked transfer encoding.
+
+    on_progress : typing.Optional[typing.Callable[[int, typing.Optional[int]], None]]
+        Called after every chunk sent with the number of bytes uploaded so far and the size of the file, if known.
+        Starts over from zero when the request is retried.
+
+    chunk_size : int
+        The number of bytes read at a time. Defaults to 64 KiB.
+    """
+
+    def __init__(
+        self,
+        source: typing.Union[
+            str, "os.PathLike[str]", typing.IO[bytes], typing.Iterable[bytes], typing.AsyncIterable[bytes]
+        ],
+        *,
+        filename: typing.Optional[str] = None,
+        content_type: typing.Optional[str] = None,
+        size: typing.Optional[int] = None,
+        on_progress: typing.Optional[ProgressCallback] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.source = source
+        self.on_progress = on_progress
+        self.chunk_size = chunk_size
+        self._start_position: typing.Optional[int] = None
+        if isinstance(source, (str, os.PathLike)):
+            self._kind = _PATH
+            name: typing.Optional[str] = os.fspath(source)
+        elif hasattr(source, "read"):
+            self._kind = _ASYNC_FILE if inspect.iscoroutinefunction(source.read) else _FILE  # type: ignore
+            name = getattr(source, "name", None)
+            if self._kind == _FILE:
+                self._start_position = _tell(typing.cast(typing.IO[bytes], source))
+        elif hasattr(source, "__aiter__"):
+            self._kind = _ASYNC_ITERATOR
+            name = None
+        elif hasattr(source, "__iter__") and not isinstance(source, (bytes, bytearray)):
+            self._kind = _ITERATOR
+            name = None
+        else:
+            raise TypeError(f"Cannot upload {type(source).__name__}, expected a path, a file object or an iterator.")
+        self.filename = filename if filename is not None else os.path.basename(name) if isinstance(name, str) else None
+        self.content_type = content_type
+        self.size = size if size is not None else self._get_size()
+
+    @property
+    def replayable(self) -> bool:
+        """
+        Whether the file can be sent again, e.g. when the request is retried.
+        """
+        return self._kind == _PATH or (self._kind == _FILE and self._start_position is not None)
+
+    def _get_size(self) -> typing.Optional[int]:
+        if self._kind == _PATH:
+            return os.path.getsize(typing.cast(str, self.source))
+        if self._kind == _FILE and self._start_position is not None:
+            file = typing.cast(typing.IO[bytes], self.source)
+            try:
+                return os.fstat(file.fileno()).st_size - self._start_position
+            except (AttributeError, OSError, ValueError):
+                end = file.seek(0, os.SEEK_END)
+                file.seek(self._start_position)
+                return end - self._start_position
+        return None
+
+    def _report(self, uploaded: int) -> None:
+        if self.on_progress is not None:
+            self.on_progress(uploaded, self.size)
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        if self._kind in (_ASYNC_FILE, _ASYNC_ITERATOR):
+            raise TypeError("Async files and iterators can only be uploaded with the async client.")
+        uploaded = 0
+        for chunk in self._iter_chunks():
+            uploaded += len(chunk)
+            yield chunk
+            self._report(uploaded)
+
+    def _iter_chunks(self) -> typing.Iterator[bytes]:
+        if self._kind == _ITERATOR:
+            iterator = iter(typing.cast(typing.Iterable[bytes], self.source))
+            try:
+                yield from iterator
+            finally:
+                _close(iterator)
+            return
+        file: typing.IO[bytes]
+        if self._kind == _PATH:
+            file = open(typing.cast(str, self.source), "rb")
+        else:
+            file = typing.cast(typing.IO[bytes], self.source)
+            if self._start_position is not None:
+                file.seek(self._start_position)
+        try:
+            while True:
+                chunk = file.read(self.chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        finally:
+            if self._kind == _PATH:
+                file.close()
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        uploaded = 0
+        async for chunk in self._aiter_chunks():
+            uploaded += len(chunk)
+            yield chunk
+            self._report(uploaded)
+
+    async def _aiter_chunks(self) -> typing.AsyncIterator[bytes]:
+        if self._kind == _ASYNC_ITERATOR:
+            async_iterator = typing.cast(typing.AsyncIterable[bytes], self.source).__aiter__()
+            try:
+                async for chunk in async_iterator:
+                    yield chunk
+            finally:
+                aclose = getattr(async_iterator, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+            return
+        if self._kind == _ASYNC_FILE:
+            while True:
+                chunk = await self.source.read(self.chunk_size)  # type: ignore
+                if not chunk:
+                    return
+                yield chunk
+        # Reads of files and sync iterators may block, they run in a worker thread.
+        loop = asyncio.get_running_loop()
+        iterator = self._iter_chunks()
+        try:
+            while True:
+                next_chunk = await loop.run_in_executor(None, _next_chunk, iterator)
+                if next_chunk is None:
+                    return
+                yield next_chunk
+        finally:
+            await loop.run_in_executor(None, _close, iterator)
+
+
+def _tell(file: typing.IO[bytes]) -> typing.Optional[int]:
+    try:
+        if not file.seekable():
+            return None
+        return file.tell()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _next_chunk(iterator: typing.Iterator[bytes]) -> typing.Optional[bytes]:
+    return next(iterator, None)
+
+
+def _close(iterator: typing.Iterator[bytes]) -> None:
+    close = getattr(iterator, "close", None)
+    if close is not None:
+        close()
+
+
+def _format_param(name: str, value: str) -> str:
+    # The HTML5 escaping used by browsers and httpx for form field names and filenames.
+    escaped = value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+    return f'{name}="{escaped}"'
+
+
+def _to_bytes(value: typing.Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    if value is True:
+        return b"true"
+    if value is False:
+        return b"false"
+    if value is None:
+        return b""
+    # Structured fields, e.g. the labels of `voices.add`, are sent as JSON rather than as their Python repr.
+    if isinstance(value, (dict, list, tuple)):
+        return json_dumps(value)
+    return str(value).encode("utf-8")
+
+
+class MultipartStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """
+    A `multipart/form-data` request body whose `UploadFile`s are read while the request is sent rather than up front.
+    The other files and the form fields are encoded like httpx does.
+    """
+
+    def __init__(
+        self,
+        data: typing.Optional[typing.Mapping[str, typing.Any]],
+        files: typing.Sequence[typing.Tuple[str, File]],
+        *,
+        boundary: typing.Optional[bytes] = None,
+    ) -> None:
+        self.boundary = boundary if boundary is not None else os.urandom(16).hex().encode("ascii")
+        self._parts: typing.List[typing.Union[bytes, UploadFile]] = []
+        for name, value in (data or {}).items():
+            for item in value if isinstance(value, (list, tuple)) else [value]:
+                self._add_part(
+                    f"Content-Disposition: form-data; {_format_param('name', name)}\r\n\r\n", _to_bytes(item)
+                )
+        for name, file in files:
+            self._add_file(name, file)
+        self._parts.append(b"--" + self.boundary + b"--\r\n")
+
+    def _add_part(self, headers: str, body: typing.Union[bytes, UploadFile]) -> None:
+        self._parts.append(b"--" + self.boundary + b"\r\n" + headers.encode("utf-8"))
+        self._parts.append(body)
+        self._parts.append(b"\r\n")
+
+    def _add_file(self, name: str, file: File) -> None:
+        filename: typing.Optional[str] = None
+        content_type: typing.Optional[str] = None
+        headers: typing.Mapping[str, str] = {}
+        if isinstance(file, tuple):
+            filename, content, *rest = file
+            content_type = typing.cast(typing.Optional[str], rest[0]) if rest else None
+            headers = typing.cast(typing.Mapping[str, str], rest[1]) if len(rest) > 1 else {}
+        else:
+            content = file
+        body: typing.Union[bytes, UploadFile]
+        if isinstance(content, UploadFile):
+            body = content
+            filename = filename if filename is not None else content.filename
+            content_type = content_type or content.content_type
+        elif isinstance(content, (bytes, str)):
+            body = content.encode("utf-8") if isinstance(content, str) else content
+        else:
+            body = UploadFile(content)
+            filename = filename if filename is not None else body.filename
+        if filename is None:
+            filename = "upload"
+        if content_type is None:
+            content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        lines = [
+            f"Content-Disposition: form-data; {_format_param('name', name)}; {_format_param('filename', filename)}"
+        ]
+        lines.extend(f"{key}: {value}" for key, value in headers.items() if key.lower() != "content-type")
+        lines.append(f"Content-Type: {content_type}")
+        self._add_part("\r\n".join(lines) + "\r\n\r\n", body)
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary.decode('ascii')}"
+
+    @property
+    def replayable(self) -> bool:
+        return all(isinstance(part, bytes) or part.replayable for part in self._parts)
+
+    def get_content_length(self) -> typing.Optional[int]:
+        length = 0
+        for part in self._parts:
+            size = len(part) if isinstance(part, bytes) else part.size
+            if size is None:
+                return None
+            length += size
+        return length
+
+    def get_headers(self) -> typing.Dict[str, str]:
+        content_length = self.get_content_length()
+        if content_length is None:
+            return {"Content-Type": self.content_type, "Transfer-Encoding": "chunked"}
+        return {"Content-Type": self.content_type, "Content-Length": str(content_length)}
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        for part in self._parts:
+            if isinstance(part, bytes):
+                yield part
+            else:
+                yield from part
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        for part in self._parts:
+            if isinstance(part, bytes):
+                yield part
+            else:
+                async for chunk in part:
+                    yield chunk
+
+
+def is_streaming_upload(files: typing.Sequence[typing.Tuple[str, File]], *, stream_file_objects: bool) -> bool:
+    """
+    Returns whether the files are sent as a `MultipartStream`: when any of them is an `UploadFile` or, if
+    `stream_file_objects` is set as it is by the async client, a file object.
+    """
+    for _, file in files:
+        content: FileContent = file[1] if isinstance(file, tuple) else file  # type: ignore
+        if isinstance(content, UploadFile):
+            return True
+        if stream_file_objects and not isinstance(content, (bytes, str)):
+            return True
+    return False
+
+
+def with_multipart_stream(
+    request: httpx.Request,
+    data: typing.Optional[typing.Mapping[str, typing.Any]],
+    files: typing.Sequence[typing.Tuple[str, File]],
+) -> httpx.Request:
+    """
+    Returns a copy of a request built without data and files whose body is a `MultipartStream` of them.
+    """
+    stream = MultipartStream(data, files)
+    headers = httpx.Headers(request.headers)
+    for header in ("Content-Type", "Content-Length", "Transfer-Encoding"):
+        headers.pop(header, None)
+    headers.update(stream.get_headers())
+    return httpx.Request(request.method, request.url, headers=headers, stream=stream, extensions=request.extensions)
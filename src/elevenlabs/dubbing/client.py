@@ -3,6 +3,7 @@
 import typing
 from ..core.client_wrapper import SyncClientWrapper
 from ..core.request_options import RequestOptions
+from ..core.download import get_chunk_size
 from ..types.dubbing_resource import DubbingResource
 from ..core.jsonable_encoder import jsonable_encoder
 from ..core.unchecked_base_model import construct_type
@@ -913,7 +914,7 @@ class DubbingClient:
         ) as _response:
             try:
                 if 200 <= _response.status_code < 300:
-                    _chunk_size = request_options.get("chunk_size", 1024) if request_options is not None else 1024
+                    _chunk_size = get_chunk_size(request_options)
                     for _chunk in _response.iter_bytes(chunk_size=_chunk_size):
                         yield _chunk
                     return
@@ -2038,7 +2039,7 @@ class AsyncDubbingClient:
         ) as _response:
             try:
                 if 200 <= _response.status_code < 300:
-                    _chunk_size = request_options.get("chunk_size", 1024) if request_options is not None else 1024
+                    _chunk_size = get_chunk_size(request_options)
                     async for _chunk in _response.aiter_bytes(chunk_size=_chunk_size):
                         yield _chunk
                     return
@@ -4,6 +4,7 @@ import typing
 from ..core.client_wrapper import SyncClientWrapper
 from .types.history_get_all_request_source import HistoryGetAllRequestSource
 from ..core.request_options import RequestOptions
+from ..core.download import get_chunk_size
 from ..types.get_speech_history_response import GetSpeechHistoryResponse
 from ..core.unchecked_base_model import construct_type
 from ..errors.unprocessable_entity_error import UnprocessableEntityError
@@ -262,7 +263,7 @@ class HistoryClient:
         ) as _response:
             try:
                 if 200 <= _response.status_code < 300:
-                    _chunk_size = request_options.get("chunk_size", 1024) if request_options is not None else 1024
+                    _chunk_size = get_chunk_size(request_options)
                     for _chunk in _response.iter_bytes(chunk_size=_chunk_size):
                         yield _chunk
                     return
@@ -334,7 +335,7 @@ class HistoryClient:
         ) as _response:
             try:
                 if 200 <= _response.status_code < 300:
-                    _chunk_size = request_options.get("chunk_size", 1024) if request_options is not None else 1024
+                    _chunk_size = get_chunk_size(request_options)
                     for _chunk in _response.iter_bytes(chunk_size=_chunk_size):
                         yield _chunk
                     return
@@ -639,7 +640,7 @@ class AsyncHistoryClient:
         ) as _response:
             try:
                 if 200 <= _response.status_code < 300:
-                    _chunk_size = request_options.get("chunk_size", 1024) if request_options is not None else 1024
+                    _chunk_size = get_chunk_size(request_options)
                     async for _chunk in _response.aiter_bytes(chunk_size=_chunk_size):
                         yield _chunk
                     return
@@ -719,7 +720,7 @@ class AsyncHistoryClient:
         ) as _response:
             try:
                 if 200 <= _response.status_code < 300:
-                    _chunk_size = request_options.get("chunk_size", 1024) if request_options is not None else 1024
+                    _chunk_size = get_chunk_size(request_options)
                     async for _chunk in _response.aiter_bytes(chunk_size=_chunk_size):
                         yield _chunk
                     return
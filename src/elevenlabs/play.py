@@ -61,7 +61,11 @@ def play(
 
 def save(audio: Union[bytes, Iterator[bytes]], filename: str) -> None:
     if isinstance(audio, Iterator):
-        audio = b"".join(audio)
+        # Imported here so that importing this module does not load the client.
+        from .core.download import download_to
+
+        download_to(audio, filename)
+        return
     with open(filename, "wb") as f:
         f.write(audio)
 
@@ -15,6 +15,7 @@ from .types.body_create_podcast_v_1_projects_podcast_create_post_duration_scale
     BodyCreatePodcastV1ProjectsPodcastCreatePostDurationScale,
 )
 from ..core.request_options import RequestOptions
+from ..core.download import get_chunk_size
 from ..types.podcast_project_response_model import PodcastProjectResponseModel
 from ..core.serialization import convert_and_respect_annotation_metadata
 from ..core.unchecked_base_model import construct_type
@@ -902,7 +903,7 @@ class ProjectsClient:
         ) as _response:
             try:
                 if 200 <= _response.status_code < 300:
-                    _chunk_size = request_options.get("chunk_size", 1024) if request_options is not None else 1024
+                    _chunk_size = get_chunk_size(request_options)
                     for _chunk in _response.iter_bytes(chunk_size=_chunk_size):
                         yield _chunk
                     return
@@ -2543,7 +2544,7 @@ class AsyncProjectsClient:
         ) as _response:
             try:
                 if 200 <= _response.status_code < 300:
-                    _chunk_size = request_options.get("chunk_size", 1024) if request_options is not None else 1024
+                    _chunk_size = get_chunk_size(request_options)
                     async for _chunk in _response.aiter_bytes(chunk_size=_chunk_size):
                         yield _chunk
                     return
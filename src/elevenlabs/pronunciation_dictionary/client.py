@@ -7,6 +7,7 @@ from .types.pronunciation_dictionary_add_from_file_request_workspace_access impo
     PronunciationDictionaryAddFromFileRequestWorkspaceAccess,
 )
 from ..core.request_options import RequestOptions
+from ..core.download import get_chunk_size
 from ..types.add_pronunciation_dictionary_response_model import AddPronunciationDictionaryResponseModel
 from ..core.unchecked_base_model import construct_type
 from ..errors.unprocessable_entity_error import UnprocessableEntityError
@@ -316,7 +317,7 @@ class PronunciationDictionaryClient:
         ) as _response:
             try:
                 if 200 <= _response.status_code < 300:
-                    _chunk_size = request_options.get("chunk_size", 1024) if request_options is not None else 1024
+                    _chunk_size = get_chunk_size(request_options)
                     for _chunk in _response.iter_bytes(chunk_size=_chunk_size):
                         yield _chunk
                     return
@@ -786,7 +787,7 @@ class AsyncPronunciationDictionaryClient:
         ) as _response:
             try:
                 if 200 <= _response.status_code < 300:
-                    _chunk_size = request_options.get("chunk_size", 1024) if request_options is not None else 1024
+                    _chunk_size = get_chunk_size(request_options)
                     async for _chunk in _response.aiter_bytes(chunk_size=_chunk_size):
                         yield _chunk
                     return
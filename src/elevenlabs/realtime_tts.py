@@ -2,7 +2,6 @@
 
 import typing
 import urllib.parse
-import json
 import base64
 import websockets
 
@@ -10,7 +9,9 @@ from websockets.sync.client import connect
 
 from .core.api_error import ApiError
 from .core.client_wrapper import SyncClientWrapper
+from .core.json_codec import json_dumps_text, json_loads
 from .core.jsonable_encoder import jsonable_encoder
+from .core.metrics import WebsocketMetrics
 from .core.remove_none_from_dict import remove_none_from_dict
 from .core.request_options import RequestOptions
 from .types.voice_settings import VoiceSettings
@@ -42,7 +43,11 @@ def text_chunker(chunks: typing.Iterator[str]) -> typing.Iterator[str]:
 class RealtimeTextToSpeechClient(TextToSpeechClient):
     def __init__(self, *, client_wrapper: SyncClientWrapper):
         super().__init__(client_wrapper=client_wrapper)
-        self._ws_base_url = urllib.parse.urlparse(self._client_wrapper.get_base_url())._replace(scheme="wss").geturl()
+
+    @property
+    def _ws_base_url(self) -> str:
+        # Resolved on every connection so that a change of environment by an `EnvironmentSelector` applies.
+        return urllib.parse.urlparse(self._client_wrapper.get_base_url())._replace(scheme="wss").geturl()
 
     def convert_realtime(
         self,
@@ -103,9 +108,9 @@ class RealtimeTextToSpeechClient(TextToSpeechClient):
                     }
                 )
             )
-        ) as socket:
+        ) as socket, WebsocketMetrics(self._client_wrapper.get_metrics(), "text_to_speech_realtime") as metrics:
             try:
-                socket.send(json.dumps(
+                socket.send(json_dumps_text(
                     dict(
                         text=" ",
                         try_trigger_generation=True,
@@ -121,20 +126,22 @@ class RealtimeTextToSpeechClient(TextToSpeechClient):
             try:
                 for text_chunk in text_chunker(text):
                     data = dict(text=text_chunk, try_trigger_generation=True)
-                    socket.send(json.dumps(data))
+                    socket.send(json_dumps_text(data))
                     try:
-                        data = json.loads(socket.recv(1e-2))
+                        data = json_loads(socket.recv(1e-2))
                         if "audio" in data and data["audio"]:
+                            metrics.record_audio()
                             yield base64.b64decode(data["audio"])  # type: ignore
                     except TimeoutError:
                         pass
 
-                socket.send(json.dumps(dict(text="")))
+                socket.send(json_dumps_text(dict(text="")))
 
                 while True:
 
-                    data = json.loads(socket.recv())
+                    data = json_loads(socket.recv())
                     if "audio" in data and data["audio"]:
+                        metrics.record_audio()
                         yield base64.b64decode(data["audio"])  # type: ignore
             except websockets.exceptions.ConnectionClosed as ce:
                 if "message" in data:
@@ -9,6 +9,7 @@ from .types.body_text_to_speech_v_1_text_to_speech_voice_id_post_apply_text_norm
     BodyTextToSpeechV1TextToSpeechVoiceIdPostApplyTextNormalization,
 )
 from ..core.request_options import RequestOptions
+from ..core.download import get_chunk_size
 from ..core.jsonable_encoder import jsonable_encoder
 from ..core.serialization import convert_and_respect_annotation_metadata
 from ..errors.unprocessable_entity_error import UnprocessableEntityError
@@ -27,7 +28,7 @@ from .types.body_text_to_speech_streaming_with_timestamps_v_1_text_to_speech_voi
     BodyTextToSpeechStreamingWithTimestampsV1TextToSpeechVoiceIdStreamWithTimestampsPostApplyTextNormalization,
 )
 from ..types.streaming_audio_chunk_with_timestamps_response_model import StreamingAudioChunkWithTimestampsResponseModel
-import json
+from ..core.json_codec import json_loads
 from ..core.client_wrapper import AsyncClientWrapper
 
 # this is used as the default value for optional parameters
@@ -181,7 +182,7 @@ class TextToSpeechClient:
         ) as _response:
             try:
                 if 200 <= _response.status_code < 300:
-                    _chunk_size = request_options.get("chunk_size", 1024) if request_options is not None else 1024
+                    _chunk_size = get_chunk_size(request_options)
                     for _chunk in _response.iter_bytes(chunk_size=_chunk_size):
                         yield _chunk
                     return
@@ -507,7 +508,7 @@ class TextToSpeechClient:
         ) as _response:
             try:
                 if 200 <= _response.status_code < 300:
-                    _chunk_size = request_options.get("chunk_size", 1024) if request_options is not None else 1024
+                    _chunk_size = get_chunk_size(request_options)
                     for _chunk in _response.iter_bytes(chunk_size=_chunk_size):
                         yield _chunk
                     return
@@ -680,7 +681,7 @@ class TextToSpeechClient:
                                 StreamingAudioChunkWithTimestampsResponseModel,
                                 construct_type(
                                     type_=StreamingAudioChunkWithTimestampsResponseModel,  # type: ignore
-                                    object_=json.loads(_text),
+                                    object_=json_loads(_text),
                                 ),
                             )
                         except:
@@ -858,7 +859,7 @@ class AsyncTextToSpeechClient:
         ) as _response:
             try:
                 if 200 <= _response.status_code < 300:
-                    _chunk_size = request_options.get("chunk_size", 1024) if request_options is not None else 1024
+                    _chunk_size = get_chunk_size(request_options)
                     async for _chunk in _response.aiter_bytes(chunk_size=_chunk_size):
                         yield _chunk
                     return
@@ -1200,7 +1201,7 @@ class AsyncTextToSpeechClient:
         ) as _response:
             try:
                 if 200 <= _response.status_code < 300:
-                    _chunk_size = request_options.get("chunk_size", 1024) if request_options is not None else 1024
+                    _chunk_size = get_chunk_size(request_options)
                     async for _chunk in _response.aiter_bytes(chunk_size=_chunk_size):
                         yield _chunk
                     return
@@ -1381,7 +1382,7 @@ class AsyncTextToSpeechClient:
                                 StreamingAudioChunkWithTimestampsResponseModel,
                                 construct_type(
                                     type_=StreamingAudioChunkWithTimestampsResponseModel,  # type: ignore
-                                    object_=json.loads(_text),
+                                    object_=json_loads(_text),
                                 ),
                             )
                         except:
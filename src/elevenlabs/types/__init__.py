@@ -1,380 +1,755 @@
 # This file was auto-generated by Fern from our API Definition.
 
-from .accent import Accent
-from .add_agent_secret_response_model import AddAgentSecretResponseModel
-from .add_chapter_response_model import AddChapterResponseModel
-from .add_knowledge_base_response_model import AddKnowledgeBaseResponseModel
-from .add_project_response_model import AddProjectResponseModel
-from .add_pronunciation_dictionary_response_model import AddPronunciationDictionaryResponseModel
-from .add_pronunciation_dictionary_rules_response_model import AddPronunciationDictionaryRulesResponseModel
-from .add_sharing_voice_request import AddSharingVoiceRequest
-from .add_voice_ivc_response_model import AddVoiceIvcResponseModel
-from .add_voice_response_model import AddVoiceResponseModel
-from .add_workspace_group_member_response_model import AddWorkspaceGroupMemberResponseModel
-from .add_workspace_invite_response_model import AddWorkspaceInviteResponseModel
-from .age import Age
-from .agent_ban import AgentBan
-from .agent_call_limits import AgentCallLimits
-from .agent_config_api_model import AgentConfigApiModel
-from .agent_config_override import AgentConfigOverride
-from .agent_config_override_config import AgentConfigOverrideConfig
-from .agent_metadata_response_model import AgentMetadataResponseModel
-from .agent_platform_settings_request_model import AgentPlatformSettingsRequestModel
-from .agent_platform_settings_response_model import AgentPlatformSettingsResponseModel
-from .agent_summary_response_model import AgentSummaryResponseModel
-from .allowlist_item import AllowlistItem
-from .array_json_schema_property import ArrayJsonSchemaProperty
-from .array_json_schema_property_items import ArrayJsonSchemaPropertyItems
-from .asr_conversational_config import AsrConversationalConfig
-from .asr_input_format import AsrInputFormat
-from .asr_provider import AsrProvider
-from .asr_quality import AsrQuality
-from .audio_native_create_project_response_model import AudioNativeCreateProjectResponseModel
-from .audio_native_edit_content_response_model import AudioNativeEditContentResponseModel
-from .audio_native_project_settings_response_model import AudioNativeProjectSettingsResponseModel
-from .audio_with_timestamps_response_model import AudioWithTimestampsResponseModel
-from .auth_settings import AuthSettings
-from .authorization_method import AuthorizationMethod
-from .ban_reason_type import BanReasonType
-from .body_add_to_knowledge_base_v_1_convai_add_to_knowledge_base_post import (
-    BodyAddToKnowledgeBaseV1ConvaiAddToKnowledgeBasePost,
-)
-from .body_add_to_knowledge_base_v_1_convai_agents_agent_id_add_to_knowledge_base_post import (
-    BodyAddToKnowledgeBaseV1ConvaiAgentsAgentIdAddToKnowledgeBasePost,
-)
-from .breakdown_types import BreakdownTypes
-from .chapter_content_block_extendable_node_response_model import ChapterContentBlockExtendableNodeResponseModel
-from .chapter_content_block_input_model import ChapterContentBlockInputModel
-from .chapter_content_block_response_model import ChapterContentBlockResponseModel
-from .chapter_content_block_response_model_nodes_item import (
-    ChapterContentBlockResponseModelNodesItem,
-    ChapterContentBlockResponseModelNodesItem_Other,
-    ChapterContentBlockResponseModelNodesItem_TtsNode,
-)
-from .chapter_content_block_tts_node_response_model import ChapterContentBlockTtsNodeResponseModel
-from .chapter_content_input_model import ChapterContentInputModel
-from .chapter_content_paragraph_tts_node_input_model import ChapterContentParagraphTtsNodeInputModel
-from .chapter_content_response_model import ChapterContentResponseModel
-from .chapter_response import ChapterResponse
-from .chapter_snapshot_extended_response_model import ChapterSnapshotExtendedResponseModel
-from .chapter_snapshot_response import ChapterSnapshotResponse
-from .chapter_snapshots_response import ChapterSnapshotsResponse
-from .chapter_state import ChapterState
-from .chapter_statistics_response import ChapterStatisticsResponse
-from .chapter_with_content_response_model import ChapterWithContentResponseModel
-from .chapter_with_content_response_model_state import ChapterWithContentResponseModelState
-from .character_alignment_model import CharacterAlignmentModel
-from .character_alignment_response_model import CharacterAlignmentResponseModel
-from .client_event import ClientEvent
-from .client_tool_config import ClientToolConfig
-from .conv_ai_secret_locator import ConvAiSecretLocator
-from .conv_ai_stored_secret_dependencies import ConvAiStoredSecretDependencies
-from .conv_ai_stored_secret_dependencies_agent_tools_item import (
-    ConvAiStoredSecretDependenciesAgentToolsItem,
-    ConvAiStoredSecretDependenciesAgentToolsItem_Available,
-    ConvAiStoredSecretDependenciesAgentToolsItem_Unknown,
-)
-from .conv_ai_stored_secret_dependencies_tools_item import (
-    ConvAiStoredSecretDependenciesToolsItem,
-    ConvAiStoredSecretDependenciesToolsItem_Available,
-    ConvAiStoredSecretDependenciesToolsItem_Unknown,
-)
-from .conv_ai_webhooks import ConvAiWebhooks
-from .conv_ai_workspace_stored_secret_config import ConvAiWorkspaceStoredSecretConfig
-from .conversation_charging_common_model import ConversationChargingCommonModel
-from .conversation_config import ConversationConfig
-from .conversation_config_client_override import ConversationConfigClientOverride
-from .conversation_config_client_override_config import ConversationConfigClientOverrideConfig
-from .conversation_deletion_settings import ConversationDeletionSettings
-from .conversation_history_analysis_common_model import ConversationHistoryAnalysisCommonModel
-from .conversation_history_evaluation_criteria_result_common_model import (
-    ConversationHistoryEvaluationCriteriaResultCommonModel,
-)
-from .conversation_history_feedback_common_model import ConversationHistoryFeedbackCommonModel
-from .conversation_history_metadata_common_model import ConversationHistoryMetadataCommonModel
-from .conversation_history_transcript_common_model import ConversationHistoryTranscriptCommonModel
-from .conversation_history_transcript_common_model_role import ConversationHistoryTranscriptCommonModelRole
-from .conversation_history_transcript_tool_call_common_model import ConversationHistoryTranscriptToolCallCommonModel
-from .conversation_history_transcript_tool_result_common_model import ConversationHistoryTranscriptToolResultCommonModel
-from .conversation_initiation_client_data import ConversationInitiationClientData
-from .conversation_initiation_client_data_config import ConversationInitiationClientDataConfig
-from .conversation_initiation_client_data_dynamic_variables_value import (
-    ConversationInitiationClientDataDynamicVariablesValue,
-)
-from .conversation_initiation_client_data_webhook import ConversationInitiationClientDataWebhook
-from .conversation_initiation_client_data_webhook_request_headers_value import (
-    ConversationInitiationClientDataWebhookRequestHeadersValue,
-)
-from .conversation_signed_url_response_model import ConversationSignedUrlResponseModel
-from .conversation_summary_response_model import ConversationSummaryResponseModel
-from .conversation_summary_response_model_status import ConversationSummaryResponseModelStatus
-from .conversation_token_db_model import ConversationTokenDbModel
-from .conversation_token_purpose import ConversationTokenPurpose
-from .conversational_config_api_model import ConversationalConfigApiModel
-from .convert_chapter_response_model import ConvertChapterResponseModel
-from .convert_project_response_model import ConvertProjectResponseModel
-from .create_agent_response_model import CreateAgentResponseModel
-from .create_audio_native_project_request import CreateAudioNativeProjectRequest
-from .create_phone_number_response_model import CreatePhoneNumberResponseModel
-from .create_pronunciation_dictionary_response_model import CreatePronunciationDictionaryResponseModel
-from .currency import Currency
-from .custom_llm import CustomLlm
-from .data_collection_result_common_model import DataCollectionResultCommonModel
-from .delete_chapter_response_model import DeleteChapterResponseModel
-from .delete_dubbing_response_model import DeleteDubbingResponseModel
-from .delete_history_item_response import DeleteHistoryItemResponse
-from .delete_project_response_model import DeleteProjectResponseModel
-from .delete_sample_response_model import DeleteSampleResponseModel
-from .delete_voice_response_model import DeleteVoiceResponseModel
-from .delete_workspace_group_member_response_model import DeleteWorkspaceGroupMemberResponseModel
-from .delete_workspace_invite_response_model import DeleteWorkspaceInviteResponseModel
-from .dependent_available_agent_identifier import DependentAvailableAgentIdentifier
-from .dependent_available_agent_identifier_access_level import DependentAvailableAgentIdentifierAccessLevel
-from .dependent_available_agent_tool_identifier import DependentAvailableAgentToolIdentifier
-from .dependent_available_agent_tool_identifier_access_level import DependentAvailableAgentToolIdentifierAccessLevel
-from .dependent_available_tool_identifier import DependentAvailableToolIdentifier
-from .dependent_available_tool_identifier_access_level import DependentAvailableToolIdentifierAccessLevel
-from .dependent_phone_number_identifier import DependentPhoneNumberIdentifier
-from .dependent_unknown_agent_identifier import DependentUnknownAgentIdentifier
-from .dependent_unknown_agent_tool_identifier import DependentUnknownAgentToolIdentifier
-from .dependent_unknown_tool_identifier import DependentUnknownToolIdentifier
-from .do_dubbing_response import DoDubbingResponse
-from .document_usage_mode_enum import DocumentUsageModeEnum
-from .dubbed_segment import DubbedSegment
-from .dubbing_media_metadata import DubbingMediaMetadata
-from .dubbing_media_reference import DubbingMediaReference
-from .dubbing_metadata_response import DubbingMetadataResponse
-from .dubbing_resource import DubbingResource
-from .dynamic_variables_config import DynamicVariablesConfig
-from .dynamic_variables_config_dynamic_variable_placeholders_value import (
-    DynamicVariablesConfigDynamicVariablePlaceholdersValue,
-)
-from .edit_chapter_response_model import EditChapterResponseModel
-from .edit_project_response_model import EditProjectResponseModel
-from .edit_voice_response_model import EditVoiceResponseModel
-from .edit_voice_settings_response_model import EditVoiceSettingsResponseModel
-from .embed_variant import EmbedVariant
-from .embedding_model_enum import EmbeddingModelEnum
-from .evaluation_settings import EvaluationSettings
-from .evaluation_success_result import EvaluationSuccessResult
-from .extended_subscription_response_model_billing_period import ExtendedSubscriptionResponseModelBillingPeriod
-from .extended_subscription_response_model_character_refresh_period import (
-    ExtendedSubscriptionResponseModelCharacterRefreshPeriod,
-)
-from .extended_subscription_response_model_currency import ExtendedSubscriptionResponseModelCurrency
-from .feedback_item import FeedbackItem
-from .fine_tuning_response import FineTuningResponse
-from .fine_tuning_response_model_state_value import FineTuningResponseModelStateValue
-from .gender import Gender
-from .get_agent_embed_response_model import GetAgentEmbedResponseModel
-from .get_agent_link_response_model import GetAgentLinkResponseModel
-from .get_agent_response_model import GetAgentResponseModel
-from .get_agents_page_response_model import GetAgentsPageResponseModel
-from .get_audio_native_project_settings_response_model import GetAudioNativeProjectSettingsResponseModel
-from .get_chapters_response import GetChaptersResponse
-from .get_conv_ai_settings_response_model import GetConvAiSettingsResponseModel
-from .get_conversation_response_model import GetConversationResponseModel
-from .get_conversation_response_model_status import GetConversationResponseModelStatus
-from .get_conversations_page_response_model import GetConversationsPageResponseModel
-from .get_knowledge_base_dependent_agents_response_model import GetKnowledgeBaseDependentAgentsResponseModel
-from .get_knowledge_base_dependent_agents_response_model_agents_item import (
-    GetKnowledgeBaseDependentAgentsResponseModelAgentsItem,
-    GetKnowledgeBaseDependentAgentsResponseModelAgentsItem_Available,
-    GetKnowledgeBaseDependentAgentsResponseModelAgentsItem_Unknown,
-)
-from .get_knowledge_base_list_response_model import GetKnowledgeBaseListResponseModel
-from .get_knowledge_base_response_model import GetKnowledgeBaseResponseModel
-from .get_knowledge_base_response_model_access_level import GetKnowledgeBaseResponseModelAccessLevel
-from .get_knowledge_base_response_model_type import GetKnowledgeBaseResponseModelType
-from .get_knowledge_base_summary_response_model import GetKnowledgeBaseSummaryResponseModel
-from .get_knowledge_base_summary_response_model_access_level import GetKnowledgeBaseSummaryResponseModelAccessLevel
-from .get_knowledge_base_summary_response_model_dependent_agents_item import (
-    GetKnowledgeBaseSummaryResponseModelDependentAgentsItem,
-    GetKnowledgeBaseSummaryResponseModelDependentAgentsItem_Available,
-    GetKnowledgeBaseSummaryResponseModelDependentAgentsItem_Unknown,
-)
-from .get_knowledge_base_summary_response_model_type import GetKnowledgeBaseSummaryResponseModelType
-from .get_library_voices_response import GetLibraryVoicesResponse
-from .get_phone_number_response_model import GetPhoneNumberResponseModel
-from .get_projects_response import GetProjectsResponse
-from .get_pronunciation_dictionaries_metadata_response_model import GetPronunciationDictionariesMetadataResponseModel
-from .get_pronunciation_dictionary_metadata_response import GetPronunciationDictionaryMetadataResponse
-from .get_speech_history_response import GetSpeechHistoryResponse
-from .get_voices_response import GetVoicesResponse
-from .get_workspace_secrets_response_model import GetWorkspaceSecretsResponseModel
-from .history_alignment_response_model import HistoryAlignmentResponseModel
-from .history_alignments_response_model import HistoryAlignmentsResponseModel
-from .history_item import HistoryItem
-from .http_validation_error import HttpValidationError
-from .image_avatar import ImageAvatar
-from .invoice import Invoice
-from .knowledge_base_document_metadata_response_model import KnowledgeBaseDocumentMetadataResponseModel
-from .knowledge_base_locator import KnowledgeBaseLocator
-from .knowledge_base_locator_type import KnowledgeBaseLocatorType
-from .language_added_response import LanguageAddedResponse
-from .language_preset import LanguagePreset
-from .language_preset_translation import LanguagePresetTranslation
-from .language_response import LanguageResponse
-from .library_voice_response import LibraryVoiceResponse
-from .library_voice_response_model_category import LibraryVoiceResponseModelCategory
-from .literal_json_schema_property import LiteralJsonSchemaProperty
-from .literal_json_schema_property_type import LiteralJsonSchemaPropertyType
-from .llm import Llm
-from .manual_verification_file_response import ManualVerificationFileResponse
-from .manual_verification_response import ManualVerificationResponse
-from .model import Model
-from .model_rates_response_model import ModelRatesResponseModel
-from .model_response_model_concurrency_group import ModelResponseModelConcurrencyGroup
-from .moderation_status_response_model import ModerationStatusResponseModel
-from .moderation_status_response_model_safety_status import ModerationStatusResponseModelSafetyStatus
-from .moderation_status_response_model_warning_status import ModerationStatusResponseModelWarningStatus
-from .object_json_schema_property import ObjectJsonSchemaProperty
-from .object_json_schema_property_properties_value import ObjectJsonSchemaPropertyPropertiesValue
-from .orb_avatar import OrbAvatar
-from .output_format import OutputFormat
-from .phone_number_agent_info import PhoneNumberAgentInfo
-from .podcast_bulletin_mode import PodcastBulletinMode
-from .podcast_bulletin_mode_data import PodcastBulletinModeData
-from .podcast_conversation_mode import PodcastConversationMode
-from .podcast_conversation_mode_data import PodcastConversationModeData
-from .podcast_project_response_model import PodcastProjectResponseModel
-from .podcast_text_source import PodcastTextSource
-from .podcast_url_source import PodcastUrlSource
-from .post_agent_avatar_response_model import PostAgentAvatarResponseModel
-from .post_workspace_secret_response_model import PostWorkspaceSecretResponseModel
-from .privacy_config import PrivacyConfig
-from .profile_page_response_model import ProfilePageResponseModel
-from .project_creation_meta_response_model import ProjectCreationMetaResponseModel
-from .project_creation_meta_response_model_status import ProjectCreationMetaResponseModelStatus
-from .project_creation_meta_response_model_type import ProjectCreationMetaResponseModelType
-from .project_extended_response_model import ProjectExtendedResponseModel
-from .project_extended_response_model_access_level import ProjectExtendedResponseModelAccessLevel
-from .project_extended_response_model_apply_text_normalization import ProjectExtendedResponseModelApplyTextNormalization
-from .project_extended_response_model_fiction import ProjectExtendedResponseModelFiction
-from .project_extended_response_model_quality_preset import ProjectExtendedResponseModelQualityPreset
-from .project_extended_response_model_source_type import ProjectExtendedResponseModelSourceType
-from .project_extended_response_model_target_audience import ProjectExtendedResponseModelTargetAudience
-from .project_response import ProjectResponse
-from .project_response_model_access_level import ProjectResponseModelAccessLevel
-from .project_response_model_fiction import ProjectResponseModelFiction
-from .project_response_model_source_type import ProjectResponseModelSourceType
-from .project_response_model_target_audience import ProjectResponseModelTargetAudience
-from .project_snapshot_extended_response_model import ProjectSnapshotExtendedResponseModel
-from .project_snapshot_response import ProjectSnapshotResponse
-from .project_snapshot_upload_response_model import ProjectSnapshotUploadResponseModel
-from .project_snapshot_upload_response_model_status import ProjectSnapshotUploadResponseModelStatus
-from .project_snapshots_response import ProjectSnapshotsResponse
-from .project_state import ProjectState
-from .prompt_agent import PromptAgent
-from .prompt_agent_override import PromptAgentOverride
-from .prompt_agent_override_config import PromptAgentOverrideConfig
-from .prompt_agent_tools_item import (
-    PromptAgentToolsItem,
-    PromptAgentToolsItem_Client,
-    PromptAgentToolsItem_System,
-    PromptAgentToolsItem_Webhook,
-)
-from .prompt_evaluation_criteria import PromptEvaluationCriteria
-from .pronunciation_dictionary_alias_rule_request_model import PronunciationDictionaryAliasRuleRequestModel
-from .pronunciation_dictionary_phoneme_rule_request_model import PronunciationDictionaryPhonemeRuleRequestModel
-from .pronunciation_dictionary_version_locator import PronunciationDictionaryVersionLocator
-from .pronunciation_dictionary_version_response_model import PronunciationDictionaryVersionResponseModel
-from .pydantic_pronunciation_dictionary_version_locator import PydanticPronunciationDictionaryVersionLocator
-from .query_params_json_schema import QueryParamsJsonSchema
-from .rag_config import RagConfig
-from .rag_index_response_model import RagIndexResponseModel
-from .rag_index_status import RagIndexStatus
-from .reader_resource_response_model import ReaderResourceResponseModel
-from .reader_resource_response_model_resource_type import ReaderResourceResponseModelResourceType
-from .recording_response import RecordingResponse
-from .remove_pronunciation_dictionary_rules_response_model import RemovePronunciationDictionaryRulesResponseModel
-from .resource_access_info import ResourceAccessInfo
-from .resource_access_info_role import ResourceAccessInfoRole
-from .review_status import ReviewStatus
-from .safety_common_model import SafetyCommonModel
-from .safety_evaluation import SafetyEvaluation
-from .safety_response_model import SafetyResponseModel
-from .safety_rule import SafetyRule
-from .secret_dependency_type import SecretDependencyType
-from .segment_create_response import SegmentCreateResponse
-from .segment_delete_response import SegmentDeleteResponse
-from .segment_dub_response import SegmentDubResponse
-from .segment_transcription_response import SegmentTranscriptionResponse
-from .segment_translation_response import SegmentTranslationResponse
-from .segment_update_response import SegmentUpdateResponse
-from .speaker_segment import SpeakerSegment
-from .speaker_track import SpeakerTrack
-from .speech_history_item_response import SpeechHistoryItemResponse
-from .speech_history_item_response_model_source import SpeechHistoryItemResponseModelSource
-from .speech_history_item_response_model_voice_category import SpeechHistoryItemResponseModelVoiceCategory
-from .speech_to_text_character_response_model import SpeechToTextCharacterResponseModel
-from .speech_to_text_chunk_response_model import SpeechToTextChunkResponseModel
-from .speech_to_text_word_response_model import SpeechToTextWordResponseModel
-from .speech_to_text_word_response_model_type import SpeechToTextWordResponseModelType
-from .streaming_audio_chunk_with_timestamps_response_model import StreamingAudioChunkWithTimestampsResponseModel
-from .subscription import Subscription
-from .subscription_response import SubscriptionResponse
-from .subscription_response_model_billing_period import SubscriptionResponseModelBillingPeriod
-from .subscription_response_model_character_refresh_period import SubscriptionResponseModelCharacterRefreshPeriod
-from .subscription_response_model_currency import SubscriptionResponseModelCurrency
-from .subscription_status import SubscriptionStatus
-from .subscription_usage_response_model import SubscriptionUsageResponseModel
-from .system_tool_config import SystemToolConfig
-from .telephony_provider import TelephonyProvider
-from .text_to_speech_as_stream_request import TextToSpeechAsStreamRequest
-from .tts_conversational_config import TtsConversationalConfig
-from .tts_conversational_config_override import TtsConversationalConfigOverride
-from .tts_conversational_config_override_config import TtsConversationalConfigOverrideConfig
-from .tts_conversational_model import TtsConversationalModel
-from .tts_optimize_streaming_latency import TtsOptimizeStreamingLatency
-from .tts_output_format import TtsOutputFormat
-from .turn_config import TurnConfig
-from .turn_mode import TurnMode
-from .update_workspace_member_response_model import UpdateWorkspaceMemberResponseModel
-from .url_avatar import UrlAvatar
-from .usage_characters_response_model import UsageCharactersResponseModel
-from .user import User
-from .user_feedback import UserFeedback
-from .user_feedback_score import UserFeedbackScore
-from .validation_error import ValidationError
-from .validation_error_loc_item import ValidationErrorLocItem
-from .verification_attempt_response import VerificationAttemptResponse
-from .verified_voice_language_response_model import VerifiedVoiceLanguageResponseModel
-from .voice import Voice
-from .voice_generation_parameter_option_response import VoiceGenerationParameterOptionResponse
-from .voice_generation_parameter_response import VoiceGenerationParameterResponse
-from .voice_preview_response_model import VoicePreviewResponseModel
-from .voice_previews_response_model import VoicePreviewsResponseModel
-from .voice_response_model_category import VoiceResponseModelCategory
-from .voice_response_model_safety_control import VoiceResponseModelSafetyControl
-from .voice_sample import VoiceSample
-from .voice_settings import VoiceSettings
-from .voice_sharing_moderation_check_response_model import VoiceSharingModerationCheckResponseModel
-from .voice_sharing_response import VoiceSharingResponse
-from .voice_sharing_response_model_category import VoiceSharingResponseModelCategory
-from .voice_sharing_state import VoiceSharingState
-from .voice_verification_response import VoiceVerificationResponse
-from .webhook_tool_api_schema_config import WebhookToolApiSchemaConfig
-from .webhook_tool_api_schema_config_method import WebhookToolApiSchemaConfigMethod
-from .webhook_tool_api_schema_config_request_headers_value import WebhookToolApiSchemaConfigRequestHeadersValue
-from .webhook_tool_config import WebhookToolConfig
-from .widget_config import WidgetConfig
-from .widget_config_avatar import (
-    WidgetConfigAvatar,
-    WidgetConfigAvatar_Image,
-    WidgetConfigAvatar_Orb,
-    WidgetConfigAvatar_Url,
-)
-from .widget_config_response_model import WidgetConfigResponseModel
-from .widget_config_response_model_avatar import (
-    WidgetConfigResponseModelAvatar,
-    WidgetConfigResponseModelAvatar_Image,
-    WidgetConfigResponseModelAvatar_Orb,
-    WidgetConfigResponseModelAvatar_Url,
-)
-from .widget_expandable import WidgetExpandable
-from .widget_feedback_mode import WidgetFeedbackMode
-from .workspace_group_by_name_response_model import WorkspaceGroupByNameResponseModel
+# Names are imported on first access (PEP 562) so that using one model does not load all of them.
+
+import typing
+from importlib import import_module
+
+if typing.TYPE_CHECKING:
+    from .accent import Accent
+    from .add_agent_secret_response_model import AddAgentSecretResponseModel
+    from .add_chapter_response_model import AddChapterResponseModel
+    from .add_knowledge_base_response_model import AddKnowledgeBaseResponseModel
+    from .add_project_response_model import AddProjectResponseModel
+    from .add_pronunciation_dictionary_response_model import AddPronunciationDictionaryResponseModel
+    from .add_pronunciation_dictionary_rules_response_model import AddPronunciationDictionaryRulesResponseModel
+    from .add_sharing_voice_request import AddSharingVoiceRequest
+    from .add_voice_ivc_response_model import AddVoiceIvcResponseModel
+    from .add_voice_response_model import AddVoiceResponseModel
+    from .add_workspace_group_member_response_model import AddWorkspaceGroupMemberResponseModel
+    from .add_workspace_invite_response_model import AddWorkspaceInviteResponseModel
+    from .age import Age
+    from .agent_ban import AgentBan
+    from .agent_call_limits import AgentCallLimits
+    from .agent_config_api_model import AgentConfigApiModel
+    from .agent_config_override import AgentConfigOverride
+    from .agent_config_override_config import AgentConfigOverrideConfig
+    from .agent_metadata_response_model import AgentMetadataResponseModel
+    from .agent_platform_settings_request_model import AgentPlatformSettingsRequestModel
+    from .agent_platform_settings_response_model import AgentPlatformSettingsResponseModel
+    from .agent_summary_response_model import AgentSummaryResponseModel
+    from .allowlist_item import AllowlistItem
+    from .array_json_schema_property import ArrayJsonSchemaProperty
+    from .array_json_schema_property_items import ArrayJsonSchemaPropertyItems
+    from .asr_conversational_config import AsrConversationalConfig
+    from .asr_input_format import AsrInputFormat
+    from .asr_provider import AsrProvider
+    from .asr_quality import AsrQuality
+    from .audio_native_create_project_response_model import AudioNativeCreateProjectResponseModel
+    from .audio_native_edit_content_response_model import AudioNativeEditContentResponseModel
+    from .audio_native_project_settings_response_model import AudioNativeProjectSettingsResponseModel
+    from .audio_with_timestamps_response_model import AudioWithTimestampsResponseModel
+    from .auth_settings import AuthSettings
+    from .authorization_method import AuthorizationMethod
+    from .ban_reason_type import BanReasonType
+    from .body_add_to_knowledge_base_v_1_convai_add_to_knowledge_base_post import (
+        BodyAddToKnowledgeBaseV1ConvaiAddToKnowledgeBasePost,
+    )
+    from .body_add_to_knowledge_base_v_1_convai_agents_agent_id_add_to_knowledge_base_post import (
+        BodyAddToKnowledgeBaseV1ConvaiAgentsAgentIdAddToKnowledgeBasePost,
+    )
+    from .breakdown_types import BreakdownTypes
+    from .chapter_content_block_extendable_node_response_model import ChapterContentBlockExtendableNodeResponseModel
+    from .chapter_content_block_input_model import ChapterContentBlockInputModel
+    from .chapter_content_block_response_model import ChapterContentBlockResponseModel
+    from .chapter_content_block_response_model_nodes_item import (
+        ChapterContentBlockResponseModelNodesItem,
+        ChapterContentBlockResponseModelNodesItem_Other,
+        ChapterContentBlockResponseModelNodesItem_TtsNode,
+    )
+    from .chapter_content_block_tts_node_response_model import ChapterContentBlockTtsNodeResponseModel
+    from .chapter_content_input_model import ChapterContentInputModel
+    from .chapter_content_paragraph_tts_node_input_model import ChapterContentParagraphTtsNodeInputModel
+    from .chapter_content_response_model import ChapterContentResponseModel
+    from .chapter_response import ChapterResponse
+    from .chapter_snapshot_extended_response_model import ChapterSnapshotExtendedResponseModel
+    from .chapter_snapshot_response import ChapterSnapshotResponse
+    from .chapter_snapshots_response import ChapterSnapshotsResponse
+    from .chapter_state import ChapterState
+    from .chapter_statistics_response import ChapterStatisticsResponse
+    from .chapter_with_content_response_model import ChapterWithContentResponseModel
+    from .chapter_with_content_response_model_state import ChapterWithContentResponseModelState
+    from .character_alignment_model import CharacterAlignmentModel
+    from .character_alignment_response_model import CharacterAlignmentResponseModel
+    from .client_event import ClientEvent
+    from .client_tool_config import ClientToolConfig
+    from .conv_ai_secret_locator import ConvAiSecretLocator
+    from .conv_ai_stored_secret_dependencies import ConvAiStoredSecretDependencies
+    from .conv_ai_stored_secret_dependencies_agent_tools_item import (
+        ConvAiStoredSecretDependenciesAgentToolsItem,
+        ConvAiStoredSecretDependenciesAgentToolsItem_Available,
+        ConvAiStoredSecretDependenciesAgentToolsItem_Unknown,
+    )
+    from .conv_ai_stored_secret_dependencies_tools_item import (
+        ConvAiStoredSecretDependenciesToolsItem,
+        ConvAiStoredSecretDependenciesToolsItem_Available,
+        ConvAiStoredSecretDependenciesToolsItem_Unknown,
+    )
+    from .conv_ai_webhooks import ConvAiWebhooks
+    from .conv_ai_workspace_stored_secret_config import ConvAiWorkspaceStoredSecretConfig
+    from .conversation_charging_common_model import ConversationChargingCommonModel
+    from .conversation_config import ConversationConfig
+    from .conversation_config_client_override import ConversationConfigClientOverride
+    from .conversation_config_client_override_config import ConversationConfigClientOverrideConfig
+    from .conversation_deletion_settings import ConversationDeletionSettings
+    from .conversation_history_analysis_common_model import ConversationHistoryAnalysisCommonModel
+    from .conversation_history_evaluation_criteria_result_common_model import (
+        ConversationHistoryEvaluationCriteriaResultCommonModel,
+    )
+    from .conversation_history_feedback_common_model import ConversationHistoryFeedbackCommonModel
+    from .conversation_history_metadata_common_model import ConversationHistoryMetadataCommonModel
+    from .conversation_history_transcript_common_model import ConversationHistoryTranscriptCommonModel
+    from .conversation_history_transcript_common_model_role import ConversationHistoryTranscriptCommonModelRole
+    from .conversation_history_transcript_tool_call_common_model import ConversationHistoryTranscriptToolCallCommonModel
+    from .conversation_history_transcript_tool_result_common_model import (
+        ConversationHistoryTranscriptToolResultCommonModel,
+    )
+    from .conversation_initiation_client_data import ConversationInitiationClientData
+    from .conversation_initiation_client_data_config import ConversationInitiationClientDataConfig
+    from .conversation_initiation_client_data_dynamic_variables_value import (
+        ConversationInitiationClientDataDynamicVariablesValue,
+    )
+    from .conversation_initiation_client_data_webhook import ConversationInitiationClientDataWebhook
+    from .conversation_initiation_client_data_webhook_request_headers_value import (
+        ConversationInitiationClientDataWebhookRequestHeadersValue,
+    )
+    from .conversation_signed_url_response_model import ConversationSignedUrlResponseModel
+    from .conversation_summary_response_model import ConversationSummaryResponseModel
+    from .conversation_summary_response_model_status import ConversationSummaryResponseModelStatus
+    from .conversation_token_db_model import ConversationTokenDbModel
+    from .conversation_token_purpose import ConversationTokenPurpose
+    from .conversational_config_api_model import ConversationalConfigApiModel
+    from .convert_chapter_response_model import ConvertChapterResponseModel
+    from .convert_project_response_model import ConvertProjectResponseModel
+    from .create_agent_response_model import CreateAgentResponseModel
+    from .create_audio_native_project_request import CreateAudioNativeProjectRequest
+    from .create_phone_number_response_model import CreatePhoneNumberResponseModel
+    from .create_pronunciation_dictionary_response_model import CreatePronunciationDictionaryResponseModel
+    from .currency import Currency
+    from .custom_llm import CustomLlm
+    from .data_collection_result_common_model import DataCollectionResultCommonModel
+    from .delete_chapter_response_model import DeleteChapterResponseModel
+    from .delete_dubbing_response_model import DeleteDubbingResponseModel
+    from .delete_history_item_response import DeleteHistoryItemResponse
+    from .delete_project_response_model import DeleteProjectResponseModel
+    from .delete_sample_response_model import DeleteSampleResponseModel
+    from .delete_voice_response_model import DeleteVoiceResponseModel
+    from .delete_workspace_group_member_response_model import DeleteWorkspaceGroupMemberResponseModel
+    from .delete_workspace_invite_response_model import DeleteWorkspaceInviteResponseModel
+    from .dependent_available_agent_identifier import DependentAvailableAgentIdentifier
+    from .dependent_available_agent_identifier_access_level import DependentAvailableAgentIdentifierAccessLevel
+    from .dependent_available_agent_tool_identifier import DependentAvailableAgentToolIdentifier
+    from .dependent_available_agent_tool_identifier_access_level import DependentAvailableAgentToolIdentifierAccessLevel
+    from .dependent_available_tool_identifier import DependentAvailableToolIdentifier
+    from .dependent_available_tool_identifier_access_level import DependentAvailableToolIdentifierAccessLevel
+    from .dependent_phone_number_identifier import DependentPhoneNumberIdentifier
+    from .dependent_unknown_agent_identifier import DependentUnknownAgentIdentifier
+    from .dependent_unknown_agent_tool_identifier import DependentUnknownAgentToolIdentifier
+    from .dependent_unknown_tool_identifier import DependentUnknownToolIdentifier
+    from .do_dubbing_response import DoDubbingResponse
+    from .document_usage_mode_enum import DocumentUsageModeEnum
+    from .dubbed_segment import DubbedSegment
+    from .dubbing_media_metadata import DubbingMediaMetadata
+    from .dubbing_media_reference import DubbingMediaReference
+    from .dubbing_metadata_response import DubbingMetadataResponse
+    from .dubbing_resource import DubbingResource
+    from .dynamic_variables_config import DynamicVariablesConfig
+    from .dynamic_variables_config_dynamic_variable_placeholders_value import (
+        DynamicVariablesConfigDynamicVariablePlaceholdersValue,
+    )
+    from .edit_chapter_response_model import EditChapterResponseModel
+    from .edit_project_response_model import EditProjectResponseModel
+    from .edit_voice_response_model import EditVoiceResponseModel
+    from .edit_voice_settings_response_model import EditVoiceSettingsResponseModel
+    from .embed_variant import EmbedVariant
+    from .embedding_model_enum import EmbeddingModelEnum
+    from .evaluation_settings import EvaluationSettings
+    from .evaluation_success_result import EvaluationSuccessResult
+    from .extended_subscription_response_model_billing_period import ExtendedSubscriptionResponseModelBillingPeriod
+    from .extended_subscription_response_model_character_refresh_period import (
+        ExtendedSubscriptionResponseModelCharacterRefreshPeriod,
+    )
+    from .extended_subscription_response_model_currency import ExtendedSubscriptionResponseModelCurrency
+    from .feedback_item import FeedbackItem
+    from .fine_tuning_response import FineTuningResponse
+    from .fine_tuning_response_model_state_value import FineTuningResponseModelStateValue
+    from .gender import Gender
+    from .get_agent_embed_response_model import GetAgentEmbedResponseModel
+    from .get_agent_link_response_model import GetAgentLinkResponseModel
+    from .get_agent_response_model import GetAgentResponseModel
+    from .get_agents_page_response_model import GetAgentsPageResponseModel
+    from .get_audio_native_project_settings_response_model import GetAudioNativeProjectSettingsResponseModel
+    from .get_chapters_response import GetChaptersResponse
+    from .get_conv_ai_settings_response_model import GetConvAiSettingsResponseModel
+    from .get_conversation_response_model import GetConversationResponseModel
+    from .get_conversation_response_model_status import GetConversationResponseModelStatus
+    from .get_conversations_page_response_model import GetConversationsPageResponseModel
+    from .get_knowledge_base_dependent_agents_response_model import GetKnowledgeBaseDependentAgentsResponseModel
+    from .get_knowledge_base_dependent_agents_response_model_agents_item import (
+        GetKnowledgeBaseDependentAgentsResponseModelAgentsItem,
+        GetKnowledgeBaseDependentAgentsResponseModelAgentsItem_Available,
+        GetKnowledgeBaseDependentAgentsResponseModelAgentsItem_Unknown,
+    )
+    from .get_knowledge_base_list_response_model import GetKnowledgeBaseListResponseModel
+    from .get_knowledge_base_response_model import GetKnowledgeBaseResponseModel
+    from .get_knowledge_base_response_model_access_level import GetKnowledgeBaseResponseModelAccessLevel
+    from .get_knowledge_base_response_model_type import GetKnowledgeBaseResponseModelType
+    from .get_knowledge_base_summary_response_model import GetKnowledgeBaseSummaryResponseModel
+    from .get_knowledge_base_summary_response_model_access_level import GetKnowledgeBaseSummaryResponseModelAccessLevel
+    from .get_knowledge_base_summary_response_model_dependent_agents_item import (
+        GetKnowledgeBaseSummaryResponseModelDependentAgentsItem,
+        GetKnowledgeBaseSummaryResponseModelDependentAgentsItem_Available,
+        GetKnowledgeBaseSummaryResponseModelDependentAgentsItem_Unknown,
+    )
+    from .get_knowledge_base_summary_response_model_type import GetKnowledgeBaseSummaryResponseModelType
+    from .get_library_voices_response import GetLibraryVoicesResponse
+    from .get_phone_number_response_model import GetPhoneNumberResponseModel
+    from .get_projects_response import GetProjectsResponse
+    from .get_pronunciation_dictionaries_metadata_response_model import (
+        GetPronunciationDictionariesMetadataResponseModel,
+    )
+    from .get_pronunciation_dictionary_metadata_response import GetPronunciationDictionaryMetadataResponse
+    from .get_speech_history_response import GetSpeechHistoryResponse
+    from .get_voices_response import GetVoicesResponse
+    from .get_workspace_secrets_response_model import GetWorkspaceSecretsResponseModel
+    from .history_alignment_response_model import HistoryAlignmentResponseModel
+    from .history_alignments_response_model import HistoryAlignmentsResponseModel
+    from .history_item import HistoryItem
+    from .http_validation_error import HttpValidationError
+    from .image_avatar import ImageAvatar
+    from .invoice import Invoice
+    from .knowledge_base_document_metadata_response_model import KnowledgeBaseDocumentMetadataResponseModel
+    from .knowledge_base_locator import KnowledgeBaseLocator
+    from .knowledge_base_locator_type import KnowledgeBaseLocatorType
+    from .language_added_response import LanguageAddedResponse
+    from .language_preset import LanguagePreset
+    from .language_preset_translation import LanguagePresetTranslation
+    from .language_response import LanguageResponse
+    from .library_voice_response import LibraryVoiceResponse
+    from .library_voice_response_model_category import LibraryVoiceResponseModelCategory
+    from .literal_json_schema_property import LiteralJsonSchemaProperty
+    from .literal_json_schema_property_type import LiteralJsonSchemaPropertyType
+    from .llm import Llm
+    from .manual_verification_file_response import ManualVerificationFileResponse
+    from .manual_verification_response import ManualVerificationResponse
+    from .model import Model
+    from .model_rates_response_model import ModelRatesResponseModel
+    from .model_response_model_concurrency_group import ModelResponseModelConcurrencyGroup
+    from .moderation_status_response_model import ModerationStatusResponseModel
+    from .moderation_status_response_model_safety_status import ModerationStatusResponseModelSafetyStatus
+    from .moderation_status_response_model_warning_status import ModerationStatusResponseModelWarningStatus
+    from .object_json_schema_property import ObjectJsonSchemaProperty
+    from .object_json_schema_property_properties_value import ObjectJsonSchemaPropertyPropertiesValue
+    from .orb_avatar import OrbAvatar
+    from .output_format import OutputFormat
+    from .phone_number_agent_info import PhoneNumberAgentInfo
+    from .podcast_bulletin_mode import PodcastBulletinMode
+    from .podcast_bulletin_mode_data import PodcastBulletinModeData
+    from .podcast_conversation_mode import PodcastConversationMode
+    from .podcast_conversation_mode_data import PodcastConversationModeData
+    from .podcast_project_response_model import PodcastProjectResponseModel
+    from .podcast_text_source import PodcastTextSource
+    from .podcast_url_source import PodcastUrlSource
+    from .post_agent_avatar_response_model import PostAgentAvatarResponseModel
+    from .post_workspace_secret_response_model import PostWorkspaceSecretResponseModel
+    from .privacy_config import PrivacyConfig
+    from .profile_page_response_model import ProfilePageResponseModel
+    from .project_creation_meta_response_model import ProjectCreationMetaResponseModel
+    from .project_creation_meta_response_model_status import ProjectCreationMetaResponseModelStatus
+    from .project_creation_meta_response_model_type import ProjectCreationMetaResponseModelType
+    from .project_extended_response_model import ProjectExtendedResponseModel
+    from .project_extended_response_model_access_level import ProjectExtendedResponseModelAccessLevel
+    from .project_extended_response_model_apply_text_normalization import (
+        ProjectExtendedResponseModelApplyTextNormalization,
+    )
+    from .project_extended_response_model_fiction import ProjectExtendedResponseModelFiction
+    from .project_extended_response_model_quality_preset import ProjectExtendedResponseModelQualityPreset
+    from .project_extended_response_model_source_type import ProjectExtendedResponseModelSourceType
+    from .project_extended_response_model_target_audience import ProjectExtendedResponseModelTargetAudience
+    from .project_response import ProjectResponse
+    from .project_response_model_access_level import ProjectResponseModelAccessLevel
+    from .project_response_model_fiction import ProjectResponseModelFiction
+    from .project_response_model_source_type import ProjectResponseModelSourceType
+    from .project_response_model_target_audience import ProjectResponseModelTargetAudience
+    from .project_snapshot_extended_response_model import ProjectSnapshotExtendedResponseModel
+    from .project_snapshot_response import ProjectSnapshotResponse
+    from .project_snapshot_upload_response_model import ProjectSnapshotUploadResponseModel
+    from .project_snapshot_upload_response_model_status import ProjectSnapshotUploadResponseModelStatus
+    from .project_snapshots_response import ProjectSnapshotsResponse
+    from .project_state import ProjectState
+    from .prompt_agent import PromptAgent
+    from .prompt_agent_override import PromptAgentOverride
+    from .prompt_agent_override_config import PromptAgentOverrideConfig
+    from .prompt_agent_tools_item import (
+        PromptAgentToolsItem,
+        PromptAgentToolsItem_Client,
+        PromptAgentToolsItem_System,
+        PromptAgentToolsItem_Webhook,
+    )
+    from .prompt_evaluation_criteria import PromptEvaluationCriteria
+    from .pronunciation_dictionary_alias_rule_request_model import PronunciationDictionaryAliasRuleRequestModel
+    from .pronunciation_dictionary_phoneme_rule_request_model import PronunciationDictionaryPhonemeRuleRequestModel
+    from .pronunciation_dictionary_version_locator import PronunciationDictionaryVersionLocator
+    from .pronunciation_dictionary_version_response_model import PronunciationDictionaryVersionResponseModel
+    from .pydantic_pronunciation_dictionary_version_locator import PydanticPronunciationDictionaryVersionLocator
+    from .query_params_json_schema import QueryParamsJsonSchema
+    from .rag_config import RagConfig
+    from .rag_index_response_model import RagIndexResponseModel
+    from .rag_index_status import RagIndexStatus
+    from .reader_resource_response_model import ReaderResourceResponseModel
+    from .reader_resource_response_model_resource_type import ReaderResourceResponseModelResourceType
+    from .recording_response import RecordingResponse
+    from .remove_pronunciation_dictionary_rules_response_model import RemovePronunciationDictionaryRulesResponseModel
+    from .resource_access_info import ResourceAccessInfo
+    from .resource_access_info_role import ResourceAccessInfoRole
+    from .review_status import ReviewStatus
+    from .safety_common_model import SafetyCommonModel
+    from .safety_evaluation import SafetyEvaluation
+    from .safety_response_model import SafetyResponseModel
+    from .safety_rule import SafetyRule
+    from .secret_dependency_type import SecretDependencyType
+    from .segment_create_response import SegmentCreateResponse
+    from .segment_delete_response import SegmentDeleteResponse
+    from .segment_dub_response import SegmentDubResponse
+    from .segment_transcription_response import SegmentTranscriptionResponse
+    from .segment_translation_response import SegmentTranslationResponse
+    from .segment_update_response import SegmentUpdateResponse
+    from .speaker_segment import SpeakerSegment
+    from .speaker_track import SpeakerTrack
+    from .speech_history_item_response import SpeechHistoryItemResponse
+    from .speech_history_item_response_model_source import SpeechHistoryItemResponseModelSource
+    from .speech_history_item_response_model_voice_category import SpeechHistoryItemResponseModelVoiceCategory
+    from .speech_to_text_character_response_model import SpeechToTextCharacterResponseModel
+    from .speech_to_text_chunk_response_model import SpeechToTextChunkResponseModel
+    from .speech_to_text_word_response_model import SpeechToTextWordResponseModel
+    from .speech_to_text_word_response_model_type import SpeechToTextWordResponseModelType
+    from .streaming_audio_chunk_with_timestamps_response_model import StreamingAudioChunkWithTimestampsResponseModel
+    from .subscription import Subscription
+    from .subscription_response import SubscriptionResponse
+    from .subscription_response_model_billing_period import SubscriptionResponseModelBillingPeriod
+    from .subscription_response_model_character_refresh_period import SubscriptionResponseModelCharacterRefreshPeriod
+    from .subscription_response_model_currency import SubscriptionResponseModelCurrency
+    from .subscription_status import SubscriptionStatus
+    from .subscription_usage_response_model import SubscriptionUsageResponseModel
+    from .system_tool_config import SystemToolConfig
+    from .telephony_provider import TelephonyProvider
+    from .text_to_speech_as_stream_request import TextToSpeechAsStreamRequest
+    from .tts_conversational_config import TtsConversationalConfig
+    from .tts_conversational_config_override import TtsConversationalConfigOverride
+    from .tts_conversational_config_override_config import TtsConversationalConfigOverrideConfig
+    from .tts_conversational_model import TtsConversationalModel
+    from .tts_optimize_streaming_latency import TtsOptimizeStreamingLatency
+    from .tts_output_format import TtsOutputFormat
+    from .turn_config import TurnConfig
+    from .turn_mode import TurnMode
+    from .update_workspace_member_response_model import UpdateWorkspaceMemberResponseModel
+    from .url_avatar import UrlAvatar
+    from .usage_characters_response_model import UsageCharactersResponseModel
+    from .user import User
+    from .user_feedback import UserFeedback
+    from .user_feedback_score import UserFeedbackScore
+    from .validation_error import ValidationError
+    from .validation_error_loc_item import ValidationErrorLocItem
+    from .verification_attempt_response import VerificationAttemptResponse
+    from .verified_voice_language_response_model import VerifiedVoiceLanguageResponseModel
+    from .voice import Voice
+    from .voice_generation_parameter_option_response import VoiceGenerationParameterOptionResponse
+    from .voice_generation_parameter_response import VoiceGenerationParameterResponse
+    from .voice_preview_response_model import VoicePreviewResponseModel
+    from .voice_previews_response_model import VoicePreviewsResponseModel
+    from .voice_response_model_category import VoiceResponseModelCategory
+    from .voice_response_model_safety_control import VoiceResponseModelSafetyControl
+    from .voice_sample import VoiceSample
+    from .voice_settings import VoiceSettings
+    from .voice_sharing_moderation_check_response_model import VoiceSharingModerationCheckResponseModel
+    from .voice_sharing_response import VoiceSharingResponse
+    from .voice_sharing_response_model_category import VoiceSharingResponseModelCategory
+    from .voice_sharing_state import VoiceSharingState
+    from .voice_verification_response import VoiceVerificationResponse
+    from .webhook_tool_api_schema_config import WebhookToolApiSchemaConfig
+    from .webhook_tool_api_schema_config_method import WebhookToolApiSchemaConfigMethod
+    from .webhook_tool_api_schema_config_request_headers_value import WebhookToolApiSchemaConfigRequestHeadersValue
+    from .webhook_tool_config import WebhookToolConfig
+    from .widget_config import WidgetConfig
+    from .widget_config_avatar import (
+        WidgetConfigAvatar,
+        WidgetConfigAvatar_Image,
+        WidgetConfigAvatar_Orb,
+        WidgetConfigAvatar_Url,
+    )
+    from .widget_config_response_model import WidgetConfigResponseModel
+    from .widget_config_response_model_avatar import (
+        WidgetConfigResponseModelAvatar,
+        WidgetConfigResponseModelAvatar_Image,
+        WidgetConfigResponseModelAvatar_Orb,
+        WidgetConfigResponseModelAvatar_Url,
+    )
+    from .widget_expandable import WidgetExpandable
+    from .widget_feedback_mode import WidgetFeedbackMode
+    from .workspace_group_by_name_response_model import WorkspaceGroupByNameResponseModel
+_dynamic_imports: typing.Dict[str, str] = {
+    "Accent": ".accent",
+    "AddAgentSecretResponseModel": ".add_agent_secret_response_model",
+    "AddChapterResponseModel": ".add_chapter_response_model",
+    "AddKnowledgeBaseResponseModel": ".add_knowledge_base_response_model",
+    "AddProjectResponseModel": ".add_project_response_model",
+    "AddPronunciationDictionaryResponseModel": ".add_pronunciation_dictionary_response_model",
+    "AddPronunciationDictionaryRulesResponseModel": ".add_pronunciation_dictionary_rules_response_model",
+    "AddSharingVoiceRequest": ".add_sharing_voice_request",
+    "AddVoiceIvcResponseModel": ".add_voice_ivc_response_model",
+    "AddVoiceResponseModel": ".add_voice_response_model",
+    "AddWorkspaceGroupMemberResponseModel": ".add_workspace_group_member_response_model",
+    "AddWorkspaceInviteResponseModel": ".add_workspace_invite_response_model",
+    "Age": ".age",
+    "AgentBan": ".agent_ban",
+    "AgentCallLimits": ".agent_call_limits",
+    "AgentConfigApiModel": ".agent_config_api_model",
+    "AgentConfigOverride": ".agent_config_override",
+    "AgentConfigOverrideConfig": ".agent_config_override_config",
+    "AgentMetadataResponseModel": ".agent_metadata_response_model",
+    "AgentPlatformSettingsRequestModel": ".agent_platform_settings_request_model",
+    "AgentPlatformSettingsResponseModel": ".agent_platform_settings_response_model",
+    "AgentSummaryResponseModel": ".agent_summary_response_model",
+    "AllowlistItem": ".allowlist_item",
+    "ArrayJsonSchemaProperty": ".array_json_schema_property",
+    "ArrayJsonSchemaPropertyItems": ".array_json_schema_property_items",
+    "AsrConversationalConfig": ".asr_conversational_config",
+    "AsrInputFormat": ".asr_input_format",
+    "AsrProvider": ".asr_provider",
+    "AsrQuality": ".asr_quality",
+    "AudioNativeCreateProjectResponseModel": ".audio_native_create_project_response_model",
+    "AudioNativeEditContentResponseModel": ".audio_native_edit_content_response_model",
+    "AudioNativeProjectSettingsResponseModel": ".audio_native_project_settings_response_model",
+    "AudioWithTimestampsResponseModel": ".audio_with_timestamps_response_model",
+    "AuthSettings": ".auth_settings",
+    "AuthorizationMethod": ".authorization_method",
+    "BanReasonType": ".ban_reason_type",
+    "BodyAddToKnowledgeBaseV1ConvaiAddToKnowledgeBasePost": ".body_add_to_knowledge_base_v_1_convai_add_to_knowledge_base_post",
+    "BodyAddToKnowledgeBaseV1ConvaiAgentsAgentIdAddToKnowledgeBasePost": ".body_add_to_knowledge_base_v_1_convai_agents_agent_id_add_to_knowledge_base_post",
+    "BreakdownTypes": ".breakdown_types",
+    "ChapterContentBlockExtendableNodeResponseModel": ".chapter_content_block_extendable_node_response_model",
+    "ChapterContentBlockInputModel": ".chapter_content_block_input_model",
+    "ChapterContentBlockResponseModel": ".chapter_content_block_response_model",
+    "ChapterContentBlockResponseModelNodesItem": ".chapter_content_block_response_model_nodes_item",
+    "ChapterContentBlockResponseModelNodesItem_Other": ".chapter_content_block_response_model_nodes_item",
+    "ChapterContentBlockResponseModelNodesItem_TtsNode": ".chapter_content_block_response_model_nodes_item",
+    "ChapterContentBlockTtsNodeResponseModel": ".chapter_content_block_tts_node_response_model",
+    "ChapterContentInputModel": ".chapter_content_input_model",
+    "ChapterContentParagraphTtsNodeInputModel": ".chapter_content_paragraph_tts_node_input_model",
+    "ChapterContentResponseModel": ".chapter_content_response_model",
+    "ChapterResponse": ".chapter_response",
+    "ChapterSnapshotExtendedResponseModel": ".chapter_snapshot_extended_response_model",
+    "ChapterSnapshotResponse": ".chapter_snapshot_response",
+    "ChapterSnapshotsResponse": ".chapter_snapshots_response",
+    "ChapterState": ".chapter_state",
+    "ChapterStatisticsResponse": ".chapter_statistics_response",
+    "ChapterWithContentResponseModel": ".chapter_with_content_response_model",
+    "ChapterWithContentResponseModelState": ".chapter_with_content_response_model_state",
+    "CharacterAlignmentModel": ".character_alignment_model",
+    "CharacterAlignmentResponseModel": ".character_alignment_response_model",
+    "ClientEvent": ".client_event",
+    "ClientToolConfig": ".client_tool_config",
+    "ConvAiSecretLocator": ".conv_ai_secret_locator",
+    "ConvAiStoredSecretDependencies": ".conv_ai_stored_secret_dependencies",
+    "ConvAiStoredSecretDependenciesAgentToolsItem": ".conv_ai_stored_secret_dependencies_agent_tools_item",
+    "ConvAiStoredSecretDependenciesAgentToolsItem_Available": ".conv_ai_stored_secret_dependencies_agent_tools_item",
+    "ConvAiStoredSecretDependenciesAgentToolsItem_Unknown": ".conv_ai_stored_secret_dependencies_agent_tools_item",
+    "ConvAiStoredSecretDependenciesToolsItem": ".conv_ai_stored_secret_dependencies_tools_item",
+    "ConvAiStoredSecretDependenciesToolsItem_Available": ".conv_ai_stored_secret_dependencies_tools_item",
+    "ConvAiStoredSecretDependenciesToolsItem_Unknown": ".conv_ai_stored_secret_dependencies_tools_item",
+    "ConvAiWebhooks": ".conv_ai_webhooks",
+    "ConvAiWorkspaceStoredSecretConfig": ".conv_ai_workspace_stored_secret_config",
+    "ConversationChargingCommonModel": ".conversation_charging_common_model",
+    "ConversationConfig": ".conversation_config",
+    "ConversationConfigClientOverride": ".conversation_config_client_override",
+    "ConversationConfigClientOverrideConfig": ".conversation_config_client_override_config",
+    "ConversationDeletionSettings": ".conversation_deletion_settings",
+    "ConversationHistoryAnalysisCommonModel": ".conversation_history_analysis_common_model",
+    "ConversationHistoryEvaluationCriteriaResultCommonModel": ".conversation_history_evaluation_criteria_result_common_model",
+    "ConversationHistoryFeedbackCommonModel": ".conversation_history_feedback_common_model",
+    "ConversationHistoryMetadataCommonModel": ".conversation_history_metadata_common_model",
+    "ConversationHistoryTranscriptCommonModel": ".conversation_history_transcript_common_model",
+    "ConversationHistoryTranscriptCommonModelRole": ".conversation_history_transcript_common_model_role",
+    "ConversationHistoryTranscriptToolCallCommonModel": ".conversation_history_transcript_tool_call_common_model",
+    "ConversationHistoryTranscriptToolResultCommonModel": ".conversation_history_transcript_tool_result_common_model",
+    "ConversationInitiationClientData": ".conversation_initiation_client_data",
+    "ConversationInitiationClientDataConfig": ".conversation_initiation_client_data_config",
+    "ConversationInitiationClientDataDynamicVariablesValue": ".conversation_initiation_client_data_dynamic_variables_value",
+    "ConversationInitiationClientDataWebhook": ".conversation_initiation_client_data_webhook",
+    "ConversationInitiationClientDataWebhookRequestHeadersValue": ".conversation_initiation_client_data_webhook_request_headers_value",
+    "ConversationSignedUrlResponseModel": ".conversation_signed_url_response_model",
+    "ConversationSummaryResponseModel": ".conversation_summary_response_model",
+    "ConversationSummaryResponseModelStatus": ".conversation_summary_response_model_status",
+    "ConversationTokenDbModel": ".conversation_token_db_model",
+    "ConversationTokenPurpose": ".conversation_token_purpose",
+    "ConversationalConfigApiModel": ".conversational_config_api_model",
+    "ConvertChapterResponseModel": ".convert_chapter_response_model",
+    "ConvertProjectResponseModel": ".convert_project_response_model",
+    "CreateAgentResponseModel": ".create_agent_response_model",
+    "CreateAudioNativeProjectRequest": ".create_audio_native_project_request",
+    "CreatePhoneNumberResponseModel": ".create_phone_number_response_model",
+    "CreatePronunciationDictionaryResponseModel": ".create_pronunciation_dictionary_response_model",
+    "Currency": ".currency",
+    "CustomLlm": ".custom_llm",
+    "DataCollectionResultCommonModel": ".data_collection_result_common_model",
+    "DeleteChapterResponseModel": ".delete_chapter_response_model",
+    "DeleteDubbingResponseModel": ".delete_dubbing_response_model",
+    "DeleteHistoryItemResponse": ".delete_history_item_response",
+    "DeleteProjectResponseModel": ".delete_project_response_model",
+    "DeleteSampleResponseModel": ".delete_sample_response_model",
+    "DeleteVoiceResponseModel": ".delete_voice_response_model",
+    "DeleteWorkspaceGroupMemberResponseModel": ".delete_workspace_group_member_response_model",
+    "DeleteWorkspaceInviteResponseModel": ".delete_workspace_invite_response_model",
+    "DependentAvailableAgentIdentifier": ".dependent_available_agent_identifier",
+    "DependentAvailableAgentIdentifierAccessLevel": ".dependent_available_agent_identifier_access_level",
+    "DependentAvailableAgentToolIdentifier": ".dependent_available_agent_tool_identifier",
+    "DependentAvailableAgentToolIdentifierAccessLevel": ".dependent_available_agent_tool_identifier_access_level",
+    "DependentAvailableToolIdentifier": ".dependent_available_tool_identifier",
+    "DependentAvailableToolIdentifierAccessLevel": ".dependent_available_tool_identifier_access_level",
+    "DependentPhoneNumberIdentifier": ".dependent_phone_number_identifier",
+    "DependentUnknownAgentIdentifier": ".dependent_unknown_agent_identifier",
+    "DependentUnknownAgentToolIdentifier": ".dependent_unknown_agent_tool_identifier",
+    "DependentUnknownToolIdentifier": ".dependent_unknown_tool_identifier",
+    "DoDubbingResponse": ".do_dubbing_response",
+    "DocumentUsageModeEnum": ".document_usage_mode_enum",
+    "DubbedSegment": ".dubbed_segment",
+    "DubbingMediaMetadata": ".dubbing_media_metadata",
+    "DubbingMediaReference": ".dubbing_media_reference",
+    "DubbingMetadataResponse": ".dubbing_metadata_response",
+    "DubbingResource": ".dubbing_resource",
+    "DynamicVariablesConfig": ".dynamic_variables_config",
+    "DynamicVariablesConfigDynamicVariablePlaceholdersValue": ".dynamic_variables_config_dynamic_variable_placeholders_value",
+    "EditChapterResponseModel": ".edit_chapter_response_model",
+    "EditProjectResponseModel": ".edit_project_response_model",
+    "EditVoiceResponseModel": ".edit_voice_response_model",
+    "EditVoiceSettingsResponseModel": ".edit_voice_settings_response_model",
+    "EmbedVariant": ".embed_variant",
+    "EmbeddingModelEnum": ".embedding_model_enum",
+    "EvaluationSettings": ".evaluation_settings",
+    "EvaluationSuccessResult": ".evaluation_success_result",
+    "ExtendedSubscriptionResponseModelBillingPeriod": ".extended_subscription_response_model_billing_period",
+    "ExtendedSubscriptionResponseModelCharacterRefreshPeriod": ".extended_subscription_response_model_character_refresh_period",
+    "ExtendedSubscriptionResponseModelCurrency": ".extended_subscription_response_model_currency",
+    "FeedbackItem": ".feedback_item",
+    "FineTuningResponse": ".fine_tuning_response",
+    "FineTuningResponseModelStateValue": ".fine_tuning_response_model_state_value",
+    "Gender": ".gender",
+    "GetAgentEmbedResponseModel": ".get_agent_embed_response_model",
+    "GetAgentLinkResponseModel": ".get_agent_link_response_model",
+    "GetAgentResponseModel": ".get_agent_response_model",
+    "GetAgentsPageResponseModel": ".get_agents_page_response_model",
+    "GetAudioNativeProjectSettingsResponseModel": ".get_audio_native_project_settings_response_model",
+    "GetChaptersResponse": ".get_chapters_response",
+    "GetConvAiSettingsResponseModel": ".get_conv_ai_settings_response_model",
+    "GetConversationResponseModel": ".get_conversation_response_model",
+    "GetConversationResponseModelStatus": ".get_conversation_response_model_status",
+    "GetConversationsPageResponseModel": ".get_conversations_page_response_model",
+    "GetKnowledgeBaseDependentAgentsResponseModel": ".get_knowledge_base_dependent_agents_response_model",
+    "GetKnowledgeBaseDependentAgentsResponseModelAgentsItem": ".get_knowledge_base_dependent_agents_response_model_agents_item",
+    "GetKnowledgeBaseDependentAgentsResponseModelAgentsItem_Available": ".get_knowledge_base_dependent_agents_response_model_agents_item",
+    "GetKnowledgeBaseDependentAgentsResponseModelAgentsItem_Unknown": ".get_knowledge_base_dependent_agents_response_model_agents_item",
+    "GetKnowledgeBaseListResponseModel": ".get_knowledge_base_list_response_model",
+    "GetKnowledgeBaseResponseModel": ".get_knowledge_base_response_model",
+    "GetKnowledgeBaseResponseModelAccessLevel": ".get_knowledge_base_response_model_access_level",
+    "GetKnowledgeBaseResponseModelType": ".get_knowledge_base_response_model_type",
+    "GetKnowledgeBaseSummaryResponseModel": ".get_knowledge_base_summary_response_model",
+    "GetKnowledgeBaseSummaryResponseModelAccessLevel": ".get_knowledge_base_summary_response_model_access_level",
+    "GetKnowledgeBaseSummaryResponseModelDependentAgentsItem": ".get_knowledge_base_summary_response_model_dependent_agents_item",
+    "GetKnowledgeBaseSummaryResponseModelDependentAgentsItem_Available": ".get_knowledge_base_summary_response_model_dependent_agents_item",
+    "GetKnowledgeBaseSummaryResponseModelDependentAgentsItem_Unknown": ".get_knowledge_base_summary_response_model_dependent_agents_item",
+    "GetKnowledgeBaseSummaryResponseModelType": ".get_knowledge_base_summary_response_model_type",
+    "GetLibraryVoicesResponse": ".get_library_voices_response",
+    "GetPhoneNumberResponseModel": ".get_phone_number_response_model",
+    "GetProjectsResponse": ".get_projects_response",
+    "GetPronunciationDictionariesMetadataResponseModel": ".get_pronunciation_dictionaries_metadata_response_model",
+    "GetPronunciationDictionaryMetadataResponse": ".get_pronunciation_dictionary_metadata_response",
+    "GetSpeechHistoryResponse": ".get_speech_history_response",
+    "GetVoicesResponse": ".get_voices_response",
+    "GetWorkspaceSecretsResponseModel": ".get_workspace_secrets_response_model",
+    "HistoryAlignmentResponseModel": ".history_alignment_response_model",
+    "HistoryAlignmentsResponseModel": ".history_alignments_response_model",
+    "HistoryItem": ".history_item",
+    "HttpValidationError": ".http_validation_error",
+    "ImageAvatar": ".image_avatar",
+    "Invoice": ".invoice",
+    "KnowledgeBaseDocumentMetadataResponseModel": ".knowledge_base_document_metadata_response_model",
+    "KnowledgeBaseLocator": ".knowledge_base_locator",
+    "KnowledgeBaseLocatorType": ".knowledge_base_locator_type",
+    "LanguageAddedResponse": ".language_added_response",
+    "LanguagePreset": ".language_preset",
+    "LanguagePresetTranslation": ".language_preset_translation",
+    "LanguageResponse": ".language_response",
+    "LibraryVoiceResponse": ".library_voice_response",
+    "LibraryVoiceResponseModelCategory": ".library_voice_response_model_category",
+    "LiteralJsonSchemaProperty": ".literal_json_schema_property",
+    "LiteralJsonSchemaPropertyType": ".literal_json_schema_property_type",
+    "Llm": ".llm",
+    "ManualVerificationFileResponse": ".manual_verification_file_response",
+    "ManualVerificationResponse": ".manual_verification_response",
+    "Model": ".model",
+    "ModelRatesResponseModel": ".model_rates_response_model",
+    "ModelResponseModelConcurrencyGroup": ".model_response_model_concurrency_group",
+    "ModerationStatusResponseModel": ".moderation_status_response_model",
+    "ModerationStatusResponseModelSafetyStatus": ".moderation_status_response_model_safety_status",
+    "ModerationStatusResponseModelWarningStatus": ".moderation_status_response_model_warning_status",
+    "ObjectJsonSchemaProperty": ".object_json_schema_property",
+    "ObjectJsonSchemaPropertyPropertiesValue": ".object_json_schema_property_properties_value",
+    "OrbAvatar": ".orb_avatar",
+    "OutputFormat": ".output_format",
+    "PhoneNumberAgentInfo": ".phone_number_agent_info",
+    "PodcastBulletinMode": ".podcast_bulletin_mode",
+    "PodcastBulletinModeData": ".podcast_bulletin_mode_data",
+    "PodcastConversationMode": ".podcast_conversation_mode",
+    "PodcastConversationModeData": ".podcast_conversation_mode_data",
+    "PodcastProjectResponseModel": ".podcast_project_response_model",
+    "PodcastTextSource": ".podcast_text_source",
+    "PodcastUrlSource": ".podcast_url_source",
+    "PostAgentAvatarResponseModel": ".post_agent_avatar_response_model",
+    "PostWorkspaceSecretResponseModel": ".post_workspace_secret_response_model",
+    "PrivacyConfig": ".privacy_config",
+    "ProfilePageResponseModel": ".profile_page_response_model",
+    "ProjectCreationMetaResponseModel": ".project_creation_meta_response_model",
+    "ProjectCreationMetaResponseModelStatus": ".project_creation_meta_response_model_status",
+    "ProjectCreationMetaResponseModelType": ".project_creation_meta_response_model_type",
+    "ProjectExtendedResponseModel": ".project_extended_response_model",
+    "ProjectExtendedResponseModelAccessLevel": ".project_extended_response_model_access_level",
+    "ProjectExtendedResponseModelApplyTextNormalization": ".project_extended_response_model_apply_text_normalization",
+    "ProjectExtendedResponseModelFiction": ".project_extended_response_model_fiction",
+    "ProjectExtendedResponseModelQualityPreset": ".project_extended_response_model_quality_preset",
+    "ProjectExtendedResponseModelSourceType": ".project_extended_response_model_source_type",
+    "ProjectExtendedResponseModelTargetAudience": ".project_extended_response_model_target_audience",
+    "ProjectResponse": ".project_response",
+    "ProjectResponseModelAccessLevel": ".project_response_model_access_level",
+    "ProjectResponseModelFiction": ".project_response_model_fiction",
+    "ProjectResponseModelSourceType": ".project_response_model_source_type",
+    "ProjectResponseModelTargetAudience": ".project_response_model_target_audience",
+    "ProjectSnapshotExtendedResponseModel": ".project_snapshot_extended_response_model",
+    "ProjectSnapshotResponse": ".project_snapshot_response",
+    "ProjectSnapshotUploadResponseModel": ".project_snapshot_upload_response_model",
+    "ProjectSnapshotUploadResponseModelStatus": ".project_snapshot_upload_response_model_status",
+    "ProjectSnapshotsResponse": ".project_snapshots_response",
+    "ProjectState": ".project_state",
+    "PromptAgent": ".prompt_agent",
+    "PromptAgentOverride": ".prompt_agent_override",
+    "PromptAgentOverrideConfig": ".prompt_agent_override_config",
+    "PromptAgentToolsItem": ".prompt_agent_tools_item",
+    "PromptAgentToolsItem_Client": ".prompt_agent_tools_item",
+    "PromptAgentToolsItem_System": ".prompt_agent_tools_item",
+    "PromptAgentToolsItem_Webhook": ".prompt_agent_tools_item",
+    "PromptEvaluationCriteria": ".prompt_evaluation_criteria",
+    "PronunciationDictionaryAliasRuleRequestModel": ".pronunciation_dictionary_alias_rule_request_model",
+    "PronunciationDictionaryPhonemeRuleRequestModel": ".pronunciation_dictionary_phoneme_rule_request_model",
+    "PronunciationDictionaryVersionLocator": ".pronunciation_dictionary_version_locator",
+    "PronunciationDictionaryVersionResponseModel": ".pronunciation_dictionary_version_response_model",
+    "PydanticPronunciationDictionaryVersionLocator": ".pydantic_pronunciation_dictionary_version_locator",
+    "QueryParamsJsonSchema": ".query_params_json_schema",
+    "RagConfig": ".rag_config",
+    "RagIndexResponseModel": ".rag_index_response_model",
+    "RagIndexStatus": ".rag_index_status",
+    "ReaderResourceResponseModel": ".reader_resource_response_model",
+    "ReaderResourceResponseModelResourceType": ".reader_resource_response_model_resource_type",
+    "RecordingResponse": ".recording_response",
+    "RemovePronunciationDictionaryRulesResponseModel": ".remove_pronunciation_dictionary_rules_response_model",
+    "ResourceAccessInfo": ".resource_access_info",
+    "ResourceAccessInfoRole": ".resource_access_info_role",
+    "ReviewStatus": ".review_status",
+    "SafetyCommonModel": ".safety_common_model",
+    "SafetyEvaluation": ".safety_evaluation",
+    "SafetyResponseModel": ".safety_response_model",
+    "SafetyRule": ".safety_rule",
+    "SecretDependencyType": ".secret_dependency_type",
+    "SegmentCreateResponse": ".segment_create_response",
+    "SegmentDeleteResponse": ".segment_delete_response",
+    "SegmentDubResponse": ".segment_dub_response",
+    "SegmentTranscriptionResponse": ".segment_transcription_response",
+    "SegmentTranslationResponse": ".segment_translation_response",
+    "SegmentUpdateResponse": ".segment_update_response",
+    "SpeakerSegment": ".speaker_segment",
+    "SpeakerTrack": ".speaker_track",
+    "SpeechHistoryItemResponse": ".speech_history_item_response",
+    "SpeechHistoryItemResponseModelSource": ".speech_history_item_response_model_source",
+    "SpeechHistoryItemResponseModelVoiceCategory": ".speech_history_item_response_model_voice_category",
+    "SpeechToTextCharacterResponseModel": ".speech_to_text_character_response_model",
+    "SpeechToTextChunkResponseModel": ".speech_to_text_chunk_response_model",
+    "SpeechToTextWordResponseModel": ".speech_to_text_word_response_model",
+    "SpeechToTextWordResponseModelType": ".speech_to_text_word_response_model_type",
+    "StreamingAudioChunkWithTimestampsResponseModel": ".streaming_audio_chunk_with_timestamps_response_model",
+    "Subscription": ".subscription",
+    "SubscriptionResponse": ".subscription_response",
+    "SubscriptionResponseModelBillingPeriod": ".subscription_response_model_billing_period",
+    "SubscriptionResponseModelCharacterRefreshPeriod": ".subscription_response_model_character_refresh_period",
+    "SubscriptionResponseModelCurrency": ".subscription_response_model_currency",
+    "SubscriptionStatus": ".subscription_status",
+    "SubscriptionUsageResponseModel": ".subscription_usage_response_model",
+    "SystemToolConfig": ".system_tool_config",
+    "TelephonyProvider": ".telephony_provider",
+    "TextToSpeechAsStreamRequest": ".text_to_speech_as_stream_request",
+    "TtsConversationalConfig": ".tts_conversational_config",
+    "TtsConversationalConfigOverride": ".tts_conversational_config_override",
+    "TtsConversationalConfigOverrideConfig": ".tts_conversational_config_override_config",
+    "TtsConversationalModel": ".tts_conversational_model",
+    "TtsOptimizeStreamingLatency": ".tts_optimize_streaming_latency",
+    "TtsOutputFormat": ".tts_output_format",
+    "TurnConfig": ".turn_config",
+    "TurnMode": ".turn_mode",
+    "UpdateWorkspaceMemberResponseModel": ".update_workspace_member_response_model",
+    "UrlAvatar": ".url_avatar",
+    "UsageCharactersResponseModel": ".usage_characters_response_model",
+    "User": ".user",
+    "UserFeedback": ".user_feedback",
+    "UserFeedbackScore": ".user_feedback_score",
+    "ValidationError": ".validation_error",
+    "ValidationErrorLocItem": ".validation_error_loc_item",
+    "VerificationAttemptResponse": ".verification_attempt_response",
+    "VerifiedVoiceLanguageResponseModel": ".verified_voice_language_response_model",
+    "Voice": ".voice",
+    "VoiceGenerationParameterOptionResponse": ".voice_generation_parameter_option_response",
+    "VoiceGenerationParameterResponse": ".voice_generation_parameter_response",
+    "VoicePreviewResponseModel": ".voice_preview_response_model",
+    "VoicePreviewsResponseModel": ".voice_previews_response_model",
+    "VoiceResponseModelCategory": ".voice_response_model_category",
+    "VoiceResponseModelSafetyControl": ".voice_response_model_safety_control",
+    "VoiceSample": ".voice_sample",
+    "VoiceSettings": ".voice_settings",
+    "VoiceSharingModerationCheckResponseModel": ".voice_sharing_moderation_check_response_model",
+    "VoiceSharingResponse": ".voice_sharing_response",
+    "VoiceSharingResponseModelCategory": ".voice_sharing_response_model_category",
+    "VoiceSharingState": ".voice_sharing_state",
+    "VoiceVerificationResponse": ".voice_verification_response",
+    "WebhookToolApiSchemaConfig": ".webhook_tool_api_schema_config",
+    "WebhookToolApiSchemaConfigMethod": ".webhook_tool_api_schema_config_method",
+    "WebhookToolApiSchemaConfigRequestHeadersValue": ".webhook_tool_api_schema_config_request_headers_value",
+    "WebhookToolConfig": ".webhook_tool_config",
+    "WidgetConfig": ".widget_config",
+    "WidgetConfigAvatar": ".widget_config_avatar",
+    "WidgetConfigAvatar_Image": ".widget_config_avatar",
+    "WidgetConfigAvatar_Orb": ".widget_config_avatar",
+    "WidgetConfigAvatar_Url": ".widget_config_avatar",
+    "WidgetConfigResponseModel": ".widget_config_response_model",
+    "WidgetConfigResponseModelAvatar": ".widget_config_response_model_avatar",
+    "WidgetConfigResponseModelAvatar_Image": ".widget_config_response_model_avatar",
+    "WidgetConfigResponseModelAvatar_Orb": ".widget_config_response_model_avatar",
+    "WidgetConfigResponseModelAvatar_Url": ".widget_config_response_model_avatar",
+    "WidgetExpandable": ".widget_expandable",
+    "WidgetFeedbackMode": ".widget_feedback_mode",
+    "WorkspaceGroupByNameResponseModel": ".workspace_group_by_name_response_model",
+}
+
+
+def __getattr__(attr_name: str) -> typing.Any:
+    module_name = _dynamic_imports.get(attr_name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {attr_name!r}")
+    module = import_module(module_name, __package__)
+    value = getattr(module, attr_name)
+    # Cached so that later lookups no longer go through __getattr__.
+    globals()[attr_name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted({*globals(), *_dynamic_imports})
+
 
 __all__ = [
     "Accent",
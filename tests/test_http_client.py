@@ -0,0 +1,1168 @@
+import asyncio
+import http.server
+import threading
+import time
+import typing
+import urllib.parse
+
+import httpx
+
+from elevenlabs import VoiceSettings
+from elevenlabs.client import AsyncElevenLabs, ElevenLabs
+from elevenlabs.core import (
+    ApiError,
+    ApiKeyPool,
+    AsyncReplayTransport,
+    CircuitBreaker,
+    CircuitOpenError,
+    ConnectionPoolOptions,
+    DeadlineExceededError,
+    DiskResponseCache,
+    EnvironmentSelector,
+    HedgingPolicy,
+    InMemoryResponseCache,
+    MetricsRegistry,
+    RateLimiter,
+    RecordingTransport,
+    RequestCoalescer,
+    RequestTiming,
+    ResponseCache,
+    RetryBudget,
+    ReplayTransport,
+    RetryPolicy,
+    TimeoutOptions,
+    UploadFile,
+    areadinto,
+    construct_type,
+    download_to,
+    encode_query,
+    jsonable_encoder,
+    readinto,
+    remove_none_from_dict,
+)
+from elevenlabs.core.http_client import _build_query, _build_url, _is_hedgeable
+from elevenlabs.core.upload import MultipartStream
+
+
+def test_connection_pool_limits() -> None:
+    """Test that connection pool options are applied to the default httpx client."""
+    client = ElevenLabs(
+        api_key="test",
+        connection_pool=ConnectionPoolOptions(max_connections=7, max_keepalive_connections=3, keepalive_expiry=12.5),
+    )
+    pool = client._client_wrapper.httpx_client.httpx_client._transport._pool  # type: ignore
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 3
+    assert pool._keepalive_expiry == 12.5
+    assert pool._http2 is False
+
+    async_client = AsyncElevenLabs(api_key="test", connection_pool=ConnectionPoolOptions(max_connections=9))
+    async_pool = async_client._client_wrapper.httpx_client.httpx_client._transport._pool  # type: ignore
+    assert async_pool._max_connections == 9
+
+
+def test_connection_pool_timeout() -> None:
+    """Test that the pool timeout survives the per-request timeout override."""
+    timeouts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"])
+        return httpx.Response(200, json=[])
+
+    client = ElevenLabs(
+        api_key="test",
+        timeout=30,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        connection_pool=ConnectionPoolOptions(pool_timeout_in_seconds=2),
+    )
+    client.models.get_all()
+    assert timeouts[0] == {"connect": 30, "read": 30, "write": 30, "pool": 2}
+
+
+def test_build_url_matches_urljoin() -> None:
+    """Test that the URL fast path resolves paths exactly like urljoin."""
+    base_urls = [
+        "https://api.elevenlabs.io",
+        "https://api.elevenlabs.io/",
+        "https://proxy.local/eleven",
+        "http://x?a=b",
+    ]
+    paths = [None, "", "v1/models", "v1/voices/abc/settings/edit", "/v1/models", "v1/./models", "../v1", "v1/a?b=c"]
+    for base_url in base_urls:
+        for path in paths:
+            assert _build_url(base_url, path) == urllib.parse.urljoin(f"{base_url}/", path)
+
+
+def test_build_query_matches_encoder() -> None:
+    """Test that the query fast path encodes parameters exactly like the recursive encoder."""
+    omit = object()
+    params = {"a": 1, "b": None, "c": omit, "d": [1, "x"], "e": {"f": {"g": True}}, "h": "s", "i": 1.5}
+    request_options = {"additional_query_parameters": {"a": 2, "j": "k"}}
+    merged = {key: value for key, value in {**params, "a": 2, "j": "k"}.items() if value is not omit}
+    expected = encode_query(jsonable_encoder(remove_none_from_dict(merged)))
+    assert _build_query(params, request_options, omit) == expected  # type: ignore
+
+
+def _mock_client(handler: typing.Callable[[httpx.Request], httpx.Response], **kwargs: typing.Any) -> ElevenLabs:
+    return ElevenLabs(api_key="test", httpx_client=httpx.Client(transport=httpx.MockTransport(handler)), **kwargs)
+
+
+class _FailingStream(httpx.SyncByteStream):
+    def __iter__(self) -> typing.Iterator[bytes]:
+        raise httpx.ReadTimeout("stalled")
+
+
+class _AsyncFailingStream(httpx.AsyncByteStream):
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        raise httpx.ReadTimeout("stalled")
+        yield b""
+
+
+def test_retry_status_codes_and_transport_errors() -> None:
+    """Test that retriable status codes and connect errors are retried."""
+    outcomes: typing.List[typing.Any] = [httpx.ConnectError("refused"), 503, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome, json=[])
+
+    client = _mock_client(handler, retry_policy=RetryPolicy(max_retries=2, initial_delay_in_seconds=0))
+    assert client.models.get_all() == []
+    assert outcomes == []
+
+
+def test_retry_stream_before_first_byte() -> None:
+    """Test that a streaming request is retried when it stalls before yielding any audio."""
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        if len(attempts) == 1:
+            return httpx.Response(200, stream=_FailingStream())
+        return httpx.Response(200, content=b"audio")
+
+    client = _mock_client(handler)
+    audio = client.text_to_speech.convert_as_stream(
+        "voice", text="Hello", request_options={"retry_policy": RetryPolicy(max_retries=1, initial_delay_in_seconds=0)}
+    )
+    assert b"".join(audio) == b"audio"
+    assert len(attempts) == 2
+
+
+async def test_async_retry_stream_before_first_byte() -> None:
+    """Test that an async streaming request is retried when it stalls before yielding any audio."""
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        if len(attempts) == 1:
+            return httpx.Response(200, stream=_AsyncFailingStream())
+        return httpx.Response(200, content=b"audio")
+
+    client = AsyncElevenLabs(
+        api_key="test",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        retry_policy=RetryPolicy(max_retries=1, initial_delay_in_seconds=0),
+    )
+    audio = b""
+    async for chunk in client.text_to_speech.convert_as_stream("voice", text="Hello"):
+        audio += chunk
+    assert audio == b"audio"
+    assert len(attempts) == 2
+
+
+def test_retry_budget() -> None:
+    """Test that the retry budget caps retries across requests."""
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        return httpx.Response(503, json={})
+
+    budget = RetryBudget(ratio=0, min_retries_per_second=0, max_tokens=1)
+    client = _mock_client(handler, retry_policy=RetryPolicy(max_retries=3, initial_delay_in_seconds=0, budget=budget))
+    for _ in range(2):
+        try:
+            client.models.get_all()
+        except Exception:
+            pass
+    assert len(attempts) == 3
+
+
+def test_hedged_stream() -> None:
+    """Test that a hedge is sent for a slow stream and that the faster response wins."""
+    release_slow = threading.Event()
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        if len(attempts) == 1:
+            release_slow.wait(5)
+            return httpx.Response(200, content=b"slow")
+        return httpx.Response(200, content=b"fast")
+
+    hedging_policy = HedgingPolicy(delay_in_seconds=0.01)
+    client = _mock_client(handler, hedging_policy=hedging_policy)
+    audio = b"".join(client.text_to_speech.convert_as_stream("voice", text="Hello"))
+    release_slow.set()
+    assert audio == b"fast"
+    assert hedging_policy.get_stats() == {"requests": 1, "hedges_fired": 1, "hedges_won": 1}
+
+
+def test_hedging_requires_in_memory_body() -> None:
+    """Test that only requests without a body or with an in-memory body are hedged."""
+    assert _is_hedgeable(httpx.Request("GET", "https://api.test/v1/models"))
+    assert _is_hedgeable(httpx.Request("POST", "https://api.test/v1/text-to-speech", content=b"{}"))
+    assert not _is_hedgeable(httpx.Request("POST", "https://api.test/v1/upload", content=iter([b"audio"])))
+    assert not _is_hedgeable(
+        httpx.Request("POST", "https://api.test/v1/upload", files={"file": ("audio.mp3", b"audio")})
+    )
+
+
+async def test_async_hedged_stream() -> None:
+    """Test that an async hedge wins over a slow stream and that the slow attempt is cancelled."""
+    attempts = []
+    cancelled = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        if len(attempts) == 1:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return httpx.Response(200, content=b"fast")
+
+    hedging_policy = HedgingPolicy(delay_in_seconds=0.01)
+    client = AsyncElevenLabs(
+        api_key="test",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    audio = b""
+    async for chunk in client.text_to_speech.convert_as_stream(
+        "voice", text="Hello", request_options={"hedging_policy": hedging_policy}
+    ):
+        audio += chunk
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert audio == b"fast"
+    assert hedging_policy.get_stats() == {"requests": 1, "hedges_fired": 1, "hedges_won": 1}
+
+
+def test_hedging_adaptive_delay() -> None:
+    """Test that the adaptive hedging delay follows the observed time to first byte."""
+    hedging_policy = HedgingPolicy(min_samples=10, min_delay_in_seconds=0)
+    assert hedging_policy.get_delay() is None
+    for sample in range(100):
+        hedging_policy.record_time_to_first_byte(sample / 100)
+    assert hedging_policy.get_delay() == 0.95
+
+
+def test_rate_limiter_concurrency() -> None:
+    """Test that the rate limiter caps the number of requests in flight."""
+    lock = threading.Lock()
+    in_flight = [0, 0]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        threading.Event().wait(0.02)
+        with lock:
+            in_flight[0] -= 1
+        return httpx.Response(200, json=[])
+
+    rate_limiter = RateLimiter(max_concurrency=2)
+    client = _mock_client(handler, rate_limiter=rate_limiter)
+    threads = [threading.Thread(target=client.models.get_all) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert in_flight[1] == 2
+    stats = rate_limiter.get_stats()
+    assert stats["acquired"] == 6
+    assert stats["in_flight"] == 0
+    assert stats["queue_depth"] == 0
+    assert stats["max_wait_time_in_seconds"] > 0
+
+
+def test_rate_limiter_releases_slot_during_retry_backoff() -> None:
+    """Test that a request backing off between retries does not hold its concurrency slot."""
+    responses = [httpx.Response(503, headers={"retry-after-ms": "200"}, json={}), httpx.Response(200, json=[])]
+    in_flight_during_backoff = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    rate_limiter = RateLimiter(max_concurrency=1)
+    client = _mock_client(handler, rate_limiter=rate_limiter, retry_policy=RetryPolicy(max_retries=1))
+    thread = threading.Thread(target=client.models.get_all)
+    thread.start()
+    time.sleep(0.1)
+    in_flight_during_backoff.append(rate_limiter.get_stats()["in_flight"])
+    thread.join()
+    assert in_flight_during_backoff == [0]
+    stats = rate_limiter.get_stats()
+    assert stats["in_flight"] == 0
+    assert stats["acquired"] == 2
+
+
+def test_rate_limiter_concurrency_limits_by_tier() -> None:
+    """Test that the concurrency limits of the subscription tiers can be overridden."""
+    subscription = typing.cast(typing.Any, type("Subscription", (), {"tier": "Pro"})())
+    rate_limiter = RateLimiter()
+    rate_limiter.update_from_subscription(subscription)
+    assert rate_limiter.max_concurrency == 10
+
+    rate_limiter = RateLimiter(concurrency_limits_by_tier={"pro": 25})
+    rate_limiter.update_from_subscription(subscription)
+    assert rate_limiter.max_concurrency == 25
+
+
+async def test_rate_limiter_backs_off_on_429() -> None:
+    """Test that a 429 halves the request rate and pauses requests for the Retry-After duration."""
+    responses = [httpx.Response(429, headers={"retry-after-ms": "50"}, json={}), httpx.Response(200, json=[])]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    rate_limiter = RateLimiter(requests_per_second=100, burst=10)
+    client = AsyncElevenLabs(
+        api_key="test",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        retry_policy=RetryPolicy(max_retries=1),
+        rate_limiter=rate_limiter,
+    )
+    assert await client.models.get_all() == []
+    stats = rate_limiter.get_stats()
+    assert stats["rate_limited_responses"] == 1
+    assert stats["requests_per_second"] == 55
+
+    rate_limiter.record_response(httpx.Response(429, headers={"retry-after-ms": "300"}))
+    started_at = asyncio.get_running_loop().time()
+    await rate_limiter.aacquire()
+    rate_limiter.release()
+    assert asyncio.get_running_loop().time() - started_at > 0.2
+
+
+def test_request_coalescing() -> None:
+    """Test that identical concurrent GET requests share a single round-trip."""
+    release = threading.Event()
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        release.wait(5)
+        return httpx.Response(200, json=[])
+
+    request_coalescer = RequestCoalescer()
+    client = _mock_client(handler, request_coalescer=request_coalescer)
+    results: typing.List[typing.Any] = []
+    threads = [threading.Thread(target=lambda: results.append(client.models.get_all())) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    while request_coalescer.get_stats()["requests"] < 5:
+        threading.Event().wait(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(attempts) == 1
+    assert results == [[]] * 5
+    assert request_coalescer.get_stats() == {"requests": 5, "coalesced": 4}
+
+
+async def test_async_request_coalescing() -> None:
+    """Test that a cancelled caller does not cancel a coalesced request for the others."""
+    attempts = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=[])
+
+    client = AsyncElevenLabs(
+        api_key="test",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        request_coalescer=RequestCoalescer(),
+    )
+    first = asyncio.ensure_future(client.models.get_all())
+    second = asyncio.ensure_future(client.models.get_all())
+    await asyncio.sleep(0.01)
+    first.cancel()
+    assert await second == []
+    assert len(attempts) == 1
+
+
+def test_response_cache_invalidation() -> None:
+    """Test that cached responses are reused until a mutating request invalidates them."""
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append((request.method, request.url.path))
+        if request.method == "POST":
+            return httpx.Response(200, json={"status": "ok"})
+        return httpx.Response(200, json={"stability": 0.5, "similarity_boost": 0.75})
+
+    response_cache = InMemoryResponseCache()
+    client = _mock_client(handler, response_cache=response_cache)
+    assert client.voices.get_settings("voice").stability == 0.5
+    assert client.voices.get_settings("voice").stability == 0.5
+    assert len(attempts) == 1
+
+    client.voices.edit_settings("voice", request=VoiceSettings(stability=0.1, similarity_boost=0.2))
+    client.voices.get_settings("voice")
+    assert attempts[-1] == ("GET", "/v1/voices/voice/settings")
+    assert len(attempts) == 3
+    assert response_cache.get_stats() == {"hits": 1, "misses": 2, "revalidations": 0, "invalidations": 1}
+
+
+def test_response_cache_invalidated_by_streamed_request() -> None:
+    """Test that a mutating request invalidates the cache when it is streamed too."""
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request.method)
+        return httpx.Response(200, json={"stability": 0.5, "similarity_boost": 0.75})
+
+    response_cache = InMemoryResponseCache()
+    client = _mock_client(handler, response_cache=response_cache)
+    client.voices.get_settings("voice")
+    with client._client_wrapper.httpx_client.stream("v1/voices/voice/settings/edit", method="POST", json={}) as r:
+        r.read()
+    client.voices.get_settings("voice")
+    assert attempts == ["GET", "POST", "GET"]
+    assert response_cache.get_stats()["invalidations"] == 1
+
+    try:
+        ResponseCache()  # type: ignore[abstract]
+        assert False, "ResponseCache is abstract"
+    except TypeError:
+        pass
+
+
+def test_response_cache_skips_uncached_families(tmp_path: typing.Any) -> None:
+    """Test that mutating requests to resources that are never cached leave the cache alone."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"stability": 0.5, "similarity_boost": 0.75})
+
+    for response_cache in (InMemoryResponseCache(), DiskResponseCache(str(tmp_path))):
+        client = _mock_client(handler, response_cache=response_cache)
+        client.voices.get_settings("voice")
+        http_client = client._client_wrapper.httpx_client
+        http_client.request("v1/text-to-speech/voice", method="POST", json={})
+        with http_client.stream("v1/speech-to-speech/voice", method="POST", json={}) as r:
+            r.read()
+        client.voices.get_settings("voice")
+        assert response_cache.get_stats() == {"hits": 1, "misses": 1, "revalidations": 0, "invalidations": 0}
+
+
+def test_response_cache_revalidation(tmp_path: typing.Any) -> None:
+    """Test that expired responses are revalidated with their ETag."""
+    conditional_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        conditional_headers.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"etag": '"v1"'}, json=[])
+
+    response_cache = DiskResponseCache(str(tmp_path), ttl_in_seconds=0)
+    client = _mock_client(handler, response_cache=response_cache)
+    assert client.models.get_all() == []
+    assert client.models.get_all() == []
+    assert conditional_headers == [None, '"v1"']
+    assert response_cache.get_stats()["revalidations"] == 1
+
+
+def test_timing_hooks() -> None:
+    """Test that a timing record is emitted when the request returns and updated once its body has been parsed."""
+    timings: typing.List[RequestTiming] = []
+    parsed: typing.List[RequestTiming] = []
+
+    def hook(timing: RequestTiming) -> None:
+        assert timing.parse_in_seconds is None
+        timings.append(timing)
+        timing.on_parse_complete(parsed.append)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/stream"):
+            return httpx.Response(200, content=b"audio")
+        return httpx.Response(200, json={"stability": 0.5, "similarity_boost": 0.75})
+
+    client = _mock_client(handler, timing_hooks=[hook])
+    client.voices.get_settings("21m00Tcm4TlvDq8ikWAM")
+    assert len(timings) == 1
+    assert timings[0].endpoint == "v1/voices/{id}/settings"
+    assert timings[0].status_code == 200
+    assert timings[0].response_bytes > 0
+    assert not timings[0].coalesced
+    assert parsed == [timings[0]]
+    assert timings[0].parse_in_seconds is not None
+
+    assert b"".join(client.text_to_speech.convert_as_stream("21m00Tcm4TlvDq8ikWAM", text="Hello")) == b"audio"
+    assert len(timings) == 2
+    assert timings[1].method == "POST"
+    assert timings[1].endpoint == "v1/text-to-speech/{id}/stream"
+    assert timings[1].request_bytes > 0
+    assert timings[1].parse_in_seconds is None
+    assert len(parsed) == 1
+
+
+def test_timing_hooks_coalesced() -> None:
+    """Test that requests served by an identical request in flight are marked as coalesced."""
+    release = threading.Event()
+    timings: typing.List[RequestTiming] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        release.wait(5)
+        return httpx.Response(200, json=[])
+
+    request_coalescer = RequestCoalescer()
+    client = _mock_client(handler, request_coalescer=request_coalescer, timing_hooks=[timings.append])
+    threads = [threading.Thread(target=client.models.get_all) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    while request_coalescer.get_stats()["requests"] < 2:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert sorted(timing.coalesced for timing in timings) == [False, True]
+    follower = next(timing for timing in timings if timing.coalesced)
+    assert follower.status_code == 200
+    assert follower.time_to_first_byte_in_seconds is None
+
+
+def test_metrics_registry() -> None:
+    """Test that requests are recorded in the metrics registry and rendered in the Prometheus format."""
+    statuses = [429, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0), json=[])
+
+    metrics = MetricsRegistry()
+    client = _mock_client(handler, retry_policy=RetryPolicy(max_retries=1, initial_delay_in_seconds=0), metrics=metrics)
+    client.models.get_all()
+
+    snapshot = metrics.snapshot()
+    labels = '{endpoint="v1/models",method="GET"}'
+    assert snapshot["elevenlabs_requests_total"] == {'{endpoint="v1/models",method="GET",status="200"}': 1}
+    assert snapshot["elevenlabs_request_retries_total"] == {labels: 1}
+    assert snapshot["elevenlabs_rate_limited_responses_total"] == {labels: 1}
+    assert snapshot["elevenlabs_requests_in_flight"] == {"": 0}
+    assert snapshot["elevenlabs_request_duration_seconds"][labels]["count"] == 1
+
+    thread = threading.Thread(target=client.models.get_all)
+    statuses.append(200)
+    thread.start()
+    thread.join()
+    prometheus = metrics.render_prometheus()
+    assert "# TYPE elevenlabs_request_duration_seconds histogram" in prometheus
+    assert 'elevenlabs_request_duration_seconds_bucket{endpoint="v1/models",method="GET",le="+Inf"} 2' in prometheus
+    assert 'elevenlabs_requests_total{endpoint="v1/models",method="GET",status="200"} 2' in prometheus
+
+
+class _ChunkedStream(httpx.SyncByteStream):
+    def __iter__(self) -> typing.Iterator[bytes]:
+        yield b"au"
+        time.sleep(0.05)
+        yield b"dio"
+
+
+def test_record_replay(tmp_path: typing.Any) -> None:
+    """Test that recorded responses, including streamed chunks and their timing, are replayed without a network."""
+    path = str(tmp_path / "fixture.json")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/stream"):
+            return httpx.Response(200, stream=_ChunkedStream())
+        return httpx.Response(200, json=[{"model_id": "eleven_multilingual_v2"}])
+
+    recording = RecordingTransport(path, transport=httpx.MockTransport(handler))
+    client = ElevenLabs(api_key="secret", httpx_client=httpx.Client(transport=recording))
+    client.models.get_all()
+    assert b"".join(client.text_to_speech.convert_as_stream("21m00Tcm4TlvDq8ikWAM", text="Hello")) == b"audio"
+    recording.save()
+    with open(path) as f:
+        assert "secret" not in f.read()
+
+    client = ElevenLabs(api_key="test", httpx_client=httpx.Client(transport=ReplayTransport(path, speed=None)))
+    for _ in range(3):
+        assert client.models.get_all()[0].model_id == "eleven_multilingual_v2"
+    started_at = time.monotonic()
+    assert b"".join(client.text_to_speech.convert_as_stream("21m00Tcm4TlvDq8ikWAM", text="Hello")) == b"audio"
+    assert time.monotonic() - started_at < 0.04
+
+    client = ElevenLabs(api_key="test", httpx_client=httpx.Client(transport=ReplayTransport(path)))
+    started_at = time.monotonic()
+    assert b"".join(client.text_to_speech.convert_as_stream("21m00Tcm4TlvDq8ikWAM", text="Hello")) == b"audio"
+    assert time.monotonic() - started_at >= 0.04
+
+
+async def test_async_replay(tmp_path: typing.Any) -> None:
+    """Test that the async replay transport serves recorded responses and rejects unrecorded requests."""
+    path = str(tmp_path / "fixture.json")
+    recording = RecordingTransport(path, transport=httpx.MockTransport(lambda request: httpx.Response(200, json=[])))
+    ElevenLabs(api_key="test", httpx_client=httpx.Client(transport=recording)).models.get_all()
+    recording.save()
+
+    client = AsyncElevenLabs(
+        api_key="test", httpx_client=httpx.AsyncClient(transport=AsyncReplayTransport(path, speed=10.0, loop=False))
+    )
+    assert await client.models.get_all() == []
+    try:
+        await client.models.get_all()
+        assert False, "expected the replay to be exhausted"
+    except httpx.TransportError:
+        pass
+
+
+def test_circuit_breaker() -> None:
+    """Test that a failing endpoint family trips its circuit, fails fast while open and closes after a probe."""
+    outcomes = [503] * 4
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/v1/models"):
+            return httpx.Response(200, json=[])
+        return httpx.Response(outcomes.pop(0) if outcomes else 200, json={"history": [], "has_more": False})
+
+    circuit_breaker = CircuitBreaker(minimum_calls=4, window_size=4, open_duration_in_seconds=0.05)
+    client = _mock_client(
+        handler, retry_policy=RetryPolicy(max_retries=10, initial_delay_in_seconds=0), circuit_breaker=circuit_breaker
+    )
+    try:
+        client.history.get_all()
+        assert False, "expected the circuit to open"
+    except CircuitOpenError as error:
+        assert error.family == "v1/history"
+        assert error.retry_after_in_seconds > 0
+    assert outcomes == []
+    assert circuit_breaker.get_state("v1/history") == "open"
+    assert client.models.get_all() == []
+
+    time.sleep(0.06)
+    assert circuit_breaker.get_state("v1/history") == "half_open"
+    client.history.get_all()
+    assert circuit_breaker.get_state("v1/history") == "closed"
+    assert circuit_breaker.get_stats() == {"opened": 1, "rejected": 1}
+
+
+def test_phase_timeouts() -> None:
+    """Test that phase timeouts of the client and the request are combined with the overall timeout."""
+    timeouts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"])
+        return httpx.Response(200, json=[])
+
+    client = _mock_client(handler, timeout=30, timeouts={"connect_in_seconds": 2, "pool_in_seconds": 1})
+    client.models.get_all()
+    client.models.get_all(request_options={"timeout_in_seconds": 600, "timeouts": {"write_in_seconds": 5}})
+    assert timeouts[0] == {"connect": 2, "read": 30, "write": 30, "pool": 1}
+    assert timeouts[1] == {"connect": 2, "read": 600, "write": 5, "pool": 1}
+
+
+class _StallingHandler(http.server.BaseHTTPRequestHandler):
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["content-length"]))
+        self.send_response(200)
+        self.send_header("content-type", "audio/mpeg")
+        self.end_headers()
+        self.wfile.write(b"audio")
+        self.wfile.flush()
+        time.sleep(2)
+
+    def log_message(self, *args: typing.Any) -> None:
+        pass
+
+
+def test_stream_idle_timeout() -> None:
+    """Test that a stream stalling between chunks fails after the idle timeout rather than the read timeout."""
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _StallingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = ElevenLabs(
+            api_key="test",
+            base_url=f"http://127.0.0.1:{server.server_address[1]}",
+            timeout=30,
+            timeouts={"stream_idle_in_seconds": 0.2},
+        )
+        started_at = time.monotonic()
+        try:
+            b"".join(client.text_to_speech.convert_as_stream("21m00Tcm4TlvDq8ikWAM", text="Hello"))
+            assert False, "expected the stalled stream to time out"
+        except httpx.ReadTimeout:
+            pass
+        assert time.monotonic() - started_at < 1.5
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class _TimeoutRecordingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, request: httpx.Request, read_timeouts: typing.List[float]) -> None:
+        self.request = request
+        self.read_timeouts = read_timeouts
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        self.read_timeouts.append(self.request.extensions["timeout"]["read"])
+        yield b"audio"
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        self.read_timeouts.append(self.request.extensions["timeout"]["read"])
+        yield b"audio"
+
+
+async def test_stream_idle_timeout_applies_to_first_chunk() -> None:
+    """Test that the first chunk is waited for with the idle timeout, whether the request is retried or hedged."""
+    read_timeouts: typing.List[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=_TimeoutRecordingStream(request, read_timeouts))
+
+    timeouts: TimeoutOptions = {"read_in_seconds": 30, "stream_idle_in_seconds": 2}
+    policies: typing.List[typing.Dict[str, typing.Any]] = [
+        {},
+        {"retry_policy": RetryPolicy(max_retries=1)},
+        {"hedging_policy": HedgingPolicy()},
+        {"hedging_policy": HedgingPolicy(delay_in_seconds=5)},
+    ]
+    for kwargs in policies:
+        client = _mock_client(handler, timeouts=timeouts, **kwargs)
+        assert b"".join(client.text_to_speech.convert_as_stream("voice", text="Hello")) == b"audio"
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    async_client = AsyncElevenLabs(
+        api_key="test",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(async_handler)),
+        timeouts=timeouts,
+        hedging_policy=HedgingPolicy(delay_in_seconds=5),
+    )
+    async for chunk in async_client.text_to_speech.convert_as_stream("voice", text="Hello"):
+        assert chunk == b"audio"
+    assert read_timeouts == [2, 2, 2, 2, 2]
+
+
+def test_deadline() -> None:
+    """Test that the deadline shrinks the attempt timeouts and prevents retries that could not start in time."""
+    timeouts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"])
+        return httpx.Response(503, headers={"retry-after": "1"}, json={})
+
+    client = _mock_client(handler, timeout=30, retry_policy=RetryPolicy(max_retries=3))
+    started_at = time.monotonic()
+    try:
+        client.models.get_all(request_options={"deadline_in_seconds": 0.5})
+        assert False, "expected the 503 to be raised"
+    except ApiError as error:
+        assert error.status_code == 503
+    assert time.monotonic() - started_at < 0.5
+    assert len(timeouts) == 1
+    assert 0 < timeouts[0]["read"] <= 0.5
+
+    try:
+        client.models.get_all(request_options={"deadline": time.time() - 1})
+        assert False, "expected the deadline to have passed"
+    except DeadlineExceededError:
+        pass
+    assert len(timeouts) == 1
+
+
+def test_api_key_pool() -> None:
+    """Test that requests are routed to the key with the most quota left and move away from rate limited keys."""
+    quotas = {"key-a": 1000, "key-b": 50000, "key-c": 0}
+    api_keys = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        api_key = request.headers["xi-api-key"]
+        if request.url.path.endswith("/v1/user/subscription"):
+            return httpx.Response(200, json={"tier": "pro", "character_count": 0, "character_limit": quotas[api_key]})
+        api_keys.append(api_key)
+        if api_key == "key-b" and len(api_keys) == 2:
+            return httpx.Response(429, json={})
+        if "text-to-speech" in request.url.path:
+            return httpx.Response(200, stream=_ChunkedStream())
+        return httpx.Response(200, json=[])
+
+    api_key_pool = ApiKeyPool(["key-a", "key-b", "key-c"])
+    client = _mock_client(
+        handler, api_key_pool=api_key_pool, retry_policy=RetryPolicy(max_retries=1, initial_delay_in_seconds=0)
+    )
+    api_key_pool.refresh(client)
+
+    client.models.get_all()
+    client.models.get_all()
+    assert api_keys == ["key-b", "key-b", "key-a"]
+    stats = api_key_pool.get_stats()
+    assert stats["...ey-b"]["rate_limited_responses"] == 1
+    assert stats["...ey-b"]["cooldown_in_seconds"] > 0
+    assert stats["...ey-c"]["remaining_characters"] == 0
+
+    audio = client.text_to_speech.convert_as_stream(
+        "21m00Tcm4TlvDq8ikWAM", text="Hello", request_options={"chunk_size": 2}
+    )
+    assert next(audio) == b"au"
+    assert api_key_pool.get_stats()["...ey-a"]["in_flight"] == 1
+    assert b"".join(audio) == b"dio"
+    assert api_key_pool.get_stats()["...ey-a"]["in_flight"] == 0
+    assert "xi-api-key" not in client._client_wrapper.get_cached_headers()
+
+
+def test_api_key_pool_response_cache() -> None:
+    """Test that the accounts of an API key pool never share cached responses."""
+    api_keys = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        api_keys.append(request.headers["xi-api-key"])
+        return httpx.Response(200, json={"user_id": request.headers["xi-api-key"]})
+
+    api_key_pool = ApiKeyPool(["key-a", "key-b"])
+    client = _mock_client(handler, api_key_pool=api_key_pool, response_cache=InMemoryResponseCache())
+    assert client.user.get().user_id == "key-a"
+    assert client.user.get().user_id == "key-a"
+    api_key_pool.record_response("key-a", httpx.Response(429, headers={"retry-after": "5"}))
+    assert client.user.get().user_id == "key-b"
+    assert api_keys == ["key-a", "key-b"]
+
+
+def test_environment_selector() -> None:
+    """Test that requests go to the fastest healthy environment and fail over to the next one on connection errors."""
+    latencies = {"https://eu.test": 0.05, "https://us.test": 0.01, "https://down.test": None}
+    urls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        urls.append(str(request.url))
+        if request.url.host == "us.test":
+            raise httpx.ConnectError("unreachable", request=request)
+        return httpx.Response(200, json=[])
+
+    selector = EnvironmentSelector(list(latencies), probe_interval_in_seconds=3600)
+    selector._probe_base_url = lambda client, base_url: latencies[base_url]  # type: ignore[assignment]
+    selector.probe()
+    assert selector.get_base_url() == "https://us.test"
+
+    client = _mock_client(
+        handler,
+        environment_selector=selector,
+        retry_policy=RetryPolicy(max_retries=1, initial_delay_in_seconds=0),
+    )
+    client.models.get_all()
+    assert urls == ["https://us.test/v1/models", "https://eu.test/v1/models"]
+    assert selector.get_base_url() == "https://eu.test"
+    assert client.text_to_speech._ws_base_url == "wss://eu.test"
+
+
+def test_environment_selector_probes_lazily() -> None:
+    """Test that environments are not probed before a base url is needed, nor after the client is closed."""
+    selector = EnvironmentSelector(["https://eu.test", "https://us.test"], probe_interval_in_seconds=0)
+    client = _mock_client(lambda request: httpx.Response(200, json=[]), environment_selector=selector)
+    assert not selector._probing
+    client.close()
+    assert client._client_wrapper.get_base_url() == "https://eu.test"
+    assert not selector._probing
+
+
+_TRANSCRIPT = {"language_code": "en", "language_probability": 1.0, "text": "Hello", "words": []}
+
+
+def test_streaming_upload(tmp_path: typing.Any) -> None:
+    """Test that uploads from paths and iterators are streamed, retried when possible and report their progress."""
+    path = tmp_path / "audio.mp3"
+    path.write_bytes(b"a" * 10_000)
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append((request.headers, request.read()))
+        if len(bodies) == 1:
+            return httpx.Response(503, json={})
+        return httpx.Response(200, json=_TRANSCRIPT)
+
+    client = _mock_client(handler, retry_policy=RetryPolicy(max_retries=1, initial_delay_in_seconds=0))
+    progress = []
+    upload = UploadFile(
+        str(path), chunk_size=4096, on_progress=lambda uploaded, total: progress.append((uploaded, total))
+    )
+    client.speech_to_text.convert(model_id="scribe_v1", file=upload, diarize=True)
+    assert len(bodies) == 2 and bodies[0][1] == bodies[1][1]
+    headers, body = bodies[1]
+    assert int(headers["content-length"]) == len(body)
+    assert b'filename="audio.mp3"\r\nContent-Type: audio/mpeg\r\n\r\n' + b"a" * 10_000 in body
+    assert b'name="diarize"\r\n\r\ntrue' in body
+    assert progress[-3:] == [(4096, 10_000), (8192, 10_000), (10_000, 10_000)]
+
+    # Iterators are sent with chunked transfer encoding and cannot be retried.
+    bodies.clear()
+    try:
+        client.speech_to_text.convert(model_id="scribe_v1", file=UploadFile(iter([b"ab", b"cd"])))
+        assert False, "expected the 503 to be raised"
+    except ApiError as error:
+        assert error.status_code == 503
+    assert len(bodies) == 1
+    assert bodies[0][0]["transfer-encoding"] == "chunked"
+    assert b"\r\n\r\nabcd\r\n" in bodies[0][1]
+
+    # The body matches the one httpx encodes.
+    request = httpx.Request(
+        "POST", "https://api.test", data={"name": "voice", "labels": ["a", "b"]}, files=[("files", ("a.wav", b"123"))]
+    )
+    boundary = request.headers["content-type"].split("boundary=")[1].encode("ascii")
+    stream = MultipartStream(
+        {"name": "voice", "labels": ["a", "b"]},
+        [("files", ("a.wav", UploadFile(iter([b"12", b"3"]))))],
+        boundary=boundary,
+    )
+    assert b"".join(stream) == request.read()
+
+    # Dicts and nested lists are sent as JSON.
+    stream = MultipartStream({"labels": {"accent": "british"}, "pairs": [["a", "b"]]}, [], boundary=boundary)
+    body = b"".join(stream)
+    assert b'\r\n\r\n{"accent":"british"}\r\n' in body
+    assert b'\r\n\r\n["a","b"]\r\n' in body
+
+
+async def test_async_streaming_upload(tmp_path: typing.Any) -> None:
+    """Test that the async client streams uploads from async iterators and file objects."""
+    path = tmp_path / "audio.mp3"
+    path.write_bytes(b"abc")
+    bodies = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(await request.aread())
+        return httpx.Response(200, json=_TRANSCRIPT)
+
+    async def chunks() -> typing.AsyncIterator[bytes]:
+        yield b"de"
+        yield b"f"
+
+    client = AsyncElevenLabs(api_key="test", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    await client.speech_to_text.convert(model_id="scribe_v1", file=UploadFile(chunks(), filename="b.mp3"))
+    with open(path, "rb") as file:
+        await client.speech_to_text.convert(model_id="scribe_v1", file=file)
+    assert b'filename="b.mp3"\r\nContent-Type: audio/mpeg\r\n\r\ndef\r\n' in bodies[0]
+    assert b'filename="audio.mp3"\r\nContent-Type: audio/mpeg\r\n\r\nabc\r\n' in bodies[1]
+
+
+def test_download(tmp_path: typing.Any) -> None:
+    """Test that binary responses are yielded as received and can be written to files and buffers."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=_ChunkedStream())
+
+    client = _mock_client(handler)
+    assert list(client.text_to_speech.convert("voice", text="Hello")) == [b"au", b"dio"]
+    assert list(client.text_to_speech.convert("voice", text="Hello", request_options={"chunk_size": 1}))[:2] == [
+        b"a",
+        b"u",
+    ]
+
+    path = tmp_path / "audio.mp3"
+    assert download_to(client.text_to_speech.convert("voice", text="Hello"), str(path)) == 5
+    assert path.read_bytes() == b"audio"
+
+    buffer = bytearray(8)
+    assert readinto(client.text_to_speech.convert("voice", text="Hello"), buffer) == 5
+    assert buffer[:5] == b"audio"
+    try:
+        readinto(client.text_to_speech.convert("voice", text="Hello"), bytearray(4))
+        assert False, "expected the buffer to overflow"
+    except ValueError:
+        pass
+
+
+async def test_async_readinto() -> None:
+    """Test that async binary responses can be copied into a buffer."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"audio")
+
+    client = AsyncElevenLabs(api_key="test", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    buffer = bytearray(5)
+    assert await areadinto(client.text_to_speech.convert("voice", text="Hello"), buffer) == 5
+    assert buffer == b"audio"
+
+
+def test_construct_type() -> None:
+    """Test that compiled decoders construct nested models, unions and scalars and keep malformed values as they are."""
+    from elevenlabs.types import GetSpeechHistoryResponse, PromptAgentToolsItem, PromptAgentToolsItem_System
+
+    history = construct_type(
+        type_=GetSpeechHistoryResponse,
+        object_={
+            "history": [{"history_item_id": "a", "date_unix": "1714650306", "feedback": {"thumbs_up": "true"}}, None],
+            "has_more": "false",
+            "unknown": 1,
+        },
+    )
+    item = history.history[0]
+    assert item.date_unix == 1714650306 and item.request_id is None
+    assert item.feedback.thumbs_up is True
+    assert history.history[1] is None and history.has_more is False
+    assert history.model_extra == {"unknown": 1}
+
+    tools = construct_type(
+        type_=typing.List[PromptAgentToolsItem], object_=[{"type": "system", "name": "end_call"}, {"type": "unknown"}]
+    )
+    assert isinstance(tools[0], PromptAgentToolsItem_System) and tools[0].name == "end_call"
+    assert tools[1].type == "unknown"
+    assert construct_type(type_=int, object_="malformed") == "malformed"
+    assert construct_type(type_=typing.Dict[str, typing.Optional[int]], object_={"a": "1", "b": None}) == {
+        "a": 1,
+        "b": None,
+    }
+
+
+def test_validate_responses() -> None:
+    """Test that validated clients parse successful responses with cached pydantic adapters."""
+    import pydantic
+
+    from elevenlabs.core.pydantic_utilities import _type_adapters
+    from elevenlabs.types import AudioWithTimestampsResponseModel, GetSpeechHistoryResponse
+
+    history_dates: typing.List[typing.Any] = [1714650306, "malformed"]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/v1/text-to-speech/"):
+            return httpx.Response(200, json={"audio_base64": "YXVkaW8=", "alignment": None})
+        item = {"history_item_id": "a", "date_unix": history_dates.pop(0)}
+        return httpx.Response(200, json={"history": [item], "has_more": False})
+
+    client = _mock_client(handler, validate_responses=True)
+    history = client.history.get_all()
+    assert isinstance(history, GetSpeechHistoryResponse) and history.history[0].date_unix == 1714650306
+    assert GetSpeechHistoryResponse in _type_adapters
+    # Aliased fields are dealiased before validation.
+    audio = client.text_to_speech.convert_with_timestamps("voice", text="Hello")
+    assert isinstance(audio, AudioWithTimestampsResponseModel) and audio.audio_base_64 == "YXVkaW8="
+    try:
+        client.history.get_all()
+        assert False, "Expected a validation error"
+    except pydantic.ValidationError:
+        pass
+
+    # Error responses are still constructed leniently.
+    client = _mock_client(lambda request: httpx.Response(400, json={"detail": "bad"}), validate_responses=True)
+    try:
+        client.history.get_all()
+        assert False, "Expected an API error"
+    except ApiError as error:
+        assert error.body == {"detail": "bad"}
+
+
+def test_convert_annotation_metadata() -> None:
+    """Test that objects of alias-free types are passed through and aliased fields are still converted."""
+    from elevenlabs.core import convert_and_respect_annotation_metadata
+    from elevenlabs.types import AudioWithTimestampsResponseModel
+
+    settings = {"stability": 0.5, "similarity_boost": 0.75}
+    assert (
+        convert_and_respect_annotation_metadata(object_=settings, annotation=VoiceSettings, direction="write")
+        is settings
+    )
+    assert convert_and_respect_annotation_metadata(
+        object_=[{"audio_base64": "YXVkaW8=", "alignment": {"characters": ["a"]}}],
+        annotation=typing.List[AudioWithTimestampsResponseModel],
+        direction="read",
+    ) == [{"audio_base_64": "YXVkaW8=", "alignment": {"characters": ["a"]}}]
+    assert convert_and_respect_annotation_metadata(
+        object_={"audio_base_64": "YXVkaW8="}, annotation=AudioWithTimestampsResponseModel, direction="write"
+    ) == {"audio_base64": "YXVkaW8="}
+
+
+def test_jsonable_encoder() -> None:
+    """Test that values are encoded by the encoder of their type, with subclasses taking the first matching one."""
+    import dataclasses
+    import datetime as dt
+    import enum
+    import pathlib
+
+    class Quality(str, enum.Enum):
+        HIGH = "high"
+
+    @dataclasses.dataclass
+    class Locator:
+        id: str
+        created: dt.date
+
+    assert jsonable_encoder(
+        {
+            "quality": Quality.HIGH,
+            1: b"\xff\x00",
+            "created": dt.datetime(2024, 1, 2, 3, 4, 5, tzinfo=dt.timezone.utc),
+            "path": pathlib.PurePosixPath("a/b"),
+            "items": ({"x"}, (1, True, None, 1.5)),
+            "locator": Locator("id", dt.date(2024, 1, 2)),
+            "settings": VoiceSettings(stability=0.5, similarity_boost=0.75),
+        }
+    ) == {
+        "quality": "high",
+        1: "/wA=",
+        "created": "2024-01-02T03:04:05Z",
+        "path": "a/b",
+        "items": [["x"], [1, True, None, 1.5]],
+        "locator": {"id": "id", "created": "2024-01-02"},
+        "settings": {"stability": 0.5, "similarity_boost": 0.75},
+    }
+    assert jsonable_encoder({"name": "voice", "tags": ["a"]}, custom_encoder={str: str.upper}) == {
+        "NAME": "VOICE",
+        "TAGS": ["A"],
+    }
+
+
+def test_json_codec() -> None:
+    """Test that request bodies and responses go through the configured JSON codec."""
+    import json
+
+    from elevenlabs.core import JsonCodec, OrjsonCodec, get_json_codec, set_json_codec
+
+    class RecordingCodec(JsonCodec):
+        def __init__(self) -> None:
+            self.calls: typing.List[str] = []
+
+        def dumps(self, obj: typing.Any) -> bytes:
+            self.calls.append("dumps")
+            return super().dumps(obj)
+
+        def loads(self, data: typing.Any) -> typing.Any:
+            self.calls.append("loads")
+            return super().loads(data)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["content-type"] == "application/json"
+        assert json.loads(request.content) == {"stability": 0.5, "similarity_boost": 0.75}
+        return httpx.Response(200, json={"status": "ok"})
+
+    codec = RecordingCodec()
+    set_json_codec(codec)
+    try:
+        response = _mock_client(handler).voices.edit_settings(
+            "voice", request=VoiceSettings(stability=0.5, similarity_boost=0.75)
+        )
+    finally:
+        set_json_codec(None)
+    assert response.status == "ok"
+    assert codec.calls == ["dumps", "loads"]
+
+    codecs = [JsonCodec()]
+    try:
+        codecs.append(OrjsonCodec())
+        assert isinstance(get_json_codec(), OrjsonCodec)
+    except ImportError:
+        pass
+    for json_codec in codecs:
+        assert json_codec.loads(json_codec.dumps({"text": "héllo", 1: [None, True, 1.5]})) == {
+            "text": "héllo",
+            "1": [None, True, 1.5],
+        }
+        try:
+            json_codec.loads(b"{")
+            assert False, "Expected a decoding error"
+        except json.JSONDecodeError:
+            pass
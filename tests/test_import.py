@@ -0,0 +1,72 @@
+import subprocess
+import sys
+
+# Generous enough for slow CI machines, an eager import of every model takes about a second.
+IMPORT_TIME_BUDGET_IN_SECONDS = 0.3
+
+
+def _run(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+
+
+def test_import_time() -> None:
+    """Test that `import elevenlabs` stays within its budget and loads no models, clients or dependencies."""
+    output = _run(
+        "import sys, time\n"
+        "started_at = time.perf_counter()\n"
+        "import elevenlabs\n"
+        "print(time.perf_counter() - started_at)\n"
+        "print(','.join(sorted(name for name in sys.modules if name.startswith(('elevenlabs.', 'pydantic', 'httpx')))))\n"
+    )
+    elapsed, modules = output.splitlines()
+    assert float(elapsed) < IMPORT_TIME_BUDGET_IN_SECONDS
+    # The audio helpers only depend on the standard library.
+    assert modules == "elevenlabs.play"
+
+
+def test_lazy_names() -> None:
+    """Test that the lazily imported names resolve to the same objects as their modules."""
+    output = _run(
+        "import elevenlabs, elevenlabs.types\n"
+        "from elevenlabs.client import ElevenLabs\n"
+        "from elevenlabs.types.voice import Voice\n"
+        "assert elevenlabs.ElevenLabs is ElevenLabs and elevenlabs.Voice is Voice and elevenlabs.types.Voice is Voice\n"
+        "assert callable(elevenlabs.play) and elevenlabs.voices.__name__ == 'elevenlabs.voices'\n"
+        "assert set(elevenlabs.__all__) <= set(dir(elevenlabs))\n"
+        "assert all(getattr(elevenlabs.types, name) is not None for name in elevenlabs.types.__all__)\n"
+        "print('ok')\n"
+    )
+    assert output.strip() == "ok"
+
+
+def test_play_functions_after_submodule_import() -> None:
+    """Test that `play`, `save` and `stream` stay functions when the `elevenlabs.play` submodule is imported first."""
+    output = _run(
+        "from elevenlabs.play import save\n"
+        "import elevenlabs\n"
+        "from elevenlabs import play, stream\n"
+        "assert callable(play) and callable(stream) and elevenlabs.save is save\n"
+        "assert elevenlabs.play.__module__ == 'elevenlabs.play'\n"
+        "print('ok')\n"
+    )
+    assert output.strip() == "ok"
+
+
+def test_lazy_sub_clients() -> None:
+    """Test that resource clients are only imported and built when first used."""
+    output = _run(
+        "import sys\n"
+        "from elevenlabs.client import AsyncElevenLabs, ElevenLabs\n"
+        "from elevenlabs.realtime_tts import RealtimeTextToSpeechClient\n"
+        "client = ElevenLabs(api_key='test')\n"
+        "async_client = AsyncElevenLabs(api_key='test')\n"
+        "assert 'elevenlabs.dubbing.client' not in sys.modules\n"
+        "assert client.dubbing is client.dubbing and 'elevenlabs.dubbing.client' in sys.modules\n"
+        "assert isinstance(client.text_to_speech, RealtimeTextToSpeechClient)\n"
+        "assert type(async_client.dubbing).__name__ == 'AsyncDubbingClient'\n"
+        "stub = object()\n"
+        "client.voices = async_client.voices = client.text_to_speech = stub\n"
+        "assert client.voices is async_client.voices is client.text_to_speech is stub\n"
+        "print('ok')\n"
+    )
+    assert output.strip() == "ok"